@@ -134,6 +134,7 @@ export interface TopicLinkRecommendationItem {
 export interface TopicLinkRecommendationResponse {
   vector_status: 'ready' | 'unconfigured' | 'failed' | string
   embedding_model: string
+  candidate_source?: 'topic_index' | 'recent_topics' | string
   items: TopicLinkRecommendationItem[]
   message?: string | null
 }
@@ -881,10 +882,12 @@ export const topicsApi = {
   },
   get: (id: string) => api.get<Topic>(`/topics/${id}`),
   getBundle: (id: string) => api.get<TopicBundleResponse>(`/topics/${id}/bundle`),
-  getTopicLinkRecommendations: (params?: { topicId?: string; limit?: number }) => {
+  getTopicLinkRecommendations: (params?: { topicId?: string; limit?: number; category?: string; status?: string }) => {
     const searchParams = new URLSearchParams()
     if (params?.topicId) searchParams.set('topic_id', params.topicId)
     if (params?.limit != null) searchParams.set('limit', String(params.limit))
+    if (params?.category) searchParams.set('category', params.category)
+    if (params?.status) searchParams.set('status', params.status)
     const qs = searchParams.toString()
     return api.get<TopicLinkRecommendationResponse>(`/topiclink/recommendations${qs ? `?${qs}` : ''}`)
   },
@@ -2120,6 +2123,7 @@ export interface ScienceSkillFinderResult extends ScienceSkillCatalogItem {
   ranking_signals?: {
     semantic_match?: number
     task_match: number
+    vector_match?: number
     function_match?: number
     readiness: ScienceSkillCatalogItem['readiness']
     source_review: string
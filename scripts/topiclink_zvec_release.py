@@ -5,8 +5,10 @@ from __future__ import annotations
 
 import argparse
 import base64
+import fcntl
 import hashlib
 import hmac
+import http.client
 import json
 import os
 import re
@@ -19,6 +21,7 @@ import urllib.parse
 import urllib.request
 import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from email.utils import formatdate
@@ -39,6 +42,11 @@ LOCK_KEYS = {
     "min_doc_count",
     "expected_dimensions",
 }
+DOWNLOAD_CHUNK_BYTES = 32 * 1024 * 1024
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_ATTEMPTS = 3
+COPY_BUFFER_BYTES = 1024 * 1024
+CONTENT_RANGE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
 
 
 def log(message: str) -> None:
@@ -239,6 +247,7 @@ def build_oss_get_request(
     credentials: OssCredentials,
     *,
     request_date: str | None = None,
+    byte_range: tuple[int, int] | None = None,
 ) -> urllib.request.Request:
     date_header = request_date or formatdate(timeval=None, localtime=False, usegmt=True)
     headers = {
@@ -246,6 +255,9 @@ def build_oss_get_request(
         "Date": date_header,
         "User-Agent": "TopicLab-Deploy/2.0",
     }
+    if byte_range is not None:
+        # Range is not part of the OSS V1 string-to-sign.
+        headers["Range"] = f"bytes={byte_range[0]}-{byte_range[1]}"
     canonical_headers = ""
     if credentials.security_token:
         headers["x-oss-security-token"] = credentials.security_token
@@ -303,11 +315,203 @@ def verify_checksum(path: Path, expected: str) -> None:
         raise RuntimeError(f"SHA-256 mismatch for {path.name}: expected {expected}, got {actual}")
 
 
+@dataclass
+class DownloadProgress:
+    """Sidecar state that lets an interrupted ranged download resume."""
+
+    sha256: str
+    size: int
+    chunk_size: int
+    done: set[int]
+
+    @property
+    def chunk_count(self) -> int:
+        return max(1, -(-self.size // self.chunk_size))
+
+    def chunk_range(self, index: int) -> tuple[int, int]:
+        start = index * self.chunk_size
+        return start, min(self.size, start + self.chunk_size) - 1
+
+    def save(self, path: Path) -> None:
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_text(
+            json.dumps(
+                {
+                    "sha256": self.sha256,
+                    "size": self.size,
+                    "chunk_size": self.chunk_size,
+                    "done": sorted(self.done),
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: Path, part: Path, sha256: str) -> DownloadProgress | None:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            progress = cls(
+                sha256=str(payload["sha256"]),
+                size=int(payload["size"]),
+                chunk_size=int(payload["chunk_size"]),
+                done={int(index) for index in payload["done"]},
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if (
+            progress.sha256 != sha256
+            or progress.size <= 0
+            or progress.chunk_size <= 0
+            or not part.is_file()
+            or part.stat().st_size != progress.size
+        ):
+            return None
+        progress.done &= set(range(progress.chunk_count))
+        return progress
+
+
+def _parse_content_range(value: str | None) -> tuple[int, int, int]:
+    match = CONTENT_RANGE.fullmatch((value or "").strip())
+    if not match:
+        raise RuntimeError(f"unexpected Content-Range: {value!r}")
+    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+def _write_response(response, fd: int, offset: int, expected: int | None, digest=None) -> int:
+    written = 0
+    while True:
+        block = response.read(COPY_BUFFER_BYTES)
+        if not block:
+            break
+        view = memoryview(block)
+        while view:
+            count = os.pwrite(fd, view, offset + written)
+            view = view[count:]
+            written += count
+        if digest is not None:
+            digest.update(block)
+    if expected is not None and written != expected:
+        raise RuntimeError(f"short read: expected {expected} bytes, got {written}")
+    return written
+
+
+def _download_chunk(
+    spec: ReleaseSpec,
+    credentials: OssCredentials,
+    part: Path,
+    progress: DownloadProgress,
+    index: int,
+) -> int:
+    start, end = progress.chunk_range(index)
+    request = build_oss_get_request(spec, credentials, byte_range=(start, end))
+    fd = os.open(part, os.O_WRONLY)
+    try:
+        with urllib.request.urlopen(request, timeout=120) as response:
+            if getattr(response, "status", 200) != 206:
+                raise RuntimeError("OSS ignored the Range header while resuming")
+            if _parse_content_range(response.headers.get("Content-Range"))[:2] != (start, end):
+                raise RuntimeError(f"OSS returned the wrong range for chunk {index}")
+            _write_response(response, fd, start, end - start + 1)
+    finally:
+        os.close(fd)
+    return index
+
+
+def _hash_prefix(part: Path, progress: DownloadProgress, digest, hashed: int) -> int:
+    """Extend ``digest`` over completed chunks that directly follow the hashed prefix."""
+    with part.open("rb") as handle:
+        while hashed < progress.chunk_count and hashed in progress.done:
+            start, end = progress.chunk_range(hashed)
+            handle.seek(start)
+            remaining = end - start + 1
+            while remaining:
+                block = handle.read(min(COPY_BUFFER_BYTES, remaining))
+                if not block:
+                    raise RuntimeError("partial download is shorter than recorded")
+                digest.update(block)
+                remaining -= len(block)
+            hashed += 1
+    return hashed
+
+
+def _download_ranges(
+    spec: ReleaseSpec,
+    credentials: OssCredentials,
+    part: Path,
+    progress_path: Path,
+    progress: DownloadProgress,
+    workers: int,
+) -> str:
+    digest = hashlib.sha256()
+    hashed = _hash_prefix(part, progress, digest, 0)
+    pending = [index for index in range(progress.chunk_count) if index not in progress.done]
+    if pending:
+        log(
+            f"downloading {len(pending)}/{progress.chunk_count} chunks of "
+            f"{spec.object_key} with {workers} workers"
+        )
+    failure: Exception | None = None
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [
+            executor.submit(_download_chunk, spec, credentials, part, progress, index)
+            for index in pending
+        ]
+        for future in as_completed(futures):
+            try:
+                index = future.result()
+            except Exception as exc:  # keep recording the chunks that did finish
+                failure = failure or exc
+                continue
+            progress.done.add(index)
+            progress.save(progress_path)
+            hashed = _hash_prefix(part, progress, digest, hashed)
+    if failure is not None:
+        raise failure
+    return digest.hexdigest()
+
+
+def _start_download(
+    spec: ReleaseSpec,
+    credentials: OssCredentials,
+    part: Path,
+    progress_path: Path,
+    chunk_size: int,
+) -> tuple[DownloadProgress | None, str | None]:
+    """Fetch the first chunk; fall back to one hashed stream if ranges are unsupported."""
+    request = build_oss_get_request(spec, credentials, byte_range=(0, chunk_size - 1))
+    with urllib.request.urlopen(request, timeout=120) as response:
+        with part.open("wb") as handle:
+            fd = handle.fileno()
+            if getattr(response, "status", 200) != 206:
+                digest = hashlib.sha256()
+                _write_response(response, fd, 0, None, digest)
+                return None, digest.hexdigest()
+            start, end, size = _parse_content_range(response.headers.get("Content-Range"))
+            if start != 0:
+                raise RuntimeError("OSS returned the wrong range for chunk 0")
+            handle.truncate(size)
+            _write_response(response, fd, 0, end + 1)
+    progress = DownloadProgress(sha256=spec.sha256, size=size, chunk_size=chunk_size, done={0})
+    progress.save(progress_path)
+    return progress, None
+
+
 def download_archive(
     spec: ReleaseSpec,
     destination: Path,
     credentials: OssCredentials,
+    *,
+    workers: int = DOWNLOAD_WORKERS,
+    chunk_size: int = DOWNLOAD_CHUNK_BYTES,
 ) -> bool:
+    """Download with parallel HTTP range requests, resuming a previous partial file.
+
+    Completed chunks are recorded next to ``.part`` so a retry or a later run
+    only fetches what is missing, and the SHA-256 follows the completed prefix
+    so the digest is ready when the last chunk lands. Objects served without
+    range support are streamed and hashed in one pass.
+    """
     destination.parent.mkdir(parents=True, exist_ok=True)
     if destination.is_file():
         try:
@@ -317,24 +521,47 @@ def download_archive(
         except RuntimeError:
             destination.unlink()
 
-    part = destination.with_name(f".{destination.name}.part-{os.getpid()}-{uuid.uuid4().hex}")
-    try:
-        for attempt in range(1, 4):
+    part = destination.with_name(f".{destination.name}.part")
+    progress_path = destination.with_name(f".{destination.name}.part.json")
+    lock_path = destination.with_name(f".{destination.name}.lock")
+    with lock_path.open("w") as lock_handle:
+        fcntl.flock(lock_handle, fcntl.LOCK_EX)
+        for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
             try:
-                request = build_oss_get_request(spec, credentials)
-                log(f"downloading private OSS object {spec.object_key} (attempt {attempt}/3)")
-                with (
-                    urllib.request.urlopen(request, timeout=120) as response,
-                    part.open("wb") as handle,
-                ):
-                    shutil.copyfileobj(response, handle, length=1024 * 1024)
-                verify_checksum(part, spec.sha256)
+                progress = DownloadProgress.load(progress_path, part, spec.sha256)
+                actual: str | None = None
+                if progress is None:
+                    log(
+                        f"downloading private OSS object {spec.object_key} "
+                        f"(attempt {attempt}/{DOWNLOAD_ATTEMPTS})"
+                    )
+                    progress, actual = _start_download(
+                        spec, credentials, part, progress_path, chunk_size
+                    )
+                else:
+                    log(
+                        f"resuming {spec.object_key} with {len(progress.done)}/"
+                        f"{progress.chunk_count} chunks (attempt {attempt}/{DOWNLOAD_ATTEMPTS})"
+                    )
+                if progress is not None:
+                    actual = _download_ranges(
+                        spec, credentials, part, progress_path, progress, workers
+                    )
+                if actual != spec.sha256:
+                    part.unlink(missing_ok=True)
+                    progress_path.unlink(missing_ok=True)
+                    raise RuntimeError(
+                        f"SHA-256 mismatch for {destination.name}: "
+                        f"expected {spec.sha256}, got {actual}"
+                    )
                 os.replace(part, destination)
+                progress_path.unlink(missing_ok=True)
                 log(f"downloaded and verified {destination}")
                 return True
-            except (OSError, urllib.error.URLError, RuntimeError) as exc:
-                part.unlink(missing_ok=True)
-                if attempt == 3:
+            except (OSError, http.client.HTTPException, RuntimeError) as exc:
+                if not progress_path.exists():
+                    part.unlink(missing_ok=True)
+                if attempt == DOWNLOAD_ATTEMPTS:
                     if isinstance(exc, urllib.error.HTTPError):
                         detail = f"OSS returned HTTP {exc.code}"
                     elif isinstance(exc, urllib.error.URLError):
@@ -343,8 +570,6 @@ def download_archive(
                         detail = str(exc)
                     raise RuntimeError(f"could not download verified OSS asset: {detail}") from exc
                 time.sleep(attempt * 5)
-    finally:
-        part.unlink(missing_ok=True)
     raise AssertionError("download retry loop ended unexpectedly")
 
 
@@ -459,13 +684,14 @@ def prepare_release(
     archive_override: Path | None = None,
     oss_credentials: OssCredentials | None = None,
     force: bool = False,
+    download_workers: int = DOWNLOAD_WORKERS,
 ) -> Path:
     paths.package_root.mkdir(parents=True, exist_ok=True)
     ensure_traversable_directory(paths.package_root)
     if archive_override is None:
         if oss_credentials is None:
             raise ValueError("OSS credentials are required when no local archive is provided")
-        download_archive(spec, paths.archive, oss_credentials)
+        download_archive(spec, paths.archive, oss_credentials, workers=download_workers)
         archive = paths.archive
     else:
         archive = archive_override.expanduser().resolve(strict=True)
@@ -478,11 +704,41 @@ def active_resolved_path(paths: ReleasePaths) -> str:
     return str(paths.active_collection.resolve(strict=False))
 
 
+def _swap_active_collection(
+    paths: ReleasePaths,
+    target: Path,
+    marker_payload: dict[str, object],
+    collection_dir: str,
+) -> None:
+    """Point the active path at ``target`` and rewrite the marker, each with one rename."""
+    relative_target = os.path.relpath(target, start=paths.package_root)
+    next_link = paths.package_root / f".{collection_dir}.next-{uuid.uuid4().hex}"
+    next_marker = paths.package_root / (
+        f".installed-release.next-{uuid.uuid4().hex}.json"
+    )
+    try:
+        os.symlink(relative_target, next_link, target_is_directory=True)
+        next_marker.write_text(
+            json.dumps(marker_payload, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        os.replace(next_link, paths.active_collection)
+        os.replace(next_marker, paths.installed_marker)
+    finally:
+        next_link.unlink(missing_ok=True)
+        next_marker.unlink(missing_ok=True)
+
+
 def activate_release(spec: ReleaseSpec, paths: ReleasePaths) -> dict[str, object]:
     if not release_is_prepared(spec, paths):
         raise RuntimeError(f"release {spec.version} is not prepared")
 
     paths.package_root.mkdir(parents=True, exist_ok=True)
+    previous_path = ""
+    if paths.active_collection.is_symlink():
+        resolved = paths.active_collection.resolve(strict=False)
+        if resolved != paths.release_collection.resolve(strict=False) and resolved.is_dir():
+            previous_path = str(resolved)
     legacy_path: Path | None = None
     if os.path.lexists(paths.active_collection) and not paths.active_collection.is_symlink():
         legacy_root = paths.package_root / ".legacy" / (
@@ -493,11 +749,6 @@ def activate_release(spec: ReleaseSpec, paths: ReleasePaths) -> dict[str, object
         os.replace(paths.active_collection, legacy_path)
         log(f"preserved legacy collection at {legacy_path}")
 
-    relative_target = os.path.relpath(paths.release_collection, start=paths.package_root)
-    next_link = paths.package_root / f".{spec.collection_dir}.next-{uuid.uuid4().hex}"
-    next_marker = paths.package_root / (
-        f".installed-release.next-{uuid.uuid4().hex}.json"
-    )
     marker_payload: dict[str, object] = {
         **spec.metadata(),
         "activated_at": datetime.now(timezone.utc).isoformat(),
@@ -505,27 +756,51 @@ def activate_release(spec: ReleaseSpec, paths: ReleasePaths) -> dict[str, object
     }
     if legacy_path is not None:
         marker_payload["legacy_path"] = str(legacy_path)
+    if previous_path:
+        marker_payload["previous_path"] = previous_path
 
     try:
-        os.symlink(relative_target, next_link, target_is_directory=True)
-        next_marker.write_text(
-            json.dumps(marker_payload, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
-            encoding="utf-8",
-        )
-        os.replace(next_link, paths.active_collection)
-        os.replace(next_marker, paths.installed_marker)
+        _swap_active_collection(paths, paths.release_collection, marker_payload, spec.collection_dir)
     except Exception:
         if legacy_path is not None and not os.path.lexists(paths.active_collection):
             os.replace(legacy_path, paths.active_collection)
         raise
-    finally:
-        next_link.unlink(missing_ok=True)
-        next_marker.unlink(missing_ok=True)
 
     log(f"activated release {spec.version} at {paths.active_collection}")
     return marker_payload
 
 
+def rollback_release(spec: ReleaseSpec, paths: ReleasePaths) -> dict[str, object]:
+    """Atomically re-activate the release that was active before the last activation."""
+    try:
+        installed = json.loads(paths.installed_marker.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise RuntimeError("no installed release marker to roll back from") from exc
+    previous = Path(str(installed.get("previous_path") or ""))
+    if not installed.get("previous_path") or not previous.is_dir():
+        raise RuntimeError("installed release has no previous release to roll back to")
+    if paths.releases_root.resolve(strict=False) not in previous.parents:
+        raise RuntimeError(f"previous release is outside {paths.releases_root}")
+    try:
+        metadata = json.loads(
+            (previous.parent / ".topiclink-zvec-release.json").read_text(encoding="utf-8")
+        )
+    except (OSError, json.JSONDecodeError) as exc:
+        raise RuntimeError(f"previous release {previous} has no release metadata") from exc
+    if not isinstance(metadata, dict) or not list(previous.glob("manifest.*")):
+        raise RuntimeError(f"previous release {previous} is incomplete")
+
+    marker_payload: dict[str, object] = {
+        **metadata,
+        "activated_at": datetime.now(timezone.utc).isoformat(),
+        "active_path": str(paths.active_collection),
+        "previous_path": active_resolved_path(paths),
+    }
+    _swap_active_collection(paths, previous, marker_payload, spec.collection_dir)
+    log(f"rolled back to release {metadata.get('version')} at {paths.active_collection}")
+    return marker_payload
+
+
 def _add_common_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--lock", required=True, type=Path)
     parser.add_argument("--workspace", required=True, type=Path)
@@ -548,12 +823,23 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="read OSS_ACCESS_KEY_ID, OSS_ACCESS_KEY_SECRET, OSS_BUCKET, and OSS_ENDPOINT",
     )
+    prepare.add_argument(
+        "--download-workers",
+        type=int,
+        default=DOWNLOAD_WORKERS,
+        help="parallel HTTP range requests for the archive download",
+    )
 
     activate = subparsers.add_parser(
         "activate", help="atomically point the runtime path at the release"
     )
     _add_common_arguments(activate)
 
+    rollback = subparsers.add_parser(
+        "rollback", help="atomically point the runtime path back at the previous release"
+    )
+    _add_common_arguments(rollback)
+
     path = subparsers.add_parser("path", help="print one resolved release path")
     _add_common_arguments(path)
     path.add_argument(
@@ -577,10 +863,13 @@ def main(argv: list[str] | None = None) -> int:
                 archive_override=args.archive,
                 oss_credentials=credentials,
                 force=args.force,
+                download_workers=args.download_workers,
             )
             print(json.dumps({"status": "prepared", "path": str(prepared)}, sort_keys=True))
         elif args.command == "activate":
             print(json.dumps(activate_release(spec, paths), ensure_ascii=False, sort_keys=True))
+        elif args.command == "rollback":
+            print(json.dumps(rollback_release(spec, paths), ensure_ascii=False, sort_keys=True))
         elif args.kind == "release-host":
             print(paths.release_collection)
         elif args.kind == "release-container":
@@ -19,7 +19,12 @@ from app.services.science_mcp_catalog import (
     get_mcp_catalog_meta,
     list_mcp_catalog,
 )
-from app.services.science_mcp_finder import find_science_mcps, get_mcp_finder_capabilities
+from app.services.science_finder_cache import cached_finder_result, replay_finder_events
+from app.services.science_mcp_finder import (
+    find_science_mcps,
+    get_mcp_finder_capabilities,
+    mcp_finder_cache_version,
+)
 from app.services.science_skill_finder import get_finder_config
 from app.services.science_mcp_hub import (
     add_mcp_collection_item,
@@ -187,7 +192,15 @@ async def find_mcp_science_catalog(
     allow_model = user is not None and get_finder_config().configured
     if allow_model:
         await run_in_threadpool(consume_model_usage, _authenticated_user_id(user), "science_finder")
-    return await find_science_mcps(query, limit=payload.limit, allow_model=allow_model)
+    result, _ = await cached_finder_result(
+        "mcp",
+        query,
+        limit=payload.limit,
+        allow_model=allow_model,
+        version=mcp_finder_cache_version,
+        compute=lambda: find_science_mcps(query, limit=payload.limit, allow_model=allow_model),
+    )
+    return result
 
 
 @router.get("/mcps")
@@ -269,12 +282,22 @@ async def stream_mcp_catalog_endpoint(
 
         async def produce():
             try:
-                result = await find_science_mcps(
+                result, cached = await cached_finder_result(
+                    "mcp",
                     query,
                     limit=payload.limit,
-                    on_event=emit,
                     allow_model=allow_model,
+                    version=mcp_finder_cache_version,
+                    compute=lambda: find_science_mcps(
+                        query,
+                        limit=payload.limit,
+                        on_event=emit,
+                        allow_model=allow_model,
+                    ),
                 )
+                if cached:
+                    for event, event_payload in replay_finder_events(result):
+                        await queue.put((event, event_payload))
                 await queue.put(("done", {key: value for key, value in result.items() if key != "results"}))
             except Exception:
                 await queue.put(("error", {"message": "搜索暂时不可用，请稍后重试。"}))
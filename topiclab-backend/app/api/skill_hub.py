@@ -46,8 +46,10 @@ from app.services.science_skill_catalog import (
     get_catalog_skill,
     list_catalog_skills,
 )
+from app.services.science_finder_cache import cached_finder_result, replay_finder_events
 from app.services.science_skill_finder import (
     find_science_skills,
+    finder_cache_version,
     get_finder_capabilities,
     get_finder_config,
 )
@@ -128,7 +130,15 @@ async def find_science_skills_endpoint(
     allow_model = user is not None and get_finder_config().configured
     if allow_model:
         await run_in_threadpool(consume_model_usage, _authenticated_user_id(user), "science_finder")
-    return await find_science_skills(query, limit=payload.limit, allow_model=allow_model)
+    result, _ = await cached_finder_result(
+        "skill",
+        query,
+        limit=payload.limit,
+        allow_model=allow_model,
+        version=finder_cache_version,
+        compute=lambda: find_science_skills(query, limit=payload.limit, allow_model=allow_model),
+    )
+    return result
 
 
 def _finder_stream_event(event: str, payload: dict) -> str:
@@ -158,12 +168,22 @@ async def stream_science_skills_endpoint(
 
         async def produce():
             try:
-                result = await find_science_skills(
+                result, cached = await cached_finder_result(
+                    "skill",
                     query,
                     limit=payload.limit,
-                    on_event=emit,
                     allow_model=allow_model,
+                    version=finder_cache_version,
+                    compute=lambda: find_science_skills(
+                        query,
+                        limit=payload.limit,
+                        on_event=emit,
+                        allow_model=allow_model,
+                    ),
                 )
+                if cached:
+                    for event, event_payload in replay_finder_events(result):
+                        await queue.put((event, event_payload))
                 await queue.put(("done", {key: value for key, value in result.items() if key != "results"}))
             except Exception:
                 await queue.put(("error", {"message": "搜索暂时不可用，请稍后重试。"}))
@@ -284,6 +304,7 @@ async def get_skill_hub_skills(
     openclaw_ready_only: bool = Query(default=False),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
     user: dict | None = Depends(_get_optional_user),
 ):
     user_id = int(user["sub"]) if user and user.get("sub") is not None else None
@@ -297,6 +318,7 @@ async def get_skill_hub_skills(
         openclaw_ready_only=openclaw_ready_only,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
 
@@ -418,6 +440,7 @@ async def search_skill_hub(
     sort: str = Query(default="hot"),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
     user: dict | None = Depends(_get_optional_user),
 ):
     user_id = int(user["sub"]) if user and user.get("sub") is not None else None
@@ -429,6 +452,7 @@ async def search_skill_hub(
         sort=sort,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
 
@@ -14,26 +14,35 @@ import json
 import logging
 import math
 import os
+import re
 import secrets
 import threading
 import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
 from sqlalchemy import bindparam, inspect, text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app.api.auth import require_openclaw_user, security, verify_access_token
+from app.services.adaptive_concurrency import AdaptiveConcurrencyLimit
+from app.services.embedding_batcher import EmbeddingBatcher, EmbeddingEndpoint
+from app.services.embedding_lru import EmbeddingKey, EmbeddingLRU
+from app.services.http_client import get_shared_async_client
 from app.services.openclaw_runtime import get_primary_openclaw_agent_for_user
+from app.services.topiclink_answer_cache import answer_cache_key, cached_answer, topic_fingerprint
+from app.services.topiclink_vector_codec import VECTOR_FRAME_CONTENT_TYPE, decode_vector_frame, encode_vector_frame
+from app.services.topiclink_vectors import UnitVectorMatrix, hash_embedding
 from app.services.twin_runtime import get_or_backfill_active_twin_for_user
 from app.storage.database.postgres_client import get_db_session
+from app.storage.database.worker_leases import acquire_worker_lease, release_worker_lease
 from app.storage.database.topic_store import (
     _invalidate_read_cache,
     annotate_posts_with_interactions,
@@ -53,32 +62,67 @@ EMBEDDING_DIM = 96
 DEFAULT_EMBEDDING_MODEL = "Qwen3-Embedding-8B"
 DEFAULT_CHAT_MODEL = "DeepSeek-V4-Flash"
 DEFAULT_EMBEDDING_BATCH_SIZE = 3
+DEFAULT_EMBEDDING_CONCURRENCY = 4
 DEFAULT_EMBEDDING_TEXT_CHARS = 2000
 DEFAULT_ZVEC_DIMENSIONS = 4096
 ZVEC_VECTOR_FIELD = "embedding"
+ZVEC_TOPIC_INDEX_SUFFIX = "-topics"
+TOPIC_INDEX_FILTER_VALUE_PATTERN = r"^[A-Za-z0-9_-]{1,64}$"
 DEFAULT_METADATA_BACKFILL_BATCH_SIZE = 8
 DEFAULT_METADATA_BACKGROUND_INTERVAL_SECONDS = 300.0
 DEFAULT_METADATA_BACKGROUND_INITIAL_DELAY_SECONDS = 20.0
 DEFAULT_METADATA_BACKGROUND_LLM_DELAY_SECONDS = 4.0
 DEFAULT_METADATA_BACKGROUND_MAX_PER_PASS = 10
 DEFAULT_METADATA_BACKGROUND_PAGE_SIZE = 50
+DEFAULT_METADATA_BACKGROUND_MAX_CONCURRENCY = 4
+DEFAULT_METADATA_LLM_LATENCY_TARGET_SECONDS = 20.0
+DEFAULT_METADATA_CATCH_UP_INTERVAL_SECONDS = 5.0
+DEFAULT_METADATA_WORKER_LEASE_SECONDS = 900.0
+TOPICLINK_WORKER_LEASE_NAME = "topiclink-background-worker"
+# The backlog only drives catch-up scheduling and health output, so counting stops here.
+METADATA_BACKLOG_COUNT_LIMIT = 1000
 DEFAULT_EMBEDDING_BACKGROUND_MAX_PER_PASS = 24
 DEFAULT_ZVEC_MAX_IDLE_DAYS = 30
 DEFAULT_ZVEC_PRUNE_INTERVAL_SECONDS = 86400.0
 DEFAULT_ZVEC_SERVICE_TIMEOUT_SECONDS = 15.0
+ZVEC_TOUCH_BUFFER_LIMIT = 4096
+ZVEC_SERVICE_CLIENT_NAME = "topiclink-zvec"
+TOPICLINK_CHAT_CLIENT_NAME = "topiclink-chat"
+SIMULATION_TEMPERATURE = 0.45
+SIMULATION_MAX_TOKENS = 700
+KNOWLEDGE_ANSWER_TEMPERATURE = 0.35
+KNOWLEDGE_ANSWER_MAX_TOKENS = 220
+KNOWLEDGE_ANSWER_VISIBLE_CHARS = 180
+# Part of the answer cache key: bump it whenever the knowledge answer prompt,
+# temperature or token budget changes so cached answers from the old prompt retire.
+KNOWLEDGE_ANSWER_PROMPT_VERSION = "1"
+DEFAULT_EMBEDDING_LRU_MB = 64
+EMBEDDING_LRU_WARM_CHUNK_SIZE = 256
 DEFAULT_TASK_CLAIM_LEASE_SECONDS = 600
 _embedding_cache_ready = False
 _zvec_collection: Any | None = None
 _zvec_collection_path: Path | None = None
 _zvec_error: str | None = None
 _zvec_lock = threading.RLock()
+_topic_index_collection: Any | None = None
+_topic_index_path: Path | None = None
 _metadata_worker_task: asyncio.Task | None = None
 _metadata_worker_stop: asyncio.Event | None = None
 _metadata_worker_cursor: str | None = None
+_metadata_worker_owner = uuid.uuid4().hex
+_metadata_worker_limit: AdaptiveConcurrencyLimit | None = None
+_metadata_worker_status: dict[str, Any] = {"leader": False, "backlog": None, "written": 0, "last_pass_at": None}
 _embedding_worker_cursor: str | None = None
 _embedding_worker_opc_offset = 0
 _zvec_last_prune_monotonic = 0.0
+_zvec_pending_touches: dict[str, str] = {}
+_zvec_touch_lock = threading.Lock()
+_zvec_service_client: httpx.Client | None = None
+_zvec_service_client_lock = threading.Lock()
+_embedding_lru: EmbeddingLRU | None = None
+_embedding_lru_lock = threading.Lock()
 _topiclink_task_creation_locks = tuple(threading.Lock() for _ in range(64))
+_embedding_batcher = EmbeddingBatcher(client_name="topiclink-embeddings")
 
 TOPICLINK_EXCLUDED_CATEGORIES = {"test"}
 TOPICLINK_EXCLUDED_TITLE_MARKERS = (
@@ -308,9 +352,9 @@ def _safe_get_topic(topic_id: str | None) -> dict[str, Any] | None:
     return _backfill_topiclink_metadata([topic], max_updates=1)[0]
 
 
-def _safe_list_topics(limit: int) -> list[dict[str, Any]]:
+def _safe_list_topics(limit: int, category: str | None = None) -> list[dict[str, Any]]:
     try:
-        page = list_topics(limit=limit)
+        page = list_topics(category=category, limit=limit)
     except SQLAlchemyError:
         logger.info("TopicLink skipped recommendations because topic storage is not ready")
         return []
@@ -323,30 +367,17 @@ def _safe_list_topics(limit: int) -> list[dict[str, Any]]:
     return _backfill_topiclink_metadata(candidates)
 
 
-def _hash_embedding(text: str) -> list[float]:
-    vector = [0.0] * EMBEDDING_DIM
-    for token in text.lower().replace("/", " ").replace("_", " ").split():
-        digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
-        value = int.from_bytes(digest, "big")
-        index = value % EMBEDDING_DIM
-        vector[index] += 1.0 if value & 1 else -1.0
-    norm = math.sqrt(sum(item * item for item in vector)) or 1.0
-    return [item / norm for item in vector]
-
-
-def _cosine(a: list[float], b: list[float]) -> float:
-    if not a or not b or len(a) != len(b):
-        return 0.0
-    return sum(x * y for x, y in zip(a, b))
-
-
 def _normalize_embedding_input(text: str, max_chars: int) -> str:
     return (text.strip() or " ").replace("\x00", " ")[:max_chars]
 
 
 def _embedding_cache_key(model: str, text_value: str) -> tuple[str, str]:
     text_hash = hashlib.sha256(text_value.encode("utf-8")).hexdigest()
-    return f"{model}:{text_hash}", text_hash
+    return _embedding_cache_key_for_hash(model, text_hash), text_hash
+
+
+def _embedding_cache_key_for_hash(model: str, text_hash: str) -> str:
+    return f"{model}:{text_hash}"
 
 
 def _topiclink_zvec_enabled() -> bool:
@@ -380,20 +411,87 @@ def _topiclink_zvec_service_url() -> str:
     return os.getenv("TOPICLINK_ZVEC_SERVICE_URL", "").strip().rstrip("/")
 
 
-def _request_zvec_service(method: str, path: str, *, payload: dict[str, Any] | None = None) -> Any:
+def _topiclink_zvec_service_socket() -> str | None:
+    return os.getenv("TOPICLINK_ZVEC_SERVICE_SOCKET", "").strip() or None
+
+
+def _zvec_service_http_client() -> httpx.Client:
+    """Keep-alive client for sidecar calls made from worker threads."""
+    global _zvec_service_client
+    with _zvec_service_client_lock:
+        if _zvec_service_client is None:
+            socket_path = _topiclink_zvec_service_socket()
+            limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            _zvec_service_client = httpx.Client(
+                limits=limits,
+                transport=httpx.HTTPTransport(uds=socket_path, limits=limits) if socket_path else None,
+            )
+        return _zvec_service_client
+
+
+def _zvec_service_request_options(
+    path: str,
+    *,
+    payload: dict[str, Any] | None,
+    frame: bytes | None,
+) -> tuple[str, dict[str, Any]]:
     url = _topiclink_zvec_service_url()
     if not url:
         raise RuntimeError("TopicLink Zvec service URL is not configured")
-    response = httpx.request(
-        method,
-        f"{url}{path}",
-        json=payload,
-        timeout=DEFAULT_ZVEC_SERVICE_TIMEOUT_SECONDS,
-    )
+    options: dict[str, Any] = {"timeout": DEFAULT_ZVEC_SERVICE_TIMEOUT_SECONDS}
+    if frame is not None:
+        options["content"] = frame
+        options["headers"] = {"Content-Type": VECTOR_FRAME_CONTENT_TYPE}
+    elif payload is not None:
+        options["json"] = payload
+    return f"{url}{path}", options
+
+
+def _zvec_service_payload(response: httpx.Response) -> Any:
     response.raise_for_status()
+    if response.headers.get("content-type", "").startswith(VECTOR_FRAME_CONTENT_TYPE):
+        return decode_vector_frame(response.content)
     return response.json()
 
 
+def _request_zvec_service(
+    method: str,
+    path: str,
+    *,
+    payload: dict[str, Any] | None = None,
+    frame: bytes | None = None,
+) -> Any:
+    url, options = _zvec_service_request_options(path, payload=payload, frame=frame)
+    return _zvec_service_payload(_zvec_service_http_client().request(method, url, **options))
+
+
+async def _request_zvec_service_async(
+    method: str,
+    path: str,
+    *,
+    payload: dict[str, Any] | None = None,
+    frame: bytes | None = None,
+) -> Any:
+    url, options = _zvec_service_request_options(path, payload=payload, frame=frame)
+    client = get_shared_async_client(ZVEC_SERVICE_CLIENT_NAME, uds=_topiclink_zvec_service_socket())
+    return _zvec_service_payload(await client.request(method, url, **options))
+
+
+def _zvec_cache_fetch_payload(model: str, inputs: list[str]) -> dict[str, Any]:
+    return {"model": model, "text_hashes": [_embedding_cache_key(model, item)[1] for item in inputs]}
+
+
+def _zvec_cache_upsert_frame(model: str, inputs: list[str], vectors: list[list[float]]) -> bytes:
+    return encode_vector_frame(_zvec_cache_fetch_payload(model, inputs), vectors)
+
+
+def _zvec_cached_vectors(result: Any, expected: int) -> list[list[float] | None]:
+    vectors = result[1] if isinstance(result, tuple) else None
+    if not isinstance(vectors, list) or len(vectors) != expected:
+        raise RuntimeError("TopicLink Zvec service returned an invalid cache response")
+    return vectors
+
+
 def _topiclink_zvec_document_id(cache_key: str) -> str:
     return hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
 
@@ -532,32 +630,35 @@ def _write_zvec_cache(model: str, inputs: list[str], vectors: list[list[float]])
     global _zvec_error
     if not _topiclink_zvec_enabled() or not inputs or len(inputs) != len(vectors):
         return False
-    dimensions = _topiclink_zvec_dimensions()
-    service_url = _topiclink_zvec_service_url()
-    if service_url:
+    if _topiclink_zvec_service_url():
         try:
-            _request_zvec_service(
-                "POST",
-                "/cache/upsert",
-                payload={"model": model, "inputs": inputs, "vectors": vectors},
-            )
+            _request_zvec_service("POST", "/v2/cache/upsert", frame=_zvec_cache_upsert_frame(model, inputs, vectors))
             _zvec_error = None
             return True
         except Exception as exc:
             _zvec_error = str(exc)
             logger.warning("TopicLink Zvec service write failed: %s", exc)
             return False
+    return _write_local_zvec_cache(model, [_embedding_cache_key(model, item)[1] for item in inputs], vectors)
+
+
+def _write_local_zvec_cache(model: str, text_hashes: list[str], vectors: list[list[float]]) -> bool:
+    """Upsert cache vectors into this process's collection, keyed by text hash."""
+    global _zvec_error
+    if not _topiclink_zvec_enabled() or not text_hashes or len(text_hashes) != len(vectors):
+        return False
+    dimensions = _topiclink_zvec_dimensions()
     try:
         import zvec
 
         timestamp = _topiclink_zvec_timestamp()
         documents = []
-        for text_value, vector in zip(inputs, vectors):
+        for text_hash, vector in zip(text_hashes, vectors):
             if len(vector) != dimensions:
                 raise RuntimeError(
                     f"TopicLink Zvec expected {dimensions} dimensions, received {len(vector)}"
                 )
-            cache_key, text_hash = _embedding_cache_key(model, text_value)
+            cache_key = _embedding_cache_key_for_hash(model, text_hash)
             documents.append(
                 zvec.Doc(
                     id=_topiclink_zvec_document_id(cache_key),
@@ -583,42 +684,42 @@ def _write_zvec_cache(model: str, inputs: list[str], vectors: list[list[float]])
 
 
 def _read_zvec_cache(model: str, inputs: list[str]) -> list[list[float] | None]:
+    return _read_zvec_cache_by_hash(model, [_embedding_cache_key(model, item)[1] for item in inputs])
+
+
+def _read_zvec_cache_by_hash(model: str, text_hashes: list[str]) -> list[list[float] | None]:
     global _zvec_error
-    cached: list[list[float] | None] = [None] * len(inputs)
-    if not _topiclink_zvec_enabled() or not inputs:
+    cached: list[list[float] | None] = [None] * len(text_hashes)
+    if not _topiclink_zvec_enabled() or not text_hashes:
         return cached
-    service_url = _topiclink_zvec_service_url()
-    if service_url:
+    if _topiclink_zvec_service_url():
         try:
-            payload = _request_zvec_service(
-                "POST",
-                "/cache/fetch",
-                payload={"model": model, "inputs": inputs},
-            )
-            vectors = payload.get("vectors") if isinstance(payload, dict) else None
-            if not isinstance(vectors, list) or len(vectors) != len(inputs):
-                raise RuntimeError("TopicLink Zvec service returned an invalid cache response")
+            payload = _request_zvec_service("POST", "/v2/cache/fetch", payload={"model": model, "text_hashes": text_hashes})
             _zvec_error = None
-            return [
-                [float(value) for value in vector] if isinstance(vector, list) else None
-                for vector in vectors
-            ]
+            return _zvec_cached_vectors(payload, len(text_hashes))
         except Exception as exc:
             _zvec_error = str(exc)
             logger.warning("TopicLink Zvec service read failed: %s", exc)
             return cached
-    try:
-        import zvec
+    return _read_local_zvec_cache(model, text_hashes)
+
 
+def _read_local_zvec_cache(model: str, text_hashes: list[str]) -> list[list[float] | None]:
+    """Fetch cache vectors from this process's collection in one multi-key lookup."""
+    global _zvec_error
+    cached: list[list[float] | None] = [None] * len(text_hashes)
+    if not _topiclink_zvec_enabled() or not text_hashes:
+        return cached
+    try:
         collection = _ensure_zvec_collection()
         if collection is None:
             return cached
-        cache_keys = [_embedding_cache_key(model, item)[0] for item in inputs]
+        cache_keys = [_embedding_cache_key_for_hash(model, text_hash) for text_hash in text_hashes]
         document_ids = [_topiclink_zvec_document_id(cache_key) for cache_key in cache_keys]
         with _zvec_lock:
             documents = collection.fetch(document_ids, include_vector=True)
         touched_at = _topiclink_zvec_timestamp()
-        touched_documents = []
+        touches = {}
         for index, document_id in enumerate(document_ids):
             document = documents.get(document_id)
             if document is None or str(document.fields.get("model") or "") != model:
@@ -627,17 +728,155 @@ def _read_zvec_cache(model: str, inputs: list[str]) -> list[list[float] | None]:
             if isinstance(vector, list) and vector:
                 cached[index] = [float(value) for value in vector]
                 if str(document.fields.get("last_used_at") or "")[:10] != touched_at[:10]:
-                    touched_documents.append(zvec.Doc(id=document_id, fields={"last_used_at": touched_at}))
-        if touched_documents:
-            with _zvec_lock:
-                _assert_zvec_statuses(collection.update(touched_documents))
-                collection.flush()
+                    touches[document_id] = touched_at
+        if touches and _buffer_zvec_touches(touches) >= ZVEC_TOUCH_BUFFER_LIMIT:
+            flush_topiclink_zvec_touches()
     except Exception as exc:
         _zvec_error = str(exc)
         logger.warning("TopicLink Zvec read failed: %s", exc)
     return cached
 
 
+def _buffer_zvec_touches(touches: dict[str, str]) -> int:
+    """Remember cache hits in memory; ``last_used_at`` is written back in batches."""
+    with _zvec_touch_lock:
+        for document_id, touched_at in touches.items():
+            if _zvec_pending_touches.get(document_id, "") < touched_at:
+                _zvec_pending_touches[document_id] = touched_at
+        return len(_zvec_pending_touches)
+
+
+def _persist_zvec_touches(collection: Any) -> int:
+    """Write buffered ``last_used_at`` values in one update; callers hold ``_zvec_lock``."""
+    import zvec
+
+    with _zvec_touch_lock:
+        touches = dict(_zvec_pending_touches)
+        _zvec_pending_touches.clear()
+    if not touches:
+        return 0
+    try:
+        statuses = collection.update(
+            [zvec.Doc(id=document_id, fields={"last_used_at": touched_at}) for document_id, touched_at in touches.items()]
+        )
+        collection.flush()
+    except Exception:
+        _buffer_zvec_touches(touches)
+        raise
+    # Documents pruned or replaced since the hit report "not found"; there is nothing left to touch.
+    return sum(1 for status in (statuses if isinstance(statuses, list) else [statuses]) if status.ok())
+
+
+def flush_topiclink_zvec_touches() -> int:
+    global _zvec_error
+    if not _topiclink_zvec_enabled() or _topiclink_zvec_service_url():
+        return 0
+    try:
+        collection = _ensure_zvec_collection()
+        if collection is None:
+            return 0
+        with _zvec_lock:
+            return _persist_zvec_touches(collection)
+    except Exception as exc:
+        _zvec_error = str(exc)
+        logger.warning("TopicLink Zvec last-used flush failed: %s", exc)
+        return 0
+
+
+def _topiclink_embedding_lru() -> EmbeddingLRU:
+    global _embedding_lru
+    with _embedding_lru_lock:
+        if _embedding_lru is None:
+            budget_mb = _topiclink_int_env("TOPICLINK_EMBEDDING_LRU_MB", DEFAULT_EMBEDDING_LRU_MB, low=0, high=4096)
+            _embedding_lru = EmbeddingLRU(budget_mb * 1024 * 1024)
+        return _embedding_lru
+
+
+def _embedding_lru_keys(model: str, text_hashes: list[str]) -> list[EmbeddingKey]:
+    dimensions = _topiclink_zvec_dimensions()
+    return [(text_hash, model, dimensions) for text_hash in text_hashes]
+
+
+def _read_embedding_lru(model: str, text_hashes: list[str]) -> list[list[float] | None]:
+    """Serve vectors this worker already holds; local hits still refresh ``last_used_at``."""
+    cached = _topiclink_embedding_lru().get_many(_embedding_lru_keys(model, text_hashes))
+    if _topiclink_zvec_enabled() and not _topiclink_zvec_service_url():
+        touched_at = _topiclink_zvec_timestamp()
+        touches = {
+            _topiclink_zvec_document_id(_embedding_cache_key_for_hash(model, text_hash)): touched_at
+            for text_hash, vector in zip(text_hashes, cached)
+            if vector is not None
+        }
+        if touches and _buffer_zvec_touches(touches) >= ZVEC_TOUCH_BUFFER_LIMIT:
+            flush_topiclink_zvec_touches()
+    return cached
+
+
+def _remember_embeddings(model: str, text_hashes: list[str], vectors: list[list[float] | None]) -> None:
+    _topiclink_embedding_lru().put_many(
+        (key, vector) for key, vector in zip(_embedding_lru_keys(model, text_hashes), vectors) if vector is not None
+    )
+
+
+def _topiclink_embedding_lru_snapshot_path() -> Path:
+    zvec_path = _topiclink_zvec_path()
+    return zvec_path.with_name(f"{zvec_path.name}-lru-keys.json")
+
+
+def save_topiclink_embedding_lru_snapshot() -> int:
+    """Record which cache keys are hot so the next process can warm its LRU."""
+    model = _topiclink_embedding_model()
+    try:
+        dimensions = _topiclink_zvec_dimensions()
+        text_hashes = [
+            text_hash
+            for text_hash, key_model, key_dimensions in _topiclink_embedding_lru().recent_keys()
+            if key_model == model and key_dimensions == dimensions
+        ]
+        if not text_hashes:
+            return 0
+        path = _topiclink_embedding_lru_snapshot_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        staging_path.write_text(
+            json.dumps({"model": model, "dimensions": dimensions, "text_hashes": text_hashes}),
+            encoding="utf-8",
+        )
+        os.replace(staging_path, path)
+        return len(text_hashes)
+    except Exception as exc:
+        logger.warning("TopicLink embedding LRU snapshot failed: %s", exc)
+        return 0
+
+
+def warm_topiclink_embedding_lru() -> int:
+    """Load the most recently used vectors named by the last snapshot."""
+    if not _topiclink_zvec_enabled() or not _topiclink_embedding_lru().max_bytes:
+        return 0
+    model = _topiclink_embedding_model()
+    try:
+        path = _topiclink_embedding_lru_snapshot_path()
+        if not path.exists():
+            return 0
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+        dimensions = _topiclink_zvec_dimensions()
+        if snapshot.get("model") != model or snapshot.get("dimensions") != dimensions:
+            return 0
+        capacity = _topiclink_embedding_lru().max_bytes // (dimensions * 4)
+        text_hashes = [str(text_hash) for text_hash in snapshot.get("text_hashes") or []][:capacity]
+    except Exception as exc:
+        logger.warning("TopicLink embedding LRU snapshot is unreadable: %s", exc)
+        return 0
+    warmed = 0
+    # Insert least recent first so the hottest keys end up at the protected end of the LRU.
+    for end in range(len(text_hashes), 0, -EMBEDDING_LRU_WARM_CHUNK_SIZE):
+        chunk = text_hashes[max(0, end - EMBEDDING_LRU_WARM_CHUNK_SIZE):end][::-1]
+        vectors = _read_zvec_cache_by_hash(model, chunk)
+        _remember_embeddings(model, chunk, vectors)
+        warmed += sum(1 for vector in vectors if vector is not None)
+    return warmed
+
+
 def _prune_zvec_cache(*, force: bool = False, now: datetime | None = None) -> int:
     global _zvec_error, _zvec_last_prune_monotonic
     max_idle_days = _topiclink_zvec_max_idle_days()
@@ -666,6 +905,7 @@ def _prune_zvec_cache(*, force: bool = False, now: datetime | None = None) -> in
             return 0
         cutoff = _topiclink_zvec_timestamp((now or datetime.now(timezone.utc)) - timedelta(days=max_idle_days))
         with _zvec_lock:
+            _persist_zvec_touches(collection)
             before = _topiclink_zvec_doc_count(collection)
             collection.delete_by_filter(f"last_used_at != '' and last_used_at < '{cutoff}'")
             collection.flush()
@@ -682,6 +922,266 @@ def _prune_zvec_cache(*, force: bool = False, now: datetime | None = None) -> in
         return 0
 
 
+def _topiclink_topic_index_path() -> Path:
+    cache_path = _topiclink_zvec_path()
+    return cache_path.with_name(f"{cache_path.name}{ZVEC_TOPIC_INDEX_SUFFIX}")
+
+
+def _topic_index_document_id(topic_id: str) -> str:
+    return hashlib.sha256(f"topic:{topic_id}".encode("utf-8")).hexdigest()
+
+
+def _topic_index_filter_value(value: str | None) -> str | None:
+    """Return a value that is safe to quote inside a Zvec filter, or ``None``."""
+    cleaned = str(value or "").strip().lower()
+    if not cleaned or not re.fullmatch(TOPIC_INDEX_FILTER_VALUE_PATTERN, cleaned):
+        return None
+    return cleaned
+
+
+def _topic_index_entry(topic: dict[str, Any]) -> dict[str, str]:
+    return {
+        "topic_id": str(topic.get("id") or "").strip(),
+        "category": _topic_index_filter_value(topic.get("category")) or "",
+        "status": _topic_index_filter_value(topic.get("status")) or "",
+    }
+
+
+def _ensure_topic_index_collection():
+    """Open the topic-keyed ANN collection that sits next to the embedding cache."""
+    global _topic_index_collection, _topic_index_path
+    if not _topiclink_zvec_enabled():
+        return None
+    path = _topiclink_topic_index_path()
+    dimensions = _topiclink_zvec_dimensions()
+    with _zvec_lock:
+        if _topic_index_collection is not None and _topic_index_path == path:
+            return _topic_index_collection
+        import zvec
+
+        if path.exists():
+            collection = zvec.open(str(path))
+            vector_schema = collection.schema.vector(ZVEC_VECTOR_FIELD)
+            actual_dimensions = None if vector_schema is None else int(vector_schema.dimension)
+            if actual_dimensions != dimensions:
+                raise RuntimeError(
+                    f"TopicLink topic index dimension {actual_dimensions} does not match configured {dimensions}"
+                )
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            schema = zvec.CollectionSchema(
+                name="topiclink_topic_index",
+                fields=[
+                    zvec.FieldSchema("topic_id", zvec.DataType.STRING),
+                    zvec.FieldSchema("model", zvec.DataType.STRING),
+                    zvec.FieldSchema("category", zvec.DataType.STRING, index_param=zvec.InvertIndexParam()),
+                    zvec.FieldSchema("status", zvec.DataType.STRING, index_param=zvec.InvertIndexParam()),
+                    zvec.FieldSchema("updated_at", zvec.DataType.STRING),
+                ],
+                vectors=zvec.VectorSchema(
+                    ZVEC_VECTOR_FIELD,
+                    zvec.DataType.VECTOR_FP32,
+                    dimensions,
+                    index_param=zvec.HnswIndexParam(metric_type=zvec.MetricType.COSINE),
+                ),
+            )
+            collection = zvec.create_and_open(str(path), schema)
+        _topic_index_collection = collection
+        _topic_index_path = path
+        return collection
+
+
+def _write_topic_index(model: str, entries: list[dict[str, str]], vectors: list[list[float]]) -> int:
+    """Upsert one ANN document per topic; returns the number written."""
+    global _zvec_error
+    if not _topiclink_zvec_enabled() or not entries or len(entries) != len(vectors):
+        return 0
+    if _topiclink_zvec_service_url():
+        try:
+            payload = _request_zvec_service(
+                "POST",
+                "/v2/topics/upsert",
+                frame=encode_vector_frame({"model": model, "entries": entries}, vectors),
+            )
+            return int(payload.get("written") or 0)
+        except Exception as exc:
+            logger.warning("TopicLink topic index service write failed: %s", exc)
+            return 0
+    try:
+        import zvec
+
+        dimensions = _topiclink_zvec_dimensions()
+        timestamp = _topiclink_zvec_timestamp()
+        documents = [
+            zvec.Doc(
+                id=_topic_index_document_id(entry["topic_id"]),
+                vectors={ZVEC_VECTOR_FIELD: vector},
+                fields={
+                    "topic_id": entry["topic_id"],
+                    "model": model,
+                    "category": entry.get("category") or "",
+                    "status": entry.get("status") or "",
+                    "updated_at": timestamp,
+                },
+            )
+            for entry, vector in zip(entries, vectors)
+            if entry.get("topic_id") and len(vector) == dimensions
+        ]
+        if not documents:
+            return 0
+        collection = _ensure_topic_index_collection()
+        if collection is None:
+            return 0
+        with _zvec_lock:
+            _assert_zvec_statuses(collection.upsert(documents))
+            collection.flush()
+        return len(documents)
+    except Exception as exc:
+        _zvec_error = str(exc)
+        logger.warning("TopicLink topic index write failed: %s", exc)
+        return 0
+
+
+def _delete_topic_index(topic_ids: list[str]) -> None:
+    topic_ids = [topic_id for topic_id in topic_ids if topic_id]
+    if not _topiclink_zvec_enabled() or not topic_ids:
+        return
+    if _topiclink_zvec_service_url():
+        try:
+            _request_zvec_service("POST", "/topics/delete", payload={"topic_ids": topic_ids})
+        except Exception as exc:
+            logger.warning("TopicLink topic index service delete failed: %s", exc)
+        return
+    try:
+        collection = _ensure_topic_index_collection()
+        if collection is None:
+            return
+        with _zvec_lock:
+            collection.delete([_topic_index_document_id(topic_id) for topic_id in topic_ids])
+            collection.flush()
+    except Exception as exc:
+        logger.warning("TopicLink topic index delete failed: %s", exc)
+
+
+def _topic_index_query_frame(
+    model: str,
+    vector: list[float],
+    *,
+    limit: int,
+    exclude_topic_id: str | None,
+    category: str | None,
+    status: str | None,
+) -> bytes:
+    return encode_vector_frame(
+        {
+            "model": model,
+            "limit": limit,
+            "exclude_topic_id": exclude_topic_id,
+            "category": category,
+            "status": status,
+        },
+        [vector],
+    )
+
+
+def _topic_index_hits(payload: Any) -> list[dict[str, Any]] | None:
+    hits = payload.get("items") if isinstance(payload, dict) else None
+    return hits if isinstance(hits, list) else None
+
+
+async def _query_topic_index_async(
+    model: str,
+    vector: list[float],
+    *,
+    limit: int,
+    exclude_topic_id: str | None = None,
+    category: str | None = None,
+    status: str | None = None,
+) -> list[dict[str, Any]] | None:
+    """Query the topic index without tying up a worker thread when the sidecar serves it."""
+    filters = {"limit": limit, "exclude_topic_id": exclude_topic_id, "category": category, "status": status}
+    if not _topiclink_zvec_enabled() or not _topiclink_zvec_service_url():
+        return await asyncio.to_thread(_query_topic_index, model, vector, **filters)
+    try:
+        return _topic_index_hits(
+            await _request_zvec_service_async("POST", "/v2/topics/query", frame=_topic_index_query_frame(model, vector, **filters))
+        )
+    except Exception as exc:
+        logger.warning("TopicLink topic index service query failed: %s", exc)
+        return None
+
+
+def _query_topic_index(
+    model: str,
+    vector: list[float],
+    *,
+    limit: int,
+    exclude_topic_id: str | None = None,
+    category: str | None = None,
+    status: str | None = None,
+) -> list[dict[str, Any]] | None:
+    """Return ``{topic_id, category, similarity}`` hits best-first, or ``None`` when unavailable."""
+    if not _topiclink_zvec_enabled():
+        return None
+    if _topiclink_zvec_service_url():
+        try:
+            return _topic_index_hits(
+                _request_zvec_service(
+                    "POST",
+                    "/v2/topics/query",
+                    frame=_topic_index_query_frame(
+                        model,
+                        vector,
+                        limit=limit,
+                        exclude_topic_id=exclude_topic_id,
+                        category=category,
+                        status=status,
+                    ),
+                )
+            )
+        except Exception as exc:
+            logger.warning("TopicLink topic index service query failed: %s", exc)
+            return None
+    clauses = [f"model = '{model}'"] if re.fullmatch(TOPIC_INDEX_FILTER_VALUE_PATTERN, model) else []
+    clauses.extend(f"category != '{excluded}'" for excluded in sorted(TOPICLINK_EXCLUDED_CATEGORIES))
+    for field_name, value in (("category", category), ("status", status)):
+        safe_value = _topic_index_filter_value(value)
+        if value and safe_value is None:
+            return []
+        if safe_value:
+            clauses.append(f"{field_name} = '{safe_value}'")
+    try:
+        import zvec
+
+        collection = _ensure_topic_index_collection()
+        if collection is None:
+            return None
+        with _zvec_lock:
+            documents = collection.query(
+                zvec.Query(field_name=ZVEC_VECTOR_FIELD, vector=vector),
+                topk=limit + (1 if exclude_topic_id else 0),
+                filter=" and ".join(clauses) or None,
+                output_fields=["topic_id", "model", "category"],
+            )
+    except Exception as exc:
+        logger.warning("TopicLink topic index query failed: %s", exc)
+        return None
+    hits = []
+    for document in documents:
+        topic_id = str(document.fields.get("topic_id") or "")
+        if not topic_id or topic_id == exclude_topic_id or str(document.fields.get("model") or "") != model:
+            continue
+        hits.append(
+            {
+                "topic_id": topic_id,
+                "category": str(document.fields.get("category") or ""),
+                # Zvec reports cosine distance; recommendations score similarity.
+                "similarity": 1.0 - float(document.score),
+            }
+        )
+    return hits[:limit]
+
+
 def _ensure_embedding_cache_table(session, *, force: bool = False) -> None:
     """Keep the explicit legacy import script compatible; runtime does not call this."""
     global _embedding_cache_ready
@@ -731,6 +1231,9 @@ def initialize_topiclink_storage() -> int:
         collection_ready = 1 if _ensure_zvec_collection() is not None else 0
     with get_db_session() as session:
         _ensure_topiclink_agent_tasks_table(session)
+    warmed = warm_topiclink_embedding_lru()
+    if warmed:
+        logger.info("TopicLink embedding LRU warmed with %s vectors", warmed)
     logger.info(
         "TopicLink Zvec store ready via %s",
         _topiclink_zvec_service_url() or _zvec_collection_path,
@@ -765,7 +1268,13 @@ def topiclink_ready_health():
             status_code=503,
             content={"status": "not_ready", "service": "topiclink", "zvec": "error"},
         )
-    return {"status": "ready", "service": "topiclink", "zvec": "ok"}
+    return {
+        "status": "ready",
+        "service": "topiclink",
+        "zvec": "ok",
+        "embedding_lru": _topiclink_embedding_lru().stats(),
+        "metadata_worker": topiclink_metadata_worker_status(),
+    }
 
 
 def _ensure_presence_table(session) -> None:
@@ -1968,62 +2477,114 @@ def _transition_topiclink_agent_task(
 
 
 def _read_embedding_cache(model: str, inputs: list[str]) -> list[list[float] | None]:
-    return _read_zvec_cache(model, inputs)
+    text_hashes = [_embedding_cache_key(model, item)[1] for item in inputs]
+    cached = _read_embedding_lru(model, text_hashes)
+    missing_indexes = [index for index, vector in enumerate(cached) if vector is None]
+    if missing_indexes:
+        fetched = _read_zvec_cache(model, [inputs[index] for index in missing_indexes])
+        _remember_embeddings(model, [text_hashes[index] for index in missing_indexes], fetched)
+        for index, vector in zip(missing_indexes, fetched):
+            cached[index] = vector
+    return cached
 
 
 def _write_embedding_cache(model: str, inputs: list[str], vectors: list[list[float]]) -> None:
     if not inputs or len(inputs) != len(vectors):
         return
+    _remember_embeddings(model, [_embedding_cache_key(model, item)[1] for item in inputs], vectors)
     _write_zvec_cache(model, inputs, vectors)
 
 
+async def _read_embedding_cache_async(model: str, inputs: list[str]) -> list[list[float] | None]:
+    global _zvec_error
+    if not inputs or not _topiclink_zvec_enabled() or not _topiclink_zvec_service_url():
+        return await asyncio.to_thread(_read_embedding_cache, model, inputs)
+    text_hashes = [_embedding_cache_key(model, item)[1] for item in inputs]
+    cached = _read_embedding_lru(model, text_hashes)
+    missing_indexes = [index for index, vector in enumerate(cached) if vector is None]
+    if not missing_indexes:
+        return cached
+    missing_hashes = [text_hashes[index] for index in missing_indexes]
+    try:
+        payload = await _request_zvec_service_async(
+            "POST",
+            "/v2/cache/fetch",
+            payload={"model": model, "text_hashes": missing_hashes},
+        )
+        _zvec_error = None
+        fetched = _zvec_cached_vectors(payload, len(missing_indexes))
+    except Exception as exc:
+        _zvec_error = str(exc)
+        logger.warning("TopicLink Zvec service read failed: %s", exc)
+        return cached
+    _remember_embeddings(model, missing_hashes, fetched)
+    for index, vector in zip(missing_indexes, fetched):
+        cached[index] = vector
+    return cached
+
+
+async def _write_embedding_cache_async(model: str, inputs: list[str], vectors: list[list[float]]) -> None:
+    global _zvec_error
+    if not inputs or len(inputs) != len(vectors):
+        return
+    if _topiclink_zvec_enabled() and _topiclink_zvec_service_url():
+        _remember_embeddings(model, [_embedding_cache_key(model, item)[1] for item in inputs], vectors)
+        try:
+            await _request_zvec_service_async("POST", "/v2/cache/upsert", frame=_zvec_cache_upsert_frame(model, inputs, vectors))
+            _zvec_error = None
+        except Exception as exc:
+            _zvec_error = str(exc)
+            logger.warning("TopicLink Zvec service write failed: %s", exc)
+        return
+    await asyncio.to_thread(
+        _write_embedding_cache,
+        model,
+        inputs,
+        vectors,
+    )
+
+
+def _topiclink_embedding_model() -> str:
+    return os.getenv("TOPICLINK_EMBEDDING_MODEL") or DEFAULT_EMBEDDING_MODEL
+
+
+def _topiclink_embedding_api_key() -> str | None:
+    return os.getenv("TOPICLINK_EMBEDDING_API_KEY") or os.getenv("SCNET_API_KEY")
+
+
+def _topiclink_embedding_endpoint(model: str, api_key: str) -> EmbeddingEndpoint:
+    base_url = os.getenv("TOPICLINK_EMBEDDING_BASE_URL") or os.getenv("SCNET_BASE_URL") or "https://api.scnet.cn/api/llm/v1"
+    return EmbeddingEndpoint(
+        base_url=base_url.rstrip("/"),
+        api_key=api_key,
+        model=model,
+        max_batch_size=max(1, min(32, int(os.getenv("TOPICLINK_EMBEDDING_BATCH_SIZE", str(DEFAULT_EMBEDDING_BATCH_SIZE))))),
+        max_concurrency=max(1, min(16, int(os.getenv("TOPICLINK_EMBEDDING_CONCURRENCY", str(DEFAULT_EMBEDDING_CONCURRENCY))))),
+    )
+
+
 async def _try_remote_embeddings(texts: list[str]) -> list[list[float]] | None:
-    model = os.getenv("TOPICLINK_EMBEDDING_MODEL") or DEFAULT_EMBEDDING_MODEL
+    model = _topiclink_embedding_model()
     max_chars = max(200, min(12000, int(os.getenv("TOPICLINK_EMBEDDING_TEXT_CHARS", str(DEFAULT_EMBEDDING_TEXT_CHARS)))))
     inputs = [_normalize_embedding_input(text, max_chars) for text in texts]
-    cached_vectors = await asyncio.to_thread(_read_embedding_cache, model, inputs)
+    cached_vectors = await _read_embedding_cache_async(model, inputs)
     if cached_vectors and all(vector is not None for vector in cached_vectors):
         return [vector for vector in cached_vectors if vector is not None]
 
-    api_key = os.getenv("TOPICLINK_EMBEDDING_API_KEY") or os.getenv("SCNET_API_KEY")
+    api_key = _topiclink_embedding_api_key()
     if not api_key:
         return None
 
-    base_url = (os.getenv("TOPICLINK_EMBEDDING_BASE_URL") or os.getenv("SCNET_BASE_URL") or "https://api.scnet.cn/api/llm/v1").rstrip("/")
-    batch_size = max(1, min(32, int(os.getenv("TOPICLINK_EMBEDDING_BATCH_SIZE", str(DEFAULT_EMBEDDING_BATCH_SIZE)))))
     missing_indexes = [index for index, vector in enumerate(cached_vectors) if vector is None]
     missing_inputs = [inputs[index] for index in missing_indexes]
-    fetched_vectors: list[list[float]] = []
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            for start in range(0, len(missing_inputs), batch_size):
-                batch = missing_inputs[start:start + batch_size]
-                res = await client.post(
-                    f"{base_url}/embeddings",
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    json={"model": model, "input": batch},
-                )
-                res.raise_for_status()
-                payload = res.json()
-                data = payload.get("data") if isinstance(payload, dict) else None
-                if not isinstance(data, list) or len(data) != len(batch):
-                    return None
-                for item in data:
-                    embedding = item.get("embedding") if isinstance(item, dict) else None
-                    if not isinstance(embedding, list):
-                        return None
-                    fetched_vectors.append([float(value) for value in embedding])
+        fetched_vectors = await _embedding_batcher.embed(_topiclink_embedding_endpoint(model, api_key), missing_inputs)
     except Exception:
         return None
 
     if len(fetched_vectors) != len(missing_inputs):
         return None
-    await asyncio.to_thread(
-        _write_embedding_cache,
-        model,
-        missing_inputs,
-        fetched_vectors,
-    )
+    await _write_embedding_cache_async(model, missing_inputs, fetched_vectors)
     merged = list(cached_vectors)
     for index, vector in zip(missing_indexes, fetched_vectors):
         merged[index] = vector
@@ -2147,7 +2708,105 @@ def _topiclink_background_llm_delay_seconds() -> float:
     )
 
 
-def _topiclink_role_for_topic(topic: dict[str, Any]) -> dict[str, str]:
+def _topiclink_background_catch_up_interval_seconds() -> float:
+    return _topiclink_float_env(
+        "TOPICLINK_METADATA_CATCH_UP_INTERVAL_SECONDS",
+        DEFAULT_METADATA_CATCH_UP_INTERVAL_SECONDS,
+        low=0.0,
+        high=3600.0,
+    )
+
+
+def _topiclink_worker_lease_seconds() -> float:
+    return _topiclink_float_env(
+        "TOPICLINK_METADATA_WORKER_LEASE_SECONDS",
+        DEFAULT_METADATA_WORKER_LEASE_SECONDS,
+        low=30.0,
+        high=86400.0,
+    )
+
+
+def _topiclink_metadata_limit() -> AdaptiveConcurrencyLimit:
+    global _metadata_worker_limit
+    if _metadata_worker_limit is None:
+        _metadata_worker_limit = AdaptiveConcurrencyLimit(
+            maximum=_topiclink_int_env(
+                "TOPICLINK_METADATA_BACKGROUND_MAX_CONCURRENCY",
+                DEFAULT_METADATA_BACKGROUND_MAX_CONCURRENCY,
+                low=1,
+                high=32,
+            ),
+            latency_target_seconds=_topiclink_float_env(
+                "TOPICLINK_METADATA_LLM_LATENCY_TARGET_SECONDS",
+                DEFAULT_METADATA_LLM_LATENCY_TARGET_SECONDS,
+                low=1.0,
+                high=120.0,
+            ),
+        )
+    return _metadata_worker_limit
+
+
+def _observe_topiclink_chat_latency(elapsed_seconds: float, *, throttled: bool) -> None:
+    if _metadata_worker_limit is not None:
+        _metadata_worker_limit.record(elapsed_seconds, throttled=throttled)
+
+
+async def _hold_topiclink_worker_lease() -> bool:
+    try:
+        # Only the lease holder runs the shared passes; renewing it also extends a long pass.
+        leader = await asyncio.to_thread(
+            acquire_worker_lease,
+            TOPICLINK_WORKER_LEASE_NAME,
+            _metadata_worker_owner,
+            _topiclink_worker_lease_seconds(),
+        )
+    except Exception:
+        logger.info("TopicLink worker lease is unavailable; skipping shared passes", exc_info=True)
+        leader = False
+    if leader != _metadata_worker_status["leader"]:
+        logger.info("TopicLink background worker %s the lease", "acquired" if leader else "does not hold")
+    _metadata_worker_status["leader"] = leader
+    return leader
+
+
+def _count_topiclink_metadata_backlog() -> int:
+    """Topics still missing TopicLink metadata, capped at ``METADATA_BACKLOG_COUNT_LIMIT``.
+
+    Title markers are only applied during the pass.
+    """
+    with get_db_session() as session:
+        if session.bind.dialect.name == "sqlite":
+            missing = "(t.metadata IS NULL OR NOT json_valid(t.metadata) OR json_extract(t.metadata, '$.topic_link') IS NULL)"
+        else:
+            missing = "(t.metadata IS NULL OR t.metadata -> 'topic_link' IS NULL)"
+        statement = text(
+            f"""
+            SELECT COUNT(*) FROM (
+                SELECT 1 FROM topics t
+                WHERE {missing}
+                  AND LOWER(COALESCE(t.category, '')) NOT IN :excluded
+                  AND (COALESCE(t.title, '') <> '' OR COALESCE(t.body, '') <> '')
+                LIMIT :cap
+            ) backlog
+            """
+        ).bindparams(bindparam("excluded", expanding=True))
+        return int(
+            session.execute(
+                statement,
+                {"excluded": sorted(TOPICLINK_EXCLUDED_CATEGORIES), "cap": METADATA_BACKLOG_COUNT_LIMIT},
+            ).scalar_one()
+        )
+
+
+def topiclink_metadata_worker_status() -> dict[str, Any]:
+    limit = _metadata_worker_limit
+    return {
+        **_metadata_worker_status,
+        "concurrency": limit.stats() if limit is not None else None,
+    }
+
+
+def _topiclink_role_for_topic(topic: dict[str, Any]) -> dict[str, str]:
     category = str(topic.get("category") or "plaza").strip().lower()
     return TOPICLINK_CATEGORY_ROLES.get(
         category,
@@ -2339,6 +2998,7 @@ async def _try_remote_topiclink_metadata(topic: dict[str, Any]) -> dict[str, Any
   "digest": "60 个汉字以内，概括这桌正在聊什么"
 }}
 """
+    started = time.monotonic()
     try:
         async with httpx.AsyncClient(timeout=45.0) as client:
             response = await client.post(
@@ -2355,8 +3015,16 @@ async def _try_remote_topiclink_metadata(topic: dict[str, Any]) -> dict[str, Any
                     "response_format": {"type": "json_object"},
                 },
             )
+            _observe_topiclink_chat_latency(
+                time.monotonic() - started,
+                throttled=response.status_code in {429, 502, 503, 504},
+            )
             response.raise_for_status()
             payload = response.json()
+    except httpx.TransportError:
+        _observe_topiclink_chat_latency(time.monotonic() - started, throttled=True)
+        logger.info("TopicLink metadata LLM fallback used", exc_info=True)
+        return None
     except Exception:
         logger.info("TopicLink metadata LLM fallback used", exc_info=True)
         return None
@@ -2508,6 +3176,12 @@ async def _run_topiclink_embedding_background_pass() -> dict[str, int]:
     vectors = await _try_remote_embeddings([_topic_text(topic) for topic in all_topics])
     if vectors is None:
         return {"scanned": scanned, "indexed": 0}
+    await asyncio.to_thread(
+        _write_topic_index,
+        _topiclink_embedding_model(),
+        [_topic_index_entry(topic) for topic in eligible],
+        vectors[: len(eligible)],
+    )
     logger.info(
         "TopicLink embedding background pass indexed %s topic(s) and %s public OPC demand(s)",
         len(eligible),
@@ -2516,6 +3190,49 @@ async def _run_topiclink_embedding_background_pass() -> dict[str, int]:
     return {"scanned": scanned, "indexed": len(all_topics)}
 
 
+def _load_topics_for_index(topic_ids: list[str]) -> list[tuple[str, dict[str, Any] | None]]:
+    loaded = []
+    for topic_id in topic_ids:
+        try:
+            topic = get_topic(topic_id)
+        except SQLAlchemyError:
+            logger.info("TopicLink topic index refresh skipped because topic storage is not ready")
+            return []
+        loaded.append((topic_id, topic if isinstance(topic, dict) else None))
+    return loaded
+
+
+async def refresh_topiclink_topic_index(topic_ids: list[str]) -> int:
+    """Re-embed written topics into the ANN index, or drop ones that are gone or excluded."""
+    if not _topiclink_zvec_enabled() or not _topiclink_embedding_api_key():
+        return 0
+    try:
+        loaded = await asyncio.to_thread(_load_topics_for_index, [topic_id for topic_id in topic_ids if topic_id])
+        eligible = [
+            topic
+            for _, topic in loaded
+            if topic is not None and (_topiclink_has_metadata(topic) or _topiclink_is_autofill_candidate(topic))
+        ]
+        eligible_ids = {str(topic.get("id") or "") for topic in eligible}
+        removed = [topic_id for topic_id, _ in loaded if topic_id not in eligible_ids]
+        if removed:
+            await asyncio.to_thread(_delete_topic_index, removed)
+        if not eligible:
+            return 0
+        vectors = await _try_remote_embeddings([_topic_text(topic) for topic in eligible])
+        if vectors is None:
+            return 0
+        return await asyncio.to_thread(
+            _write_topic_index,
+            _topiclink_embedding_model(),
+            [_topic_index_entry(topic) for topic in eligible],
+            vectors,
+        )
+    except Exception:
+        logger.info("TopicLink topic index refresh failed", exc_info=True)
+        return 0
+
+
 async def _run_topiclink_metadata_background_pass() -> dict[str, int]:
     global _metadata_worker_cursor
 
@@ -2528,20 +3245,20 @@ async def _run_topiclink_metadata_background_pass() -> dict[str, int]:
         return {"scanned": 0, "written": 0}
 
     scanned = 0
-    written = 0
+    candidates: list[dict[str, Any]] = []
     pages_seen = 0
     cursor = _metadata_worker_cursor
     max_pages = max(1, math.ceil(max_writes * 3 / page_size) + 2)
 
-    while written < max_writes and pages_seen < max_pages:
+    while len(candidates) < max_writes and pages_seen < max_pages:
         try:
             page = list_topics(limit=page_size, cursor=cursor)
         except SQLAlchemyError:
             logger.info("TopicLink metadata background pass skipped because topic storage is not ready")
-            return {"scanned": scanned, "written": written}
+            return {"scanned": scanned, "written": 0}
         except Exception:
             logger.info("TopicLink metadata background pass failed", exc_info=True)
-            return {"scanned": scanned, "written": written}
+            return {"scanned": scanned, "written": 0}
 
         items = page.get("items", []) if isinstance(page, dict) else []
         next_cursor = page.get("next_cursor") if isinstance(page, dict) else None
@@ -2551,55 +3268,107 @@ async def _run_topiclink_metadata_background_pass() -> dict[str, int]:
             break
 
         for topic in items:
-            if written >= max_writes:
+            if len(candidates) >= max_writes:
                 break
             if not isinstance(topic, dict):
                 continue
             scanned += 1
             if _topiclink_has_metadata(topic) or not _topiclink_is_autofill_candidate(topic):
                 continue
-            topic_link = await _build_background_topiclink_metadata(topic)
-            merged = _merge_topiclink_metadata_payload(topic, topic_link)
-            if merged is None:
-                continue
-            topic_id = str(topic.get("id") or "").strip()
-            if _persist_topiclink_metadata(topic_id, merged):
-                written += 1
-                await _sleep_until_topiclink_worker_tick(_topiclink_background_llm_delay_seconds())
+            candidates.append(topic)
 
         cursor = str(next_cursor or "").strip() or None
         if cursor is None:
             break
 
+    limit = _topiclink_metadata_limit()
+
+    async def fill(topic: dict[str, Any]) -> bool:
+        async with limit.slot():
+            throttled_before = limit.throttled
+            topic_link = await _build_background_topiclink_metadata(topic)
+            merged = _merge_topiclink_metadata_payload(topic, topic_link)
+            persisted = merged is not None and bool(
+                await asyncio.to_thread(_persist_topiclink_metadata, str(topic.get("id") or "").strip(), merged)
+            )
+            if limit.throttled > throttled_before:
+                # Hold the slot through the pause so a throttled upstream sees fewer callers.
+                await _sleep_until_topiclink_worker_tick(_topiclink_background_llm_delay_seconds())
+            return persisted
+
+    results: list[Any] = []
+    batch_size = limit.maximum
+    for start in range(0, len(candidates), batch_size):
+        # A long pass renews the lease between batches; a worker that lost it stops writing.
+        if start and not await _hold_topiclink_worker_lease():
+            cursor = _metadata_worker_cursor
+            break
+        batch = candidates[start : start + batch_size]
+        results += await asyncio.gather(*(fill(topic) for topic in batch), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+        if isinstance(result, Exception):
+            logger.info("TopicLink metadata background fill failed", exc_info=result)
+    written = sum(1 for result in results if result is True)
+
     _metadata_worker_cursor = cursor
+    try:
+        backlog = await asyncio.to_thread(_count_topiclink_metadata_backlog)
+    except Exception:
+        backlog = None
+    _metadata_worker_status.update(
+        backlog=backlog,
+        written=written,
+        last_pass_at=_topiclink_zvec_timestamp(),
+    )
     if written:
-        logger.info("TopicLink metadata background pass wrote %s topic(s) after scanning %s", written, scanned)
+        logger.info(
+            "TopicLink metadata background pass wrote %s topic(s) after scanning %s; backlog %s, concurrency %s",
+            written,
+            scanned,
+            backlog,
+            limit.limit,
+        )
     return {"scanned": scanned, "written": written}
 
 
 async def _run_topiclink_zvec_maintenance_pass() -> dict[str, int]:
-    return {"deleted": _prune_zvec_cache()}
+    touched = flush_topiclink_zvec_touches()
+    return {"touched": touched, "deleted": _prune_zvec_cache()}
 
 
 async def _topiclink_metadata_worker_loop() -> None:
     if not await _sleep_until_topiclink_worker_tick(_topiclink_background_initial_delay_seconds()):
         return
     while _metadata_worker_stop is not None and not _metadata_worker_stop.is_set():
-        for label, run_pass in (
-            ("zvec-prune", _run_topiclink_zvec_maintenance_pass),
-            ("embedding", _run_topiclink_embedding_background_pass),
-            ("metadata", _run_topiclink_metadata_background_pass),
-        ):
+        passes = [("zvec-prune", _run_topiclink_zvec_maintenance_pass)]
+        # The Zvec buffer is per process; topic backfills are shared work, so only the lease holder runs them.
+        if await _hold_topiclink_worker_lease():
+            passes += [
+                ("embedding", _run_topiclink_embedding_background_pass),
+                ("metadata", _run_topiclink_metadata_background_pass),
+            ]
+        for label, run_pass in passes:
             try:
                 await run_pass()
             except asyncio.CancelledError:
                 raise
             except Exception:
                 logger.info("TopicLink %s background worker iteration failed", label, exc_info=True)
-        if not await _sleep_until_topiclink_worker_tick(_topiclink_background_interval_seconds()):
+        if not await _sleep_until_topiclink_worker_tick(_topiclink_worker_next_tick_seconds()):
             return
 
 
+def _topiclink_worker_next_tick_seconds() -> float:
+    """Come back quickly while a backlog is draining, otherwise wait the full interval."""
+    interval = _topiclink_background_interval_seconds()
+    status = _metadata_worker_status
+    if status["leader"] and status["backlog"] and status["written"]:
+        return min(interval, _topiclink_background_catch_up_interval_seconds())
+    return interval
+
+
 def start_topiclink_metadata_worker() -> None:
     global _metadata_worker_task, _metadata_worker_stop
     if _topiclink_zvec_service_url():
@@ -2621,7 +3390,7 @@ def start_topiclink_metadata_worker() -> None:
 
 
 async def stop_topiclink_metadata_worker() -> None:
-    global _metadata_worker_task, _metadata_worker_stop
+    global _metadata_worker_task, _metadata_worker_stop, _metadata_worker_limit
     task = _metadata_worker_task
     stop_event = _metadata_worker_stop
     _metadata_worker_task = None
@@ -2632,6 +3401,15 @@ async def stop_topiclink_metadata_worker() -> None:
         task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await task
+    _metadata_worker_limit = None
+    if _metadata_worker_status["leader"]:
+        _metadata_worker_status["leader"] = False
+        try:
+            await asyncio.to_thread(release_worker_lease, TOPICLINK_WORKER_LEASE_NAME, _metadata_worker_owner)
+        except Exception:
+            logger.info("TopicLink worker lease release failed; it will expire", exc_info=True)
+    await asyncio.to_thread(flush_topiclink_zvec_touches)
+    await asyncio.to_thread(save_topiclink_embedding_lru_snapshot)
 
 
 def _fallback_simulation(topic: dict[str, Any], persona: str, provider_status: str = "unconfigured", message: str | None = None) -> dict[str, Any]:
@@ -2686,11 +3464,7 @@ def _parse_chat_json(content: str) -> dict[str, Any] | None:
     return payload if isinstance(payload, dict) else None
 
 
-async def _try_remote_simulation(topic: dict[str, Any], req: TopicLinkSimulationRequest | None, persona: str) -> dict[str, Any] | None:
-    config = _topiclink_chat_config()
-    if not config:
-        return None
-    base_url, api_key, model = config
+def _simulation_messages(topic: dict[str, Any], req: TopicLinkSimulationRequest | None, persona: str) -> list[dict[str, str]]:
     profile_text = _compact_visible_text(req.profile_text if req else "", 1600)
     title = _compact_visible_text(topic.get("title"), 180)
     body = _compact_visible_text(topic.get("body"), 1400)
@@ -2721,35 +3495,13 @@ async def _try_remote_simulation(topic: dict[str, Any], req: TopicLinkSimulation
 输出格式：
 {{"summary":"一句内部参与判断","message":"公开第一句回应","suggested_action":"下一步动作"}}
 """
-    try:
-        async with httpx.AsyncClient(timeout=45.0) as client:
-            response = await client.post(
-                f"{base_url}/chat/completions",
-                headers={"Authorization": f"Bearer {api_key}"},
-                json={
-                    "model": model,
-                    "messages": [
-                        {"role": "system", "content": "你帮助认知分身判断怎样自然参与 TopicLab 讨论。"},
-                        {"role": "user", "content": prompt},
-                    ],
-                    "temperature": 0.45,
-                    "max_tokens": 700,
-                },
-            )
-            response.raise_for_status()
-            payload = response.json()
-    except Exception:
-        logger.info("TopicLink chat simulation fallback used", exc_info=True)
-        return None
+    return [
+        {"role": "system", "content": "你帮助认知分身判断怎样自然参与 TopicLab 讨论。"},
+        {"role": "user", "content": prompt},
+    ]
 
-    content = ""
-    try:
-        choices = payload.get("choices") if isinstance(payload, dict) else None
-        first = choices[0] if isinstance(choices, list) and choices else {}
-        message = first.get("message") if isinstance(first, dict) else None
-        content = str(message.get("content") if isinstance(message, dict) else first.get("text") or "")
-    except Exception:
-        content = ""
+
+def _simulation_result(topic: dict[str, Any], persona: str, model: str, content: str) -> dict[str, Any] | None:
     parsed = _parse_chat_json(content)
     if parsed:
         summary = _compact_visible_text(parsed.get("summary"), 240)
@@ -2777,6 +3529,123 @@ async def _try_remote_simulation(topic: dict[str, Any], req: TopicLinkSimulation
     }
 
 
+async def _try_remote_simulation(topic: dict[str, Any], req: TopicLinkSimulationRequest | None, persona: str) -> dict[str, Any] | None:
+    config = _topiclink_chat_config()
+    if not config:
+        return None
+    base_url, api_key, model = config
+    try:
+        async with httpx.AsyncClient(timeout=45.0) as client:
+            response = await client.post(
+                f"{base_url}/chat/completions",
+                headers={"Authorization": f"Bearer {api_key}"},
+                json={
+                    "model": model,
+                    "messages": _simulation_messages(topic, req, persona),
+                    "temperature": SIMULATION_TEMPERATURE,
+                    "max_tokens": SIMULATION_MAX_TOKENS,
+                },
+            )
+            response.raise_for_status()
+            payload = response.json()
+    except Exception:
+        logger.info("TopicLink chat simulation fallback used", exc_info=True)
+        return None
+    return _simulation_result(topic, persona, model, _chat_completion_content(payload))
+
+
+def _chat_completion_content(payload: Any) -> str:
+    try:
+        choices = payload.get("choices") if isinstance(payload, dict) else None
+        first = choices[0] if isinstance(choices, list) and choices else {}
+        message = first.get("message") if isinstance(first, dict) else None
+        return str(message.get("content") if isinstance(message, dict) else first.get("text") or "")
+    except Exception:
+        return ""
+
+
+async def _stream_topiclink_chat(
+    config: tuple[str, str, str],
+    messages: list[dict[str, str]],
+    *,
+    temperature: float,
+    max_tokens: int,
+    timeout: float,
+) -> AsyncIterator[str]:
+    """Yield content deltas of a streaming chat completion.
+
+    Closing the generator closes the upstream response, so a caller that stops
+    reading (client disconnect) also stops the generation it was paying for.
+    """
+    base_url, api_key, model = config
+    client = get_shared_async_client(TOPICLINK_CHAT_CLIENT_NAME)
+    async with client.stream(
+        "POST",
+        f"{base_url}/chat/completions",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+        },
+        timeout=timeout,
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            try:
+                chunk = json.loads(data)
+            except ValueError:
+                continue
+            choices = chunk.get("choices") if isinstance(chunk, dict) else None
+            first = choices[0] if isinstance(choices, list) and choices else {}
+            delta = first.get("delta") if isinstance(first, dict) else None
+            piece = delta.get("content") if isinstance(delta, dict) else None
+            if isinstance(piece, str) and piece:
+                yield piece
+
+
+def _topiclink_stream_event(event: str, payload: dict[str, Any]) -> str:
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def _topiclink_event_stream(
+    produce: Callable[[Callable[[str, dict[str, Any]], Awaitable[None]]], Awaitable[None]],
+) -> AsyncIterator[str]:
+    """Run ``produce(emit)`` in a task and forward what it emits as SSE; disconnecting cancels it."""
+    queue: asyncio.Queue[tuple[str, dict[str, Any]] | None] = asyncio.Queue()
+
+    async def emit(event: str, payload: dict[str, Any]) -> None:
+        await queue.put((event, payload))
+
+    async def run() -> None:
+        try:
+            await produce(emit)
+        except Exception:
+            logger.info("TopicLink stream failed", exc_info=True)
+            await queue.put(("error", {"message": "暂时不可用，请稍后重试。"}))
+        finally:
+            await queue.put(None)
+
+    task = asyncio.create_task(run())
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            yield _topiclink_stream_event(item[0], item[1])
+    finally:
+        if not task.done():
+            task.cancel()
+
+
 def _fallback_knowledge_answer(query: str, topics: list[dict[str, Any]]) -> str:
     titles = [_compact_visible_text(topic.get("title") or topic.get("body") or "一桌讨论", 42) for topic in topics[:3]]
     titles = [title for title in titles if title]
@@ -2789,11 +3658,7 @@ def _fallback_knowledge_answer(query: str, topics: list[dict[str, Any]]) -> str:
     return f"先看「{titles[0]}」；另外「{titles[1]}」和「{titles[2]}」也能顺手对照。"
 
 
-async def _try_remote_knowledge_answer(query: str, topics: list[dict[str, Any]]) -> str | None:
-    config = _topiclink_chat_config()
-    if not config or not topics:
-        return None
-    base_url, api_key, model = config
+def _knowledge_answer_messages(query: str, topics: list[dict[str, Any]]) -> list[dict[str, str]]:
     snippets = []
     for index, topic in enumerate(topics[:5], start=1):
         snippets.append(
@@ -2819,6 +3684,17 @@ async def _try_remote_knowledge_answer(query: str, topics: list[dict[str, Any]])
 - 不编造候选话题里没有的信息。
 - 告诉用户先看哪一桌，以及为什么顺手看另一桌。
 """
+    return [
+        {"role": "system", "content": "你帮用户把知识库里检索到的话题讲成人话。"},
+        {"role": "user", "content": prompt},
+    ]
+
+
+async def _try_remote_knowledge_answer(query: str, topics: list[dict[str, Any]]) -> str | None:
+    config = _topiclink_chat_config()
+    if not config or not topics:
+        return None
+    base_url, api_key, model = config
     try:
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.post(
@@ -2826,12 +3702,9 @@ async def _try_remote_knowledge_answer(query: str, topics: list[dict[str, Any]])
                 headers={"Authorization": f"Bearer {api_key}"},
                 json={
                     "model": model,
-                    "messages": [
-                        {"role": "system", "content": "你帮用户把知识库里检索到的话题讲成人话。"},
-                        {"role": "user", "content": prompt},
-                    ],
-                    "temperature": 0.35,
-                    "max_tokens": 220,
+                    "messages": _knowledge_answer_messages(query, topics),
+                    "temperature": KNOWLEDGE_ANSWER_TEMPERATURE,
+                    "max_tokens": KNOWLEDGE_ANSWER_MAX_TOKENS,
                 },
             )
             response.raise_for_status()
@@ -2839,15 +3712,48 @@ async def _try_remote_knowledge_answer(query: str, topics: list[dict[str, Any]])
     except Exception:
         logger.info("TopicLink knowledge answer fallback used", exc_info=True)
         return None
+    answer = _compact_visible_text(_chat_completion_content(payload), KNOWLEDGE_ANSWER_VISIBLE_CHARS)
+    return answer or None
 
+
+async def _stream_remote_knowledge_answer(
+    query: str,
+    topics: list[dict[str, Any]],
+    emit: Callable[[str, dict[str, Any]], Awaitable[None]],
+) -> str | None:
+    config = _topiclink_chat_config()
+    if not config or not topics:
+        return None
+    # Tokens only ever carry text the final answer keeps: the compacted answer
+    # is cut to KNOWLEDGE_ANSWER_VISIBLE_CHARS with "…" as its last character.
+    streamable = KNOWLEDGE_ANSWER_VISIBLE_CHARS - 1
+    raw = ""
+    sent = 0
     try:
-        choices = payload.get("choices") if isinstance(payload, dict) else None
-        first = choices[0] if isinstance(choices, list) and choices else {}
-        message = first.get("message") if isinstance(first, dict) else None
-        content = str(message.get("content") if isinstance(message, dict) else first.get("text") or "")
-    except Exception:
-        content = ""
-    answer = _compact_visible_text(content, 180)
+        async with contextlib.aclosing(
+            _stream_topiclink_chat(
+                config,
+                _knowledge_answer_messages(query, topics),
+                temperature=KNOWLEDGE_ANSWER_TEMPERATURE,
+                max_tokens=KNOWLEDGE_ANSWER_MAX_TOKENS,
+                timeout=30.0,
+            )
+        ) as pieces:
+            async for piece in pieces:
+                raw += piece
+                visible = " ".join(raw.replace("\x00", " ").split())
+                if sent < streamable and len(visible) > sent:
+                    delta = visible[sent:streamable]
+                    sent += len(delta)
+                    await emit("token", {"text": delta})
+                if len(visible) > KNOWLEDGE_ANSWER_VISIBLE_CHARS:
+                    break
+    except httpx.HTTPError:
+        logger.info("TopicLink knowledge answer stream fallback used", exc_info=True)
+        if sent:
+            await emit("reset", {})
+        return None
+    answer = _compact_visible_text(raw, KNOWLEDGE_ANSWER_VISIBLE_CHARS)
     return answer or None
 
 
@@ -2938,8 +3844,32 @@ def _list_topiclink_posts(topic_id: str, limit: int) -> dict[str, Any]:
         return {"items": [], "next_cursor": None}
 
 
+def _recommendation_item(topic: dict[str, Any], similarity: float, source: str) -> dict[str, Any]:
+    score = _score_from_similarity(similarity)
+    return {
+        "topic_id": str(topic.get("id") or ""),
+        "semantic_similarity": score,
+        "profile_similarity": score,
+        "recommendation_score": score,
+        "confidence": "high" if score >= 78 else "medium" if score >= 62 else "low",
+        "score_source": source,
+        "reasons": _reason_for_score(score, topic),
+        "next_action": "可以先看一轮，再决定是否回应。" if score < 78 else "适合加入讨论。",
+        "embedding_breakdown": {
+            "semantic": score,
+            "demand": max(35, score - 4),
+            "context": max(35, score - 2),
+            "field": score,
+        },
+    }
+
+
+def _default_profile_text(profile_text: str) -> str:
+    return profile_text.strip() or "关注科研、协作、资料整理和真实经验。"
+
+
 async def _score_topics(profile_text: str, topics: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], str]:
-    profile = profile_text.strip() or "关注科研、协作、资料整理和真实经验。"
+    profile = _default_profile_text(profile_text)
     topic_texts = [_topic_text(topic) for topic in topics]
     vectors = await _try_remote_embeddings([profile, *topic_texts])
     source = "qwen_embedding" if vectors else "local_text_rule"
@@ -2947,34 +3877,68 @@ async def _score_topics(profile_text: str, topics: list[dict[str, Any]]) -> tupl
         profile_vector = vectors[0]
         topic_vectors = vectors[1:]
     else:
-        profile_vector = _hash_embedding(profile)
-        topic_vectors = [_hash_embedding(text) for text in topic_texts]
-    items: list[dict[str, Any]] = []
-    for topic, vector in zip(topics, topic_vectors):
-        similarity = _cosine(profile_vector, vector)
-        score = _score_from_similarity(similarity)
-        items.append(
-            {
-                "topic_id": str(topic.get("id") or ""),
-                "semantic_similarity": score,
-                "profile_similarity": score,
-                "recommendation_score": score,
-                "confidence": "high" if score >= 78 else "medium" if score >= 62 else "low",
-                "score_source": source,
-                "reasons": _reason_for_score(score, topic),
-                "next_action": "可以先看一轮，再决定是否回应。" if score < 78 else "适合加入讨论。",
-                "embedding_breakdown": {
-                    "semantic": score,
-                    "demand": max(35, score - 4),
-                    "context": max(35, score - 2),
-                    "field": score,
-                },
-            }
-        )
+        profile_vector = hash_embedding(profile, EMBEDDING_DIM)
+        topic_vectors = [hash_embedding(text, EMBEDDING_DIM) for text in topic_texts]
+    similarities = UnitVectorMatrix.for_query(profile_vector, topic_vectors).similarities(profile_vector)
+    items = [
+        _recommendation_item(topic, float(similarity), source)
+        for topic, similarity in zip(topics, similarities)
+    ]
     items.sort(key=lambda item: item["recommendation_score"], reverse=True)
     return items, source
 
 
+def _existing_topic_ids(topic_ids: list[str]) -> set[str]:
+    if not topic_ids:
+        return set()
+    with get_db_session() as session:
+        rows = session.execute(
+            text("SELECT id FROM topics WHERE id IN :topic_ids").bindparams(
+                bindparam("topic_ids", expanding=True),
+            ),
+            {"topic_ids": topic_ids},
+        ).fetchall()
+    return {str(row[0]) for row in rows}
+
+
+async def _recommend_from_topic_index(
+    profile_text: str,
+    *,
+    limit: int,
+    exclude_topic_id: str | None,
+    category: str | None,
+    status: str | None,
+) -> list[dict[str, Any]] | None:
+    """Serve recommendations from the corpus-wide ANN index; ``None`` means use the recent-topic scan."""
+    if not _topiclink_embedding_api_key():
+        return None
+    vectors = await _try_remote_embeddings([_default_profile_text(profile_text)])
+    if not vectors:
+        return None
+    hits = await _query_topic_index_async(
+        _topiclink_embedding_model(),
+        vectors[0],
+        limit=limit,
+        exclude_topic_id=exclude_topic_id,
+        category=category,
+        status=status,
+    )
+    if not hits:
+        return None
+    try:
+        existing = await asyncio.to_thread(_existing_topic_ids, [str(hit["topic_id"]) for hit in hits])
+    except SQLAlchemyError:
+        return None
+    stale = [str(hit["topic_id"]) for hit in hits if str(hit["topic_id"]) not in existing]
+    if stale:
+        await asyncio.to_thread(_delete_topic_index, stale)
+    return [
+        _recommendation_item({"id": hit["topic_id"], "category": hit.get("category")}, float(hit["similarity"]), "qwen_embedding")
+        for hit in hits
+        if str(hit["topic_id"]) in existing
+    ]
+
+
 @router.get("/profile")
 async def get_topiclink_profile(user: dict[str, Any] | None = Depends(_optional_topiclink_user)) -> dict[str, Any]:
     return _topiclink_profile_from_user(user)
@@ -2984,15 +3948,38 @@ async def get_topiclink_profile(user: dict[str, Any] | None = Depends(_optional_
 async def recommend_topiclink_topics(
     topic_id: str | None = Query(default=None),
     limit: int = Query(default=32, ge=1, le=80),
+    category: str | None = Query(default=None, pattern=TOPIC_INDEX_FILTER_VALUE_PATTERN),
+    status: str | None = Query(default=None, pattern=TOPIC_INDEX_FILTER_VALUE_PATTERN),
 ) -> dict[str, Any]:
     seed = _safe_get_topic(topic_id)
-    candidate_limit = min(80, max(12, limit * 3))
-    topics = [item for item in _safe_list_topics(limit=candidate_limit) if not topic_id or item.get("id") != topic_id]
     profile_text = _topic_text(seed) if seed else ""
+    indexed = await _recommend_from_topic_index(
+        profile_text,
+        limit=limit,
+        exclude_topic_id=topic_id,
+        category=category,
+        status=status,
+    )
+    if indexed is not None:
+        return {
+            "vector_status": "ready",
+            "embedding_model": DEFAULT_EMBEDDING_MODEL,
+            "candidate_source": "topic_index",
+            "items": indexed,
+            "message": None,
+        }
+    candidate_limit = min(80, max(12, limit * 3))
+    topics = [
+        item
+        for item in _safe_list_topics(limit=candidate_limit, category=category)
+        if (not topic_id or item.get("id") != topic_id)
+        and (not status or str(item.get("status") or "").lower() == status.lower())
+    ]
     items, source = await _score_topics(profile_text, topics)
     return {
         "vector_status": "ready" if source == "qwen_embedding" else "unconfigured",
         "embedding_model": DEFAULT_EMBEDDING_MODEL,
+        "candidate_source": "recent_topics",
         "items": items[:limit],
         "message": None if source == "qwen_embedding" else "未配置远程 Embedding，已使用本地相近度估计。",
     }
@@ -3009,8 +3996,7 @@ async def score_topiclink_topics(req: TopicLinkScoreRequest) -> dict[str, Any]:
     }
 
 
-@router.post("/knowledge/answer")
-async def answer_topiclink_knowledge(req: TopicLinkKnowledgeAnswerRequest) -> dict[str, Any]:
+async def _rank_knowledge_topics(req: TopicLinkKnowledgeAnswerRequest) -> tuple[str, list[dict[str, Any]], str]:
     query = _compact_visible_text(req.query, 1000)
     if not query:
         raise HTTPException(status_code=400, detail="请输入想找的内容")
@@ -3022,20 +4008,92 @@ async def answer_topiclink_knowledge(req: TopicLinkKnowledgeAnswerRequest) -> di
         for item in items[:6]
         if topic_by_id.get(str(item.get("topic_id") or ""))
     ]
-    answer = await _try_remote_knowledge_answer(query, ranked_topics)
-    provider_status = "ready" if answer else "local"
-    if not answer:
-        answer = _fallback_knowledge_answer(query, ranked_topics)
+    return query, ranked_topics, source
+
+
+async def _knowledge_answer(
+    query: str,
+    ranked_topics: list[dict[str, Any]],
+    compute: Callable[[], Awaitable[str | None]],
+) -> tuple[str | None, bool]:
+    chat_config = _topiclink_chat_config()
+    if not chat_config or not ranked_topics:
+        return None, False
+    # Retrieval runs first, so the key changes whenever a cited topic is edited or the ranking moves.
+    return await cached_answer(
+        answer_cache_key(
+            query,
+            model=chat_config[2],
+            prompt_version=KNOWLEDGE_ANSWER_PROMPT_VERSION,
+            fingerprint=topic_fingerprint(ranked_topics),
+        ),
+        compute,
+        prompt_version=KNOWLEDGE_ANSWER_PROMPT_VERSION,
+    )
+
+
+def _knowledge_answer_payload(
+    query: str,
+    ranked_topics: list[dict[str, Any]],
+    source: str,
+    answer: str | None,
+    cached: bool,
+) -> dict[str, Any]:
     return {
-        "provider_status": provider_status,
+        "provider_status": "ready" if answer else "local",
         "vector_status": "ready" if source == "qwen_embedding" else "unconfigured",
         "embedding_model": DEFAULT_EMBEDDING_MODEL,
-        "answer": answer,
+        "answer": answer or _fallback_knowledge_answer(query, ranked_topics),
         "topic_ids": [str(topic.get("id") or "") for topic in ranked_topics],
+        "cached": cached,
         "message": None,
     }
 
 
+@router.post("/knowledge/answer")
+async def answer_topiclink_knowledge(req: TopicLinkKnowledgeAnswerRequest) -> dict[str, Any]:
+    query, ranked_topics, source = await _rank_knowledge_topics(req)
+    answer, cached = await _knowledge_answer(
+        query,
+        ranked_topics,
+        lambda: _try_remote_knowledge_answer(query, ranked_topics),
+    )
+    return _knowledge_answer_payload(query, ranked_topics, source, answer, cached)
+
+
+@router.post("/knowledge/answer/stream")
+async def stream_topiclink_knowledge_answer(req: TopicLinkKnowledgeAnswerRequest) -> StreamingResponse:
+    """SSE: ``retrieval`` with the ranked topic ids, ``token`` deltas, then the full ``done`` payload.
+
+    ``reset`` tells the client to drop the streamed text when the upstream fails midway.
+    """
+    query = _compact_visible_text(req.query, 1000)
+    if not query:
+        raise HTTPException(status_code=400, detail="请输入想找的内容")
+
+    async def produce(emit: Callable[[str, dict[str, Any]], Awaitable[None]]) -> None:
+        _, ranked_topics, source = await _rank_knowledge_topics(req)
+        await emit(
+            "retrieval",
+            {
+                "vector_status": "ready" if source == "qwen_embedding" else "unconfigured",
+                "topic_ids": [str(topic.get("id") or "") for topic in ranked_topics],
+            },
+        )
+        answer, cached = await _knowledge_answer(
+            query,
+            ranked_topics,
+            lambda: _stream_remote_knowledge_answer(query, ranked_topics, emit),
+        )
+        await emit("done", _knowledge_answer_payload(query, ranked_topics, source, answer, cached))
+
+    return StreamingResponse(
+        _topiclink_event_stream(produce),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/opc/{slug}/diligence", status_code=201)
 async def dispatch_opc_diligence(
     slug: str,
@@ -3175,3 +4233,40 @@ async def simulate_topiclink(topic_id: str, req: TopicLinkSimulationRequest | No
     if remote:
         return remote
     return _fallback_simulation(topic, persona)
+
+
+@router.post("/{topic_id}/simulate/stream")
+async def stream_topiclink_simulation(topic_id: str, req: TopicLinkSimulationRequest | None = None) -> StreamingResponse:
+    """SSE: ``context``, ``token`` deltas of the model output, then the parsed ``done`` result."""
+    topic = _safe_get_topic(topic_id)
+    if not topic:
+        raise HTTPException(status_code=404, detail="话题不存在")
+    persona = (req.persona_name if req else None) or "分身"
+
+    async def produce(emit: Callable[[str, dict[str, Any]], Awaitable[None]]) -> None:
+        config = _topiclink_chat_config()
+        result = None
+        if config:
+            messages = _simulation_messages(topic, req, persona)
+            await emit("context", {"topic_id": topic_id, "persona": persona, "model": config[2]})
+            pieces = []
+            try:
+                async for piece in _stream_topiclink_chat(
+                    config,
+                    messages,
+                    temperature=SIMULATION_TEMPERATURE,
+                    max_tokens=SIMULATION_MAX_TOKENS,
+                    timeout=45.0,
+                ):
+                    pieces.append(piece)
+                    await emit("token", {"text": piece})
+                result = _simulation_result(topic, persona, config[2], "".join(pieces))
+            except httpx.HTTPError:
+                logger.info("TopicLink chat simulation stream fallback used", exc_info=True)
+        await emit("done", result or _fallback_simulation(topic, persona))
+
+    return StreamingResponse(
+        _topiclink_event_stream(produce),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
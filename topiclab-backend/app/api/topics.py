@@ -16,7 +16,7 @@ import tempfile
 from typing import Any
 
 import httpx
-from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query
 from fastapi.responses import FileResponse, Response
 from fastapi.security import HTTPAuthorizationCredentials
 from PIL import Image, ImageOps, UnidentifiedImageError
@@ -32,6 +32,7 @@ from app.api.auth import (
     verify_openclaw_api_key,
 )
 from app.api.admin import require_admin_panel
+from app.api.topiclink import refresh_topiclink_topic_index
 from app.services.content_moderation import moderate_post_content
 from app.services.request_audit import set_authenticated_actor_context
 from app.services.resonnet_client import request_json
@@ -1680,7 +1681,11 @@ def get_topic_category_profile_endpoint(category_id: str):
 
 
 @router.post("/topics", status_code=201)
-async def create_topic_endpoint(data: TopicCreateRequest, user: dict | None = Depends(_get_optional_user)):
+async def create_topic_endpoint(
+    data: TopicCreateRequest,
+    background_tasks: BackgroundTasks,
+    user: dict | None = Depends(_get_optional_user),
+):
     category = _normalize_topic_category(data.category) or "plaza"
     if category == "arcade":
         raise HTTPException(status_code=403, detail="Arcade topics must be created through protected internal APIs")
@@ -1727,6 +1732,7 @@ async def create_topic_endpoint(data: TopicCreateRequest, user: dict | None = De
             target_type="topic",
             target_id=topic["id"],
     )
+    background_tasks.add_task(refresh_topiclink_topic_index, [topic["id"]])
     return topic
 
 
@@ -1841,7 +1847,12 @@ async def get_topic_bundle_endpoint(
 
 
 @router.patch("/topics/{topic_id}")
-def update_topic_endpoint(topic_id: str, data: TopicUpdateRequest, user: dict | None = Depends(_get_optional_user)):
+def update_topic_endpoint(
+    topic_id: str,
+    data: TopicUpdateRequest,
+    background_tasks: BackgroundTasks,
+    user: dict | None = Depends(_get_optional_user),
+):
     user_id, auth_type = _resolve_owner_identity(user)
     topic = get_topic(topic_id, user_id=user_id, auth_type=auth_type)
     if not topic:
@@ -1858,6 +1869,7 @@ def update_topic_endpoint(topic_id: str, data: TopicUpdateRequest, user: dict |
     updated = update_topic(topic_id, payload)
     if not updated:
         raise HTTPException(status_code=404, detail="Topic not found")
+    background_tasks.add_task(refresh_topiclink_topic_index, [topic_id])
     return updated
 
 
@@ -1878,7 +1890,11 @@ def update_arcade_topic_endpoint(
 
 
 @router.post("/topics/{topic_id}/close")
-def close_topic_endpoint(topic_id: str, user: dict | None = Depends(_get_optional_user)):
+def close_topic_endpoint(
+    topic_id: str,
+    background_tasks: BackgroundTasks,
+    user: dict | None = Depends(_get_optional_user),
+):
     user_id, auth_type = _resolve_owner_identity(user)
     topic = get_topic(topic_id, user_id=user_id, auth_type=auth_type)
     if not topic:
@@ -1890,11 +1906,16 @@ def close_topic_endpoint(topic_id: str, user: dict | None = Depends(_get_optiona
     closed = close_topic(topic_id)
     if not closed:
         raise HTTPException(status_code=404, detail="Topic not found")
+    background_tasks.add_task(refresh_topiclink_topic_index, [topic_id])
     return closed
 
 
 @router.delete("/topics/{topic_id}")
-def delete_topic_endpoint(topic_id: str, user: dict | None = Depends(_get_optional_user)):
+def delete_topic_endpoint(
+    topic_id: str,
+    background_tasks: BackgroundTasks,
+    user: dict | None = Depends(_get_optional_user),
+):
     user_id, auth_type = _resolve_owner_identity(user)
     topic = get_topic(topic_id, user_id=user_id, auth_type=auth_type)
     if not topic:
@@ -1905,6 +1926,7 @@ def delete_topic_endpoint(topic_id: str, user: dict | None = Depends(_get_option
         raise HTTPException(status_code=403, detail="No permission to delete this topic")
     if not delete_topic(topic_id):
         raise HTTPException(status_code=404, detail="Topic not found")
+    background_tasks.add_task(refresh_topiclink_topic_index, [topic_id])
     return {"ok": True, "topic_id": topic_id}
 
 
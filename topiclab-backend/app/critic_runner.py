@@ -23,6 +23,12 @@ from typing import Any
 from urllib.parse import urlparse
 
 from app.critic_security import is_supported_github_target, is_supported_npm_package
+from app.critic_source_cache import DEFAULT_SOURCE_CACHE_MAX_BYTES, SourceCache, source_cache_key
+from app.critic_verdict_cache import (
+    DEFAULT_VERDICT_CACHE_TTL_SECONDS,
+    VerdictCache,
+    verdict_cache_key,
+)
 from app.services.research_hub_config import get_research_hub_scnet_api_key
 
 
@@ -2240,6 +2246,51 @@ def _evaluate_mcp_source(
     }
 
 
+def _rubric_fingerprint(kernel_root: pathlib.Path) -> str:
+    """Version of everything besides the source that shapes a verdict."""
+    material: list[Any] = [
+        RESULT_SCHEMA,
+        BASIC_REVIEW_SCHEMA,
+        STANDARD_SCHEMA,
+        REQUEST_RUNTIME,
+        DEFAULT_SCNET_MODEL,
+        _python_source_manifest(kernel_root)["content_sha256"],
+    ]
+    try:
+        research_root = _critic_research_root(kernel_root)
+    except ValueError:
+        research_root = None
+    for name in ("skill-criticagent", "mcp-criticagent"):
+        skill_file = research_root / "skills" / name / "SKILL.md" if research_root else None
+        material.append(
+            hashlib.sha256(skill_file.read_bytes()).hexdigest() if skill_file and skill_file.is_file() else None
+        )
+    canonical = json.dumps(material, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _verdict_cache(job_dir: pathlib.Path) -> VerdictCache | None:
+    try:
+        ttl = float(os.environ.get("CRITIC_VERDICT_CACHE_TTL_SECONDS") or DEFAULT_VERDICT_CACHE_TTL_SECONDS)
+    except ValueError:
+        ttl = DEFAULT_VERDICT_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return None
+    configured = (os.environ.get("CRITIC_VERDICT_CACHE_DIR") or "").strip()
+    root = pathlib.Path(configured).expanduser() if configured else job_dir.resolve().parent / "verdict-cache"
+    return VerdictCache(root, ttl_seconds=ttl)
+
+
+def _remember_verdict(cache: VerdictCache | None, key: str, result: dict[str, Any]) -> dict[str, Any]:
+    if cache is None or not key or result.get("status") != "completed":
+        return result
+    try:
+        cache.put(key, result)
+    except OSError:
+        return result
+    return {**result, "verdict_cache": {"hit": False, "key": key}}
+
+
 def evaluate_acquired_source(
     request: dict[str, Any],
     source_root: pathlib.Path,
@@ -2250,12 +2301,32 @@ def evaluate_acquired_source(
     validator: Validator = _vendored_validate,
     mcp_evaluator: MCPEvaluator | None = None,
     skill_evaluator: SkillEvaluator | None = None,
+    verdict_cache: VerdictCache | None = None,
+    rubric: str = "",
 ) -> dict[str, Any]:
     source_root = source_root.resolve()
     job_dir.mkdir(parents=True, exist_ok=True)
     before = _source_manifest(source_root)
     _atomic_json(job_dir / "source-manifest.json", before)
     _atomic_json(job_dir / "provenance.json", provenance)
+    cache_key = ""
+    if verdict_cache is not None:
+        cache_key = verdict_cache_key(
+            manifest_sha256=before["content_sha256"],
+            kind=str(request.get("kind") or ""),
+            evaluation_profile=str(request.get("evaluation_profile") or ""),
+            requested_subpath=provenance.get("requested_subpath"),
+            rubric=rubric,
+        )
+        cached = verdict_cache.get(cache_key)
+        if cached is not None:
+            _write_progress(
+                job_dir,
+                "verdict",
+                ["validation", "behavior", "triggers"],
+                "相同来源内容已在同一评测标准下形成结论，直接复用",
+            )
+            return cached
 
     if request.get("kind") == "mcp":
         _write_progress(
@@ -2268,7 +2339,11 @@ def evaluate_acquired_source(
             if request.get("evaluation_profile") == "standard"
             else "正在执行 MCP 的真实能力评测",
         )
-        return _evaluate_mcp_source(request, source_root, job_dir, before, mcp_evaluator)
+        return _remember_verdict(
+            verdict_cache,
+            cache_key,
+            _evaluate_mcp_source(request, source_root, job_dir, before, mcp_evaluator),
+        )
 
     skill_dir = _locate_skill_dir(source_root, provenance.get("requested_subpath"))
     static_result = validator(skill_dir, kernel_root)
@@ -2366,21 +2441,25 @@ def evaluate_acquired_source(
                 "evidence": evidence,
             }
         evidence.update(raw_evidence)
-        return {
-            "schema": RESULT_SCHEMA,
-            "status": "completed",
-            "evaluation_profile_status": "basic_complete"
-            if request.get("evaluation_profile") == "basic"
-            else "standard_complete"
-            if request.get("evaluation_profile") == "standard"
-            else "complete",
-            "verdict": raw.get("verdict"),
-            "score": raw.get("score"),
-            "dimensions": raw.get("dimensions") or [],
-            "limitations": raw.get("limitations") or [],
-            "report_url": raw.get("report_url"),
-            "evidence": evidence,
-        }
+        return _remember_verdict(
+            verdict_cache,
+            cache_key,
+            {
+                "schema": RESULT_SCHEMA,
+                "status": "completed",
+                "evaluation_profile_status": "basic_complete"
+                if request.get("evaluation_profile") == "basic"
+                else "standard_complete"
+                if request.get("evaluation_profile") == "standard"
+                else "complete",
+                "verdict": raw.get("verdict"),
+                "score": raw.get("score"),
+                "dimensions": raw.get("dimensions") or [],
+                "limitations": raw.get("limitations") or [],
+                "report_url": raw.get("report_url"),
+                "evidence": evidence,
+            },
+        )
 
     return {
         "schema": RESULT_SCHEMA,
@@ -2404,6 +2483,97 @@ def _validate_request(request: dict[str, Any]) -> None:
         raise ValueError("runner request source mismatch")
 
 
+def _snapshot_parent(job_dir: pathlib.Path, name: str) -> tuple[pathlib.Path, bool]:
+    """Directory for an unpacked snapshot, moved under a short temporary root when the job path is long."""
+    default_source_parent = (job_dir / name).resolve()
+    if len(str(default_source_parent)) <= 150:
+        return default_source_parent, False
+    source_key = hashlib.sha256(str(default_source_parent).encode("utf-8")).hexdigest()[:24]
+    source_parent = pathlib.Path(tempfile.gettempdir()) / "topiclab-critic-sources" / source_key
+    source_parent.parent.mkdir(parents=True, exist_ok=True)
+    shutil.rmtree(source_parent, ignore_errors=True)
+    return source_parent, True
+
+
+def _source_cache(job_dir: pathlib.Path) -> SourceCache | None:
+    try:
+        max_bytes = int(os.environ.get("CRITIC_SOURCE_CACHE_MAX_BYTES") or DEFAULT_SOURCE_CACHE_MAX_BYTES)
+    except ValueError:
+        max_bytes = DEFAULT_SOURCE_CACHE_MAX_BYTES
+    if max_bytes <= 0:
+        return None
+    configured = (os.environ.get("CRITIC_SOURCE_CACHE_DIR") or "").strip()
+    root = pathlib.Path(configured).expanduser() if configured else job_dir.resolve().parent / "source-cache"
+    return SourceCache(root, max_bytes=max_bytes)
+
+
+def _acquire_through_cache(
+    cache: SourceCache,
+    key: str,
+    job_dir: pathlib.Path,
+    acquire: Callable[[], tuple[pathlib.Path, dict[str, Any]]],
+    *,
+    pinned: Callable[[dict[str, Any]], bool],
+    overrides: dict[str, Any],
+) -> tuple[pathlib.Path, dict[str, Any]]:
+    """Reuse the cached snapshot for ``key`` or acquire it once while other runners wait on the key lock."""
+    with cache.lock(key):
+        parent, ephemeral = _snapshot_parent(job_dir, "source-cached")
+        cached = cache.materialize(key, parent)
+        if cached is not None:
+            source_root, provenance = cached
+            _write_progress(job_dir, "validation", [], "已复用同一版本的来源快照")
+            return source_root, {
+                **provenance,
+                **overrides,
+                "ephemeral_source_snapshot": ephemeral,
+                "source_cache": {"hit": True, "key": key},
+            }
+        source_root, provenance = acquire()
+        if not pinned(provenance):
+            return source_root, provenance
+        try:
+            cache.store(key, source_root, provenance)
+        except (OSError, ValueError):
+            return source_root, provenance
+        return source_root, {**provenance, "source_cache": {"hit": False, "key": key}}
+
+
+def _resolve_github_commit(parsed: dict[str, str | None], job_dir: pathlib.Path) -> str | None:
+    """Commit SHA the requested ref points at right now, or ``None`` when it cannot be resolved cheaply."""
+    requested_ref = parsed.get("requested_ref")
+    if requested_ref and re.fullmatch(r"[0-9a-fA-F]{40}", requested_ref):
+        return requested_ref.lower()
+    patterns = (
+        [f"refs/tags/{requested_ref}^{{}}", f"refs/heads/{requested_ref}", f"refs/tags/{requested_ref}"]
+        if requested_ref
+        else ["HEAD"]
+    )
+    environment = _minimal_process_environment(job_dir / ".process-home")
+    environment["GIT_TERMINAL_PROMPT"] = "0"
+    try:
+        completed = _run_bounded_process(
+            ["git", "-c", "credential.helper=", "ls-remote", str(parsed["repository_url"]), *patterns],
+            cwd=job_dir,
+            env=environment,
+            timeout=30,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if completed.returncode != 0:
+        return None
+    refs = {
+        name.strip(): commit.strip()
+        for commit, name in (line.split("\t", 1) for line in completed.stdout.splitlines() if "\t" in line)
+    }
+    for pattern in patterns:
+        commit = refs.get(pattern, "")
+        if re.fullmatch(r"[0-9a-fA-F]{40}", commit):
+            return commit.lower()
+    return None
+
+
 def _acquire_github_archive(
     parsed: dict[str, str | None],
     job_dir: pathlib.Path,
@@ -2416,15 +2586,7 @@ def _acquire_github_archive(
     encoded_ref = urllib.parse.quote(requested_ref, safe="")
     archive_url = f"https://codeload.github.com/{repository}/tar.gz/{encoded_ref}"
     archive_path = job_dir / "source-archive.tar.gz"
-    default_source_parent = (job_dir / "source-archive").resolve()
-    ephemeral_source_snapshot = len(str(default_source_parent)) > 150
-    if ephemeral_source_snapshot:
-        source_key = hashlib.sha256(str(job_dir.resolve()).encode("utf-8")).hexdigest()[:24]
-        source_parent = pathlib.Path(tempfile.gettempdir()) / "topiclab-critic-sources" / source_key
-        source_parent.parent.mkdir(parents=True, exist_ok=True)
-        shutil.rmtree(source_parent, ignore_errors=True)
-    else:
-        source_parent = default_source_parent
+    source_parent, ephemeral_source_snapshot = _snapshot_parent(job_dir, "source-archive")
     request = urllib.request.Request(
         archive_url,
         headers={"User-Agent": "tashan-topiclab-critic-runner"},
@@ -2451,6 +2613,7 @@ def _acquire_github_archive(
     file_count = 0
     unpacked_bytes = 0
     top_levels: set[str] = set()
+    archive_commit = ""
     try:
         with tarfile.open(archive_path, mode="r:gz") as archive:
             for member in archive.getmembers():
@@ -2483,6 +2646,8 @@ def _acquire_github_archive(
                 destination.parent.mkdir(parents=True, exist_ok=True)
                 with destination.open("wb") as output:
                     shutil.copyfileobj(extracted, output)
+            # ``git archive`` records the commit it was built from in the pax global header.
+            archive_commit = str(archive.pax_headers.get("comment") or "")
         if file_count == 0 or len(top_levels) != 1:
             raise RuntimeError("GitHub archive does not contain one repository root")
     except (tarfile.TarError, OSError, RuntimeError):
@@ -2491,7 +2656,10 @@ def _acquire_github_archive(
 
     archive_sha256 = hashlib.sha256(archive_path.read_bytes()).hexdigest()
     source_root = (source_parent / next(iter(top_levels))).resolve()
-    commit_sha = requested_ref if re.fullmatch(r"[0-9a-fA-F]{40}", requested_ref) else None
+    commit_sha = next(
+        (value.lower() for value in (requested_ref, archive_commit) if re.fullmatch(r"[0-9a-fA-F]{40}", value)),
+        None,
+    )
     _atomic_json(
         job_dir / "acquisition-archive.json",
         {
@@ -2520,8 +2688,35 @@ def _acquire_github_archive(
     }
 
 
-def _acquire_github(target: str, job_dir: pathlib.Path) -> tuple[pathlib.Path, dict[str, Any]]:
+def _acquire_github(
+    target: str,
+    job_dir: pathlib.Path,
+    *,
+    source_cache: SourceCache | None = None,
+) -> tuple[pathlib.Path, dict[str, Any]]:
     parsed = parse_github_target(target)
+    commit_sha = _resolve_github_commit(parsed, job_dir) if source_cache is not None else None
+    if source_cache is None or commit_sha is None:
+        return _acquire_github_snapshot(target, parsed, job_dir)
+    return _acquire_through_cache(
+        source_cache,
+        source_cache_key("github", str(parsed["repository_url"]), commit_sha, str(parsed["requested_subpath"] or "")),
+        job_dir,
+        lambda: _acquire_github_snapshot(target, parsed, job_dir),
+        pinned=lambda provenance: str(provenance.get("commit_sha") or "").lower() == commit_sha,
+        overrides={
+            "requested_target": target,
+            "requested_ref": parsed["requested_ref"],
+            "requested_subpath": parsed["requested_subpath"],
+        },
+    )
+
+
+def _acquire_github_snapshot(
+    target: str,
+    parsed: dict[str, str | None],
+    job_dir: pathlib.Path,
+) -> tuple[pathlib.Path, dict[str, Any]]:
     previous_error = ""
     if parsed["requested_subpath"]:
         _write_progress(job_dir, "validation", [], "正在读取 GitHub 指定目录的只读来源快照")
@@ -2694,7 +2889,12 @@ def _acquire_github_contents_api(
     }
 
 
-def _acquire_npm(package: str, job_dir: pathlib.Path) -> tuple[pathlib.Path, dict[str, Any]]:
+def _acquire_npm(
+    package: str,
+    job_dir: pathlib.Path,
+    *,
+    source_cache: SourceCache | None = None,
+) -> tuple[pathlib.Path, dict[str, Any]]:
     if not is_supported_npm_package(package):
         raise ValueError("invalid npm package name")
     npm = shutil.which("npm")
@@ -2703,7 +2903,7 @@ def _acquire_npm(package: str, job_dir: pathlib.Path) -> tuple[pathlib.Path, dic
     environment = _minimal_process_environment(job_dir / ".process-home")
     environment["NPM_CONFIG_IGNORE_SCRIPTS"] = "true"
     view = _run_bounded_process(
-        [npm, "view", package, "version", "dist.tarball", "--json"],
+        [npm, "view", package, "version", "dist.tarball", "dist.integrity", "--json"],
         cwd=job_dir,
         env=environment,
         timeout=60,
@@ -2717,6 +2917,27 @@ def _acquire_npm(package: str, job_dir: pathlib.Path) -> tuple[pathlib.Path, dic
     if not isinstance(metadata, dict) or not str(metadata.get("version") or "").strip():
         raise ValueError("npm metadata response is incomplete")
     version = str(metadata["version"])
+    integrity = str(metadata.get("dist.integrity") or "")
+    if source_cache is None or not integrity:
+        return _pack_npm(npm, package, version, metadata, job_dir, environment)
+    return _acquire_through_cache(
+        source_cache,
+        source_cache_key("npm", package, version, integrity),
+        job_dir,
+        lambda: _pack_npm(npm, package, version, metadata, job_dir, environment),
+        pinned=lambda provenance: provenance.get("integrity") == integrity,
+        overrides={"requested_target": package},
+    )
+
+
+def _pack_npm(
+    npm: str,
+    package: str,
+    version: str,
+    metadata: dict[str, Any],
+    job_dir: pathlib.Path,
+    environment: dict[str, str],
+) -> tuple[pathlib.Path, dict[str, Any]]:
     archive_dir = job_dir / "npm-archive"
     archive_dir.mkdir(parents=True, exist_ok=False)
     pack = _run_bounded_process(
@@ -2760,6 +2981,7 @@ def _acquire_npm(package: str, job_dir: pathlib.Path) -> tuple[pathlib.Path, dic
         "package_version": version,
         "tarball_url": metadata.get("dist.tarball"),
         "tarball_sha256": hashlib.sha256(archive.read_bytes()).hexdigest(),
+        "integrity": packed[0].get("integrity"),
         "acquisition": "npm-pack-ignore-scripts",
         "third_party_code_executed": False,
     }
@@ -2769,10 +2991,11 @@ def run_request(request: dict[str, Any], job_dir: pathlib.Path, *, kernel_root:
     _validate_request(request)
     _write_progress(job_dir, "validation", [], "正在封存来源并核验规范与安全")
     target = str(request.get("target") or "")
+    source_cache = _source_cache(job_dir)
     if request["kind"] == "mcp" and not target.startswith("https://"):
-        source_root, provenance = _acquire_npm(target, job_dir)
+        source_root, provenance = _acquire_npm(target, job_dir, source_cache=source_cache)
     else:
-        source_root, provenance = _acquire_github(target, job_dir)
+        source_root, provenance = _acquire_github(target, job_dir, source_cache=source_cache)
     _write_progress(job_dir, "validation", [], "来源已封存，正在执行规范与安全检查")
     mcp_evaluator: MCPEvaluator | None = None
     if request["kind"] == "mcp" and request.get("evaluation_profile") in {"basic", "standard"}:
@@ -2829,6 +3052,8 @@ def run_request(request: dict[str, Any], job_dir: pathlib.Path, *, kernel_root:
             provenance=provenance,
             mcp_evaluator=mcp_evaluator,
             skill_evaluator=skill_evaluator,
+            verdict_cache=_verdict_cache(job_dir),
+            rubric=_rubric_fingerprint(kernel_root),
         )
     finally:
         if provenance.get("ephemeral_source_snapshot"):
@@ -0,0 +1,150 @@
+"""Slot scheduler for the Critic worker: priority classes, per-requester fairness, wait metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+PRIORITY_CLASSES = ("small", "standard", "large")
+DEFAULT_AGING_SECONDS = 600.0
+WAIT_SAMPLE_SIZE = 200
+
+
+@dataclass
+class _Entry:
+    job_id: str
+    requester_id: int
+    priority: int
+    enqueued_at: float
+    sequence: int
+    granted: asyncio.Future = field(repr=False)
+
+
+class CriticJobScheduler:
+    """Admit jobs up to a pending budget and hand out ``slots`` in a fair order.
+
+    Waiting jobs are ordered by priority class (promoted one class per
+    ``aging_seconds`` waited so large jobs cannot starve), then by how many
+    jobs the requester already has running, then by when the requester was
+    last served, then by arrival. One submitter therefore cannot hold every
+    slot while others wait.
+    """
+
+    def __init__(
+        self,
+        *,
+        slots: int = 1,
+        max_pending: int = 8,
+        max_pending_per_requester: int = 4,
+        aging_seconds: float = DEFAULT_AGING_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.slots = max(1, slots)
+        self.max_outstanding = self.slots + max(0, max_pending)
+        self.max_pending_per_requester = max(1, max_pending_per_requester)
+        self.aging_seconds = max(1.0, aging_seconds)
+        self._clock = clock
+        self._sequence = itertools.count()
+        self._waiting: dict[str, _Entry] = {}
+        self._running: dict[str, _Entry] = {}
+        self._last_served: dict[int, float] = {}
+        self._waits: deque[float] = deque(maxlen=WAIT_SAMPLE_SIZE)
+        self.dispatched = 0
+
+    def _requester_load(self, requester_id: int) -> tuple[int, int]:
+        waiting = sum(1 for entry in self._waiting.values() if entry.requester_id == requester_id)
+        running = sum(1 for entry in self._running.values() if entry.requester_id == requester_id)
+        return waiting, running
+
+    def submit(self, job_id: str, requester_id: int, priority: int) -> str | None:
+        """Queue a job; return ``None`` on success or the reason it was refused."""
+        if len(self._waiting) + len(self._running) >= self.max_outstanding:
+            return "queue_full"
+        if sum(self._requester_load(requester_id)) >= self.max_pending_per_requester:
+            return "requester_limit"
+        self._waiting[job_id] = _Entry(
+            job_id=job_id,
+            requester_id=requester_id,
+            priority=min(max(priority, 0), len(PRIORITY_CLASSES) - 1),
+            enqueued_at=self._clock(),
+            sequence=next(self._sequence),
+            granted=asyncio.get_running_loop().create_future(),
+        )
+        self._dispatch()
+        return None
+
+    async def acquire(self, job_id: str) -> float:
+        """Wait for the job's slot and return the seconds it spent queued."""
+        entry = self._waiting.get(job_id) or self._running.get(job_id)
+        if entry is None:
+            raise KeyError(job_id)
+        try:
+            return await asyncio.shield(entry.granted)
+        except asyncio.CancelledError:
+            self.release(job_id)
+            raise
+
+    def release(self, job_id: str) -> None:
+        """Free the job's slot, or drop it from the queue if it never started."""
+        self._waiting.pop(job_id, None)
+        self._running.pop(job_id, None)
+        self._dispatch()
+
+    def _order(self, entry: _Entry, now: float) -> tuple[int, int, float, int]:
+        promoted = int((now - entry.enqueued_at) // self.aging_seconds)
+        running = sum(1 for other in self._running.values() if other.requester_id == entry.requester_id)
+        return (
+            max(0, entry.priority - promoted),
+            running,
+            self._last_served.get(entry.requester_id, -math.inf),
+            entry.sequence,
+        )
+
+    def _dispatch(self) -> None:
+        while self._waiting and len(self._running) < self.slots:
+            now = self._clock()
+            entry = min(self._waiting.values(), key=lambda item: self._order(item, now))
+            del self._waiting[entry.job_id]
+            self._running[entry.job_id] = entry
+            self._last_served[entry.requester_id] = now
+            waited = max(0.0, now - entry.enqueued_at)
+            self._waits.append(waited)
+            self.dispatched += 1
+            if not entry.granted.done():
+                entry.granted.set_result(waited)
+
+    def stats(self) -> dict[str, Any]:
+        waits = sorted(self._waits)
+
+        def percentile(fraction: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(fraction * len(waits)))], 3)
+
+        now = self._clock()
+        return {
+            "slots": self.slots,
+            "running": len(self._running),
+            "waiting": len(self._waiting),
+            "waiting_by_priority": {
+                name: sum(1 for entry in self._waiting.values() if entry.priority == index)
+                for index, name in enumerate(PRIORITY_CLASSES)
+            },
+            "oldest_wait_seconds": round(
+                max((now - entry.enqueued_at for entry in self._waiting.values()), default=0.0), 3
+            ),
+            "dispatched": self.dispatched,
+            "queue_wait_seconds": {
+                "samples": len(waits),
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": round(waits[-1], 3) if waits else 0.0,
+            },
+        }
@@ -0,0 +1,192 @@
+"""Content-addressed cache of sealed Critic source trees shared by runner processes.
+
+Entries are keyed by what pins the content before anything is downloaded: the
+resolved GitHub commit SHA (with the requested subpath) or the npm registry
+integrity hash. Cached files are read-only and hardlinked into each job
+directory (copied when the job lives on another filesystem). The total size
+is bounded with least-recently-used eviction, and a per-key file lock makes
+concurrent runners wait for one acquisition instead of downloading in parallel.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import pathlib
+import secrets
+import shutil
+import stat
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows development hosts run without cross-process locking
+    fcntl = None  # type: ignore[assignment]
+
+
+SOURCE_CACHE_SCHEMA = "topiclab_critic_source_cache_v1"
+DEFAULT_SOURCE_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+READ_ONLY_FILE_MODE = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+def source_cache_key(*parts: str) -> str:
+    material = json.dumps([SOURCE_CACHE_SCHEMA, *parts], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _link_tree(source: pathlib.Path, destination: pathlib.Path) -> int:
+    """Mirror ``source`` into ``destination`` with hardlinks, falling back to copies; return the bytes mirrored."""
+    total = 0
+    destination.mkdir(parents=True, exist_ok=False)
+    for path in sorted(source.rglob("*")):
+        relative = path.relative_to(source)
+        if ".git" in relative.parts:
+            continue
+        if path.is_symlink():
+            raise ValueError(f"source contains unsupported symbolic link: {relative.as_posix()}")
+        target = destination / relative
+        if path.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+            continue
+        if not path.is_file():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(path, target)
+        except OSError:
+            shutil.copy2(path, target)
+        total += target.stat().st_size
+    return total
+
+
+class SourceCache:
+    def __init__(
+        self,
+        root: pathlib.Path,
+        *,
+        max_bytes: int = DEFAULT_SOURCE_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.root = root.resolve()
+        self.max_bytes = max(1, max_bytes)
+        self._clock = clock
+
+    def _entry(self, key: str) -> pathlib.Path:
+        if len(key) != 64 or any(character not in "0123456789abcdef" for character in key):
+            raise ValueError("source cache key must be a sha256 hex digest")
+        return self.root / key
+
+    @contextlib.contextmanager
+    def _locked(self, key: str, *, blocking: bool) -> Iterator[bool]:
+        locks = self.root / ".locks"
+        try:
+            locks.mkdir(parents=True, exist_ok=True)
+            handle = (locks / f"{key}.lock").open("a+b")
+        except OSError:
+            # An unwritable cache still lets the caller acquire directly, but never evicts.
+            yield blocking
+            return
+        with handle:
+            if fcntl is None:
+                yield True
+                return
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold the key while checking, filling or reading it so only one runner acquires a target."""
+        self._entry(key)
+        with self._locked(key, blocking=True):
+            yield
+
+    def materialize(self, key: str, parent: pathlib.Path) -> tuple[pathlib.Path, dict[str, Any]] | None:
+        """Link the cached tree under ``parent``; return the source root and stored provenance, or ``None``."""
+        entry = self._entry(key)
+        try:
+            metadata = json.loads((entry / "entry.json").read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if (
+            not isinstance(metadata, dict)
+            or metadata.get("schema") != SOURCE_CACHE_SCHEMA
+            or metadata.get("key") != key
+            or not isinstance(metadata.get("provenance"), dict)
+            or not (entry / "tree").is_dir()
+        ):
+            return None
+        source_root = parent / str(metadata.get("root_name") or "source")
+        try:
+            _link_tree(entry / "tree", source_root)
+        except (OSError, ValueError):
+            shutil.rmtree(parent, ignore_errors=True)
+            return None
+        now = self._clock()
+        with contextlib.suppress(OSError):
+            os.utime(entry / "entry.json", (now, now))
+        return source_root.resolve(), dict(metadata["provenance"])
+
+    def store(self, key: str, source_root: pathlib.Path, provenance: dict[str, Any]) -> None:
+        entry = self._entry(key)
+        if (entry / "entry.json").is_file():
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        temporary = self.root / f".{key}.{secrets.token_hex(4)}.tmp"
+        try:
+            size = _link_tree(source_root, temporary / "tree")
+            for path in (temporary / "tree").rglob("*"):
+                if path.is_file():
+                    os.chmod(path, READ_ONLY_FILE_MODE)
+            (temporary / "entry.json").write_text(
+                json.dumps(
+                    {
+                        "schema": SOURCE_CACHE_SCHEMA,
+                        "key": key,
+                        "stored_at": self._clock(),
+                        "root_name": source_root.name,
+                        "size_bytes": size,
+                        "provenance": provenance,
+                    },
+                    ensure_ascii=False,
+                ),
+                encoding="utf-8",
+            )
+            shutil.rmtree(entry, ignore_errors=True)
+            os.replace(temporary, entry)
+        finally:
+            shutil.rmtree(temporary, ignore_errors=True)
+        self.prune(keep=key)
+
+    def prune(self, *, keep: str = "") -> None:
+        """Evict least recently used entries until the cache fits ``max_bytes``; entries in use are skipped."""
+        entries: list[tuple[float, int, str]] = []
+        for metadata_path in self.root.glob("*/entry.json"):
+            if metadata_path.parent.name.startswith("."):
+                continue
+            try:
+                metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+                entries.append((metadata_path.stat().st_mtime, int(metadata.get("size_bytes") or 0), metadata_path.parent.name))
+            except (OSError, ValueError, AttributeError):
+                continue
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            with self._locked(key, blocking=False) as acquired:
+                if not acquired:
+                    continue
+                shutil.rmtree(self.root / key, ignore_errors=True)
+            total -= size
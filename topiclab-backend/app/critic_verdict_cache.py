@@ -0,0 +1,115 @@
+"""Content-addressed verdict cache shared by Critic runner processes.
+
+Entries are keyed by the sealed source manifest hash together with the target
+kind, evaluation profile, skill location and a rubric fingerprint (result
+schemas, provider model and critic kernel content). Re-submitting a GitHub
+commit or npm version that was already judged under the same rubric therefore
+returns the stored verdict instead of re-running the provider calls. Only
+completed verdicts are stored; blocked or failed runs are always retried.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import secrets
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+VERDICT_CACHE_SCHEMA = "topiclab_critic_verdict_cache_v1"
+DEFAULT_VERDICT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_VERDICT_CACHE_MAX_ENTRIES = 1000
+
+
+def verdict_cache_key(
+    *,
+    manifest_sha256: str,
+    kind: str,
+    evaluation_profile: str,
+    requested_subpath: str | None,
+    rubric: str,
+) -> str:
+    material = json.dumps(
+        [VERDICT_CACHE_SCHEMA, manifest_sha256, kind, evaluation_profile, requested_subpath or "", rubric],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    """One JSON file per key; reads refresh the file time so pruning is least-recently-used."""
+
+    def __init__(
+        self,
+        root: pathlib.Path,
+        *,
+        ttl_seconds: float = DEFAULT_VERDICT_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_VERDICT_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.root = root.resolve()
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+
+    def _path(self, key: str) -> pathlib.Path:
+        if len(key) != 64 or any(character not in "0123456789abcdef" for character in key):
+            raise ValueError("verdict cache key must be a sha256 hex digest")
+        return self.root / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get("schema") != VERDICT_CACHE_SCHEMA
+            or entry.get("key") != key
+            or not isinstance(entry.get("result"), dict)
+        ):
+            return None
+        now = self._clock()
+        if now - float(entry.get("cached_at") or 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        return {**entry["result"], "verdict_cache": {"hit": True, "key": key, "cached_at": entry["cached_at"]}}
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        path = self._path(key)
+        self.root.mkdir(parents=True, exist_ok=True)
+        stored = {name: value for name, value in result.items() if name != "verdict_cache"}
+        temporary = path.with_name(f"{path.name}.{secrets.token_hex(4)}.tmp")
+        temporary.write_text(
+            json.dumps(
+                {"schema": VERDICT_CACHE_SCHEMA, "key": key, "cached_at": self._clock(), "result": stored},
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(temporary, path)
+        self.prune()
+
+    def prune(self) -> None:
+        entries: list[tuple[float, pathlib.Path]] = []
+        for path in self.root.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        entries.sort(key=lambda item: item[0])
+        expired = self._clock() - self.ttl_seconds
+        overflow = max(0, len(entries) - self.max_entries)
+        for index, (modified, path) in enumerate(entries):
+            if index < overflow or modified < expired:
+                path.unlink(missing_ok=True)
@@ -21,6 +21,7 @@ from typing import Any
 
 from fastapi import BackgroundTasks, FastAPI, Header, HTTPException, Query
 
+from app.critic_scheduler import PRIORITY_CLASSES, CriticJobScheduler
 from app.critic_security import (
     derive_worker_token,
     is_supported_github_target,
@@ -38,13 +39,24 @@ RUNTIME = {
 }
 TERMINAL_STATUSES = {"completed", "failed", "blocked", "unverifiable"}
 ACTIVE_STATUSES = {"queued", "running"}
-MAX_CONCURRENT_JOBS = 1
-MAX_PENDING_JOBS = 8
+MAX_CONCURRENT_JOBS = 2
+MAX_PENDING_JOBS = 16
+MAX_PENDING_JOBS_PER_REQUESTER = 4
 JOB_RETENTION_SECONDS = 24 * 60 * 60
 MAX_STORED_JOBS = 100
 Runner = Callable[[dict[str, Any], pathlib.Path], dict[str, Any] | Awaitable[dict[str, Any]]]
 DEFAULT_RUNNER_COMMAND = f'"{sys.executable}" -m app.critic_runner'
 DEFAULT_RUNNER_PROFILE = "standard_v1"
+SHARED_TARGET_KEYS = ("kind", "target", "depth", "evaluation_profile")
+SHARED_RESULT_EXCLUDED_KEYS = {
+    "job_id",
+    "requester_id",
+    "created_at",
+    "updated_at",
+    "priority",
+    "queue_wait_seconds",
+    "shared_job_id",
+}
 
 
 def _default_state_dir() -> pathlib.Path:
@@ -75,6 +87,22 @@ def _parsed_timestamp(raw: object, fallback: datetime) -> datetime:
     return value.astimezone(timezone.utc)
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, "") or default)
+    except ValueError:
+        return default
+
+
+def _job_priority(request: dict[str, Any]) -> int:
+    """Index into ``PRIORITY_CLASSES``: npm packages and basic checks first, full repo critiques last."""
+    if request["depth"] == "basic" or not is_supported_github_target(request["target"]):
+        return 0
+    if request["depth"] == "full":
+        return 2
+    return 1
+
+
 def _is_valid_target(kind: str, target: str) -> bool:
     is_https = is_supported_github_target(target)
     if kind == "skill":
@@ -175,6 +203,17 @@ class JobStore:
                     return dict(job)
         return None
 
+    def find_shared(self, request: dict[str, Any], candidates: set[str]) -> dict[str, Any] | None:
+        """Return an active job among ``candidates`` that evaluates the same target under the same contract."""
+        with self._lock:
+            for job_id in candidates:
+                job = self._jobs.get(job_id)
+                if not job or job.get("status") not in ACTIVE_STATUSES:
+                    continue
+                if all(job.get(key) == request.get(key) for key in SHARED_TARGET_KEYS):
+                    return dict(job)
+        return None
+
     def cleanup(self) -> None:
         with self._lock:
             now = datetime.now(timezone.utc)
@@ -359,8 +398,9 @@ def create_critic_worker_app(
     runner: Runner | None = None,
     worker_token: str | None = None,
     state_dir: pathlib.Path | None = None,
-    max_concurrent_jobs: int = MAX_CONCURRENT_JOBS,
-    max_pending_jobs: int = MAX_PENDING_JOBS,
+    max_concurrent_jobs: int | None = None,
+    max_pending_jobs: int | None = None,
+    max_pending_jobs_per_requester: int | None = None,
     retention_seconds: int = JOB_RETENTION_SECONDS,
     max_stored_jobs: int = MAX_STORED_JOBS,
 ) -> FastAPI:
@@ -373,11 +413,26 @@ def create_critic_worker_app(
         retention_seconds=retention_seconds,
         max_stored_jobs=max_stored_jobs,
     )
-    concurrent_limit = max(1, max_concurrent_jobs)
-    outstanding_limit = concurrent_limit + max(0, max_pending_jobs)
-    semaphore = asyncio.Semaphore(concurrent_limit)
-    capacity_lock = asyncio.Lock()
-    outstanding_jobs = 0
+    scheduler = CriticJobScheduler(
+        slots=(
+            max_concurrent_jobs
+            if max_concurrent_jobs is not None
+            else _env_int("CRITIC_WORKER_MAX_CONCURRENT_JOBS", MAX_CONCURRENT_JOBS)
+        ),
+        max_pending=(
+            max_pending_jobs
+            if max_pending_jobs is not None
+            else _env_int("CRITIC_WORKER_MAX_PENDING_JOBS", MAX_PENDING_JOBS)
+        ),
+        max_pending_per_requester=(
+            max_pending_jobs_per_requester
+            if max_pending_jobs_per_requester is not None
+            else _env_int("CRITIC_WORKER_MAX_PENDING_JOBS_PER_REQUESTER", MAX_PENDING_JOBS_PER_REQUESTER)
+        ),
+    )
+    # Jobs that actually run, resolved with their final state so that identical
+    # submissions from other requesters can share one evaluation.
+    completions: dict[str, asyncio.Future[dict[str, Any] | None]] = {}
     worker = FastAPI(title="TopicLab Critic Worker", docs_url=None, redoc_url=None)
     runner_ready = selected_runner is not None and (
         not isinstance(selected_runner, SubprocessRunner) or selected_runner.ready
@@ -390,56 +445,65 @@ def create_critic_worker_app(
         if not authorization or not secrets.compare_digest(authorization, expected):
             raise HTTPException(status_code=401, detail="Worker authentication failed")
 
-    async def reserve_request(request: dict[str, Any]) -> tuple[dict[str, Any] | None, bool]:
-        nonlocal outstanding_jobs
-        async with capacity_lock:
-            existing = store.find_active(request)
-            if existing is not None:
-                return existing, False
-            if outstanding_jobs >= outstanding_limit:
-                return None, False
-            outstanding_jobs += 1
-            return None, True
-
-    async def release_capacity() -> None:
-        nonlocal outstanding_jobs
-        async with capacity_lock:
-            outstanding_jobs = max(0, outstanding_jobs - 1)
-
     async def run_job(job_id: str, request: dict[str, Any]) -> None:
+        final: dict[str, Any] | None = None
         try:
-            async with semaphore:
-                job = store.get(job_id)
-                if not job:
-                    return
-                job["status"] = "running"
-                job["progress"] = {"current_step": "validation", "completed_steps": [], "total_steps": 4}
-                store.write(job)
-                try:
-                    result = selected_runner(request, store.job_dir(job_id)) if selected_runner else None
-                    if inspect.isawaitable(result):
-                        result = await result
-                    if not isinstance(result, dict):
-                        raise RuntimeError("critic runner is unavailable")
-                    status = str(result.get("status") or "failed")
-                    if status not in TERMINAL_STATUSES:
-                        raise ValueError("runner returned a non-terminal status")
-                    job.update(result)
-                    job["status"] = status
-                except Exception as exc:
-                    job.update(
-                        {
-                            "status": "failed",
-                            "message": "评测执行器发生错误",
-                            "error_type": type(exc).__name__,
-                        }
-                    )
-                job["progress"] = _result_progress(job)
-                job["trace"] = _trace_events(store.job_dir(job_id))
-                store.write(job)
-                store.cleanup()
+            waited = await scheduler.acquire(job_id)
+            job = store.get(job_id)
+            if not job:
+                return
+            job["status"] = "running"
+            job["queue_wait_seconds"] = round(waited, 3)
+            job["progress"] = {"current_step": "validation", "completed_steps": [], "total_steps": 4}
+            store.write(job)
+            try:
+                result = selected_runner(request, store.job_dir(job_id)) if selected_runner else None
+                if inspect.isawaitable(result):
+                    result = await result
+                if not isinstance(result, dict):
+                    raise RuntimeError("critic runner is unavailable")
+                status = str(result.get("status") or "failed")
+                if status not in TERMINAL_STATUSES:
+                    raise ValueError("runner returned a non-terminal status")
+                job.update(result)
+                job["status"] = status
+            except Exception as exc:
+                job.update(
+                    {
+                        "status": "failed",
+                        "message": "评测执行器发生错误",
+                        "error_type": type(exc).__name__,
+                    }
+                )
+            job["progress"] = _result_progress(job)
+            job["trace"] = _trace_events(store.job_dir(job_id))
+            store.write(job)
+            final = job
+            store.cleanup()
         finally:
-            await release_capacity()
+            scheduler.release(job_id)
+            completion = completions.pop(job_id, None)
+            if completion is not None and not completion.done():
+                completion.set_result(final)
+
+    async def follow_job(job_id: str, shared_job_id: str, completion: asyncio.Future[dict[str, Any] | None]) -> None:
+        final = await asyncio.shield(completion)
+        job = store.get(job_id)
+        if not job:
+            return
+        if final is None:
+            job.update(
+                {
+                    "status": "failed",
+                    "message": "共享的评测任务未能完成，请重新提交",
+                    "error_type": "SharedJobAborted",
+                }
+            )
+        else:
+            job.update({key: value for key, value in final.items() if key not in SHARED_RESULT_EXCLUDED_KEYS})
+        job["shared_job_id"] = shared_job_id
+        store.write(job)
+        store.cleanup()
 
     @worker.get("/health")
     async def health():
@@ -460,16 +524,38 @@ def create_critic_worker_app(
         if not runner_ready:
             raise HTTPException(status_code=503, detail="Critic runner is not configured")
         request = _validate_request(payload)
-        existing, reserved = await reserve_request(request)
+        existing = store.find_active(request)
         if existing is not None:
             return existing
-        if not reserved:
+        job_id = uuid.uuid4().hex
+        shared = store.find_shared(request, set(completions))
+        if shared is not None:
+            store.job_dir(job_id).mkdir(parents=True, exist_ok=False)
+            _atomic_json(store.job_dir(job_id) / "request.json", request)
+            job = {
+                "job_id": job_id,
+                "status": shared["status"],
+                **request,
+                "priority": shared.get("priority"),
+                "shared_job_id": shared["job_id"],
+                "progress": shared.get("progress"),
+                "trace": [],
+            }
+            store.write(job)
+            background_tasks.add_task(follow_job, job_id, shared["job_id"], completions[shared["job_id"]])
+            return job
+        priority = _job_priority(request)
+        refused = scheduler.submit(job_id, request["requester_id"], priority)
+        if refused is not None:
             raise HTTPException(
                 status_code=429,
-                detail="Critic Worker 队列已满，请稍后再试",
+                detail=(
+                    "你提交的评测排队数已达上限，请等待已有评测完成"
+                    if refused == "requester_limit"
+                    else "Critic Worker 队列已满，请稍后再试"
+                ),
                 headers={"Retry-After": "60"},
             )
-        job_id = uuid.uuid4().hex
         try:
             job_dir = store.job_dir(job_id)
             job_dir.mkdir(parents=True, exist_ok=False)
@@ -478,16 +564,23 @@ def create_critic_worker_app(
                 "job_id": job_id,
                 "status": "queued",
                 **request,
+                "priority": PRIORITY_CLASSES[priority],
                 "progress": {"current_step": "validation", "completed_steps": [], "total_steps": 4},
                 "trace": [],
             }
             store.write(job)
+            completions[job_id] = asyncio.get_running_loop().create_future()
             background_tasks.add_task(run_job, job_id, request)
             return job
         except Exception:
-            await release_capacity()
+            scheduler.release(job_id)
             raise
 
+    @worker.get("/api/v1/scheduler")
+    async def scheduler_stats(authorization: str | None = Header(default=None)):
+        authorize(authorization)
+        return scheduler.stats()
+
     @worker.get("/api/v1/evaluations/{job_id}")
     async def get_job(
         job_id: str,
@@ -498,11 +591,17 @@ def create_critic_worker_app(
         job = store.get(job_id)
         if not job or int(job.get("requester_id") or 0) != requester_id:
             raise HTTPException(status_code=404, detail="Evaluation job not found")
+        source_id = job_id
+        if job.get("shared_job_id") and job.get("status") in ACTIVE_STATUSES:
+            shared = store.get(str(job["shared_job_id"]))
+            if shared and shared.get("status") in ACTIVE_STATUSES:
+                source_id = shared["job_id"]
+                job["status"] = shared["status"]
         if job.get("status") == "running":
-            progress = _running_progress(store.job_dir(job_id))
+            progress = _running_progress(store.job_dir(source_id))
             if progress is not None:
                 job["progress"] = progress
-            job["trace"] = _trace_events(store.job_dir(job_id))
+            job["trace"] = _trace_events(store.job_dir(source_id))
         return job
 
     return worker
@@ -0,0 +1,109 @@
+"""AIMD concurrency limit for calls to a shared upstream.
+
+Each response under ``latency_target_seconds`` grows the limit by ``1 / limit``
+(about +1 per fully used window); a throttled (429) or slow response multiplies
+it by ``backoff_factor``, at most once per ``cooldown_seconds`` so a burst of
+concurrent failures counts as one congestion signal.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import time
+from collections import deque
+from typing import Any, AsyncIterator
+
+
+class AdaptiveConcurrencyLimit:
+    def __init__(
+        self,
+        *,
+        initial: int = 1,
+        minimum: int = 1,
+        maximum: int = 8,
+        latency_target_seconds: float = 20.0,
+        backoff_factor: float = 0.5,
+        cooldown_seconds: float | None = None,
+    ) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.latency_target_seconds = latency_target_seconds
+        self.backoff_factor = min(max(backoff_factor, 0.1), 0.9)
+        self.cooldown_seconds = latency_target_seconds if cooldown_seconds is None else cooldown_seconds
+        self._limit = float(min(self.maximum, max(self.minimum, initial)))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._last_decrease = -math.inf
+        self.throttled = 0
+        self.slow = 0
+
+    @property
+    def limit(self) -> int:
+        return max(self.minimum, min(self.maximum, int(self._limit)))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self._in_flight -= 1
+                self._wake()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        self._in_flight = max(0, self._in_flight - 1)
+        self._wake()
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def record(self, latency_seconds: float, *, throttled: bool = False) -> None:
+        """Feed one upstream response into the limit."""
+        if throttled or latency_seconds > self.latency_target_seconds:
+            if throttled:
+                self.throttled += 1
+            else:
+                self.slow += 1
+            now = time.monotonic()
+            if now - self._last_decrease >= self.cooldown_seconds:
+                self._last_decrease = now
+                self._limit = max(float(self.minimum), self._limit * self.backoff_factor)
+            return
+        self._limit = min(float(self.maximum), self._limit + 1.0 / max(self._limit, 1.0))
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "throttled": self.throttled,
+            "slow": self.slow,
+        }
@@ -0,0 +1,119 @@
+"""Chunked, resumable and throttled bulk loads for offline TopicLink maintenance scripts.
+
+Sources are streamed as ``(line_number, row)`` pairs and cut into chunks; after
+each chunk is durably written the caller records the last line in a
+:class:`Checkpoint`, so an interrupted run resumes after that line instead of
+starting over. :class:`RowRateLimiter` keeps the long-run write rate under a
+budget so a backfill can share the single-writer Zvec sidecar with live traffic.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+
+T = TypeVar("T")
+
+
+def source_fingerprint(path: Path) -> dict[str, Any]:
+    """Identity of a source file; a checkpoint only applies to the same bytes."""
+    resolved = path.expanduser().resolve()
+    info = resolved.stat()
+    return {"path": str(resolved), "size": info.st_size, "mtime_ns": info.st_mtime_ns}
+
+
+@dataclass
+class Checkpoint:
+    path: Path
+    source: dict[str, Any]
+    line: int = 0
+    rows: int = 0
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path, source_path: Path) -> Checkpoint:
+        fingerprint = source_fingerprint(source_path)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return cls(path=path, source=fingerprint)
+        if not isinstance(payload, dict) or payload.get("source") != fingerprint:
+            return cls(path=path, source=fingerprint)
+        return cls(
+            path=path,
+            source=fingerprint,
+            line=int(payload.get("line") or 0),
+            rows=int(payload.get("rows") or 0),
+            extra=dict(payload.get("extra") or {}),
+        )
+
+    def advance(self, line: int, rows: int) -> None:
+        self.line = line
+        self.rows += rows
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f"{self.path.name}.tmp")
+        temporary.write_text(
+            json.dumps(
+                {"source": self.source, "line": self.line, "rows": self.rows, "extra": self.extra},
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(temporary, self.path)
+
+    def complete(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+class RowRateLimiter:
+    """Sleep so that rows written since start stay under ``rows_per_second``."""
+
+    def __init__(
+        self,
+        rows_per_second: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rows_per_second = max(0.0, rows_per_second)
+        self._clock = clock
+        self._sleep = sleep
+        self._started = clock()
+        self._rows = 0
+
+    def wait(self, rows: int) -> float:
+        """Account for ``rows`` about to be written; return the seconds slept."""
+        if self.rows_per_second <= 0:
+            return 0.0
+        self._rows += rows
+        delay = self._started + self._rows / self.rows_per_second - self._clock()
+        if delay > 0:
+            self._sleep(delay)
+            return delay
+        return 0.0
+
+
+def iter_chunks(
+    rows: Iterable[tuple[int, T]],
+    size: int,
+    *,
+    after_line: int = 0,
+) -> Iterator[list[tuple[int, T]]]:
+    """Group ``(line_number, row)`` pairs into lists of ``size``, skipping lines up to ``after_line``."""
+    if size < 1:
+        raise ValueError("chunk size must be at least 1")
+    chunk: list[tuple[int, T]] = []
+    for line_number, row in rows:
+        if line_number <= after_line:
+            continue
+        chunk.append((line_number, row))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,193 @@
+"""Micro-batched client for OpenAI-compatible ``/embeddings`` endpoints.
+
+Concurrent callers enqueue texts; everything enqueued for the same endpoint within
+``window_seconds`` is merged (duplicates, including texts already in flight, share
+one slot), split into batches of ``max_batch_size`` and sent concurrently, at most
+``max_concurrency`` in flight per endpoint, over the pooled client from
+:mod:`app.services.http_client`. Each batch retries transport errors, 429 and 5xx
+responses with exponential backoff.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from app.services.http_client import get_shared_async_client
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+
+class EmbeddingBatchError(RuntimeError):
+    """Raised to every caller whose texts were in a batch that could not be embedded."""
+
+
+@dataclass(frozen=True)
+class EmbeddingEndpoint:
+    base_url: str
+    api_key: str
+    model: str
+    max_batch_size: int = 32
+    max_concurrency: int = 4
+
+    @property
+    def url(self) -> str:
+        return f"{self.base_url.rstrip('/')}/embeddings"
+
+
+@dataclass
+class _LoopState:
+    pending: dict[EmbeddingEndpoint, dict[str, list[asyncio.Future]]] = field(default_factory=dict)
+    in_flight: dict[EmbeddingEndpoint, dict[str, list[asyncio.Future]]] = field(default_factory=dict)
+    flushes: dict[EmbeddingEndpoint, asyncio.TimerHandle] = field(default_factory=dict)
+    limits: dict[EmbeddingEndpoint, asyncio.Semaphore] = field(default_factory=dict)
+    tasks: set[asyncio.Task] = field(default_factory=set)
+
+
+class EmbeddingBatcher:
+    def __init__(
+        self,
+        *,
+        client_name: str = "embeddings",
+        window_seconds: float = 0.01,
+        timeout_seconds: float = 60.0,
+        max_attempts: int = 3,
+        backoff_seconds: float = 0.5,
+    ) -> None:
+        self.client_name = client_name
+        self.window_seconds = window_seconds
+        self.timeout_seconds = timeout_seconds
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self._states: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState] = weakref.WeakKeyDictionary()
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = self._states[loop] = _LoopState()
+        return state
+
+    async def embed(self, endpoint: EmbeddingEndpoint, texts: list[str]) -> list[list[float]]:
+        """Return one vector per text, in order; raises ``EmbeddingBatchError`` on failure."""
+
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        state = self._state()
+        pending = state.pending.setdefault(endpoint, {})
+        in_flight = state.in_flight.setdefault(endpoint, {})
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            (in_flight[text] if text in in_flight else pending.setdefault(text, [])).append(future)
+            futures.append(future)
+        if len(pending) >= endpoint.max_batch_size:
+            self._flush(state, endpoint, full_batches_only=True)
+        if pending and endpoint not in state.flushes:
+            state.flushes[endpoint] = loop.call_later(self.window_seconds, self._flush, state, endpoint)
+        return list(await asyncio.gather(*futures))
+
+    def _flush(self, state: _LoopState, endpoint: EmbeddingEndpoint, *, full_batches_only: bool = False) -> None:
+        """Send pending texts; with ``full_batches_only`` a partial tail keeps waiting for the window."""
+
+        size = max(1, endpoint.max_batch_size)
+        pending = state.pending.get(endpoint, {})
+        in_flight = state.in_flight.setdefault(endpoint, {})
+        entries = list(pending.items())
+        sendable = len(entries) - len(entries) % size if full_batches_only else len(entries)
+        for text, _ in entries[:sendable]:
+            in_flight[text] = pending.pop(text)
+        if not pending:
+            state.pending.pop(endpoint, None)
+            timer = state.flushes.pop(endpoint, None)
+            if timer is not None:
+                timer.cancel()
+        elif not full_batches_only:
+            state.flushes.pop(endpoint, None)
+        for start in range(0, sendable, size):
+            batch = [text for text, _ in entries[start:start + size]]
+            task = asyncio.create_task(self._send(state, endpoint, batch))
+            state.tasks.add(task)
+            task.add_done_callback(state.tasks.discard)
+
+    async def _send(
+        self,
+        state: _LoopState,
+        endpoint: EmbeddingEndpoint,
+        batch: list[str],
+    ) -> None:
+        limit = state.limits.get(endpoint)
+        if limit is None:
+            limit = state.limits[endpoint] = asyncio.Semaphore(max(1, endpoint.max_concurrency))
+        vectors: list[list[float]] | None = None
+        error: EmbeddingBatchError | None = None
+        try:
+            async with limit:
+                vectors = await self._post_with_retry(endpoint, batch)
+        except Exception as exc:
+            error = exc if isinstance(exc, EmbeddingBatchError) else EmbeddingBatchError(str(exc) or type(exc).__name__)
+        in_flight = state.in_flight.get(endpoint, {})
+        for position, text in enumerate(batch):
+            for future in in_flight.pop(text, []):
+                if future.done():
+                    continue
+                if vectors is None:
+                    future.set_exception(error or EmbeddingBatchError("embedding request failed"))
+                else:
+                    future.set_result(vectors[position])
+
+    async def _post_with_retry(self, endpoint: EmbeddingEndpoint, batch: list[str]) -> list[list[float]]:
+        client = get_shared_async_client(self.client_name)
+        for attempt in range(1, self.max_attempts + 1):
+            delay = self.backoff_seconds * 2 ** (attempt - 1)
+            try:
+                res = await client.post(
+                    endpoint.url,
+                    headers={"Authorization": f"Bearer {endpoint.api_key}"},
+                    json={"model": endpoint.model, "input": batch},
+                    timeout=self.timeout_seconds,
+                )
+            except httpx.TransportError as exc:
+                if attempt == self.max_attempts:
+                    raise EmbeddingBatchError(f"embedding request failed: {type(exc).__name__}") from exc
+            else:
+                if res.status_code not in RETRYABLE_STATUS_CODES:
+                    res.raise_for_status()
+                    return _parse_embeddings(res.json(), len(batch))
+                if attempt == self.max_attempts:
+                    raise EmbeddingBatchError(f"embedding request failed with HTTP {res.status_code}")
+                delay = max(delay, _retry_after_seconds(res))
+            logger.info("Embedding batch of %s attempt %s failed; retrying in %.2fs", len(batch), attempt, delay)
+            await asyncio.sleep(delay)
+        raise EmbeddingBatchError("embedding request failed")
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    try:
+        return min(MAX_RETRY_AFTER_SECONDS, max(0.0, float(response.headers.get("Retry-After", "0"))))
+    except ValueError:
+        return 0.0
+
+
+def _parse_embeddings(payload: Any, expected: int) -> list[list[float]]:
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if not isinstance(data, list) or len(data) != expected:
+        raise EmbeddingBatchError("embedding response does not match the batch")
+    if all(isinstance(item, dict) and isinstance(item.get("index"), int) for item in data):
+        data = sorted(data, key=lambda item: item["index"])
+    vectors = []
+    for item in data:
+        embedding = item.get("embedding") if isinstance(item, dict) else None
+        if not isinstance(embedding, list):
+            raise EmbeddingBatchError("embedding response item has no vector")
+        vectors.append([float(value) for value in embedding])
+    return vectors
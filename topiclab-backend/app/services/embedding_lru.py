@@ -0,0 +1,81 @@
+"""Memory-budgeted, thread-safe LRU of float32 embeddings.
+
+Entries are keyed by ``(text_hash, model, dimensions)`` so a model or dimension
+switch never serves a stale vector. The budget counts vector bytes only.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+EmbeddingKey = tuple[str, str, int]
+
+
+class EmbeddingLRU:
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, max_bytes)
+        self._entries: OrderedDict[EmbeddingKey, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Sequence[EmbeddingKey]) -> list[list[float] | None]:
+        found: list[list[float] | None] = []
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is None:
+                    self._misses += 1
+                    found.append(None)
+                    continue
+                self._hits += 1
+                self._entries.move_to_end(key)
+                found.append(vector.tolist())
+        return found
+
+    def put_many(self, items: Iterable[tuple[EmbeddingKey, Sequence[float]]]) -> None:
+        if not self.max_bytes:
+            return
+        with self._lock:
+            for key, vector in items:
+                array = np.array(vector, dtype=np.float32)
+                if array.ndim != 1 or len(array) != key[2] or array.nbytes > self.max_bytes:
+                    continue
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._bytes -= previous.nbytes
+                self._entries[key] = array
+                self._bytes += array.nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def recent_keys(self) -> list[EmbeddingKey]:
+        """Keys from most to least recently used."""
+
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
@@ -7,12 +7,15 @@ import httpx
 _clients: dict[str, httpx.AsyncClient] = {}
 
 
-def get_shared_async_client(name: str = "default") -> httpx.AsyncClient:
+def get_shared_async_client(name: str = "default", *, uds: str | None = None) -> httpx.AsyncClient:
+    """Return the pooled client for ``name``; ``uds`` routes it over a Unix domain socket."""
     client = _clients.get(name)
     if client is not None:
         return client
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
     client = httpx.AsyncClient(
-        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        limits=limits,
+        transport=httpx.AsyncHTTPTransport(uds=uds, limits=limits) if uds else None,
     )
     _clients[name] = client
     return client
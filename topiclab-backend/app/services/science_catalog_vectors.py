@@ -0,0 +1,230 @@
+"""Offline hash-embedding index and rank fusion for the science skill/MCP finders.
+
+Catalog entries are embedded as IDF-weighted, signed feature hashes of their words,
+character trigrams and CJK n-grams. That gives morphology- and script-tolerant
+similarity (``proteins`` ~ ``protein``, ``单细胞测序`` ~ ``单细胞``) without a model
+download. The build step writes one flat float32 file per catalog that workers
+memory-map, so the matrix is shared through the OS page cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import re
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+VECTOR_DIMENSIONS = 4096
+VECTOR_FILE_MAGIC = b"TLSCVEC1"
+_HEADER = struct.Struct("<8sIII64s")
+EMBEDDING_FIELD_WEIGHTS = (
+    ("name", 3.0),
+    ("id", 3.0),
+    ("task", 3.0),
+    ("summary", 2.0),
+    ("description", 1.0),
+    ("tags", 2.0),
+    ("capabilities", 1.0),
+    ("subdomain", 1.0),
+)
+TRIGRAM_WEIGHT = 0.35
+RRF_K = 60
+
+
+def _hashed(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(entry) for entry in value)
+    return str(value or "")
+
+
+def text_features(text: str, *, stopwords: Iterable[str] = ()) -> dict[int, float]:
+    """Hash words, word trigrams and CJK 2/3-grams of ``text`` into weighted features."""
+
+    skipped = set(stopwords)
+    normalized = text.casefold()
+    features: dict[int, float] = {}
+
+    def add(feature: str, weight: float) -> None:
+        key = _hashed(feature)
+        features[key] = features.get(key, 0.0) + weight
+
+    for word in re.findall(r"[a-z0-9]+", normalized):
+        if len(word) < 2 or word in skipped:
+            continue
+        add(word, 1.0)
+        padded = f"^{word}$"
+        for index in range(len(padded) - 2):
+            add(padded[index : index + 3], TRIGRAM_WEIGHT)
+    for run in re.findall(r"[\u4e00-\u9fff]+", normalized):
+        for width, weight in ((2, 1.0), (3, 0.5)):
+            for index in range(max(0, len(run) - width + 1)):
+                gram = run[index : index + width]
+                if gram not in skipped:
+                    add(gram, weight)
+    return features
+
+
+def item_features(item: dict[str, Any]) -> dict[int, float]:
+    features: dict[int, float] = {}
+    for field, weight in EMBEDDING_FIELD_WEIGHTS:
+        for key, value in text_features(_field_text(item.get(field))).items():
+            features[key] = features.get(key, 0.0) + weight * value
+    return features
+
+
+@dataclass(frozen=True)
+class CatalogVectors:
+    """Row-aligned unit vectors for one catalog plus the feature IDF table."""
+
+    matrix: np.ndarray
+    feature_keys: np.ndarray
+    feature_idf: np.ndarray
+    source_sha256: str
+
+    def embed(self, text: str, *, stopwords: Iterable[str] = ()) -> np.ndarray:
+        vector = np.zeros(self.matrix.shape[1], dtype=np.float32)
+        features = text_features(text, stopwords=stopwords)
+        if not features or not len(self.feature_keys):
+            return vector
+        keys = np.fromiter(features, dtype=np.uint64, count=len(features))
+        weights = np.fromiter(features.values(), dtype=np.float32, count=len(features))
+        positions = np.minimum(np.searchsorted(self.feature_keys, keys), len(self.feature_keys) - 1)
+        idf = np.where(self.feature_keys[positions] == keys, self.feature_idf[positions], 0.0).astype(np.float32)
+        _accumulate(vector, keys, weights * idf)
+        return _normalized(vector)
+
+    def similarities(self, query_vector: np.ndarray) -> np.ndarray:
+        return self.matrix @ query_vector
+
+    def nearest(self, query_vector: np.ndarray, *, limit: int, minimum: float, candidates: Sequence[int] | None = None) -> list[tuple[int, float]]:
+        """Return ``(row, cosine)`` pairs above ``minimum``, best first."""
+
+        if not np.any(query_vector):
+            return []
+        rows = np.arange(self.matrix.shape[0]) if candidates is None else np.asarray(candidates, dtype=np.int64)
+        if not len(rows):
+            return []
+        scores = self.matrix[rows] @ query_vector if candidates is not None else self.similarities(query_vector)
+        take = min(limit, len(rows))
+        best = np.argpartition(-scores, take - 1)[:take]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(int(rows[index]), float(scores[index])) for index in best if scores[index] >= minimum]
+
+
+def _accumulate(vector: np.ndarray, keys: np.ndarray, weights: np.ndarray) -> None:
+    buckets = (keys % np.uint64(vector.shape[0])).astype(np.int64)
+    signs = np.where((keys >> np.uint64(63)) == 1, -1.0, 1.0).astype(np.float32)
+    np.add.at(vector, buckets, signs * weights)
+
+
+def _normalized(vector: np.ndarray) -> np.ndarray:
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm > 0 else vector
+
+
+def embed_catalog(items: Sequence[dict[str, Any]], *, source_sha256: str) -> CatalogVectors:
+    per_item = [item_features(item) for item in items]
+    frequencies: dict[int, int] = {}
+    for features in per_item:
+        for key in features:
+            frequencies[key] = frequencies.get(key, 0) + 1
+    total = max(1, len(items))
+    feature_keys = np.fromiter(sorted(frequencies), dtype=np.uint64, count=len(frequencies))
+    feature_idf = np.fromiter(
+        (math.log(1 + total / frequencies[int(key)]) for key in feature_keys),
+        dtype=np.float32,
+        count=len(feature_keys),
+    )
+    idf_by_key = dict(zip(feature_keys.tolist(), feature_idf.tolist()))
+    matrix = np.zeros((len(items), VECTOR_DIMENSIONS), dtype=np.float32)
+    for row, features in enumerate(per_item):
+        if not features:
+            continue
+        keys = np.fromiter(features, dtype=np.uint64, count=len(features))
+        weights = np.fromiter(
+            (value * idf_by_key[key] for key, value in features.items()),
+            dtype=np.float32,
+            count=len(features),
+        )
+        _accumulate(matrix[row], keys, weights)
+        matrix[row] = _normalized(matrix[row])
+    return CatalogVectors(matrix, feature_keys, feature_idf, source_sha256)
+
+
+def write_vector_file(vectors: CatalogVectors, destination: Path) -> None:
+    """Write ``header | feature keys | feature idf | matrix`` atomically."""
+
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    temporary = destination.with_suffix(destination.suffix + ".tmp")
+    rows, dimensions = vectors.matrix.shape
+    with temporary.open("wb") as handle:
+        handle.write(
+            _HEADER.pack(
+                VECTOR_FILE_MAGIC,
+                dimensions,
+                rows,
+                len(vectors.feature_keys),
+                vectors.source_sha256.encode("ascii"),
+            )
+        )
+        handle.write(np.ascontiguousarray(vectors.feature_keys, dtype="<u8").tobytes())
+        handle.write(np.ascontiguousarray(vectors.feature_idf, dtype="<f4").tobytes())
+        handle.write(np.ascontiguousarray(vectors.matrix, dtype="<f4").tobytes())
+    temporary.replace(destination)
+
+
+def read_vector_file(path: Path, *, source_sha256: str, expected_rows: int) -> CatalogVectors | None:
+    """Memory-map a vector file, or return ``None`` if it is missing or stale."""
+
+    try:
+        with path.open("rb") as handle:
+            magic, dimensions, rows, vocabulary, digest = _HEADER.unpack(handle.read(_HEADER.size))
+    except (OSError, struct.error):
+        return None
+    if (
+        magic != VECTOR_FILE_MAGIC
+        or digest.decode("ascii", "replace") != source_sha256
+        or rows != expected_rows
+        or dimensions != VECTOR_DIMENSIONS
+    ):
+        return None
+    offset = _HEADER.size
+    expected_size = offset + vocabulary * 12 + rows * dimensions * 4
+    if path.stat().st_size != expected_size:
+        return None
+    feature_keys = np.memmap(path, dtype="<u8", mode="r", offset=offset, shape=(vocabulary,))
+    offset += vocabulary * 8
+    feature_idf = np.memmap(path, dtype="<f4", mode="r", offset=offset, shape=(vocabulary,))
+    offset += vocabulary * 4
+    matrix = np.memmap(path, dtype="<f4", mode="r", offset=offset, shape=(rows, dimensions))
+    return CatalogVectors(matrix, feature_keys, feature_idf, source_sha256)
+
+
+def load_catalog_vectors(path: Path, items: Sequence[dict[str, Any]], *, source_sha256: str) -> CatalogVectors:
+    vectors = read_vector_file(path, source_sha256=source_sha256, expected_rows=len(items))
+    if vectors is not None:
+        return vectors
+    logger.info("Science catalog vectors at %s are missing or stale; embedding in process", path.name)
+    return embed_catalog(items, source_sha256=source_sha256)
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[int]], *, k: int = RRF_K) -> dict[int, float]:
+    """Fuse best-first rankings: ``score(d) = sum(1 / (k + rank_i(d)))``."""
+
+    fused: dict[int, float] = {}
+    for ranking in rankings:
+        for rank, document in enumerate(ranking, start=1):
+            fused[document] = fused.get(document, 0.0) + 1.0 / (k + rank)
+    return fused
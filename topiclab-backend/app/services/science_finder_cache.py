@@ -0,0 +1,99 @@
+"""Cross-worker result cache and single-flight for the science skill/MCP finders."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import unicodedata
+from typing import Any, Awaitable, Callable
+
+from starlette.concurrency import run_in_threadpool
+
+from app.services.single_flight_cache import SingleFlightCache
+
+
+logger = logging.getLogger(__name__)
+DEFAULT_FINDER_CACHE_TTL_SECONDS = 3600.0
+# Two AgentScope calls with a 90s client timeout each bound the leader's work.
+FINDER_CACHE_LEASE_SECONDS = 180.0
+
+FINDER_CACHE = SingleFlightCache(
+    table="finder_results",
+    env_prefix="SCIENCE_FINDER",
+    default_ttl_seconds=DEFAULT_FINDER_CACHE_TTL_SECONDS,
+    lease_seconds=FINDER_CACHE_LEASE_SECONDS,
+    label="Science finder",
+)
+
+
+def normalize_finder_query(query: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def finder_cache_key(kind: str, query: str, *, limit: int, allow_model: bool, version: str) -> str:
+    material = json.dumps(
+        [kind, normalize_finder_query(query), int(limit), bool(allow_model), version],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _is_cacheable(result: dict[str, Any], *, allow_model: bool) -> bool:
+    """Cache deterministic catalog answers and complete model answers, never degraded fallbacks."""
+
+    return not allow_model or (result.get("driver") or {}).get("mode") in {"model", "hybrid_local"}
+
+
+def _cached_result(payload: str, query: str) -> dict[str, Any]:
+    result = json.loads(payload)
+    result["query"] = query.strip()
+    result.setdefault("driver", {})["cached"] = True
+    return result
+
+
+def replay_finder_events(result: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
+    """Rebuild the route/result stream events for an answer served from cache."""
+
+    return [("route", result["route"]), *(("result", item) for item in result.get("results") or [])]
+
+
+async def cached_finder_result(
+    kind: str,
+    query: str,
+    *,
+    limit: int,
+    allow_model: bool,
+    version: Callable[[], str],
+    compute: Callable[[], Awaitable[dict[str, Any]]],
+) -> tuple[dict[str, Any], bool]:
+    """Return ``(result, served_from_cache)``, coalescing identical in-flight searches.
+
+    Any cache failure degrades to a direct, uncached search.
+    """
+
+    if FINDER_CACHE.ttl_seconds() <= 0:
+        return await compute(), False
+    try:
+        catalog_version = await run_in_threadpool(version)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("Science finder cache unavailable: %s", type(exc).__name__)
+        return await compute(), False
+
+    def encode(result: dict[str, Any]) -> str | None:
+        if not _is_cacheable(result, allow_model=allow_model):
+            return None
+        return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+
+    value, hit = await FINDER_CACHE.get_or_compute(
+        finder_cache_key(kind, query, limit=limit, allow_model=allow_model, version=catalog_version),
+        compute,
+        encode=encode,
+        kind=kind,
+        version=catalog_version,
+    )
+    if hit:
+        return _cached_result(value, query), True
+    return value, False
@@ -13,12 +13,13 @@ from typing import Any
 
 from fastapi import HTTPException
 
+from app.services.science_catalog_vectors import CatalogVectors, load_catalog_vectors
 from app.services.science_mcp_catalog_db import (
+    catalog_connection,
     database_matches_source,
-    decode_catalog_payload,
     hashed_search_terms,
+    load_catalog_payloads,
     normalize_canonical_url,
-    open_catalog_database,
     search_tokens,
     validate_catalog_snapshot,
 )
@@ -33,6 +34,9 @@ CATALOG_PATH = Path(
 CATALOG_DATABASE_PATH = Path(
     os.getenv("SCIENCE_MCP_CATALOG_DB_PATH", str(CATALOG_PATH.with_suffix(".sqlite3")))
 )
+CATALOG_VECTORS_PATH = Path(
+    os.getenv("SCIENCE_MCP_CATALOG_VECTORS_PATH", str(CATALOG_PATH.with_suffix(".vectors.f32")))
+)
 SEARCH_FIELDS = (
     "id",
     "name",
@@ -100,7 +104,7 @@ def _runtime_database_path() -> Path | None:
 
 
 def _database_metadata(database: Path) -> tuple[dict[str, Any], str]:
-    with open_catalog_database(database) as connection:
+    with catalog_connection(database) as connection:
         metadata = dict(connection.execute("SELECT key, value FROM catalog_metadata"))
     return json.loads(metadata["catalog_json"]), metadata["source_sha256"]
 
@@ -159,7 +163,7 @@ def get_mcp_catalog_meta() -> dict[str, Any]:
 
 @lru_cache(maxsize=1)
 def _database_finder_items(database_path: str) -> tuple[dict[str, Any], ...]:
-    with open_catalog_database(Path(database_path)) as connection:
+    with catalog_connection(Path(database_path)) as connection:
         rows = connection.execute("SELECT finder_json FROM mcps ORDER BY position").fetchall()
     return tuple(json.loads(zlib.decompress(row["finder_json"]).decode("utf-8")) for row in rows)
 
@@ -174,6 +178,17 @@ def get_mcp_catalog_items() -> list[dict[str, Any]]:
     return list(payload["mcps"])
 
 
+@lru_cache(maxsize=1)
+def get_mcp_catalog_vectors() -> CatalogVectors:
+    """Hash-embedding rows aligned with :func:`get_mcp_catalog_items`."""
+
+    return load_catalog_vectors(
+        CATALOG_VECTORS_PATH,
+        get_mcp_catalog_items(),
+        source_sha256=get_mcp_catalog_meta()["source"]["snapshot_sha256"],
+    )
+
+
 def _safe_sort_mode(value: str | None) -> str:
     mode = str(value or "organized").strip().casefold()
     return mode if mode in SORT_LABELS else "organized"
@@ -231,20 +246,24 @@ def _list_mcp_catalog_database(
             parameters.append(value)
     where_sql = f" WHERE {' AND '.join(clauses)}" if clauses else ""
     order_sql = _database_order(sort_mode, searching=bool(query))
-    with open_catalog_database(database) as connection:
+    with catalog_connection(database) as connection:
         total = int(
             connection.execute(
                 f"SELECT COUNT(*) FROM {from_sql}{where_sql}",
                 parameters,
             ).fetchone()[0]
         )
-        rows = connection.execute(
-            f"SELECT m.payload FROM {from_sql}{where_sql} "
-            f"ORDER BY {order_sql} LIMIT ? OFFSET ?",
-            [*parameters, limit, offset],
-        ).fetchall()
+        page_ids = [
+            str(row["id"])
+            for row in connection.execute(
+                f"SELECT m.id FROM {from_sql}{where_sql} "
+                f"ORDER BY {order_sql} LIMIT ? OFFSET ?",
+                [*parameters, limit, offset],
+            )
+        ]
+    payloads = load_catalog_payloads(database, "mcps", page_ids)
     return {
-        "list": [decode_catalog_payload(row["payload"]) for row in rows],
+        "list": [payloads[item_id] for item_id in page_ids if item_id in payloads],
         "total": total,
         "limit": limit,
         "offset": offset,
@@ -393,9 +412,7 @@ def _mcp_card_projection(item: dict[str, Any]) -> dict[str, Any]:
 
 
 def _database_item(database: Path, mcp_id: str) -> dict[str, Any] | None:
-    with open_catalog_database(database) as connection:
-        row = connection.execute("SELECT payload FROM mcps WHERE id = ? LIMIT 1", (mcp_id,)).fetchone()
-    return decode_catalog_payload(row["payload"]) if row is not None else None
+    return load_catalog_payloads(database, "mcps", [mcp_id]).get(mcp_id)
 
 
 def hydrate_mcp_catalog_results(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -406,14 +423,7 @@ def hydrate_mcp_catalog_results(results: list[dict[str, Any]]) -> list[dict[str,
     database = _runtime_database_path()
     if database is None:
         return results
-    ids = [str(result.get("id") or "") for result in results]
-    placeholders = ",".join("?" for _ in ids)
-    with open_catalog_database(database) as connection:
-        rows = connection.execute(
-            f"SELECT id, payload FROM mcps WHERE id IN ({placeholders})",
-            ids,
-        ).fetchall()
-    payloads = {str(row["id"]): decode_catalog_payload(row["payload"]) for row in rows}
+    payloads = load_catalog_payloads(database, "mcps", [str(result.get("id") or "") for result in results])
     hydrated: list[dict[str, Any]] = []
     for result in results:
         item = payloads.get(str(result.get("id") or ""))
@@ -440,22 +450,26 @@ def get_mcp_catalog_item(mcp_id: str, *, include_related: bool = False) -> dict[
             raise HTTPException(status_code=404, detail="科研 MCP 不存在")
         if not include_related:
             return item
-        with open_catalog_database(database) as connection:
-            rows = connection.execute(
-                """
-                SELECT payload FROM mcps
-                WHERE id != ? AND (subdomain = ? OR domain = ?)
-                ORDER BY
-                    CASE WHEN subdomain = ? THEN 0 ELSE 1 END,
-                    CASE WHEN domain = ? THEN 0 ELSE 1 END,
-                    quality_score DESC,
-                    name_sort,
-                    id
-                LIMIT 4
-                """,
-                (needle, item.get("subdomain"), item.get("domain"), item.get("subdomain"), item.get("domain")),
-            ).fetchall()
-        related = [decode_catalog_payload(row["payload"]) for row in rows]
+        with catalog_connection(database) as connection:
+            related_ids = [
+                str(row["id"])
+                for row in connection.execute(
+                    """
+                    SELECT id FROM mcps
+                    WHERE id != ? AND (subdomain = ? OR domain = ?)
+                    ORDER BY
+                        CASE WHEN subdomain = ? THEN 0 ELSE 1 END,
+                        CASE WHEN domain = ? THEN 0 ELSE 1 END,
+                        quality_score DESC,
+                        name_sort,
+                        id
+                    LIMIT 4
+                    """,
+                    (needle, item.get("subdomain"), item.get("domain"), item.get("subdomain"), item.get("domain")),
+                )
+            ]
+        payloads = load_catalog_payloads(database, "mcps", related_ids)
+        related = [payloads[related_id] for related_id in related_ids if related_id in payloads]
     else:
         payload, _ = _load_catalog()
         item = next((candidate for candidate in payload["mcps"] if candidate.get("id") == needle), None)
@@ -488,7 +502,7 @@ def get_mcp_catalog_item(mcp_id: str, *, include_related: bool = False) -> dict[
 def get_mcp_catalog_categories() -> dict[str, Any]:
     database = _runtime_database_path()
     if database is not None:
-        with open_catalog_database(database) as connection:
+        with catalog_connection(database) as connection:
             row = connection.execute(
                 "SELECT value FROM catalog_metadata WHERE key = 'categories_json'"
             ).fetchone()
@@ -7,13 +7,20 @@ import json
 import os
 import re
 import sqlite3
+import threading
 import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Sequence
 from urllib.parse import urlsplit, urlunsplit
 
 
 DATABASE_SCHEMA_VERSION = 2
+CONNECTION_POOL_SIZE = 8
+PAYLOAD_CACHE_SIZE = 512
+# Stay well below SQLite's default host-parameter limit for IN (...) lookups.
+PAYLOAD_BATCH_SIZE = 500
 REQUIRED_DIMENSIONS = ("domains", "subdomains", "stages", "functions")
 SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
 SEARCH_FIELDS = (
@@ -79,14 +86,14 @@ def search_tokens(value: str) -> set[str]:
     return tokens
 
 
-def _hashed_token(value: str) -> str:
+def hashed_search_token(value: str) -> str:
     return hashlib.blake2s(value.encode("utf-8"), digest_size=8).hexdigest()
 
 
 def hashed_search_terms(value: str) -> list[str]:
     """Return FTS-safe opaque terms without exposing catalog text to SQL syntax."""
 
-    return sorted(_hashed_token(token) for token in search_tokens(value))
+    return sorted(hashed_search_token(token) for token in search_tokens(value))
 
 
 def _search_document(item: dict[str, Any]) -> str:
@@ -328,11 +335,87 @@ def database_matches_source(source: Path, database: Path) -> bool:
     )
 
 
-def open_catalog_database(database: Path) -> sqlite3.Connection:
-    connection = sqlite3.connect(f"{database.resolve().as_uri()}?mode=ro&immutable=1", uri=True)
-    connection.row_factory = sqlite3.Row
-    return connection
+class _ConnectionPool:
+    """Idle read-only connections for one immutable catalog file in this process."""
+
+    def __init__(self, database: Path) -> None:
+        self.database = database
+        self.pid = os.getpid()
+        self._idle: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        connection = sqlite3.connect(
+            f"{self.database.resolve().as_uri()}?mode=ro&immutable=1",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def release(self, connection: sqlite3.Connection) -> None:
+        with self._lock:
+            if len(self._idle) < CONNECTION_POOL_SIZE:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+
+_pools: dict[str, _ConnectionPool] = {}
+_pools_lock = threading.Lock()
+_payload_cache: OrderedDict[tuple[str, str, str], bytes] = OrderedDict()
+_payload_cache_lock = threading.Lock()
 
 
-def decode_catalog_payload(value: bytes) -> dict[str, Any]:
-    return json.loads(zlib.decompress(value).decode("utf-8"))
+@contextmanager
+def catalog_connection(database: Path) -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled connection; each keeps its compiled statements across requests."""
+
+    key = str(database)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.pid != os.getpid():
+            pool = _pools[key] = _ConnectionPool(database)
+    connection = pool.acquire()
+    try:
+        yield connection
+    finally:
+        pool.release(connection)
+
+
+def load_catalog_payloads(database: Path, table: str, ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+    """Fetch full items by ID in batched statements, reusing recently decompressed payloads."""
+
+    key = str(database)
+    raw: dict[str, bytes] = {}
+    missing: list[str] = []
+    with _payload_cache_lock:
+        for item_id in dict.fromkeys(ids):
+            cached = _payload_cache.get((key, table, item_id))
+            if cached is None:
+                missing.append(item_id)
+            else:
+                _payload_cache.move_to_end((key, table, item_id))
+                raw[item_id] = cached
+    if missing:
+        fetched: dict[str, bytes] = {}
+        with catalog_connection(database) as connection:
+            for start in range(0, len(missing), PAYLOAD_BATCH_SIZE):
+                batch = missing[start : start + PAYLOAD_BATCH_SIZE]
+                placeholders = ",".join("?" for _ in batch)
+                for row in connection.execute(
+                    f"SELECT id, payload FROM {table} WHERE id IN ({placeholders})",
+                    batch,
+                ):
+                    fetched[str(row["id"])] = zlib.decompress(row["payload"])
+        with _payload_cache_lock:
+            for item_id, value in fetched.items():
+                _payload_cache[(key, table, item_id)] = value
+            while len(_payload_cache) > PAYLOAD_CACHE_SIZE:
+                _payload_cache.popitem(last=False)
+        raw.update(fetched)
+    return {item_id: json.loads(value.decode("utf-8")) for item_id, value in raw.items()}
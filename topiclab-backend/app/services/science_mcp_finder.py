@@ -9,13 +9,18 @@ from typing import Any
 
 from starlette.concurrency import run_in_threadpool
 
+from app.services.science_catalog_vectors import reciprocal_rank_fusion
 from app.services.science_mcp_catalog import (
     get_mcp_catalog_items,
     get_mcp_catalog_meta,
+    get_mcp_catalog_vectors,
     hydrate_mcp_catalog_results,
 )
 from app.services.science_skill_finder import (
     GENERIC_QUERY_TOKENS,
+    HYBRID_CONFIDENT_SIMILARITY,
+    HYBRID_DEPTH,
+    VECTOR_MIN_SIMILARITY,
     FinderEventCallback,
     _apply_semantic_recommendations,
     _clean_route,
@@ -52,6 +57,7 @@ RANKING_CRITERIA = [
 ]
 LOCAL_RANKING_CRITERIA = [
     {"key": "task_match", "label": "任务匹配"},
+    {"key": "vector_match", "label": "语义相近"},
     {"key": "function_match", "label": "功能偏好"},
     {"key": "quality_score", "label": "资料完整度"},
 ]
@@ -72,6 +78,12 @@ async def _emit_finder_event(
         await callback(event, payload)
 
 
+def mcp_finder_cache_version() -> str:
+    """Identify the catalog snapshot and model that a cached finder answer depends on."""
+
+    return f"{get_mcp_catalog_meta()['source']['snapshot_sha256']}:{get_finder_config().model}"
+
+
 def get_mcp_finder_capabilities() -> dict[str, Any]:
     """Expose the SkillHub model/fallback contract for MCP discovery."""
     capabilities = dict(get_finder_capabilities())
@@ -165,6 +177,37 @@ def _item_score(item: dict[str, Any], query_tokens: set[str]) -> int:
     )
 
 
+def _vector_hits(
+    query: str,
+    items: list[dict[str, Any]],
+    candidates: list[int] | None = None,
+) -> list[tuple[int, float]]:
+    vectors = get_mcp_catalog_vectors()
+    if vectors.matrix.shape[0] != len(items):
+        return []
+    return vectors.nearest(
+        vectors.embed(query, stopwords=GENERIC_QUERY_TOKENS),
+        limit=HYBRID_DEPTH,
+        minimum=VECTOR_MIN_SIMILARITY,
+        candidates=candidates,
+    )
+
+
+def _confident_local_match(query: str, items: list[dict[str, Any]]) -> int | None:
+    """Return the catalog position both retrievers put first with high similarity, if any."""
+
+    hits = _vector_hits(query, items)
+    if not hits or hits[0][1] < HYBRID_CONFIDENT_SIMILARITY:
+        return None
+    query_tokens = _text_tokens(query) - GENERIC_QUERY_TOKENS
+    best_position, best_score = None, 0
+    for position, item in enumerate(items):
+        score = _item_score(item, query_tokens)
+        if score > best_score:
+            best_position, best_score = position, score
+    return best_position if best_position == hits[0][0] else None
+
+
 def _local_route(
     query: str,
     dimensions: dict[str, list[str]],
@@ -210,43 +253,47 @@ def _rank_results(
 ) -> tuple[list[dict[str, Any]], int]:
     combined = " ".join([query, *route.get("search_terms", [])])
     query_tokens = _text_tokens(combined)
-    candidates = [
-        item
-        for item in items
+    positions = [
+        position
+        for position, item in enumerate(items)
         if all(not route.get(key) or item.get(key) == route[key] for key in ("domain", "stage"))
     ]
-    scored = [
-        (
-            _item_score(item, query_tokens),
-            int(bool(route.get("function") and item.get("function") == route["function"])),
-            item,
-        )
-        for item in candidates
-    ]
-    scored.sort(
-        key=lambda pair: (
-            -pair[0],
-            -pair[1],
-            READINESS_ORDER.get(str(pair[2].get("readiness")), 9),
-            SOURCE_REVIEW_ORDER.get(str(pair[2].get("evidence_scope")), 9),
-            -int(pair[2].get("quality_score") or 0),
-            str(pair[2].get("id")),
+    task_matches = {position: _item_score(items[position], query_tokens) for position in positions}
+
+    def lexical_key(position: int) -> tuple:
+        item = items[position]
+        return (
+            -task_matches[position],
+            -int(bool(route.get("function") and item.get("function") == route["function"])),
+            READINESS_ORDER.get(str(item.get("readiness")), 9),
+            SOURCE_REVIEW_ORDER.get(str(item.get("evidence_scope")), 9),
+            -int(item.get("quality_score") or 0),
+            str(item.get("id")),
         )
-    )
+
+    lexical = sorted((position for position in positions if task_matches[position] > 0), key=lexical_key)[:HYBRID_DEPTH]
+    filtered = len(positions) != len(items)
+    vector_hits = _vector_hits(combined, items, positions if filtered else None)
+    similarities = dict(vector_hits)
+    fused = reciprocal_rank_fusion([lexical, [position for position, _ in vector_hits]])
+    positions.sort(key=lambda position: (-fused.get(position, 0.0), *lexical_key(position)))
+
     ranked: list[dict[str, Any]] = []
-    for rank, (task_match, function_match, item) in enumerate(scored[:limit], start=1):
+    for rank, position in enumerate(positions[:limit], start=1):
+        item = items[position]
         enriched = dict(item)
         enriched["rank"] = rank
         enriched["recommendation_reason"] = "研究对象、科研动作或预期产物与当前需求相符。"
         enriched["ranking_signals"] = {
-            "task_match": task_match,
-            "function_match": function_match,
+            "task_match": task_matches[position],
+            "vector_match": round(similarities.get(position, 0.0), 4),
+            "function_match": int(bool(route.get("function") and item.get("function") == route["function"])),
             "readiness": str(item.get("readiness") or ""),
             "source_review": str(item.get("evidence_scope") or ""),
             "quality_score": int(item.get("quality_score") or 0),
         }
         ranked.append(enriched)
-    return ranked, len(candidates)
+    return ranked, len(positions)
 
 
 async def find_science_mcps(
@@ -272,7 +319,16 @@ async def find_science_mcps(
         dimensions,
         items,
     )
-    if allow_model and config.configured:
+    confident_match = (
+        await run_in_threadpool(_confident_local_match, clean_query, items)
+        if allow_model and config.configured
+        else None
+    )
+    if confident_match is not None:
+        has_catalog_evidence = True
+        mode = "hybrid_local"
+        message = "目录检索结果一致，已跳过模型路由"
+    elif allow_model and config.configured:
         try:
             raw_route = await _route_with_agentscope(clean_query, dimensions, config)
             skill_mounted = raw_route.get("__skill_mounted") is True
@@ -4,49 +4,73 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import re
+import zlib
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Sequence
 
 from fastapi import HTTPException
 
+from app.services.science_catalog_vectors import CatalogVectors, load_catalog_vectors
+from app.services.science_mcp_catalog_db import catalog_connection, load_catalog_payloads
+from app.services.science_skill_catalog_db import (
+    READINESS_ORDER,
+    SEARCH_FIELDS,
+    SEARCH_STOPWORDS,
+    SOURCE_REVIEW_ORDER,
+    database_matches_source,
+    validate_catalog_snapshot,
+)
 
-CATALOG_PATH = Path(__file__).resolve().parents[1] / "data" / "science_skill_catalog.json"
+
+CATALOG_PATH = Path(
+    os.getenv(
+        "SCIENCE_SKILL_CATALOG_PATH",
+        str(Path(__file__).resolve().parents[1] / "data" / "science_skill_catalog.json"),
+    )
+)
+CATALOG_DATABASE_PATH = Path(
+    os.getenv("SCIENCE_SKILL_CATALOG_DB_PATH", str(CATALOG_PATH.with_suffix(".sqlite3")))
+)
+CATALOG_VECTORS_PATH = Path(
+    os.getenv("SCIENCE_SKILL_CATALOG_VECTORS_PATH", str(CATALOG_PATH.with_suffix(".vectors.f32")))
+)
 SOURCE_REPOSITORY = "TashanGKD/tashan-research-skills"
 SOURCE_PATH = "skills/find-science-skills/data/science_skill_catalog.json"
 
-READINESS_ORDER = {"trusted": 0, "provisional": 1, "restricted": 2}
-SOURCE_REVIEW_ORDER = {
-    "manual_confirmed": 0,
-    "model_assisted_full_source_review": 1,
-    "metadata_reviewed": 2,
-    "needs_source_review": 3,
-}
-SEARCH_FIELDS = ("id", "name", "summary", "domain", "subdomain", "stage", "function", "task")
-SEARCH_STOPWORDS = frozenset({
-    "a", "an", "and", "for", "help", "in", "need", "of", "research", "the", "to", "use", "with",
-    "一个", "使用", "帮我", "帮助", "科研", "研究", "需要", "搜索", "技能", "工具",
-})
-
 
 @lru_cache(maxsize=1)
 def _load_catalog() -> tuple[dict[str, Any], str]:
+    """Fallback loader for source checkouts without a compiled runtime index."""
+
     raw = CATALOG_PATH.read_bytes()
     payload = json.loads(raw.decode("utf-8"))
-    skills = payload.get("skills")
-    if payload.get("schema") != "science_skill_catalog_v1" or not isinstance(skills, list):
-        raise RuntimeError("Invalid built-in science skill catalog")
-    if payload.get("skill_count") != len(skills):
-        raise RuntimeError("Built-in science skill catalog count does not match payload")
-    ids = [str(item.get("id") or "") for item in skills]
-    if any(not item for item in ids) or len(ids) != len(set(ids)):
-        raise RuntimeError("Built-in science skill catalog contains empty or duplicate IDs")
+    payload["skills"] = tuple(validate_catalog_snapshot(payload))
     return payload, hashlib.sha256(raw).hexdigest()
 
 
+@lru_cache(maxsize=1)
+def _runtime_database_path() -> Path | None:
+    if database_matches_source(CATALOG_PATH, CATALOG_DATABASE_PATH):
+        return CATALOG_DATABASE_PATH
+    return None
+
+
+@lru_cache(maxsize=1)
+def _database_metadata(database_path: str) -> tuple[dict[str, Any], str]:
+    with catalog_connection(Path(database_path)) as connection:
+        metadata = dict(connection.execute("SELECT key, value FROM catalog_metadata"))
+    return json.loads(metadata["catalog_json"]), metadata["source_sha256"]
+
+
 def get_catalog_meta() -> dict[str, Any]:
-    payload, digest = _load_catalog()
+    database = _runtime_database_path()
+    if database is not None:
+        payload, digest = _database_metadata(str(database))
+    else:
+        payload, digest = _load_catalog()
     return {
         "schema": payload["schema"],
         "total": int(payload["skill_count"]),
@@ -62,9 +86,61 @@ def get_catalog_meta() -> dict[str, Any]:
     }
 
 
-def get_catalog_items() -> list[dict[str, Any]]:
+@lru_cache(maxsize=1)
+def _database_finder_items(database_path: str) -> tuple[dict[str, Any], ...]:
+    with catalog_connection(Path(database_path)) as connection:
+        rows = connection.execute("SELECT finder_json FROM skills ORDER BY position").fetchall()
+    return tuple(json.loads(zlib.decompress(row["finder_json"]).decode("utf-8")) for row in rows)
+
+
+def get_catalog_items() -> Sequence[dict[str, Any]]:
+    """Return the lightweight fields needed by the finder index.
+
+    The result is the cached, shared tuple; callers must not mutate its items.
+    """
+
+    database = _runtime_database_path()
+    if database is not None:
+        return _database_finder_items(str(database))
     payload, _ = _load_catalog()
-    return list(payload["skills"])
+    return payload["skills"]
+
+
+@lru_cache(maxsize=1)
+def get_catalog_vectors() -> CatalogVectors:
+    """Hash-embedding rows aligned with :func:`get_catalog_items`."""
+
+    return load_catalog_vectors(
+        CATALOG_VECTORS_PATH,
+        get_catalog_items(),
+        source_sha256=get_catalog_meta()["source"]["sha256"],
+    )
+
+
+def hydrate_catalog_results(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Hydrate finder projections only after ranking has selected a small result set."""
+
+    if not results:
+        return []
+    database = _runtime_database_path()
+    if database is None:
+        return results
+    payloads = load_catalog_payloads(database, "skills", [str(result.get("id") or "") for result in results])
+    hydrated: list[dict[str, Any]] = []
+    for result in results:
+        item = payloads.get(str(result.get("id") or ""))
+        if item is None:
+            continue
+        enriched = dict(item)
+        enriched.update(
+            {
+                key: value
+                for key, value in result.items()
+                if key in {"rank", "recommendation_reason", "ranking_signals"}
+            }
+        )
+        hydrated.append(enriched)
+    return hydrated
 
 
 def _search_tokens(value: str) -> set[str]:
@@ -76,23 +152,119 @@ def _search_tokens(value: str) -> set[str]:
     return tokens
 
 
-def _query_match_score(item: dict[str, Any], query: str) -> int:
-    if not query:
-        return 0
+def _compact(value: str) -> str:
+    return re.sub(r"[^a-z0-9\u4e00-\u9fff]+", "", value.casefold())
+
+
+def _search_entry(item: dict[str, Any]) -> tuple[str, frozenset[str]]:
+    """Return the compact haystack and tokens one item is scored against."""
+
     haystack = " ".join(str(item.get(key) or "") for key in SEARCH_FIELDS).casefold()
-    compact_query = re.sub(r"[^a-z0-9\u4e00-\u9fff]+", "", query.casefold())
-    compact_haystack = re.sub(r"[^a-z0-9\u4e00-\u9fff]+", "", haystack)
-    query_tokens = {token for token in _search_tokens(query) if token not in SEARCH_STOPWORDS}
-    item_tokens = _search_tokens(haystack)
+    return _compact(haystack), frozenset(_search_tokens(haystack))
+
+
+@lru_cache(maxsize=1)
+def _database_search_entries(database_path: str) -> tuple[tuple[str, frozenset[str]], ...]:
+    return tuple(_search_entry(item) for item in _database_finder_items(database_path))
+
+
+def _entry_match_score(entry: tuple[str, frozenset[str]], compact_query: str, query_tokens: set[str]) -> int:
+    compact_haystack, item_tokens = entry
     if compact_query and compact_query in compact_haystack:
         return max(1, len(query_tokens)) + 2
     return len(query_tokens & item_tokens)
 
 
-def _matches_query(item: dict[str, Any], query: str) -> bool:
-    if not query:
-        return True
-    return _query_match_score(item, query) > 0
+def _ranked_matches(
+    items: Sequence[dict[str, Any]],
+    entries: Iterable[tuple[str, frozenset[str]]],
+    *,
+    query: str,
+    expected: dict[str, str],
+) -> list[dict[str, Any]]:
+    """Filter and order the whole catalog; the database and JSON paths share this ranking."""
+
+    compact_query = _compact(query)
+    query_tokens = {token for token in _search_tokens(query) if token not in SEARCH_STOPWORDS}
+    scored: list[tuple[int, dict[str, Any]]] = []
+    for item, entry in zip(items, entries):
+        if any(value and str(item.get(key) or "") != value for key, value in expected.items()):
+            continue
+        score = _entry_match_score(entry, compact_query, query_tokens)
+        if score > 0:
+            scored.append((score, item))
+    scored.sort(key=lambda pair: _catalog_sort_key(pair[1], pair[0]))
+    return [item for _, item in scored]
+
+
+def _catalog_sort_key(item: dict[str, Any], score: int) -> tuple[Any, ...]:
+    return (
+        -score,
+        READINESS_ORDER.get(str(item.get("readiness") or ""), 9),
+        SOURCE_REVIEW_ORDER.get(str(item.get("review_status") or ""), 9),
+        -int(item.get("quality_score") or 0),
+        str(item.get("name") or item.get("id") or "").casefold(),
+    )
+
+
+def _list_catalog_skills_database(
+    database: Path,
+    *,
+    query: str,
+    expected: dict[str, str],
+    limit: int,
+    offset: int,
+) -> dict[str, Any]:
+    if query:
+        # Every page is cut from one ranking of the whole cached finder index, so
+        # pages never overlap and ``total`` matches the JSON fallback exactly.
+        matches = _ranked_matches(
+            _database_finder_items(str(database)),
+            _database_search_entries(str(database)),
+            query=query,
+            expected=expected,
+        )
+        page_ids = [str(item["id"]) for item in matches[offset : offset + limit]]
+        by_id = load_catalog_payloads(database, "skills", page_ids)
+        return {
+            "list": [by_id[item_id] for item_id in page_ids if item_id in by_id],
+            "total": len(matches),
+            "limit": limit,
+            "offset": offset,
+        }
+    clauses: list[str] = []
+    parameters: list[Any] = []
+    column_names = {
+        "domain": "s.domain",
+        "subdomain": "s.subdomain",
+        "stage": "s.stage",
+        "function": "s.function_name",
+        "readiness": "s.readiness",
+    }
+    for key, value in expected.items():
+        if value:
+            clauses.append(f"{column_names[key]} = ?")
+            parameters.append(value)
+    where_sql = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    with catalog_connection(database) as connection:
+        total = int(connection.execute(f"SELECT COUNT(*) FROM skills s{where_sql}", parameters).fetchone()[0])
+        page_ids = [
+            str(row["id"])
+            for row in connection.execute(
+                f"SELECT s.id FROM skills s{where_sql} "
+                "ORDER BY s.readiness_rank, s.review_rank, s.quality_score DESC, s.name_sort "
+                "LIMIT ? OFFSET ?",
+                [*parameters, limit, offset],
+            )
+        ]
+    by_id = load_catalog_payloads(database, "skills", page_ids)
+    payloads = [by_id[item_id] for item_id in page_ids if item_id in by_id]
+    return {
+        "list": payloads,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+    }
 
 
 def list_catalog_skills(
@@ -106,7 +278,6 @@ def list_catalog_skills(
     limit: int = 24,
     offset: int = 0,
 ) -> dict[str, Any]:
-    payload, _ = _load_catalog()
     query = (q or "").strip().casefold()
     expected = {
         "domain": (domain or "").strip(),
@@ -115,23 +286,33 @@ def list_catalog_skills(
         "function": (function or "").strip(),
         "readiness": (readiness or "").strip(),
     }
-    matches = [
-        item
-        for item in payload["skills"]
-        if _matches_query(item, query)
-        and all(not value or str(item.get(key) or "") == value for key, value in expected.items())
-    ]
-    matches.sort(
-        key=lambda item: (
-            -_query_match_score(item, query),
-            READINESS_ORDER.get(str(item.get("readiness") or ""), 9),
-            SOURCE_REVIEW_ORDER.get(str(item.get("review_status") or ""), 9),
-            -int(item.get("quality_score") or 0),
-            str(item.get("name") or item.get("id") or "").casefold(),
-        )
-    )
     safe_limit = max(1, min(int(limit), 100))
     safe_offset = max(0, int(offset))
+    database = _runtime_database_path()
+    if database is not None:
+        return _list_catalog_skills_database(
+            database,
+            query=query,
+            expected=expected,
+            limit=safe_limit,
+            offset=safe_offset,
+        )
+
+    payload, _ = _load_catalog()
+    if query:
+        matches = _ranked_matches(
+            payload["skills"],
+            (_search_entry(item) for item in payload["skills"]),
+            query=query,
+            expected=expected,
+        )
+    else:
+        matches = [
+            item
+            for item in payload["skills"]
+            if all(not value or str(item.get(key) or "") == value for key, value in expected.items())
+        ]
+        matches.sort(key=lambda item: _catalog_sort_key(item, 0))
     return {
         "list": matches[safe_offset : safe_offset + safe_limit],
         "total": len(matches),
@@ -141,6 +322,12 @@ def list_catalog_skills(
 
 
 def get_catalog_skill(canonical_id: str) -> dict[str, Any]:
+    database = _runtime_database_path()
+    if database is not None:
+        item = load_catalog_payloads(database, "skills", [canonical_id]).get(canonical_id)
+        if item is None:
+            raise HTTPException(status_code=404, detail="科研 Skill 不存在")
+        return item
     payload, _ = _load_catalog()
     for item in payload["skills"]:
         if item.get("id") == canonical_id:
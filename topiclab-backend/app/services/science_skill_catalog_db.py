@@ -0,0 +1,189 @@
+"""Build and open the shared runtime index for the built-in science skill catalog."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Any
+
+from app.services.science_mcp_catalog_db import file_sha256, hashed_search_token, search_tokens
+
+
+DATABASE_SCHEMA_VERSION = 1
+READINESS_ORDER = {"trusted": 0, "provisional": 1, "restricted": 2}
+SOURCE_REVIEW_ORDER = {
+    "manual_confirmed": 0,
+    "model_assisted_full_source_review": 1,
+    "metadata_reviewed": 2,
+    "needs_source_review": 3,
+}
+SEARCH_FIELDS = ("id", "name", "summary", "domain", "subdomain", "stage", "function", "task")
+SEARCH_STOPWORDS = frozenset({
+    "a", "an", "and", "for", "help", "in", "need", "of", "research", "the", "to", "use", "with",
+    "一个", "使用", "帮我", "帮助", "科研", "研究", "需要", "搜索", "技能", "工具",
+})
+FINDER_FIELDS = (
+    "id",
+    "name",
+    "task",
+    "summary",
+    "domain",
+    "subdomain",
+    "stage",
+    "function",
+    "quality_score",
+    "readiness",
+    "review_status",
+)
+
+
+def validate_catalog_snapshot(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    """Validate the invariants shared by the JSON fallback and the compiled index."""
+
+    skills = payload.get("skills")
+    if payload.get("schema") != "science_skill_catalog_v1" or not isinstance(skills, list):
+        raise RuntimeError("Invalid built-in science skill catalog")
+    if payload.get("skill_count") != len(skills):
+        raise RuntimeError("Built-in science skill catalog count does not match payload")
+    ids = [str(item.get("id") or "") for item in skills]
+    if any(not item for item in ids) or len(ids) != len(set(ids)):
+        raise RuntimeError("Built-in science skill catalog contains empty or duplicate IDs")
+    return skills
+
+
+def hashed_search_terms(value: str, *, exclude: frozenset[str] = frozenset()) -> list[str]:
+    """Hash search tokens plus their ``-``/``.``/``+`` parts so "single cell" reaches "single-cell"."""
+
+    tokens = search_tokens(value)
+    tokens |= {part for token in tokens for part in re.split(r"[+._-]+", token) if len(part) >= 2}
+    return sorted(hashed_search_token(token) for token in tokens - exclude)
+
+
+def _search_document(item: dict[str, Any]) -> str:
+    return " ".join(str(item.get(field) or "") for field in SEARCH_FIELDS)
+
+
+def _compressed_json(value: dict[str, Any]) -> bytes:
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), level=6)
+
+
+def build_catalog_database(source: Path, destination: Path) -> tuple[int, str]:
+    """Compile the checked-in JSON snapshot into an atomic SQLite/FTS index."""
+
+    raw = source.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    payload = json.loads(raw.decode("utf-8"))
+    items = validate_catalog_snapshot(payload)
+    public_payload = {key: value for key, value in payload.items() if key != "skills"}
+
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    temporary = destination.with_suffix(destination.suffix + ".tmp")
+    if temporary.exists():
+        temporary.unlink()
+
+    connection = sqlite3.connect(temporary)
+    try:
+        connection.executescript(
+            """
+            PRAGMA journal_mode=OFF;
+            PRAGMA synchronous=OFF;
+            CREATE TABLE catalog_metadata (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE skills (
+                position INTEGER NOT NULL UNIQUE,
+                id TEXT PRIMARY KEY,
+                name_sort TEXT NOT NULL,
+                domain TEXT NOT NULL,
+                subdomain TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                function_name TEXT NOT NULL,
+                readiness TEXT NOT NULL,
+                readiness_rank INTEGER NOT NULL,
+                review_rank INTEGER NOT NULL,
+                quality_score INTEGER NOT NULL,
+                finder_json BLOB NOT NULL,
+                payload BLOB NOT NULL
+            );
+            CREATE INDEX idx_skill_ranking
+                ON skills(readiness_rank, review_rank, quality_score DESC, name_sort);
+            CREATE INDEX idx_skill_filters
+                ON skills(domain, subdomain, stage, function_name, readiness);
+            CREATE VIRTUAL TABLE skill_search USING fts5(
+                terms,
+                content='',
+                tokenize='unicode61'
+            );
+            """
+        )
+        metadata = {
+            "schema_version": str(DATABASE_SCHEMA_VERSION),
+            "source_sha256": digest,
+            "catalog_json": json.dumps(public_payload, ensure_ascii=False, separators=(",", ":")),
+        }
+        connection.executemany(
+            "INSERT INTO catalog_metadata(key, value) VALUES (?, ?)",
+            metadata.items(),
+        )
+        for position, item in enumerate(items):
+            connection.execute(
+                """
+                INSERT INTO skills(
+                    position, id, name_sort, domain, subdomain, stage, function_name,
+                    readiness, readiness_rank, review_rank, quality_score, finder_json, payload
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    position,
+                    str(item["id"]),
+                    str(item.get("name") or item["id"]).casefold(),
+                    str(item.get("domain") or ""),
+                    str(item.get("subdomain") or ""),
+                    str(item.get("stage") or ""),
+                    str(item.get("function") or ""),
+                    str(item.get("readiness") or ""),
+                    READINESS_ORDER.get(str(item.get("readiness") or ""), 9),
+                    SOURCE_REVIEW_ORDER.get(str(item.get("review_status") or ""), 9),
+                    int(item.get("quality_score") or 0),
+                    _compressed_json({field: item.get(field) for field in FINDER_FIELDS}),
+                    _compressed_json(item),
+                ),
+            )
+            terms = " ".join(hashed_search_terms(_search_document(item)))
+            connection.execute(
+                "INSERT INTO skill_search(rowid, terms) VALUES (?, ?)",
+                (position + 1, terms),
+            )
+        connection.commit()
+        connection.execute("INSERT INTO skill_search(skill_search) VALUES ('optimize')")
+        connection.commit()
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+    os.replace(temporary, destination)
+    return len(items), digest
+
+
+def database_matches_source(source: Path, database: Path) -> bool:
+    if not source.is_file() or not database.is_file():
+        return False
+    try:
+        with sqlite3.connect(f"{database.resolve().as_uri()}?mode=ro", uri=True) as connection:
+            metadata = dict(connection.execute("SELECT key, value FROM catalog_metadata"))
+            item_count = int(connection.execute("SELECT COUNT(*) FROM skills").fetchone()[0])
+            search_count = int(connection.execute("SELECT COUNT(*) FROM skill_search").fetchone()[0])
+        expected_count = int(json.loads(metadata["catalog_json"])["skill_count"])
+    except (KeyError, OSError, TypeError, ValueError, sqlite3.Error):
+        return False
+    return (
+        metadata.get("schema_version") == str(DATABASE_SCHEMA_VERSION)
+        and metadata.get("source_sha256") == file_sha256(source)
+        and item_count == expected_count
+        and search_count == expected_count
+    )
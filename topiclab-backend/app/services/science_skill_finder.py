@@ -3,17 +3,27 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
 import logging
+import math
 import re
 from dataclasses import dataclass
 from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Sequence
+
+from starlette.concurrency import run_in_threadpool
 
 from app.services.research_hub_config import get_research_hub_scnet_api_key
-from app.services.science_skill_catalog import get_catalog_items, get_catalog_meta
+from app.services.science_catalog_vectors import reciprocal_rank_fusion
+from app.services.science_skill_catalog import (
+    get_catalog_items,
+    get_catalog_meta,
+    get_catalog_vectors,
+    hydrate_catalog_results,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -78,6 +88,7 @@ RANKING_CRITERIA = [
 ]
 LOCAL_RANKING_CRITERIA = [
     {"key": "task_match", "label": "任务匹配"},
+    {"key": "vector_match", "label": "语义相近"},
     {"key": "function_match", "label": "功能偏好"},
     {"key": "quality_score", "label": "质量分"},
 ]
@@ -125,6 +136,12 @@ def _resolve_find_skill_source() -> tuple[Path, str]:
     raise FileNotFoundError("find-science-skills source is unavailable")
 
 
+def finder_cache_version() -> str:
+    """Identify the catalog snapshot and model that a cached finder answer depends on."""
+
+    return f"{get_catalog_meta()['source']['sha256']}:{get_finder_config().model}"
+
+
 def get_finder_capabilities() -> dict[str, Any]:
     config = get_finder_config()
     try:
@@ -388,17 +405,118 @@ def _compact_text(value: str) -> str:
     return re.sub(r"[^a-z0-9\u4e00-\u9fff]+", "", value.casefold())
 
 
+FIELD_WEIGHTS = (
+    ("name", 5),
+    ("id", 5),
+    ("task", 4),
+    ("summary", 3),
+    ("subdomain", 2),
+    ("domain", 1),
+    ("stage", 1),
+    ("function", 1),
+)
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Depth of each ranking fed into reciprocal rank fusion.
+HYBRID_DEPTH = 50
+# Hash-embedding cosine below this is collision noise, not similarity.
+VECTOR_MIN_SIMILARITY = 0.2
+# Lexical and vector retrieval agreeing on a top hit this close is answered locally.
+HYBRID_CONFIDENT_SIMILARITY = 0.45
+
+
+@dataclass(frozen=True)
+class CatalogIndex:
+    """Inverted index over the catalog's evidence fields, built once per catalog load.
+
+    A posting's term frequency is the sum of the weights of the fields that
+    contain the token, so name/id hits still outrank summary hits under BM25.
+    """
+
+    items: tuple[dict[str, Any], ...]
+    postings: dict[str, tuple[tuple[int, float], ...]]
+    document_lengths: tuple[float, ...]
+    average_length: float
+    dimension_members: dict[tuple[str, str], frozenset[int]]
+    compact_names: frozenset[str]
+    compact_tasks: str
+
+    def document_frequency(self, token: str) -> int:
+        return len(self.postings.get(token, ()))
+
+    def bm25(self, query_tokens: set[str]) -> dict[int, float]:
+        total = len(self.items)
+        scores: dict[int, float] = {}
+        for token in query_tokens:
+            postings = self.postings.get(token)
+            if not postings:
+                continue
+            frequency = len(postings)
+            idf = math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+            for document, term_frequency in postings:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.document_lengths[document] / self.average_length)
+                scores[document] = scores.get(document, 0.0) + idf * term_frequency * (BM25_K1 + 1) / (term_frequency + norm)
+        return scores
+
+
+def build_catalog_index(items: Sequence[dict[str, Any]]) -> CatalogIndex:
+    postings: dict[str, list[tuple[int, float]]] = {}
+    lengths: list[float] = []
+    members: dict[tuple[str, str], set[int]] = {}
+    for document, item in enumerate(items):
+        weighted: dict[str, float] = {}
+        length = 0.0
+        for field, weight in FIELD_WEIGHTS:
+            tokens = _text_tokens(str(item.get(field) or ""))
+            length += weight * len(tokens)
+            for token in tokens:
+                weighted[token] = weighted.get(token, 0.0) + weight
+        for token, term_frequency in weighted.items():
+            postings.setdefault(token, []).append((document, term_frequency))
+        lengths.append(length)
+        for key in ("domain", "stage"):
+            members.setdefault((key, str(item.get(key) or "")), set()).add(document)
+    return CatalogIndex(
+        items=tuple(items),
+        postings={token: tuple(entries) for token, entries in postings.items()},
+        document_lengths=tuple(lengths),
+        average_length=(sum(lengths) / len(lengths)) if lengths else 1.0,
+        dimension_members={key: frozenset(value) for key, value in members.items()},
+        compact_names=frozenset(
+            compact
+            for item in items
+            for compact in (_compact_text(str(item.get("name") or "")), _compact_text(str(item.get("id") or "")))
+        ),
+        compact_tasks="\x00".join(_compact_text(str(item.get("task") or "")) for item in items),
+    )
+
+
 @lru_cache(maxsize=1)
-def _catalog_token_document_frequency() -> tuple[int, dict[str, int]]:
-    frequencies: dict[str, int] = {}
-    items = get_catalog_items()
-    for item in items:
-        item_tokens: set[str] = set()
-        for field in EVIDENCE_FIELDS:
-            item_tokens.update(_text_tokens(str(item.get(field) or "")))
-        for token in item_tokens:
-            frequencies[token] = frequencies.get(token, 0) + 1
-    return len(items), frequencies
+def _catalog_index() -> CatalogIndex:
+    return build_catalog_index(get_catalog_items())
+
+
+def _vector_hits(query: str, candidates: frozenset[int] | None = None) -> list[tuple[int, float]]:
+    vectors = get_catalog_vectors()
+    query_vector = vectors.embed(query, stopwords=GENERIC_QUERY_TOKENS)
+    return vectors.nearest(
+        query_vector,
+        limit=HYBRID_DEPTH,
+        minimum=VECTOR_MIN_SIMILARITY,
+        candidates=None if candidates is None else sorted(candidates),
+    )
+
+
+def _confident_local_match(query: str) -> int | None:
+    """Return the catalog row both retrievers put first with high similarity, if any."""
+
+    index = _catalog_index()
+    scores = index.bm25(_text_tokens(query) - GENERIC_QUERY_TOKENS)
+    hits = _vector_hits(query)
+    if not scores or not hits or hits[0][1] < HYBRID_CONFIDENT_SIMILARITY:
+        return None
+    lexical_top = max(scores, key=lambda document: (scores[document], -document))
+    return lexical_top if lexical_top == hits[0][0] else None
 
 
 def _has_distinctive_catalog_evidence(query: str, dimensions: dict[str, list[str]]) -> bool:
@@ -415,21 +533,17 @@ def _has_distinctive_catalog_evidence(query: str, dimensions: dict[str, list[str
     if any(label and label in compact_query for label in labels):
         return True
 
-    for item in get_catalog_items():
-        if compact_query in {
-            _compact_text(str(item.get("name") or "")),
-            _compact_text(str(item.get("id") or "")),
-        }:
-            return True
-        if len(compact_query) >= 4 and compact_query in _compact_text(str(item.get("task") or "")):
-            return True
-
-    catalog_size, frequencies = _catalog_token_document_frequency()
-    max_frequency = max(2, catalog_size // 20)
+    index = _catalog_index()
+    if compact_query in index.compact_names:
+        return True
+    if len(compact_query) >= 4 and compact_query in index.compact_tasks:
+        return True
+
+    max_frequency = max(2, len(index.items) // 20)
     for token in _text_tokens(query):
         if token in GENERIC_QUERY_TOKENS:
             continue
-        frequency = frequencies.get(token, 0)
+        frequency = index.document_frequency(token)
         if not 2 <= frequency <= max_frequency:
             continue
         if re.fullmatch(r"[\u4e00-\u9fff]+", token) and len(token) < 2:
@@ -438,26 +552,22 @@ def _has_distinctive_catalog_evidence(query: str, dimensions: dict[str, list[str
     return False
 
 
-def _item_score(item: dict[str, Any], query_tokens: set[str]) -> int:
-    weighted_fields = (
-        ("name", 5),
-        ("id", 5),
-        ("task", 4),
-        ("summary", 3),
-        ("subdomain", 2),
-        ("domain", 1),
-        ("stage", 1),
-        ("function", 1),
-    )
-    return sum(len(query_tokens & _text_tokens(str(item.get(key) or ""))) * weight for key, weight in weighted_fields)
+def _local_catalog_evidence(query: str, dimensions: dict[str, list[str]]) -> tuple[int | None, bool]:
+    """Return ``(confident_match, has_catalog_evidence)`` from one pass over the local retrievers."""
+
+    confident_match = _confident_local_match(query)
+    return confident_match, confident_match is not None or _has_distinctive_catalog_evidence(query, dimensions)
 
 
 def _local_route(query: str, dimensions: dict[str, list[str]]) -> dict[str, Any]:
-    query_tokens = _text_tokens(query)
-    scored = [(_item_score(item, query_tokens), item) for item in get_catalog_items()]
-    scored = [pair for pair in scored if pair[0] > 0]
-    scored.sort(key=lambda pair: (-pair[0], -int(pair[1].get("quality_score") or 0), str(pair[1].get("id"))))
-    if not scored:
+    index = _catalog_index()
+    scores = index.bm25(_text_tokens(query))
+    leaders = heapq.nsmallest(
+        12,
+        scores.items(),
+        key=lambda pair: (-pair[1], -int(index.items[pair[0]].get("quality_score") or 0), str(index.items[pair[0]].get("id"))),
+    )
+    if not leaders:
         return {
             "domain": None,
             "stage": None,
@@ -465,12 +575,11 @@ def _local_route(query: str, dimensions: dict[str, list[str]]) -> dict[str, Any]
             "search_terms": [],
             "rationale": "当前描述不足以形成可靠路径，请补充研究对象、所处阶段与预期产物。",
         }
-    leaders = scored[:12]
     route: dict[str, Any] = {}
     for key, dimension_key in (("domain", "domains"), ("stage", "stages"), ("function", "functions")):
-        votes: dict[str, int] = {}
-        for score, item in leaders:
-            value = str(item.get(key) or "")
+        votes: dict[str, float] = {}
+        for document, score in leaders:
+            value = str(index.items[document].get(key) or "")
             if value in dimensions[dimension_key]:
                 # Strong direct matches should outweigh several weak matches from nearby stages.
                 votes[value] = votes.get(value, 0) + score * score
@@ -481,31 +590,46 @@ def _local_route(query: str, dimensions: dict[str, list[str]]) -> dict[str, Any]
 
 
 def _rank_results(query: str, route: dict[str, Any], limit: int) -> tuple[list[dict[str, Any]], int]:
+    index = _catalog_index()
     combined = " ".join([query, *route.get("search_terms", [])])
-    query_tokens = _text_tokens(combined)
-    candidates = [
-        item
-        for item in get_catalog_items()
-        if all(not route.get(key) or item.get(key) == route[key] for key in ("domain", "stage"))
-    ]
-    scored = [(_item_score(item, query_tokens), int(bool(route.get("function") and item.get("function") == route["function"])), item) for item in candidates]
-    scored.sort(
-        key=lambda pair: (
-            -pair[0],
-            -pair[1],
-            READINESS_ORDER.get(str(pair[2].get("readiness")), 9),
-            SOURCE_REVIEW_ORDER.get(str(pair[2].get("review_status")), 9),
-            -int(pair[2].get("quality_score") or 0),
-            str(pair[2].get("id")),
+    scores = index.bm25(_text_tokens(combined))
+    filtered: frozenset[int] | None = None
+    for key in ("domain", "stage"):
+        if route.get(key):
+            members = index.dimension_members.get((key, str(route[key])), frozenset())
+            filtered = members if filtered is None else filtered & members
+    candidates: frozenset[int] | range = range(len(index.items)) if filtered is None else filtered
+
+    def lexical_key(document: int) -> tuple:
+        item = index.items[document]
+        return (
+            -scores.get(document, 0.0),
+            -int(bool(route.get("function") and item.get("function") == route["function"])),
+            READINESS_ORDER.get(str(item.get("readiness")), 9),
+            SOURCE_REVIEW_ORDER.get(str(item.get("review_status")), 9),
+            -int(item.get("quality_score") or 0),
+            str(item.get("id")),
         )
+
+    lexical = heapq.nsmallest(
+        HYBRID_DEPTH,
+        (document for document in scores if filtered is None or document in filtered),
+        key=lexical_key,
     )
+    vector_hits = _vector_hits(combined, filtered)
+    similarities = dict(vector_hits)
+    fused = reciprocal_rank_fusion([lexical, [document for document, _ in vector_hits]])
+
     ranked: list[dict[str, Any]] = []
-    for rank, (task_match, function_match, item) in enumerate(scored[:limit], start=1):
+    chosen = heapq.nsmallest(limit, candidates, key=lambda document: (-fused.get(document, 0.0), *lexical_key(document)))
+    for rank, document in enumerate(chosen, start=1):
+        item = index.items[document]
         enriched = dict(item)
         enriched["rank"] = rank
         enriched["ranking_signals"] = {
-            "task_match": task_match,
-            "function_match": function_match,
+            "task_match": round(scores.get(document, 0.0), 4),
+            "vector_match": round(similarities.get(document, 0.0), 4),
+            "function_match": int(bool(route.get("function") and item.get("function") == route["function"])),
             "readiness": str(item.get("readiness") or ""),
             "source_review": str(item.get("review_status") or ""),
             "quality_score": int(item.get("quality_score") or 0),
@@ -549,8 +673,11 @@ async def find_science_skills(
     message = "本地三维路由已完成"
     route: dict[str, Any] | None = None
     skill_mounted = False
-    has_catalog_evidence = _has_distinctive_catalog_evidence(clean_query, dimensions)
-    if allow_model and config.configured:
+    confident_match, has_catalog_evidence = await run_in_threadpool(_local_catalog_evidence, clean_query, dimensions)
+    if confident_match is not None and allow_model and config.configured:
+        mode = "hybrid_local"
+        message = "目录检索结果一致，已跳过模型路由"
+    elif allow_model and config.configured:
         try:
             raw_route = await _route_with_agentscope(clean_query, dimensions, config)
             skill_mounted = raw_route.get("__skill_mounted") is True
@@ -597,6 +724,7 @@ async def find_science_skills(
             logger.warning("Science skill finder model recommendation failed: %s", type(exc).__name__)
             mode = "model_route_local_rank"
             message = "三维路径已识别，候选暂按目录规则排序"
+    results = hydrate_catalog_results(results)
     for item in results:
         await _emit_finder_event(on_event, "result", item)
     return {
@@ -0,0 +1,231 @@
+"""SQLite result cache with cross-worker single-flight, shared by the finder and answer caches.
+
+Each cache owns one table of serialized results and one lease table in a WAL
+SQLite file under ``WORKSPACE_BASE`` (or ``<PREFIX>_CACHE_PATH``). Identical
+keys in one worker await the same future; across workers the first caller
+takes a short lease and the others poll the shared table for its result. Rows
+carry a ``kind`` and ``version`` so a new catalog snapshot, model or prompt
+retires every older entry of that kind on the next write. Any cache failure
+degrades to a direct, uncached call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import secrets
+import sqlite3
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Iterator, TypeVar
+
+from starlette.concurrency import run_in_threadpool
+
+
+logger = logging.getLogger(__name__)
+DEFAULT_POLL_SECONDS = 0.2
+
+T = TypeVar("T")
+
+
+class SingleFlightCache:
+    def __init__(
+        self,
+        *,
+        table: str,
+        env_prefix: str,
+        default_ttl_seconds: float,
+        lease_seconds: float,
+        label: str,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+    ) -> None:
+        self.table = table
+        self.lease_table = f"{table}_leases"
+        self.env_prefix = env_prefix
+        self.default_ttl_seconds = default_ttl_seconds
+        self.lease_seconds = lease_seconds
+        self.label = label
+        self.poll_seconds = poll_seconds
+        self._inflight: dict[str, asyncio.Future[str | None]] = {}
+        self._initialized_paths: set[str] = set()
+
+    def ttl_seconds(self) -> float:
+        raw = (os.getenv(f"{self.env_prefix}_CACHE_TTL_SECONDS", "") or "").strip()
+        if not raw:
+            return self.default_ttl_seconds
+        try:
+            return max(0.0, float(raw))
+        except ValueError:
+            return self.default_ttl_seconds
+
+    def path(self) -> Path:
+        configured = os.getenv(f"{self.env_prefix}_CACHE_PATH", "").strip()
+        if configured:
+            return Path(configured).expanduser().resolve()
+        workspace = Path(os.getenv("WORKSPACE_BASE", "workspace")).expanduser().resolve()
+        return workspace / f"{self.env_prefix.lower().replace('_', '-')}-cache.sqlite3"
+
+    @contextlib.contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection inside one transaction and always close it afterwards."""
+
+        path = self.path()
+        if str(path) not in self._initialized_paths:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, timeout=5.0)
+        try:
+            if str(path) not in self._initialized_paths:
+                connection.executescript(
+                    f"""
+                    PRAGMA journal_mode=WAL;
+                    CREATE TABLE IF NOT EXISTS {self.table} (
+                        cache_key TEXT PRIMARY KEY,
+                        kind TEXT NOT NULL,
+                        version TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        expires_at REAL NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_{self.table}_expiry ON {self.table}(expires_at);
+                    CREATE TABLE IF NOT EXISTS {self.lease_table} (
+                        cache_key TEXT PRIMARY KEY,
+                        owner TEXT NOT NULL,
+                        expires_at REAL NOT NULL
+                    );
+                    """
+                )
+                self._initialized_paths.add(str(path))
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def read(self, cache_key: str) -> str | None:
+        with self.connect() as connection:
+            row = connection.execute(
+                f"SELECT payload FROM {self.table} WHERE cache_key = ? AND expires_at > ?",
+                (cache_key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def write(self, cache_key: str, *, kind: str, version: str, payload: str, ttl: float) -> None:
+        now = time.time()
+        with self.connect() as connection:
+            connection.execute(
+                f"DELETE FROM {self.table} WHERE expires_at <= ? OR (kind = ? AND version <> ?)",
+                (now, kind, version),
+            )
+            connection.execute(
+                f"""
+                INSERT INTO {self.table}(cache_key, kind, version, payload, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET payload = excluded.payload, expires_at = excluded.expires_at
+                """,
+                (cache_key, kind, version, payload, now + ttl),
+            )
+
+    def acquire_lease(self, cache_key: str, owner: str) -> bool:
+        now = time.time()
+        with self.connect() as connection:
+            connection.execute(f"DELETE FROM {self.lease_table} WHERE cache_key = ? AND expires_at <= ?", (cache_key, now))
+            cursor = connection.execute(
+                f"INSERT OR IGNORE INTO {self.lease_table}(cache_key, owner, expires_at) VALUES (?, ?, ?)",
+                (cache_key, owner, now + self.lease_seconds),
+            )
+            return cursor.rowcount == 1
+
+    def release_lease(self, cache_key: str, owner: str) -> None:
+        with self.connect() as connection:
+            connection.execute(f"DELETE FROM {self.lease_table} WHERE cache_key = ? AND owner = ?", (cache_key, owner))
+
+    def lease_active(self, cache_key: str) -> bool:
+        with self.connect() as connection:
+            row = connection.execute(
+                f"SELECT 1 FROM {self.lease_table} WHERE cache_key = ? AND expires_at > ?",
+                (cache_key, time.time()),
+            ).fetchone()
+        return row is not None
+
+    async def _wait_for_peer_worker(self, cache_key: str) -> str | None:
+        deadline = time.monotonic() + self.lease_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_seconds)
+            payload = await run_in_threadpool(self.read, cache_key)
+            if payload is not None:
+                return payload
+            if not await run_in_threadpool(self.lease_active, cache_key):
+                return None
+        return None
+
+    async def get_or_compute(
+        self,
+        cache_key: str,
+        compute: Callable[[], Awaitable[T]],
+        *,
+        encode: Callable[[T], str | None],
+        kind: str = "",
+        version: str = "",
+    ) -> tuple[T | str, bool]:
+        """Return ``(stored payload, True)`` on a hit, otherwise ``(compute() result, False)``.
+
+        ``encode`` turns a computed result into the payload to store, or ``None``
+        for results that must not be cached.
+        """
+
+        ttl = self.ttl_seconds()
+        if ttl <= 0:
+            return await compute(), False
+        try:
+            payload = await run_in_threadpool(self.read, cache_key)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("%s cache unavailable: %s", self.label, type(exc).__name__)
+            return await compute(), False
+        if payload is not None:
+            return payload, True
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            payload = await asyncio.shield(inflight)
+            if payload is not None:
+                return payload, True
+            return await compute(), False
+
+        future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        owner = secrets.token_hex(8)
+        leased = False
+        shared: str | None = None
+        try:
+            try:
+                leased = await run_in_threadpool(self.acquire_lease, cache_key, owner)
+                if not leased:
+                    payload = await self._wait_for_peer_worker(cache_key)
+                    if payload is not None:
+                        shared = payload
+                        return payload, True
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("%s cache lease failed: %s", self.label, type(exc).__name__)
+            result = await compute()
+            shared = encode(result)
+            if shared is not None:
+                try:
+                    await run_in_threadpool(
+                        self.write,
+                        cache_key,
+                        kind=kind,
+                        version=version,
+                        payload=shared,
+                        ttl=ttl,
+                    )
+                except (OSError, sqlite3.Error) as exc:
+                    logger.warning("%s cache write failed: %s", self.label, type(exc).__name__)
+            return result, False
+        finally:
+            self._inflight.pop(cache_key, None)
+            future.set_result(shared)
+            if leased:
+                try:
+                    await run_in_threadpool(self.release_lease, cache_key, owner)
+                except (OSError, sqlite3.Error):
+                    pass
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import contextlib
 import functools
+import hashlib
 import json
 import logging
 import os
 import re
 import secrets
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
@@ -28,6 +34,7 @@ from app.services.openclaw_runtime import (
 )
 from app.services.resonnet_client import get_resonnet_base_url
 from app.storage.database.postgres_client import get_db_session
+from app.storage.database.worker_leases import acquire_worker_lease, release_worker_lease
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +117,19 @@ CLAUDE_SCIENTIFIC_CLUSTER_RULES: tuple[tuple[str, str], ...] = (
     ("zotero", "literature"),
     ("literature", "literature"),
 )
+SKILL_HUB_SEED_VERSION = 1
+SKILL_HUB_SEED_STATE_KEY = "skill_hub"
+# Daily buckets are kept a little past the 30-day window so the periodic
+# refresh can decay a skill to zero before its last bucket is pruned.
+SKILL_HUB_TRENDING_BUCKET_RETENTION_DAYS = 45
+DEFAULT_TRENDING_REFRESH_SECONDS = 900.0
+SKILL_HUB_TRENDING_LEASE_NAME = "skill-hub-trending-refresh"
+DEFAULT_AGENT_STATS_REBUILD_SECONDS = 3600.0
+_trending_worker_owner = uuid.uuid4().hex
+_trending_worker_leader = False
+_agent_stats_rebuilt_at: float | None = None
+_trending_worker_task: asyncio.Task | None = None
+_trending_worker_stop: asyncio.Event | None = None
 DEMO_SKILL_SLUGS = (
     "scanpy-pipeline",
     "literature-map",
@@ -613,6 +633,9 @@ def _build_skill_summary(row, *, viewer_favorited: bool = False) -> dict[str, An
         "total_favorites": int(getattr(row, "total_favorites", 0) or 0),
         "total_downloads": int(getattr(row, "total_downloads", 0) or 0),
         "weekly_downloads": int(getattr(row, "weekly_downloads", 0) or 0),
+        "monthly_downloads": int(getattr(row, "monthly_downloads", 0) or 0),
+        "weekly_reviews": int(getattr(row, "weekly_reviews", 0) or 0),
+        "monthly_reviews": int(getattr(row, "monthly_reviews", 0) or 0),
         "viewer_favorited": bool(viewer_favorited),
         "author_openclaw_agent_id": int(row.author_openclaw_agent_id) if getattr(row, "author_openclaw_agent_id", None) is not None else None,
         "created_at": _to_iso(row.created_at),
@@ -725,6 +748,7 @@ def _upsert_seeded_skill(session, *, source: dict[str, Any], now: datetime) -> i
                     openclaw_ready = :openclaw_ready,
                     featured = :featured,
                     hero_note = :hero_note,
+                    status = 'published',
                     updated_at = :updated_at,
                     published_at = :published_at
                 WHERE id = :skill_id
@@ -797,12 +821,141 @@ def _upsert_seeded_skill(session, *, source: dict[str, Any], now: datetime) -> i
     return skill_id
 
 
-def ensure_skill_hub_seed_data(session=None) -> None:
+def _seed_checksum(payload: Any) -> str:
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _load_seed_entities() -> tuple[list[dict[str, Any]], dict[str, str]]:
+    seeded_sources = [_load_research_dream_source()]
+    for source_name in ASSIGNABLE_SOURCES_TO_IMPORT:
+        seeded_sources.extend(_load_assignable_source_entries(source_name))
+    checksums: dict[str, str] = {}
+    for source in seeded_sources:
+        checksums[f"skill:{source['slug']}"] = _seed_checksum(source)
+    for task in DEFAULT_TASK_DEFS:
+        checksums[f"task:{task['task_key']}"] = _seed_checksum(task)
+    for collection in DEFAULT_COLLECTION_DEFS:
+        checksums[f"collection:{collection['slug']}"] = _seed_checksum(collection)
+    return seeded_sources, checksums
+
+
+def _upsert_seeded_task_def(session, *, task: dict[str, Any], now: datetime) -> None:
+    session.execute(
+        text(
+            """
+            INSERT INTO skill_hub_task_defs (
+                task_key, title, description, reason_code, points_reward,
+                daily_limit, goal_count, created_at, updated_at
+            ) VALUES (
+                :task_key, :title, :description, :reason_code, :points_reward,
+                :daily_limit, :goal_count, :created_at, :updated_at
+            )
+            ON CONFLICT (task_key) DO UPDATE SET
+                title = EXCLUDED.title,
+                description = EXCLUDED.description,
+                reason_code = EXCLUDED.reason_code,
+                points_reward = EXCLUDED.points_reward,
+                daily_limit = EXCLUDED.daily_limit,
+                goal_count = EXCLUDED.goal_count,
+                updated_at = EXCLUDED.updated_at
+            """
+        ),
+        {**task, "created_at": now, "updated_at": now},
+    )
+
+
+def _upsert_seeded_collection(session, *, collection: dict[str, Any], now: datetime) -> None:
+    inserted_collection = session.execute(
+        text(
+            """
+            INSERT INTO skill_hub_collections (
+                slug, title, description, accent, created_at, updated_at
+            ) VALUES (
+                :slug, :title, :description, :accent, :created_at, :created_at
+            )
+            ON CONFLICT (slug) DO UPDATE SET
+                title = EXCLUDED.title,
+                description = EXCLUDED.description,
+                accent = EXCLUDED.accent,
+                updated_at = EXCLUDED.updated_at
+            RETURNING id
+            """
+        ),
+        {
+            "slug": collection["slug"],
+            "title": collection["title"],
+            "description": collection["description"],
+            "accent": collection["accent"],
+            "created_at": now,
+        },
+    ).fetchone()
+    collection_id = int(inserted_collection.id)
+    session.execute(
+        text("DELETE FROM skill_hub_collection_items WHERE collection_id = :collection_id"),
+        {"collection_id": collection_id},
+    )
+    skill_slugs = list(collection["skill_slugs"])
+    if not skill_slugs:
+        return
+    slug_rows = session.execute(
+        text("SELECT id, slug FROM skill_hub_skills WHERE slug IN :slugs").bindparams(bindparam("slugs", expanding=True)),
+        {"slugs": skill_slugs},
+    ).fetchall()
+    slug_to_skill_id = {str(row.slug): int(row.id) for row in slug_rows}
+    for position, collection_skill_slug in enumerate(skill_slugs):
+        skill_id = slug_to_skill_id.get(collection_skill_slug)
+        if skill_id is None:
+            continue
+        session.execute(
+            text(
+                """
+                INSERT INTO skill_hub_collection_items (
+                    collection_id, skill_id, position, created_at
+                ) VALUES (
+                    :collection_id, :skill_id, :position, :created_at
+                )
+                """
+            ),
+            {
+                "collection_id": collection_id,
+                "skill_id": skill_id,
+                "position": position,
+                "created_at": now,
+            },
+        )
+
+
+def ensure_skill_hub_seed_data(session=None, *, force: bool = False) -> dict[str, Any]:
+    """Sync seed skills, task definitions and collections by checksum.
+
+    The whole seed is skipped after one ``skill_hub_seed_state`` SELECT when its
+    checksum matches; otherwise only entities whose checksum changed are
+    upserted, so counters, task events and user rows are never reset.
+    """
     owns_session = session is None
     if owns_session:
         ctx = get_db_session()
         session = ctx.__enter__()
     try:
+        seeded_sources, entity_checksums = _load_seed_entities()
+        seed_checksum = _seed_checksum(
+            {
+                "version": SKILL_HUB_SEED_VERSION,
+                "demo_slugs": DEMO_SKILL_SLUGS,
+                "entities": entity_checksums,
+            }
+        )
+        state = session.execute(
+            text("SELECT checksum, entity_checksums_json FROM skill_hub_seed_state WHERE seed_key = :seed_key"),
+            {"seed_key": SKILL_HUB_SEED_STATE_KEY},
+        ).fetchone()
+        if state is not None and state.checksum == seed_checksum and not force:
+            return {"applied": False, "changed": [], "removed": []}
+        previous = {} if force or state is None else _json_loads(state.entity_checksums_json, {})
+        changed = sorted(key for key, checksum in entity_checksums.items() if previous.get(key) != checksum)
+        removed = sorted(key for key in previous if key not in entity_checksums)
+
         session.execute(
             text(
                 """
@@ -812,78 +965,60 @@ def ensure_skill_hub_seed_data(session=None) -> None:
             ).bindparams(bindparam("slugs", expanding=True)),
             {"slugs": list(DEMO_SKILL_SLUGS)},
         )
-        session.execute(text("DELETE FROM skill_hub_collection_items"))
-        session.execute(text("DELETE FROM skill_hub_collections"))
-        session.execute(text("DELETE FROM skill_hub_task_events"))
-        session.execute(text("DELETE FROM skill_hub_task_defs"))
-
         now = _now()
-        seeded_sources = [_load_research_dream_source()]
-        for source_name in ASSIGNABLE_SOURCES_TO_IMPORT:
-            seeded_sources.extend(_load_assignable_source_entries(source_name))
-        slug_to_skill_id: dict[str, int] = {}
+        changed_keys = set(changed)
         for source in seeded_sources:
-            slug_to_skill_id[source["slug"]] = _upsert_seeded_skill(session, source=source, now=now)
+            if f"skill:{source['slug']}" in changed_keys:
+                _upsert_seeded_skill(session, source=source, now=now)
         for task in DEFAULT_TASK_DEFS:
-            session.execute(
-                text(
-                    """
-                    INSERT INTO skill_hub_task_defs (
-                        task_key, title, description, reason_code, points_reward,
-                        daily_limit, goal_count, created_at, updated_at
-                    ) VALUES (
-                        :task_key, :title, :description, :reason_code, :points_reward,
-                        :daily_limit, :goal_count, :created_at, :updated_at
-                    )
-                    """
-                ),
-                {
-                    **task,
-                    "created_at": now,
-                    "updated_at": now,
-                },
-            )
+            if f"task:{task['task_key']}" in changed_keys:
+                _upsert_seeded_task_def(session, task=task, now=now)
         for collection in DEFAULT_COLLECTION_DEFS:
-            inserted_collection = session.execute(
-                text(
-                    """
-                    INSERT INTO skill_hub_collections (
-                        slug, title, description, accent, created_at
-                    ) VALUES (
-                        :slug, :title, :description, :accent, :created_at
-                    )
-                    RETURNING id
-                    """
-                ),
-                {
-                    "slug": collection["slug"],
-                    "title": collection["title"],
-                    "description": collection["description"],
-                    "accent": collection["accent"],
-                    "created_at": now,
-                },
-            ).fetchone()
-            for position, collection_skill_slug in enumerate(collection["skill_slugs"]):
-                skill_id = slug_to_skill_id.get(collection_skill_slug)
-                if skill_id is None:
-                    continue
+            if f"collection:{collection['slug']}" in changed_keys:
+                _upsert_seeded_collection(session, collection=collection, now=now)
+        for key in removed:
+            kind, _, entity_key = key.partition(":")
+            if kind == "skill":
+                # Archive only the unowned seed row so its reviews, downloads and favorites
+                # (and the agent counters built from them) survive; re-seeding republishes it.
                 session.execute(
                     text(
                         """
-                        INSERT INTO skill_hub_collection_items (
-                            collection_id, skill_id, position, created_at
-                        ) VALUES (
-                            :collection_id, :skill_id, :position, :created_at
-                        )
+                        UPDATE skill_hub_skills
+                        SET status = 'archived', featured = FALSE, updated_at = :now
+                        WHERE slug = :key AND author_openclaw_agent_id IS NULL
                         """
                     ),
-                    {
-                        "collection_id": int(inserted_collection.id),
-                        "skill_id": skill_id,
-                        "position": position,
-                        "created_at": now,
-                    },
+                    {"key": entity_key, "now": now},
                 )
+            elif kind == "task":
+                session.execute(text("DELETE FROM skill_hub_task_defs WHERE task_key = :key"), {"key": entity_key})
+            elif kind == "collection":
+                session.execute(text("DELETE FROM skill_hub_collections WHERE slug = :key"), {"key": entity_key})
+
+        session.execute(
+            text(
+                """
+                INSERT INTO skill_hub_seed_state (seed_key, seed_version, checksum, entity_checksums_json, applied_at)
+                VALUES (:seed_key, :seed_version, :checksum, :entity_checksums_json, :applied_at)
+                ON CONFLICT (seed_key) DO UPDATE SET
+                    seed_version = EXCLUDED.seed_version,
+                    checksum = EXCLUDED.checksum,
+                    entity_checksums_json = EXCLUDED.entity_checksums_json,
+                    applied_at = EXCLUDED.applied_at
+                """
+            ),
+            {
+                "seed_key": SKILL_HUB_SEED_STATE_KEY,
+                "seed_version": SKILL_HUB_SEED_VERSION,
+                "checksum": seed_checksum,
+                "entity_checksums_json": _json_dumps(entity_checksums),
+                "applied_at": now,
+            },
+        )
+        if changed or removed:
+            logger.info("SkillHub seed synced: %s changed, %s removed", len(changed), len(removed))
+        return {"applied": True, "changed": changed, "removed": removed}
     finally:
         if owns_session:
             ctx.__exit__(None, None, None)
@@ -893,6 +1028,72 @@ def list_categories() -> dict[str, Any]:
     return {"disciplines": DISCIPLINES, "clusters": RESEARCH_CLUSTERS}
 
 
+SKILL_HUB_EXACT_COUNT_CAP = 1000
+_SKILL_FTS_MIN_QUERY_CHARS = 3
+_HOT_SCORE_EXPR = "(weekly_downloads * 2 + total_favorites + total_reviews)"
+# Every sort is fully descending and ends in ``id`` so keyset cursors are unambiguous.
+_SKILL_SORT_KEYS: dict[str, tuple[str, ...]] = {
+    "new": ("featured", "published_at", "id"),
+    "downloads": ("featured", "total_downloads", "avg_rating", "id"),
+    "stars": ("featured", "avg_rating", "total_reviews", "id"),
+    "top": ("featured", "avg_rating", "total_downloads", "id"),
+    "hot": ("featured", "hot_score", "avg_rating", "id"),
+    "trending": ("weekly_downloads", "weekly_reviews", "id"),
+}
+
+
+def _encode_skill_cursor(sort: str, values: list[Any]) -> str:
+    normalized = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps({"s": sort, "k": normalized}, ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_skill_cursor(cursor: str, sort: str) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        values = payload["k"]
+        valid = payload.get("s") == sort and isinstance(values, list) and len(values) == len(_SKILL_SORT_KEYS[sort])
+    except Exception:
+        valid = False
+    if not valid:
+        raise HTTPException(status_code=400, detail="分页游标无效或与排序方式不匹配")
+    return values
+
+
+def _skill_search_clause(session, clean_q: str) -> tuple[str, dict[str, Any]]:
+    """Return the search predicate for ``clean_q``: FTS5 trigram MATCH on SQLite, trigram-indexed LIKE on Postgres."""
+    if not clean_q:
+        return "", {}
+    if session.bind.dialect.name == "sqlite" and len(clean_q) >= _SKILL_FTS_MIN_QUERY_CHARS:
+        phrase = '"' + clean_q.replace('"', '""') + '"'
+        return (
+            "AND id IN (SELECT rowid FROM skill_hub_skill_fts WHERE skill_hub_skill_fts MATCH :fts_q)",
+            {"fts_q": phrase},
+        )
+    # Postgres serves this from the pg_trgm GIN index; on SQLite only 1-2 character queries get here.
+    return "AND search_text LIKE :like_q", {"like_q": f"%{clean_q}%"}
+
+
+def _count_skills(session, where_sql: str, params: dict[str, Any]) -> tuple[int, bool]:
+    """Count matches exactly up to ``SKILL_HUB_EXACT_COUNT_CAP``; beyond that use the planner estimate on Postgres."""
+    capped = int(
+        session.execute(
+            text(f"SELECT COUNT(*) FROM (SELECT 1 FROM skill_hub_skills {where_sql} LIMIT :count_cap) AS capped"),
+            {**params, "count_cap": SKILL_HUB_EXACT_COUNT_CAP + 1},
+        ).scalar_one()
+    )
+    if capped <= SKILL_HUB_EXACT_COUNT_CAP:
+        return capped, False
+    if session.bind.dialect.name == "sqlite":
+        return int(session.execute(text(f"SELECT COUNT(*) FROM skill_hub_skills {where_sql}"), params).scalar_one()), False
+    plan = session.execute(text(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM skill_hub_skills {where_sql}"), params).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimated = int(plan[0]["Plan"]["Plan Rows"])
+    return max(estimated, capped), True
+
+
 def list_skills(
     *,
     user_id: int | None = None,
@@ -904,57 +1105,80 @@ def list_skills(
     openclaw_ready_only: bool = False,
     limit: int = 20,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
+    """List published skills.
+
+    Pass ``next_cursor`` from the previous page as ``cursor`` for keyset paging;
+    ``offset`` is kept for existing clients and ignored when a cursor is given.
+    """
     safe_limit = max(1, min(limit, 100))
-    safe_offset = max(0, offset)
-    order_by = {
-        "new": "featured DESC, published_at DESC, id DESC",
-        "downloads": "featured DESC, total_downloads DESC, avg_rating DESC, id DESC",
-        "stars": "featured DESC, avg_rating DESC, total_reviews DESC, id DESC",
-        "top": "featured DESC, avg_rating DESC, total_downloads DESC, id DESC",
-        "hot": "featured DESC, (weekly_downloads * 2 + total_favorites + total_reviews) DESC, avg_rating DESC, id DESC",
-    }.get(sort, "featured DESC, (weekly_downloads * 2 + total_favorites + total_reviews) DESC, avg_rating DESC, id DESC")
+    safe_offset = 0 if cursor else max(0, offset)
+    sort_key = sort if sort in _SKILL_SORT_KEYS else "hot"
+    key_exprs = _SKILL_SORT_KEYS[sort_key]
+    order_by = ", ".join(f"{expr} DESC" for expr in key_exprs)
+    key_select = ", ".join(f"{expr} AS sort_key_{index}" for index, expr in enumerate(key_exprs))
     clean_q = (q or "").strip().lower()
     params: dict[str, Any] = {
-        "q": clean_q,
-        "like_q": f"%{clean_q}%",
         "category": (category or "").strip(),
         "cluster": (cluster or "").strip(),
         "featured_only": bool(featured_only),
         "openclaw_ready_only": bool(openclaw_ready_only),
-        "limit": safe_limit,
+        "limit": safe_limit + 1,
         "offset": safe_offset,
     }
-    where_sql = """
-        WHERE status = 'published'
-          AND (:q = '' OR LOWER(name) LIKE :like_q OR LOWER(summary) LIKE :like_q OR LOWER(description) LIKE :like_q OR LOWER(COALESCE(tags_json, '')) LIKE :like_q)
-          AND (:category = '' OR category_key = :category)
-          AND (:cluster = '' OR cluster_key = :cluster)
-          AND (:featured_only = FALSE OR featured = TRUE)
-          AND (:openclaw_ready_only = FALSE OR openclaw_ready = TRUE)
-    """
     with get_db_session() as session:
+        search_sql, search_params = _skill_search_clause(session, clean_q)
+        params.update(search_params)
+        where_sql = f"""
+            WHERE status = 'published'
+              {search_sql}
+              AND (:category = '' OR category_key = :category)
+              AND (:cluster = '' OR cluster_key = :cluster)
+              AND (:featured_only = FALSE OR featured = TRUE)
+              AND (:openclaw_ready_only = FALSE OR openclaw_ready = TRUE)
+        """
+        keyset_sql = ""
+        if cursor:
+            cursor_values = _decode_skill_cursor(cursor, sort_key)
+            placeholders = ", ".join(f":cursor_{index}" for index in range(len(cursor_values)))
+            keyset_sql = f"AND ({', '.join(key_exprs)}) < ({placeholders})"
+            params.update({f"cursor_{index}": value for index, value in enumerate(cursor_values)})
         viewer_agent = get_primary_openclaw_agent_for_user(user_id) if user_id else None
-        total = int(session.execute(text(f"SELECT COUNT(*) FROM skill_hub_skills {where_sql}"), params).scalar_one())
+        total, total_is_estimate = _count_skills(session, where_sql, params)
         rows = session.execute(
             text(
                 f"""
-                SELECT *
+                SELECT *, {key_select}
                 FROM skill_hub_skills
                 {where_sql}
+                {keyset_sql}
                 ORDER BY {order_by}
                 LIMIT :limit OFFSET :offset
                 """
             ),
             params,
         ).fetchall()
+        has_more = len(rows) > safe_limit
+        rows = rows[:safe_limit]
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]._mapping
+            next_cursor = _encode_skill_cursor(sort_key, [last[f"sort_key_{index}"] for index in range(len(key_exprs))])
         favorites = _resolve_viewer_favorites(
             session,
             user_agent_id=int(viewer_agent["id"]) if viewer_agent else None,
             skill_ids=[int(row.id) for row in rows],
         )
         payload = [_build_skill_summary(row, viewer_favorited=int(row.id) in favorites) for row in rows]
-    return {"list": payload, "total": total, "limit": safe_limit, "offset": safe_offset}
+    return {
+        "list": payload,
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+        "limit": safe_limit,
+        "offset": safe_offset,
+        "next_cursor": next_cursor,
+    }
 
 
 def _resolve_skill_row(session, id_or_slug: str):
@@ -963,7 +1187,7 @@ def _resolve_skill_row(session, id_or_slug: str):
             """
             SELECT *
             FROM skill_hub_skills
-            WHERE CAST(id AS TEXT) = :needle OR slug = :needle
+            WHERE (CAST(id AS TEXT) = :needle OR slug = :needle) AND status = 'published'
             LIMIT 1
             """
         ),
@@ -1018,7 +1242,7 @@ def get_skill_detail(id_or_slug: str, *, user_id: int | None = None) -> dict[str
                 WHERE id <> :skill_id
                   AND status = 'published'
                   AND (cluster_key = :cluster_key OR category_key = :category_key)
-                ORDER BY (weekly_downloads * 2 + total_favorites + total_reviews) DESC, avg_rating DESC
+                ORDER BY hot_score DESC, avg_rating DESC
                 LIMIT 4
                 """
             ),
@@ -1223,19 +1447,8 @@ def _recompute_skill_aggregates(session, *, skill_id: int) -> None:
             {"skill_id": skill_id},
         ).scalar_one()
     )
-    weekly_count = int(
-        session.execute(
-            text(
-                """
-                SELECT COUNT(*)
-                FROM skill_hub_downloads
-                WHERE skill_id = :skill_id
-                  AND created_at >= :cutoff
-                """
-            ),
-            {"skill_id": skill_id, "cutoff": _now() - timedelta(days=7)},
-        ).scalar_one()
-    )
+    rolling = _rolling_skill_counts(session, skill_id=skill_id)
+    total_reviews = int(review_row.total_reviews or 0)
     session.execute(
         text(
             """
@@ -1245,22 +1458,332 @@ def _recompute_skill_aggregates(session, *, skill_id: int) -> None:
                 total_favorites = :total_favorites,
                 total_downloads = :total_downloads,
                 weekly_downloads = :weekly_downloads,
+                monthly_downloads = :monthly_downloads,
+                weekly_reviews = :weekly_reviews,
+                monthly_reviews = :monthly_reviews,
+                hot_score = :hot_score,
                 updated_at = :updated_at
             WHERE id = :skill_id
             """
         ),
         {
             "skill_id": skill_id,
-            "total_reviews": int(review_row.total_reviews or 0),
+            "total_reviews": total_reviews,
             "avg_rating": float(review_row.avg_rating or 0),
             "total_favorites": favorite_count,
             "total_downloads": download_count,
-            "weekly_downloads": weekly_count,
+            **rolling,
+            "hot_score": float(rolling["weekly_downloads"] * 2 + favorite_count + total_reviews),
             "updated_at": _now(),
         },
     )
 
 
+def _trending_window_bounds(now: datetime | None = None) -> dict[str, str]:
+    today = (now or _now()).astimezone(timezone.utc).date()
+    return {
+        "today": today.isoformat(),
+        "week_start": (today - timedelta(days=6)).isoformat(),
+        "month_start": (today - timedelta(days=29)).isoformat(),
+        "retain_from": (today - timedelta(days=SKILL_HUB_TRENDING_BUCKET_RETENTION_DAYS - 1)).isoformat(),
+    }
+
+
+def _bump_skill_daily_stats(session, *, skill_id: int, downloads: int = 0, reviews: int = 0) -> None:
+    session.execute(
+        text(
+            """
+            INSERT INTO skill_hub_skill_daily_stats (skill_id, bucket_day, downloads, reviews)
+            VALUES (:skill_id, :bucket_day, :downloads, :reviews)
+            ON CONFLICT (skill_id, bucket_day) DO UPDATE SET
+                downloads = skill_hub_skill_daily_stats.downloads + EXCLUDED.downloads,
+                reviews = skill_hub_skill_daily_stats.reviews + EXCLUDED.reviews
+            """
+        ),
+        {
+            "skill_id": skill_id,
+            "bucket_day": _trending_window_bounds()["today"],
+            "downloads": downloads,
+            "reviews": reviews,
+        },
+    )
+
+
+def _rolling_skill_counts(session, *, skill_id: int) -> dict[str, int]:
+    bounds = _trending_window_bounds()
+    row = session.execute(
+        text(
+            """
+            SELECT
+                COALESCE(SUM(CASE WHEN bucket_day >= :week_start THEN downloads ELSE 0 END), 0) AS weekly_downloads,
+                COALESCE(SUM(downloads), 0) AS monthly_downloads,
+                COALESCE(SUM(CASE WHEN bucket_day >= :week_start THEN reviews ELSE 0 END), 0) AS weekly_reviews,
+                COALESCE(SUM(reviews), 0) AS monthly_reviews
+            FROM skill_hub_skill_daily_stats
+            WHERE skill_id = :skill_id AND bucket_day >= :month_start
+            """
+        ),
+        {"skill_id": skill_id, "week_start": bounds["week_start"], "month_start": bounds["month_start"]},
+    ).fetchone()
+    return {key: int(getattr(row, key) or 0) for key in ("weekly_downloads", "monthly_downloads", "weekly_reviews", "monthly_reviews")}
+
+
+def _refresh_skill_trending_scores(session) -> int:
+    bounds = _trending_window_bounds()
+    # Only skills with buckets inside the retention window can have moving
+    # counters; seeded skills without real activity keep their seeded values.
+    # Rows whose counters would not change are left alone so a refresh on a
+    # quiet day writes nothing.
+    rescored = session.execute(
+        text(
+            """
+            UPDATE skill_hub_skills
+            SET weekly_downloads = rolling.weekly_downloads,
+                monthly_downloads = rolling.monthly_downloads,
+                weekly_reviews = rolling.weekly_reviews,
+                monthly_reviews = rolling.monthly_reviews
+            FROM (
+                SELECT
+                    skill_id,
+                    SUM(CASE WHEN bucket_day >= :week_start THEN downloads ELSE 0 END) AS weekly_downloads,
+                    SUM(CASE WHEN bucket_day >= :month_start THEN downloads ELSE 0 END) AS monthly_downloads,
+                    SUM(CASE WHEN bucket_day >= :week_start THEN reviews ELSE 0 END) AS weekly_reviews,
+                    SUM(CASE WHEN bucket_day >= :month_start THEN reviews ELSE 0 END) AS monthly_reviews
+                FROM skill_hub_skill_daily_stats
+                GROUP BY skill_id
+            ) AS rolling
+            WHERE skill_hub_skills.id = rolling.skill_id
+              AND (
+                skill_hub_skills.weekly_downloads <> rolling.weekly_downloads
+                OR skill_hub_skills.monthly_downloads <> rolling.monthly_downloads
+                OR skill_hub_skills.weekly_reviews <> rolling.weekly_reviews
+                OR skill_hub_skills.monthly_reviews <> rolling.monthly_reviews
+              )
+            """
+        ),
+        bounds,
+    ).rowcount
+    session.execute(
+        text(
+            f"""
+            UPDATE skill_hub_skills
+            SET hot_score = {_HOT_SCORE_EXPR}
+            WHERE hot_score <> {_HOT_SCORE_EXPR}
+            """
+        )
+    )
+    session.execute(
+        text("DELETE FROM skill_hub_skill_daily_stats WHERE bucket_day < :retain_from"),
+        {"retain_from": bounds["retain_from"]},
+    )
+    return int(rescored or 0)
+
+
+def refresh_skill_trending_scores(session=None) -> int:
+    """Decay rolling counters and hot scores as days leave the 7/30-day windows.
+
+    Returns the number of skills whose rolling counters changed.
+    """
+    if session is not None:
+        return _refresh_skill_trending_scores(session)
+    with get_db_session() as owned_session:
+        return _refresh_skill_trending_scores(owned_session)
+
+
+def rebuild_skill_trending_stats(session) -> int:
+    """Rebuild daily buckets from recent download and review rows, then rescore; runs with the schema migration."""
+    is_sqlite = session.bind.dialect.name == "sqlite"
+    day_expr = "substr(created_at, 1, 10)" if is_sqlite else "CAST((created_at AT TIME ZONE 'UTC') AS DATE)"
+    since = _now() - timedelta(days=SKILL_HUB_TRENDING_BUCKET_RETENTION_DAYS)
+    session.execute(text("DELETE FROM skill_hub_skill_daily_stats"))
+    session.execute(
+        text(
+            f"""
+            INSERT INTO skill_hub_skill_daily_stats (skill_id, bucket_day, downloads, reviews)
+            SELECT skill_id, bucket_day, SUM(downloads), SUM(reviews)
+            FROM (
+                SELECT skill_id, {day_expr} AS bucket_day, 1 AS downloads, 0 AS reviews
+                FROM skill_hub_downloads
+                WHERE created_at >= :since
+                UNION ALL
+                SELECT skill_id, {day_expr} AS bucket_day, 0 AS downloads, 1 AS reviews
+                FROM skill_hub_reviews
+                WHERE created_at >= :since
+            ) events
+            GROUP BY skill_id, bucket_day
+            """
+        ),
+        {"since": since},
+    )
+    return _refresh_skill_trending_scores(session)
+
+
+def _trending_refresh_interval_seconds() -> float:
+    raw = os.getenv("SKILL_HUB_TRENDING_REFRESH_SECONDS", "").strip()
+    if not raw:
+        return DEFAULT_TRENDING_REFRESH_SECONDS
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("Invalid SKILL_HUB_TRENDING_REFRESH_SECONDS=%r; using default", raw)
+        return DEFAULT_TRENDING_REFRESH_SECONDS
+
+
+def _agent_stats_rebuild_interval_seconds() -> float:
+    raw = os.getenv("SKILL_HUB_AGENT_STATS_REBUILD_SECONDS", "").strip()
+    if not raw:
+        return DEFAULT_AGENT_STATS_REBUILD_SECONDS
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("Invalid SKILL_HUB_AGENT_STATS_REBUILD_SECONDS=%r; using default", raw)
+        return DEFAULT_AGENT_STATS_REBUILD_SECONDS
+
+
+def _rebuild_agent_leaderboard_stats_if_due() -> bool:
+    """Recount the agent leaderboard on the trending lease holder at most once per interval."""
+    global _agent_stats_rebuilt_at
+    interval = _agent_stats_rebuild_interval_seconds()
+    now = time.monotonic()
+    if interval <= 0 or (_agent_stats_rebuilt_at is not None and now - _agent_stats_rebuilt_at < interval):
+        return False
+    with get_db_session() as session:
+        rebuild_agent_leaderboard_stats(session)
+    _agent_stats_rebuilt_at = now
+    return True
+
+
+def _trending_lease_seconds(interval: float) -> float:
+    # Outlive one missed tick so a healthy holder keeps the lease between refreshes.
+    return max(60.0, interval * 2)
+
+
+async def _skill_hub_trending_worker_loop(stop_event: asyncio.Event, interval: float) -> None:
+    global _trending_worker_leader
+    while not stop_event.is_set():
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            return
+        except asyncio.TimeoutError:
+            pass
+        try:
+            # Every worker process runs this loop; only the lease holder rescans the skills.
+            _trending_worker_leader = await asyncio.to_thread(
+                acquire_worker_lease,
+                SKILL_HUB_TRENDING_LEASE_NAME,
+                _trending_worker_owner,
+                _trending_lease_seconds(interval),
+            )
+            if _trending_worker_leader:
+                await asyncio.to_thread(refresh_skill_trending_scores)
+                await asyncio.to_thread(_rebuild_agent_leaderboard_stats_if_due)
+        except Exception:
+            logger.info("SkillHub trending refresh failed", exc_info=True)
+
+
+def start_skill_hub_trending_worker() -> None:
+    global _trending_worker_task, _trending_worker_stop
+    interval = _trending_refresh_interval_seconds()
+    if interval <= 0:
+        logger.info("SkillHub trending refresh worker disabled")
+        return
+    if _trending_worker_task and not _trending_worker_task.done():
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.info("SkillHub trending refresh worker skipped because no event loop is running")
+        return
+    _trending_worker_stop = asyncio.Event()
+    _trending_worker_task = loop.create_task(_skill_hub_trending_worker_loop(_trending_worker_stop, interval))
+
+
+async def stop_skill_hub_trending_worker() -> None:
+    global _trending_worker_task, _trending_worker_stop, _trending_worker_leader
+    task, stop_event = _trending_worker_task, _trending_worker_stop
+    _trending_worker_task = None
+    _trending_worker_stop = None
+    if stop_event is not None:
+        stop_event.set()
+    if task is not None and not task.done():
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    if _trending_worker_leader:
+        _trending_worker_leader = False
+        try:
+            await asyncio.to_thread(release_worker_lease, SKILL_HUB_TRENDING_LEASE_NAME, _trending_worker_owner)
+        except Exception:
+            logger.info("SkillHub trending lease release failed; it will expire", exc_info=True)
+
+
+def _bump_agent_leaderboard_stats(
+    session,
+    *,
+    agent_id: int,
+    skills: int = 0,
+    reviews: int = 0,
+    downloads: int = 0,
+) -> None:
+    session.execute(
+        text(
+            """
+            INSERT INTO skill_hub_agent_stats (openclaw_agent_id, total_skills, total_reviews, total_downloads, updated_at)
+            VALUES (:agent_id, :skills, :reviews, :downloads, :updated_at)
+            ON CONFLICT (openclaw_agent_id) DO UPDATE SET
+                total_skills = skill_hub_agent_stats.total_skills + EXCLUDED.total_skills,
+                total_reviews = skill_hub_agent_stats.total_reviews + EXCLUDED.total_reviews,
+                total_downloads = skill_hub_agent_stats.total_downloads + EXCLUDED.total_downloads,
+                updated_at = EXCLUDED.updated_at
+            """
+        ),
+        {"agent_id": agent_id, "skills": skills, "reviews": reviews, "downloads": downloads, "updated_at": _now()},
+    )
+
+
+def rebuild_agent_leaderboard_stats(session) -> int:
+    """Recount ``skill_hub_agent_stats`` from source tables.
+
+    Writes only ever increment the counters, so rows removed by cascading
+    deletes (demo skill cleanup, agent deletion) leave them high. The schema
+    migration runs this once, and the trending worker's lease holder reruns it
+    every ``SKILL_HUB_AGENT_STATS_REBUILD_SECONDS`` to repair that drift.
+    """
+    session.execute(text("DELETE FROM skill_hub_agent_stats"))
+    result = session.execute(
+        text(
+            """
+            INSERT INTO skill_hub_agent_stats (openclaw_agent_id, total_skills, total_reviews, total_downloads, updated_at)
+            SELECT
+                a.id,
+                COALESCE(s.total, 0),
+                COALESCE(r.total, 0),
+                COALESCE(d.total, 0),
+                :updated_at
+            FROM openclaw_agents a
+            LEFT JOIN (
+                SELECT author_openclaw_agent_id AS agent_id, COUNT(*) AS total
+                FROM skill_hub_skills
+                GROUP BY author_openclaw_agent_id
+            ) s ON s.agent_id = a.id
+            LEFT JOIN (
+                SELECT author_openclaw_agent_id AS agent_id, COUNT(*) AS total
+                FROM skill_hub_reviews
+                GROUP BY author_openclaw_agent_id
+            ) r ON r.agent_id = a.id
+            LEFT JOIN (
+                SELECT openclaw_agent_id AS agent_id, COUNT(*) AS total
+                FROM skill_hub_downloads
+                GROUP BY openclaw_agent_id
+            ) d ON d.agent_id = a.id
+            WHERE s.total IS NOT NULL OR r.total IS NOT NULL OR d.total IS NOT NULL
+            """
+        ),
+        {"updated_at": _now()},
+    )
+    return int(result.rowcount or 0)
+
+
 def _record_task_event(session, *, openclaw_agent_id: int, task_key: str, target_id: str) -> None:
     task_row = session.execute(
         text("SELECT id FROM skill_hub_task_defs WHERE task_key = :task_key LIMIT 1"),
@@ -1377,6 +1900,7 @@ def create_skill(
                 "published_at": _now(),
             },
         ).fetchone()
+        _bump_agent_leaderboard_stats(session, agent_id=int(agent["id"]), skills=1)
         session.execute(
             text(
                 """
@@ -1662,7 +2186,9 @@ def create_review(
             session=session,
         )
         _record_task_event(session, openclaw_agent_id=int(agent["id"]), task_key="review_a_skill", target_id=str(inserted.id))
+        _bump_skill_daily_stats(session, skill_id=int(skill.id), reviews=1)
         _recompute_skill_aggregates(session, skill_id=int(skill.id))
+        _bump_agent_leaderboard_stats(session, agent_id=int(agent["id"]), reviews=1)
         row = session.execute(
             text(
                 """
@@ -1857,7 +2383,9 @@ def create_download(*, skill_id_or_slug: str, user: dict[str, Any], referrer: st
                 metadata={"slug": skill.slug, "version": latest_version.version},
                 session=session,
             )
+        _bump_skill_daily_stats(session, skill_id=int(skill.id), downloads=1)
         _recompute_skill_aggregates(session, skill_id=int(skill.id))
+        _bump_agent_leaderboard_stats(session, agent_id=int(agent["id"]), downloads=1)
         return {
             "skill_id": int(skill.id),
             "download_id": int(inserted.id),
@@ -2069,15 +2597,12 @@ def get_leaderboard() -> dict[str, Any]:
                     a.display_name,
                     a.handle,
                     COALESCE(w.balance, 0) AS balance,
-                    COALESCE(COUNT(DISTINCT s.id), 0) AS total_skills,
-                    COALESCE(COUNT(DISTINCT r.id), 0) AS total_reviews,
-                    COALESCE(COUNT(DISTINCT d.id), 0) AS total_downloads
+                    COALESCE(st.total_skills, 0) AS total_skills,
+                    COALESCE(st.total_reviews, 0) AS total_reviews,
+                    COALESCE(st.total_downloads, 0) AS total_downloads
                 FROM openclaw_agents a
                 LEFT JOIN openclaw_wallets w ON w.openclaw_agent_id = a.id
-                LEFT JOIN skill_hub_skills s ON s.author_openclaw_agent_id = a.id
-                LEFT JOIN skill_hub_reviews r ON r.author_openclaw_agent_id = a.id
-                LEFT JOIN skill_hub_downloads d ON d.openclaw_agent_id = a.id
-                GROUP BY a.id, a.agent_uid, a.display_name, a.handle, w.balance
+                LEFT JOIN skill_hub_agent_stats st ON st.openclaw_agent_id = a.id
                 ORDER BY balance DESC, total_skills DESC, total_reviews DESC
                 LIMIT 20
                 """
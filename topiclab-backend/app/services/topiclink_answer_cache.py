@@ -0,0 +1,77 @@
+"""Cross-worker answer cache and single-flight for TopicLink ``/knowledge/answer``.
+
+Keys cover the normalized question, the chat model, the answer prompt version
+and a fingerprint of every retrieved topic's id and content version, so an edit
+to any cited topic (or a different retrieval result) simply misses and the stale
+answer ages out.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import unicodedata
+from typing import Any, Awaitable, Callable, Sequence
+
+from app.services.single_flight_cache import SingleFlightCache
+
+
+DEFAULT_ANSWER_CACHE_TTL_SECONDS = 3600.0
+# One 30s chat completion bounds the leader's work.
+ANSWER_CACHE_LEASE_SECONDS = 60.0
+ANSWER_CACHE_KIND = "knowledge_answer"
+
+ANSWER_CACHE = SingleFlightCache(
+    table="topiclink_answer_results",
+    env_prefix="TOPICLINK_ANSWER",
+    default_ttl_seconds=DEFAULT_ANSWER_CACHE_TTL_SECONDS,
+    lease_seconds=ANSWER_CACHE_LEASE_SECONDS,
+    label="TopicLink answer",
+)
+
+
+def normalize_question(question: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", question).casefold().split())
+
+
+def topic_fingerprint(topics: Sequence[dict[str, Any]]) -> list[list[str]]:
+    """``[id, version]`` per retrieved topic, in ranking order."""
+
+    fingerprint = []
+    for topic in topics:
+        material = json.dumps(
+            [topic.get("title"), topic.get("category"), topic.get("body"), topic.get("updated_at")],
+            ensure_ascii=False,
+            default=str,
+        )
+        fingerprint.append([str(topic.get("id") or ""), hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]])
+    return fingerprint
+
+
+def answer_cache_key(question: str, *, model: str, prompt_version: str, fingerprint: list[list[str]]) -> str:
+    material = json.dumps(
+        [normalize_question(question), model, prompt_version, fingerprint],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+async def cached_answer(
+    cache_key: str,
+    compute: Callable[[], Awaitable[str | None]],
+    *,
+    prompt_version: str,
+) -> tuple[str | None, bool]:
+    """Return ``(answer, served_from_cache)``; ``None`` answers are never cached.
+
+    Writing under a new ``prompt_version`` retires the answers of older prompts.
+    """
+
+    return await ANSWER_CACHE.get_or_compute(
+        cache_key,
+        compute,
+        encode=lambda answer: answer or None,
+        kind=ANSWER_CACHE_KIND,
+        version=prompt_version,
+    )
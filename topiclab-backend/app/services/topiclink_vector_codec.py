@@ -0,0 +1,74 @@
+"""Binary frames for shipping embeddings between TopicLab workers and the Zvec sidecar.
+
+A frame is ``magic | version | header length | row count``, a UTF-8 JSON header,
+one little-endian ``uint32`` width per row (``0`` for a missing vector), then the
+rows as contiguous little-endian float32. A 4096-dim vector is 16 KB on the wire
+instead of ~80 KB of JSON and decodes without parsing floats.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any, Sequence
+
+import numpy as np
+
+VECTOR_FRAME_CONTENT_TYPE = "application/x-topiclink-vectors"
+VECTOR_FRAME_MAGIC = b"TLVF"
+VECTOR_FRAME_VERSION = 1
+_PREFIX = struct.Struct("<4sBxxxII")
+
+
+class VectorFrameError(ValueError):
+    """Raised when a payload is not a well-formed vector frame."""
+
+
+def encode_vector_frame(header: dict[str, Any], vectors: Sequence[Sequence[float] | np.ndarray | None]) -> bytes:
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    widths = np.fromiter((0 if vector is None else len(vector) for vector in vectors), dtype="<u4", count=len(vectors))
+    rows = [np.asarray(vector, dtype="<f4").ravel() for vector in vectors if vector is not None and len(vector)]
+    body = np.concatenate(rows).tobytes() if rows else b""
+    return b"".join(
+        (
+            _PREFIX.pack(VECTOR_FRAME_MAGIC, VECTOR_FRAME_VERSION, len(header_bytes), len(widths)),
+            header_bytes,
+            widths.tobytes(),
+            body,
+        )
+    )
+
+
+def decode_vector_frame(payload: bytes) -> tuple[dict[str, Any], list[list[float] | None]]:
+    """Return ``(header, vectors)``; rows with width ``0`` decode as ``None``."""
+
+    try:
+        magic, version, header_length, count = _PREFIX.unpack_from(payload)
+    except struct.error as exc:
+        raise VectorFrameError("vector frame is truncated") from exc
+    if magic != VECTOR_FRAME_MAGIC or version != VECTOR_FRAME_VERSION:
+        raise VectorFrameError("unsupported vector frame")
+    offset = _PREFIX.size
+    widths_offset = offset + header_length
+    body_offset = widths_offset + count * 4
+    if len(payload) < body_offset:
+        raise VectorFrameError("vector frame is truncated")
+    try:
+        header = json.loads(payload[offset:widths_offset].decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise VectorFrameError("vector frame header is not JSON") from exc
+    if not isinstance(header, dict):
+        raise VectorFrameError("vector frame header must be an object")
+    widths = np.frombuffer(payload, dtype="<u4", count=count, offset=widths_offset)
+    if len(payload) != body_offset + int(widths.sum(dtype=np.int64)) * 4:
+        raise VectorFrameError("vector frame length does not match its row widths")
+    values = np.frombuffer(payload, dtype="<f4", offset=body_offset)
+    vectors: list[list[float] | None] = []
+    position = 0
+    for width in widths.tolist():
+        if not width:
+            vectors.append(None)
+            continue
+        vectors.append(values[position:position + width].tolist())
+        position += width
+    return header, vectors
@@ -0,0 +1,69 @@
+"""Contiguous float32 vector math for TopicLink similarity scoring.
+
+Embeddings are L2-normalized once when they enter a :class:`UnitVectorMatrix`, so
+scoring every candidate against a profile is one matrix-vector product instead of
+a Python loop per pair and per dimension.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Sequence
+
+import numpy as np
+
+
+def _normalized_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def unit_vector(vector: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Return ``vector`` as a contiguous, L2-normalized float32 array."""
+
+    array = np.array(vector, dtype=np.float32, copy=True, ndmin=1).reshape(1, -1)
+    return np.ascontiguousarray(_normalized_rows(array)[0])
+
+
+def hash_embedding(text: str, dimensions: int) -> np.ndarray:
+    """Signed feature-hash embedding of whitespace tokens, used when no model is configured."""
+
+    tokens = text.lower().replace("/", " ").replace("_", " ").split()
+    vector = np.zeros(dimensions, dtype=np.float32)
+    if not tokens:
+        return vector
+    values = [int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big") for token in tokens]
+    buckets = np.fromiter((value % dimensions for value in values), dtype=np.int64, count=len(values))
+    signs = np.fromiter((1.0 if value & 1 else -1.0 for value in values), dtype=np.float32, count=len(values))
+    np.add.at(vector, buckets, signs)
+    return unit_vector(vector)
+
+
+class UnitVectorMatrix:
+    """Row-aligned unit vectors; rows whose width differs from ``dimensions`` score zero."""
+
+    def __init__(self, vectors: Sequence[Sequence[float] | np.ndarray], dimensions: int) -> None:
+        self.dimensions = dimensions
+        if vectors and all(len(vector) == dimensions for vector in vectors):
+            self.matrix = np.array(vectors, dtype=np.float32).reshape(len(vectors), dimensions)
+        else:
+            self.matrix = np.zeros((len(vectors), dimensions), dtype=np.float32)
+            for row, vector in enumerate(vectors):
+                if len(vector) == dimensions:
+                    self.matrix[row] = vector
+        _normalized_rows(self.matrix)
+
+    @classmethod
+    def for_query(cls, query: Sequence[float] | np.ndarray, vectors: Sequence[Sequence[float] | np.ndarray]) -> "UnitVectorMatrix":
+        return cls(vectors, len(query))
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def similarities(self, query: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Cosine similarity of every row against ``query``."""
+
+        if not len(self) or len(query) != self.dimensions or not self.dimensions:
+            return np.zeros(len(self), dtype=np.float32)
+        return self.matrix @ unit_vector(query)
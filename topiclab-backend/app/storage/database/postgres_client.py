@@ -1156,6 +1156,138 @@ def _apply_openclaw_identity_ddl(session) -> None:
         _create_openclaw_api_keys_v2(session)
 
 
+_SKILL_HUB_SEARCH_TEXT_EXPR = (
+    "LOWER(name || ' ' || COALESCE(summary, '') || ' ' || COALESCE(description, '') || ' ' || COALESCE(tags_json, ''))"
+)
+
+
+def _ensure_skill_hub_search_index(session, *, is_sqlite: bool) -> None:
+    """Maintain the Skill Hub full-text search column and its index.
+
+    ``search_text`` is a generated column over name/summary/description/tags.
+    SQLite indexes it with an FTS5 trigram table kept in sync by triggers;
+    Postgres uses a pg_trgm GIN index so ``search_text LIKE '%q%'`` stays indexed.
+    Trigrams work on raw characters, which also covers CJK text without a segmenter.
+    """
+    inspector = _get_session_inspector(session)
+    skill_columns = {column["name"] for column in inspector.get_columns("skill_hub_skills")}
+    if "search_text" not in skill_columns:
+        storage = "VIRTUAL" if is_sqlite else "STORED"
+        session.execute(
+            text(
+                f"ALTER TABLE skill_hub_skills ADD COLUMN search_text TEXT "
+                f"GENERATED ALWAYS AS ({_SKILL_HUB_SEARCH_TEXT_EXPR}) {storage}"
+            )
+        )
+    if not is_sqlite:
+        try:
+            with session.begin_nested():
+                session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                session.execute(
+                    text(
+                        "CREATE INDEX IF NOT EXISTS idx_skill_hub_skills_search_trgm "
+                        "ON skill_hub_skills USING GIN (search_text gin_trgm_ops)"
+                    )
+                )
+        except DBAPIError as exc:
+            logger.warning("pg_trgm unavailable; Skill Hub search falls back to sequential LIKE: %s", exc)
+        return
+    fts_exists = session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'skill_hub_skill_fts'")
+    ).first()
+    if fts_exists is None:
+        session.execute(
+            text(
+                """
+                CREATE VIRTUAL TABLE skill_hub_skill_fts USING fts5(
+                    search_text,
+                    content='skill_hub_skills',
+                    content_rowid='id',
+                    tokenize='trigram'
+                )
+                """
+            )
+        )
+        session.execute(text("INSERT INTO skill_hub_skill_fts(skill_hub_skill_fts) VALUES ('rebuild')"))
+    session.execute(
+        text(
+            """
+            CREATE TRIGGER IF NOT EXISTS skill_hub_skills_fts_ai AFTER INSERT ON skill_hub_skills BEGIN
+                INSERT INTO skill_hub_skill_fts(rowid, search_text) VALUES (new.id, new.search_text);
+            END
+            """
+        )
+    )
+    session.execute(
+        text(
+            """
+            CREATE TRIGGER IF NOT EXISTS skill_hub_skills_fts_ad AFTER DELETE ON skill_hub_skills BEGIN
+                INSERT INTO skill_hub_skill_fts(skill_hub_skill_fts, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+            END
+            """
+        )
+    )
+    session.execute(
+        text(
+            """
+            CREATE TRIGGER IF NOT EXISTS skill_hub_skills_fts_au
+            AFTER UPDATE OF name, summary, description, tags_json ON skill_hub_skills BEGIN
+                INSERT INTO skill_hub_skill_fts(skill_hub_skill_fts, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+                INSERT INTO skill_hub_skill_fts(rowid, search_text) VALUES (new.id, new.search_text);
+            END
+            """
+        )
+    )
+
+
+_SKILL_HUB_TRENDING_COLUMNS = (
+    ("hot_score", "DOUBLE PRECISION NOT NULL DEFAULT 0"),
+    ("monthly_downloads", "INTEGER NOT NULL DEFAULT 0"),
+    ("weekly_reviews", "INTEGER NOT NULL DEFAULT 0"),
+    ("monthly_reviews", "INTEGER NOT NULL DEFAULT 0"),
+)
+
+
+def _ensure_skill_hub_trending_columns(session, *, is_sqlite: bool) -> None:
+    """Stored hot score, rolling-window counters and the daily buckets they are summed from."""
+    inspector = _get_session_inspector(session)
+    skill_columns = {column["name"] for column in inspector.get_columns("skill_hub_skills")}
+    for column_name, column_type in _SKILL_HUB_TRENDING_COLUMNS:
+        if column_name not in skill_columns:
+            session.execute(text(f"ALTER TABLE skill_hub_skills ADD COLUMN {column_name} {column_type}"))
+    session.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_skill_hub_skills_hot "
+            "ON skill_hub_skills(featured DESC, hot_score DESC, avg_rating DESC, id DESC) "
+            "WHERE status = 'published'"
+        )
+    )
+    session.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_skill_hub_skills_trending "
+            "ON skill_hub_skills(weekly_downloads DESC, weekly_reviews DESC, id DESC) "
+            "WHERE status = 'published'"
+        )
+    )
+    bucket_day_type = "TEXT" if is_sqlite else "DATE"
+    session.execute(
+        text(
+            f"""
+            CREATE TABLE IF NOT EXISTS skill_hub_skill_daily_stats (
+                skill_id INTEGER NOT NULL REFERENCES skill_hub_skills(id) ON DELETE CASCADE,
+                bucket_day {bucket_day_type} NOT NULL,
+                downloads INTEGER NOT NULL DEFAULT 0,
+                reviews INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (skill_id, bucket_day)
+            )
+            """
+        )
+    )
+    session.execute(
+        text("CREATE INDEX IF NOT EXISTS idx_skill_hub_skill_daily_stats_day ON skill_hub_skill_daily_stats(bucket_day)")
+    )
+
+
 def _apply_skill_hub_ddl(session) -> None:
     is_sqlite = _is_sqlite_session(session)
     session.execute(
@@ -1244,6 +1376,8 @@ def _apply_skill_hub_ddl(session) -> None:
     )
     session.execute(text("CREATE INDEX IF NOT EXISTS idx_skill_hub_skills_cluster ON skill_hub_skills(cluster_key, total_downloads DESC)"))
     session.execute(text("CREATE INDEX IF NOT EXISTS idx_skill_hub_skills_category ON skill_hub_skills(category_key, published_at DESC)"))
+    _ensure_skill_hub_search_index(session, is_sqlite=is_sqlite)
+    _ensure_skill_hub_trending_columns(session, is_sqlite=is_sqlite)
     session.execute(
         text(
             """
@@ -1584,6 +1718,30 @@ def _apply_skill_hub_ddl(session) -> None:
         )
     )
     session.execute(text("CREATE INDEX IF NOT EXISTS idx_skill_hub_task_events_agent_created ON skill_hub_task_events(openclaw_agent_id, created_at DESC)"))
+    session.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS skill_hub_seed_state (
+                seed_key VARCHAR(64) PRIMARY KEY,
+                seed_version INTEGER NOT NULL DEFAULT 0,
+                checksum VARCHAR(64) NOT NULL,
+                entity_checksums_json TEXT NOT NULL DEFAULT '{}',
+                applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+            if is_sqlite
+            else
+            """
+            CREATE TABLE IF NOT EXISTS skill_hub_seed_state (
+                seed_key VARCHAR(64) PRIMARY KEY,
+                seed_version INTEGER NOT NULL DEFAULT 0,
+                checksum VARCHAR(64) NOT NULL,
+                entity_checksums_json TEXT NOT NULL DEFAULT '{}',
+                applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+            )
+            """
+        )
+    )
     session.execute(
         text(
             """
@@ -1612,6 +1770,30 @@ def _apply_skill_hub_ddl(session) -> None:
             "ON skill_hub_model_usage(user_id, operation, created_at DESC)"
         )
     )
+    session.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS skill_hub_agent_stats (
+                openclaw_agent_id INTEGER PRIMARY KEY REFERENCES openclaw_agents(id) ON DELETE CASCADE,
+                total_skills INTEGER NOT NULL DEFAULT 0,
+                total_reviews INTEGER NOT NULL DEFAULT 0,
+                total_downloads INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+            if is_sqlite
+            else
+            """
+            CREATE TABLE IF NOT EXISTS skill_hub_agent_stats (
+                openclaw_agent_id INTEGER PRIMARY KEY REFERENCES openclaw_agents(id) ON DELETE CASCADE,
+                total_skills INTEGER NOT NULL DEFAULT 0,
+                total_reviews INTEGER NOT NULL DEFAULT 0,
+                total_downloads INTEGER NOT NULL DEFAULT 0,
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+            )
+            """
+        )
+    )
 
 
 def _apply_science_mcp_hub_ddl(session) -> None:
@@ -1999,8 +2181,14 @@ def _init_auth_tables_once() -> None:
         _apply_skill_hub_ddl(session)
         _apply_science_mcp_hub_ddl(session)
         _apply_site_feedback_ddl(session)
-        from app.services.skill_hub import ensure_skill_hub_seed_data
+        from app.services.skill_hub import (
+            ensure_skill_hub_seed_data,
+            rebuild_agent_leaderboard_stats,
+            rebuild_skill_trending_stats,
+        )
         ensure_skill_hub_seed_data(session)
+        rebuild_agent_leaderboard_stats(session)
+        rebuild_skill_trending_stats(session)
 
 
 def init_auth_tables():
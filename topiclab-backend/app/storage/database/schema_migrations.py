@@ -0,0 +1,265 @@
+"""Versioned schema migration ledger for TopicLab startup.
+
+Every store keeps its idempotent ``CREATE ... IF NOT EXISTS`` / backfill DDL in
+its own ``init_*`` or ``ensure_*`` function. This module wraps those functions in
+explicitly versioned steps and records the applied version in
+``schema_migrations``. Worker boot only reads the ledger rows; pending steps run
+under a database-wide advisory lock so one process migrates while the others
+wait and then re-check the ledger.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import inspect, text
+
+from app.storage.database.postgres_client import get_db_session, get_engine
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary constant shared by every TopicLab process for pg_advisory_lock.
+SCHEMA_MIGRATION_LOCK_KEY = 7_316_402_211
+DEFAULT_LOCK_TIMEOUT_SECONDS = 300.0
+_LOCK_POLL_INTERVAL_SECONDS = 0.5
+
+_sqlite_migration_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class SchemaMigration:
+    """One idempotent schema step tracked by the ledger.
+
+    Bump ``version`` whenever the step's DDL or seed data changes; unrelated
+    edits to the store modules never re-run a step.
+    """
+
+    name: str
+    version: int
+    apply: Callable[[], None]
+
+    def fingerprint(self) -> str:
+        return hashlib.sha256(f"{self.name}:{self.version}".encode("utf-8")).hexdigest()
+
+
+def _init_auth_tables() -> None:
+    from app.storage.database import postgres_client
+
+    postgres_client.init_auth_tables()
+
+
+def _init_topic_tables() -> None:
+    from app.storage.database import topic_store
+
+    topic_store.init_topic_tables()
+
+
+def _ensure_site_assets() -> None:
+    from app.storage.database import site_assets_store
+
+    site_assets_store.ensure_site_assets_schema_and_seed()
+
+
+def _ensure_youth_ted() -> None:
+    from app.storage.database import youth_ted_store
+
+    youth_ted_store.ensure_youth_ted_schema_and_seed()
+
+
+def _ensure_inspiration() -> None:
+    from app.storage.database import inspiration_store
+
+    inspiration_store.ensure_inspiration_schema_and_seed()
+
+
+def _ensure_site_feedback() -> None:
+    from app.storage.database import postgres_client
+
+    postgres_client.ensure_site_feedback_schema()
+
+
+def _ensure_worker_leases() -> None:
+    from app.storage.database import worker_leases
+
+    worker_leases.ensure_worker_leases_schema()
+
+
+SCHEMA_MIGRATIONS: tuple[SchemaMigration, ...] = (
+    SchemaMigration(name="auth_tables", version=1, apply=_init_auth_tables),
+    SchemaMigration(name="topic_tables", version=1, apply=_init_topic_tables),
+    SchemaMigration(name="site_assets", version=1, apply=_ensure_site_assets),
+    SchemaMigration(name="youth_ted", version=1, apply=_ensure_youth_ted),
+    SchemaMigration(name="inspiration", version=1, apply=_ensure_inspiration),
+    # auth_tables already creates site_feedback; this step keeps the table explicit in the
+    # ledger so it no longer depends on the lazy ensure in the feedback routes.
+    SchemaMigration(name="site_feedback", version=1, apply=_ensure_site_feedback),
+    SchemaMigration(name="worker_leases", version=1, apply=_ensure_worker_leases),
+)
+
+
+def _lock_timeout_seconds() -> float:
+    raw = os.getenv("TOPICLAB_SCHEMA_MIGRATION_LOCK_TIMEOUT_SECONDS", "").strip()
+    if not raw:
+        return DEFAULT_LOCK_TIMEOUT_SECONDS
+    try:
+        return max(1.0, float(raw))
+    except ValueError:
+        logger.warning("Invalid TOPICLAB_SCHEMA_MIGRATION_LOCK_TIMEOUT_SECONDS=%r; using default", raw)
+        return DEFAULT_LOCK_TIMEOUT_SECONDS
+
+
+def migrate_on_startup_enabled() -> bool:
+    return os.getenv("TOPICLAB_SCHEMA_MIGRATE_ON_STARTUP", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _ensure_ledger_table(session) -> None:
+    if session.bind.dialect.name == "sqlite":
+        session.execute(text("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                name VARCHAR(64) PRIMARY KEY,
+                version INTEGER NOT NULL,
+                fingerprint VARCHAR(64) NOT NULL,
+                applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """))
+        return
+    session.execute(text("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            name VARCHAR(64) PRIMARY KEY,
+            version INTEGER NOT NULL,
+            fingerprint VARCHAR(64) NOT NULL,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+    """))
+
+
+def read_applied_migrations() -> dict[str, tuple[int, str]]:
+    """Return ``{name: (version, fingerprint)}`` from the ledger; empty when it does not exist yet."""
+    with get_db_session() as session:
+        if not inspect(session.connection()).has_table("schema_migrations"):
+            return {}
+        rows = session.execute(text("SELECT name, version, fingerprint FROM schema_migrations")).fetchall()
+    return {str(row.name): (int(row.version), str(row.fingerprint)) for row in rows}
+
+
+def pending_migrations(
+    migrations: tuple[SchemaMigration, ...] = SCHEMA_MIGRATIONS,
+    *,
+    applied: dict[str, tuple[int, str]] | None = None,
+) -> list[SchemaMigration]:
+    if applied is None:
+        applied = read_applied_migrations()
+    return [
+        migration
+        for migration in migrations
+        if applied.get(migration.name) != (migration.version, migration.fingerprint())
+    ]
+
+
+def _record_migration(migration: SchemaMigration) -> None:
+    with get_db_session() as session:
+        _ensure_ledger_table(session)
+        now_expr = "CURRENT_TIMESTAMP" if session.bind.dialect.name == "sqlite" else "NOW()"
+        session.execute(
+            text(f"""
+                INSERT INTO schema_migrations (name, version, fingerprint, applied_at)
+                VALUES (:name, :version, :fingerprint, {now_expr})
+                ON CONFLICT (name) DO UPDATE SET
+                    version = EXCLUDED.version,
+                    fingerprint = EXCLUDED.fingerprint,
+                    applied_at = EXCLUDED.applied_at
+            """),
+            {"name": migration.name, "version": migration.version, "fingerprint": migration.fingerprint()},
+        )
+
+
+class _AdvisoryLock:
+    """Session-level Postgres advisory lock held on a dedicated connection."""
+
+    def __init__(self, timeout_seconds: float):
+        self.timeout_seconds = timeout_seconds
+        self._connection = None
+
+    def __enter__(self):
+        engine = get_engine()
+        if engine.dialect.name == "sqlite":
+            if not _sqlite_migration_lock.acquire(timeout=self.timeout_seconds):
+                raise TimeoutError("Timed out waiting for the schema migration lock")
+            return self
+        self._connection = engine.connect()
+        deadline = time.monotonic() + self.timeout_seconds
+        # Poll with pg_try_advisory_lock so DB_STATEMENT_TIMEOUT_MS never cancels the wait.
+        while True:
+            acquired = self._connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"),
+                {"key": SCHEMA_MIGRATION_LOCK_KEY},
+            ).scalar()
+            self._connection.commit()
+            if acquired:
+                return self
+            if time.monotonic() >= deadline:
+                self._connection.close()
+                self._connection = None
+                raise TimeoutError("Timed out waiting for the schema migration lock")
+            time.sleep(_LOCK_POLL_INTERVAL_SECONDS)
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._connection is None:
+            _sqlite_migration_lock.release()
+            return False
+        try:
+            self._connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": SCHEMA_MIGRATION_LOCK_KEY})
+            self._connection.commit()
+        finally:
+            self._connection.close()
+            self._connection = None
+        return False
+
+
+def run_schema_migrations(
+    migrations: tuple[SchemaMigration, ...] = SCHEMA_MIGRATIONS,
+    *,
+    force: bool = False,
+) -> list[str]:
+    """Apply pending migrations under the advisory lock and return the applied step names."""
+    if not force and not pending_migrations(migrations):
+        return []
+    applied_names: list[str] = []
+    with _AdvisoryLock(_lock_timeout_seconds()):
+        with get_db_session() as session:
+            _ensure_ledger_table(session)
+        # Another process may have finished while this one waited for the lock.
+        todo = list(migrations) if force else pending_migrations(migrations)
+        for migration in todo:
+            started = time.monotonic()
+            migration.apply()
+            _record_migration(migration)
+            applied_names.append(migration.name)
+            logger.info(
+                "Schema migration %s v%s applied in %.2fs",
+                migration.name,
+                migration.version,
+                time.monotonic() - started,
+            )
+    return applied_names
+
+
+def ensure_schema_current(migrations: tuple[SchemaMigration, ...] = SCHEMA_MIGRATIONS) -> list[str]:
+    """Startup hook: read the ledger and only migrate when steps are pending and allowed."""
+    pending = pending_migrations(migrations)
+    if not pending:
+        return []
+    if not migrate_on_startup_enabled():
+        logger.warning(
+            "Schema migrations pending (%s) and TOPICLAB_SCHEMA_MIGRATE_ON_STARTUP=0; "
+            "run `python scripts/migrate_schema.py` before serving traffic",
+            ", ".join(migration.name for migration in pending),
+        )
+        return []
+    return run_schema_migrations(migrations)
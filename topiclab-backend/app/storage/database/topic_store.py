@@ -1177,6 +1177,7 @@ def _init_topic_tables_sqlite(session) -> None:
         session.execute(text("ALTER TABLE topics ADD COLUMN metadata TEXT"))
     if not _sqlite_has_column(session, "posts", "metadata"):
         session.execute(text("ALTER TABLE posts ADD COLUMN metadata TEXT"))
+    _ensure_arcade_metadata_columns(session)
     # Some local/backup SQLite files were produced without the original primary
     # key constraints. The write paths rely on ON CONFLICT(id/topic_id), so add
     # equivalent unique indexes without rebuilding user data tables.
@@ -1187,6 +1188,72 @@ def _init_topic_tables_sqlite(session) -> None:
     session.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS idx_post_like_inbox_messages_post_actor_unique ON post_like_inbox_messages(post_id, actor_user_id)"))
 
 
+_ARCADE_POST_METADATA_COLUMNS = (
+    ("arcade_scene", ("scene",)),
+    ("arcade_post_kind", ("arcade", "post_kind")),
+    ("arcade_for_post_id", ("arcade", "for_post_id")),
+    ("arcade_branch_owner_openclaw_agent_id", ("arcade", "branch_owner_openclaw_agent_id")),
+)
+_ARCADE_TOPIC_METADATA_COLUMNS = (
+    ("arcade_validator_source", ("arcade", "validator", "config", "source")),
+)
+_ARCADE_METADATA_INDEXES = (
+    """
+    CREATE INDEX IF NOT EXISTS idx_posts_arcade_kind
+    ON posts(arcade_post_kind, topic_id, created_at)
+    WHERE arcade_scene = 'arcade'
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_posts_arcade_for_post
+    ON posts(topic_id, arcade_for_post_id)
+    WHERE arcade_scene = 'arcade'
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_posts_arcade_branch_owner
+    ON posts(arcade_branch_owner_openclaw_agent_id, topic_id)
+    WHERE arcade_scene = 'arcade'
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_topics_arcade_validator_source
+    ON topics(arcade_validator_source)
+    WHERE category = 'arcade'
+    """,
+)
+
+
+def _ensure_arcade_metadata_columns(session) -> None:
+    """Promote hot arcade metadata fields to generated columns with partial indexes.
+
+    SQLite only allows VIRTUAL generated columns through ALTER TABLE, which is
+    enough because the indexes store the computed values; Postgres gets STORED
+    columns derived from the JSONB metadata.
+    """
+    is_sqlite = session.bind.dialect.name == "sqlite"
+    for table_name, columns in (
+        ("posts", _ARCADE_POST_METADATA_COLUMNS),
+        ("topics", _ARCADE_TOPIC_METADATA_COLUMNS),
+    ):
+        for column_name, path in columns:
+            if is_sqlite:
+                if _sqlite_has_column(session, table_name, column_name):
+                    continue
+                json_path = "$." + ".".join(path)
+                session.execute(text(f"""
+                    ALTER TABLE {table_name} ADD COLUMN {column_name} TEXT
+                    GENERATED ALWAYS AS (
+                        CASE WHEN json_valid(metadata) THEN json_extract(metadata, '{json_path}') END
+                    ) VIRTUAL
+                """))
+            else:
+                json_path = "{" + ",".join(path) + "}"
+                session.execute(text(f"""
+                    ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS {column_name} TEXT
+                    GENERATED ALWAYS AS (metadata #>> '{json_path}') STORED
+                """))
+    for statement in _ARCADE_METADATA_INDEXES:
+        session.execute(text(statement))
+
+
 def _ensure_sqlite_conflict_indexes(session) -> None:
     if session.bind.dialect.name != "sqlite":
         return
@@ -1331,6 +1398,7 @@ def init_topic_tables() -> None:
             CREATE INDEX IF NOT EXISTS idx_posts_topic_root_created
             ON posts(topic_id, root_post_id, created_at)
         """))
+        _ensure_arcade_metadata_columns(session)
         session.execute(text("""
             CREATE TABLE IF NOT EXISTS discussion_turns (
                 id VARCHAR(36) PRIMARY KEY,
@@ -2803,6 +2871,154 @@ def list_all_posts(
     return annotate_posts_with_interactions(posts, user_id=user_id, auth_type=auth_type)
 
 
+def _build_arcade_pending_review_query(
+    *,
+    is_sqlite: bool,
+    topic_id: str | None,
+    owner_openclaw_agent_id: int | None,
+    source_filters: list[str],
+    limit: int,
+):
+    # Hot arcade fields are read from the generated columns maintained by
+    # _ensure_arcade_metadata_columns so the partial indexes can serve the filters.
+    scene_expr = "{alias}.arcade_scene"
+    post_kind_expr = "{alias}.arcade_post_kind"
+    for_post_expr = "{alias}.arcade_for_post_id"
+    branch_owner_expr = "CAST(NULLIF(br.arcade_branch_owner_openclaw_agent_id, '') AS INTEGER)"
+    if is_sqlite:
+        runtime_reason_expr = "json_extract({alias}.metadata, '$.arcade.result.runtime_error_reason')"
+        runtime_outcome_expr = "COALESCE(json_extract({alias}.metadata, '$.arcade.result.outcome'), json_extract({alias}.metadata, '$.arcade.result.feedback'), '')"
+    else:
+        runtime_reason_expr = "{alias}.metadata -> 'arcade' -> 'result' ->> 'runtime_error_reason'"
+        runtime_outcome_expr = "COALESCE({alias}.metadata -> 'arcade' -> 'result' ->> 'outcome', {alias}.metadata -> 'arcade' -> 'result' ->> 'feedback', '')"
+
+    filters = ["t.category = 'arcade'"]
+    params: dict[str, object] = {
+        "limit": limit,
+        "max_runtime_retries": ARCADE_EVALUATION_MAX_RUNTIME_RETRIES,
+    }
+    if topic_id:
+        filters.append("t.id = :topic_id")
+        params["topic_id"] = topic_id
+    if owner_openclaw_agent_id is not None:
+        filters.append("br.arcade_branch_owner_openclaw_agent_id = :owner_openclaw_agent_id")
+        params["owner_openclaw_agent_id"] = str(owner_openclaw_agent_id)
+    if source_filters:
+        filters.append("t.arcade_validator_source IN :sources")
+        params["sources"] = source_filters
+    where_clause = " AND ".join(filters)
+
+    queue_query = text(f"""
+        WITH branch_roots AS (
+            SELECT
+                br.id AS branch_root_post_id,
+                br.topic_id,
+                {branch_owner_expr} AS branch_owner_openclaw_agent_id
+            FROM posts br
+            JOIN topics t ON t.id = br.topic_id
+            WHERE {where_clause}
+              AND br.in_reply_to_id IS NULL
+              AND {scene_expr.format(alias="br")} = 'arcade'
+              AND {post_kind_expr.format(alias="br")} = 'submission'
+        ),
+        leaf_submissions AS (
+            SELECT
+                lp.topic_id,
+                br.branch_root_post_id,
+                lp.id AS submission_post_id,
+                br.branch_owner_openclaw_agent_id,
+                lp.created_at AS submission_created_at,
+                NULL AS previous_evaluation_post_id,
+                0 AS retry_count
+            FROM branch_roots br
+            JOIN posts lp
+              ON lp.topic_id = br.topic_id
+             AND COALESCE(lp.root_post_id, lp.id) = br.branch_root_post_id
+            WHERE {scene_expr.format(alias="lp")} = 'arcade'
+              AND {post_kind_expr.format(alias="lp")} = 'submission'
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM posts child
+                  WHERE child.topic_id = lp.topic_id
+                    AND child.in_reply_to_id = lp.id
+              )
+        ),
+        retryable_leaf_evaluations AS (
+            SELECT
+                le.topic_id,
+                br.branch_root_post_id,
+                sp.id AS submission_post_id,
+                br.branch_owner_openclaw_agent_id,
+                sp.created_at AS submission_created_at,
+                le.id AS previous_evaluation_post_id,
+                (
+                    SELECT COUNT(*)
+                    FROM posts ev
+                    WHERE ev.topic_id = le.topic_id
+                      AND COALESCE(ev.root_post_id, ev.id) = br.branch_root_post_id
+                      AND {scene_expr.format(alias="ev")} = 'arcade'
+                      AND {post_kind_expr.format(alias="ev")} = 'evaluation'
+                      AND {for_post_expr.format(alias="ev")} = sp.id
+                      AND (
+                          NULLIF({runtime_reason_expr.format(alias="ev")}, '') IS NOT NULL
+                          OR {runtime_outcome_expr.format(alias="ev")} LIKE '%评测器运行异常%'
+                          OR LOWER({runtime_outcome_expr.format(alias="ev")}) LIKE '%runtime_error%'
+                      )
+                ) AS retry_count
+            FROM branch_roots br
+            JOIN posts le
+              ON le.topic_id = br.topic_id
+             AND COALESCE(le.root_post_id, le.id) = br.branch_root_post_id
+            JOIN posts sp
+              ON sp.topic_id = le.topic_id
+             AND sp.id = {for_post_expr.format(alias="le")}
+            WHERE {scene_expr.format(alias="le")} = 'arcade'
+              AND {post_kind_expr.format(alias="le")} = 'evaluation'
+              AND {scene_expr.format(alias="sp")} = 'arcade'
+              AND {post_kind_expr.format(alias="sp")} = 'submission'
+              AND (
+                  NULLIF({runtime_reason_expr.format(alias="le")}, '') IS NOT NULL
+                  OR {runtime_outcome_expr.format(alias="le")} LIKE '%评测器运行异常%'
+                  OR LOWER({runtime_outcome_expr.format(alias="le")}) LIKE '%runtime_error%'
+              )
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM posts child
+                  WHERE child.topic_id = le.topic_id
+                    AND child.in_reply_to_id = le.id
+              )
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM posts newer
+                  WHERE newer.topic_id = le.topic_id
+                    AND COALESCE(newer.root_post_id, newer.id) = br.branch_root_post_id
+                    AND (newer.created_at > le.created_at OR (newer.created_at = le.created_at AND newer.id > le.id))
+                    AND NOT EXISTS (
+                        SELECT 1
+                        FROM posts newer_child
+                        WHERE newer_child.topic_id = newer.topic_id
+                          AND newer_child.in_reply_to_id = newer.id
+                    )
+              )
+        ),
+        pending_reviews AS (
+            SELECT *
+            FROM leaf_submissions
+            UNION ALL
+            SELECT *
+            FROM retryable_leaf_evaluations
+            WHERE retry_count < :max_runtime_retries
+        )
+        SELECT *
+        FROM pending_reviews
+        ORDER BY submission_created_at ASC, submission_post_id ASC
+        LIMIT :limit
+    """)
+    if source_filters:
+        queue_query = queue_query.bindparams(bindparam("sources", expanding=True))
+    return queue_query, params
+
+
 def list_arcade_pending_review_items(
     *,
     topic_id: str | None = None,
@@ -2815,148 +3031,13 @@ def list_arcade_pending_review_items(
     source_filters = list(dict.fromkeys(str(source).strip() for source in (sources or []) if str(source).strip()))
 
     with get_db_session() as session:
-        is_sqlite = session.bind.dialect.name == "sqlite"
-        if is_sqlite:
-            scene_expr = "json_extract({alias}.metadata, '$.scene')"
-            post_kind_expr = "json_extract({alias}.metadata, '$.arcade.post_kind')"
-            validator_source_expr = "json_extract(t.metadata, '$.arcade.validator.config.source')"
-            branch_owner_expr = "CAST(json_extract(br.metadata, '$.arcade.branch_owner_openclaw_agent_id') AS INTEGER)"
-            for_post_expr = "json_extract({alias}.metadata, '$.arcade.for_post_id')"
-            runtime_reason_expr = "json_extract({alias}.metadata, '$.arcade.result.runtime_error_reason')"
-            runtime_outcome_expr = "COALESCE(json_extract({alias}.metadata, '$.arcade.result.outcome'), json_extract({alias}.metadata, '$.arcade.result.feedback'), '')"
-        else:
-            scene_expr = "{alias}.metadata ->> 'scene'"
-            post_kind_expr = "{alias}.metadata -> 'arcade' ->> 'post_kind'"
-            validator_source_expr = "t.metadata -> 'arcade' -> 'validator' -> 'config' ->> 'source'"
-            branch_owner_expr = "CAST(NULLIF(br.metadata -> 'arcade' ->> 'branch_owner_openclaw_agent_id', '') AS INTEGER)"
-            for_post_expr = "{alias}.metadata -> 'arcade' ->> 'for_post_id'"
-            runtime_reason_expr = "{alias}.metadata -> 'arcade' -> 'result' ->> 'runtime_error_reason'"
-            runtime_outcome_expr = "COALESCE({alias}.metadata -> 'arcade' -> 'result' ->> 'outcome', {alias}.metadata -> 'arcade' -> 'result' ->> 'feedback', '')"
-
-        filters = ["t.category = 'arcade'"]
-        params: dict[str, object] = {
-            "limit": page_limit,
-            "max_runtime_retries": ARCADE_EVALUATION_MAX_RUNTIME_RETRIES,
-        }
-        if topic_id:
-            filters.append("t.id = :topic_id")
-            params["topic_id"] = topic_id
-        if owner_openclaw_agent_id is not None:
-            filters.append(f"{branch_owner_expr} = :owner_openclaw_agent_id")
-            params["owner_openclaw_agent_id"] = owner_openclaw_agent_id
-        if source_filters:
-            filters.append(f"{validator_source_expr} IN :sources")
-            params["sources"] = source_filters
-        where_clause = " AND ".join(filters)
-
-        queue_query = text(f"""
-            WITH branch_roots AS (
-                SELECT
-                    br.id AS branch_root_post_id,
-                    br.topic_id,
-                    {branch_owner_expr} AS branch_owner_openclaw_agent_id
-                FROM posts br
-                JOIN topics t ON t.id = br.topic_id
-                WHERE {where_clause}
-                  AND br.in_reply_to_id IS NULL
-                  AND {scene_expr.format(alias="br")} = 'arcade'
-                  AND {post_kind_expr.format(alias="br")} = 'submission'
-            ),
-            leaf_submissions AS (
-                SELECT
-                    lp.topic_id,
-                    br.branch_root_post_id,
-                    lp.id AS submission_post_id,
-                    br.branch_owner_openclaw_agent_id,
-                    lp.created_at AS submission_created_at,
-                    NULL AS previous_evaluation_post_id,
-                    0 AS retry_count
-                FROM branch_roots br
-                JOIN posts lp
-                  ON lp.topic_id = br.topic_id
-                 AND COALESCE(lp.root_post_id, lp.id) = br.branch_root_post_id
-                WHERE {scene_expr.format(alias="lp")} = 'arcade'
-                  AND {post_kind_expr.format(alias="lp")} = 'submission'
-                  AND NOT EXISTS (
-                      SELECT 1
-                      FROM posts child
-                      WHERE child.topic_id = lp.topic_id
-                        AND child.in_reply_to_id = lp.id
-                  )
-            ),
-            retryable_leaf_evaluations AS (
-                SELECT
-                    le.topic_id,
-                    br.branch_root_post_id,
-                    sp.id AS submission_post_id,
-                    br.branch_owner_openclaw_agent_id,
-                    sp.created_at AS submission_created_at,
-                    le.id AS previous_evaluation_post_id,
-                    (
-                        SELECT COUNT(*)
-                        FROM posts ev
-                        WHERE ev.topic_id = le.topic_id
-                          AND COALESCE(ev.root_post_id, ev.id) = br.branch_root_post_id
-                          AND {scene_expr.format(alias="ev")} = 'arcade'
-                          AND {post_kind_expr.format(alias="ev")} = 'evaluation'
-                          AND {for_post_expr.format(alias="ev")} = sp.id
-                          AND (
-                              NULLIF({runtime_reason_expr.format(alias="ev")}, '') IS NOT NULL
-                              OR {runtime_outcome_expr.format(alias="ev")} LIKE '%评测器运行异常%'
-                              OR LOWER({runtime_outcome_expr.format(alias="ev")}) LIKE '%runtime_error%'
-                          )
-                    ) AS retry_count
-                FROM branch_roots br
-                JOIN posts le
-                  ON le.topic_id = br.topic_id
-                 AND COALESCE(le.root_post_id, le.id) = br.branch_root_post_id
-                JOIN posts sp
-                  ON sp.topic_id = le.topic_id
-                 AND sp.id = {for_post_expr.format(alias="le")}
-                WHERE {scene_expr.format(alias="le")} = 'arcade'
-                  AND {post_kind_expr.format(alias="le")} = 'evaluation'
-                  AND {scene_expr.format(alias="sp")} = 'arcade'
-                  AND {post_kind_expr.format(alias="sp")} = 'submission'
-                  AND (
-                      NULLIF({runtime_reason_expr.format(alias="le")}, '') IS NOT NULL
-                      OR {runtime_outcome_expr.format(alias="le")} LIKE '%评测器运行异常%'
-                      OR LOWER({runtime_outcome_expr.format(alias="le")}) LIKE '%runtime_error%'
-                  )
-                  AND NOT EXISTS (
-                      SELECT 1
-                      FROM posts child
-                      WHERE child.topic_id = le.topic_id
-                        AND child.in_reply_to_id = le.id
-                  )
-                  AND NOT EXISTS (
-                      SELECT 1
-                      FROM posts newer
-                      WHERE newer.topic_id = le.topic_id
-                        AND COALESCE(newer.root_post_id, newer.id) = br.branch_root_post_id
-                        AND (newer.created_at > le.created_at OR (newer.created_at = le.created_at AND newer.id > le.id))
-                        AND NOT EXISTS (
-                            SELECT 1
-                            FROM posts newer_child
-                            WHERE newer_child.topic_id = newer.topic_id
-                              AND newer_child.in_reply_to_id = newer.id
-                        )
-                  )
-            ),
-            pending_reviews AS (
-                SELECT *
-                FROM leaf_submissions
-                UNION ALL
-                SELECT *
-                FROM retryable_leaf_evaluations
-                WHERE retry_count < :max_runtime_retries
-            )
-            SELECT *
-            FROM pending_reviews
-            ORDER BY submission_created_at ASC, submission_post_id ASC
-            LIMIT :limit
-        """)
-        if source_filters:
-            queue_query = queue_query.bindparams(bindparam("sources", expanding=True))
+        queue_query, params = _build_arcade_pending_review_query(
+            is_sqlite=session.bind.dialect.name == "sqlite",
+            topic_id=topic_id,
+            owner_openclaw_agent_id=owner_openclaw_agent_id,
+            source_filters=source_filters,
+            limit=page_limit,
+        )
 
         candidate_rows = session.execute(queue_query, params).fetchall()
 
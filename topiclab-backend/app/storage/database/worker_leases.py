@@ -0,0 +1,63 @@
+"""Named database leases that elect one process for shared background passes.
+
+Every worker process may start the same periodic loop; before a pass it takes
+or renews the lease for that loop's name and only the holder does the shared
+work. A lease that is not renewed expires, so a crashed holder is replaced
+after ``lease_seconds``. The table itself is created by the ``worker_leases``
+schema migration, never on the hot path.
+"""
+
+from __future__ import annotations
+
+import time
+
+from sqlalchemy import text
+
+from app.storage.database.postgres_client import get_db_session
+
+
+def ensure_worker_leases_schema() -> None:
+    with get_db_session() as session:
+        session.execute(
+            text(
+                """
+                CREATE TABLE IF NOT EXISTS worker_leases (
+                    name VARCHAR(64) PRIMARY KEY,
+                    owner VARCHAR(64) NOT NULL,
+                    expires_at DOUBLE PRECISION NOT NULL
+                )
+                """
+            )
+        )
+
+
+def acquire_worker_lease(name: str, owner: str, lease_seconds: float) -> bool:
+    """Take or renew the ``name`` lease for ``owner``; return whether ``owner`` now holds it."""
+    now = time.time()
+    params = {"name": name, "owner": owner, "expires_at": now + lease_seconds, "now": now}
+    with get_db_session() as session:
+        renewed = session.execute(
+            text(
+                "UPDATE worker_leases SET owner = :owner, expires_at = :expires_at "
+                "WHERE name = :name AND (owner = :owner OR expires_at <= :now)"
+            ),
+            params,
+        ).rowcount
+        if renewed:
+            return True
+        inserted = session.execute(
+            text(
+                "INSERT INTO worker_leases (name, owner, expires_at) "
+                "VALUES (:name, :owner, :expires_at) ON CONFLICT (name) DO NOTHING"
+            ),
+            params,
+        ).rowcount
+        return bool(inserted)
+
+
+def release_worker_lease(name: str, owner: str) -> None:
+    with get_db_session() as session:
+        session.execute(
+            text("DELETE FROM worker_leases WHERE name = :name AND owner = :owner"),
+            {"name": name, "owner": owner},
+        )
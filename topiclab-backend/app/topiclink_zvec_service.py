@@ -1,54 +1,105 @@
-"""Single-writer Zvec sidecar for TopicLink deployments."""
-
-from __future__ import annotations
-
+"""Single-writer Zvec sidecar for TopicLink deployments.
+
+The ``/v2`` routes carry vectors as binary frames (see
+``app.services.topiclink_vector_codec``) and address cache entries by text hash.
+The JSON ``/cache/*`` routes stay for workers from the previous release, and
+``/topics/delete`` is JSON because it carries no vectors.
+"""
+
+from __future__ import annotations
+
+import asyncio
 import logging
 import os
-from contextlib import asynccontextmanager
-
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-
-from app.api import topiclink
-
-logger = logging.getLogger(__name__)
-
-
-class CacheFetchRequest(BaseModel):
-    model: str
-    inputs: list[str]
-
-
-class CacheUpsertRequest(CacheFetchRequest):
-    vectors: list[list[float]]
-
-
-class CachePruneRequest(BaseModel):
-    force: bool = False
-
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    topiclink._ensure_zvec_collection()
-    topiclink.start_topiclink_metadata_worker()
-    yield
-    await topiclink.stop_topiclink_metadata_worker()
-
-
-app = FastAPI(title="TopicLink Zvec", version="0.1.0", lifespan=lifespan)
-
-
-@app.get("/health/ready")
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+from app.api import topiclink
+from app.services.topiclink_vector_codec import (
+    VECTOR_FRAME_CONTENT_TYPE,
+    VectorFrameError,
+    decode_vector_frame,
+    encode_vector_frame,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CacheFetchRequest(BaseModel):
+    model: str
+    inputs: list[str]
+
+
+class CacheUpsertRequest(CacheFetchRequest):
+    vectors: list[list[float]]
+
+
+class CacheKeyFetchRequest(BaseModel):
+    model: str
+    text_hashes: list[str]
+
+
+class CachePruneRequest(BaseModel):
+    force: bool = False
+
+
+class TopicIndexQueryRequest(BaseModel):
+    model: str
+    vector: list[float]
+    limit: int = 32
+    exclude_topic_id: str | None = None
+    category: str | None = None
+    status: str | None = None
+
+
+class TopicIndexDeleteRequest(BaseModel):
+    topic_ids: list[str]
+
+
+async def _read_vector_frame(request: Request) -> tuple[dict[str, Any], list[list[float]]]:
+    if not request.headers.get("content-type", "").startswith(VECTOR_FRAME_CONTENT_TYPE):
+        raise HTTPException(status_code=415, detail=f"expected {VECTOR_FRAME_CONTENT_TYPE}")
+    try:
+        header, vectors = decode_vector_frame(await request.body())
+    except VectorFrameError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if any(vector is None for vector in vectors):
+        raise HTTPException(status_code=422, detail="every row must carry a vector")
+    return header, vectors
+
+
+def _header_strings(header: dict[str, Any], name: str, expected: int) -> list[str]:
+    values = header.get(name)
+    if not isinstance(values, list) or len(values) != expected or not all(isinstance(value, str) for value in values):
+        raise HTTPException(status_code=422, detail=f"{name} must list one string per vector")
+    return values
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    topiclink._ensure_zvec_collection()
+    topiclink.start_topiclink_metadata_worker()
+    yield
+    await topiclink.stop_topiclink_metadata_worker()
+
+
+app = FastAPI(title="TopicLink Zvec", version="0.1.0", lifespan=lifespan)
+
+
+@app.get("/health/ready")
 def ready_health():
     try:
         topiclink.probe_topiclink_storage(None)
-    except Exception as exc:
-        logger.warning("TopicLink Zvec sidecar readiness failed: %s", exc)
-        return JSONResponse(
-            status_code=503,
-            content={"status": "not_ready", "service": "topiclink-zvec", "zvec": "error"},
-        )
+    except Exception as exc:
+        logger.warning("TopicLink Zvec sidecar readiness failed: %s", exc)
+        return JSONResponse(
+            status_code=503,
+            content={"status": "not_ready", "service": "topiclink-zvec", "zvec": "error"},
+        )
     collection = topiclink._ensure_zvec_collection()
     doc_count = topiclink._topiclink_zvec_doc_count(collection)
     min_doc_count = max(0, int(os.getenv("TOPICLINK_ZVEC_MIN_DOC_COUNT", "0")))
@@ -68,23 +119,84 @@ def ready_health():
         "service": "topiclink-zvec",
         "zvec": "ok",
         "doc_count": doc_count,
+        "metadata_worker": topiclink.topiclink_metadata_worker_status(),
     }
-
-
-@app.post("/cache/fetch")
-def fetch_cache(request: CacheFetchRequest):
-    return {"vectors": topiclink._read_zvec_cache(request.model, request.inputs)}
-
-
-@app.post("/cache/upsert")
-def upsert_cache(request: CacheUpsertRequest):
-    if len(request.inputs) != len(request.vectors):
-        raise HTTPException(status_code=422, detail="inputs and vectors must have equal length")
-    if not topiclink._write_zvec_cache(request.model, request.inputs, request.vectors):
-        raise HTTPException(status_code=503, detail="Zvec write failed")
-    return {"written": len(request.inputs)}
-
-
-@app.post("/cache/prune")
-def prune_cache(request: CachePruneRequest):
-    return {"deleted": topiclink._prune_zvec_cache(force=request.force)}
+
+
+@app.post("/cache/fetch")
+def fetch_cache(request: CacheFetchRequest):
+    return {"vectors": topiclink._read_zvec_cache(request.model, request.inputs)}
+
+
+@app.post("/cache/upsert")
+def upsert_cache(request: CacheUpsertRequest):
+    if len(request.inputs) != len(request.vectors):
+        raise HTTPException(status_code=422, detail="inputs and vectors must have equal length")
+    if not topiclink._write_zvec_cache(request.model, request.inputs, request.vectors):
+        raise HTTPException(status_code=503, detail="Zvec write failed")
+    return {"written": len(request.inputs)}
+
+
+@app.post("/cache/prune")
+def prune_cache(request: CachePruneRequest):
+    return {"deleted": topiclink._prune_zvec_cache(force=request.force)}
+
+
+def _query_topic_index(request: TopicIndexQueryRequest) -> dict[str, Any]:
+    items = topiclink._query_topic_index(
+        request.model,
+        request.vector,
+        limit=max(1, min(request.limit, 80)),
+        exclude_topic_id=request.exclude_topic_id,
+        category=request.category,
+        status=request.status,
+    )
+    if items is None:
+        raise HTTPException(status_code=503, detail="Zvec topic index unavailable")
+    return {"items": items}
+
+
+@app.post("/topics/delete")
+def delete_topic_index(request: TopicIndexDeleteRequest):
+    topiclink._delete_topic_index(request.topic_ids)
+    return {"deleted": len(request.topic_ids)}
+
+
+@app.post("/v2/cache/fetch")
+def fetch_cache_vectors(request: CacheKeyFetchRequest):
+    vectors = topiclink._read_local_zvec_cache(request.model, request.text_hashes)
+    return Response(content=encode_vector_frame({"model": request.model}, vectors), media_type=VECTOR_FRAME_CONTENT_TYPE)
+
+
+@app.post("/v2/cache/upsert")
+async def upsert_cache_vectors(request: Request):
+    header, vectors = await _read_vector_frame(request)
+    model = str(header.get("model") or "")
+    text_hashes = _header_strings(header, "text_hashes", len(vectors))
+    if not model:
+        raise HTTPException(status_code=422, detail="model is required")
+    if not await asyncio.to_thread(topiclink._write_local_zvec_cache, model, text_hashes, vectors):
+        raise HTTPException(status_code=503, detail="Zvec write failed")
+    return {"written": len(vectors)}
+
+
+@app.post("/v2/topics/upsert")
+async def upsert_topic_index_vectors(request: Request):
+    header, vectors = await _read_vector_frame(request)
+    entries = header.get("entries")
+    if not isinstance(entries, list) or len(entries) != len(vectors) or not all(isinstance(entry, dict) for entry in entries):
+        raise HTTPException(status_code=422, detail="entries and vectors must have equal length")
+    written = await asyncio.to_thread(topiclink._write_topic_index, str(header.get("model") or ""), entries, vectors)
+    return {"written": written}
+
+
+@app.post("/v2/topics/query")
+async def query_topic_index_vectors(request: Request):
+    header, vectors = await _read_vector_frame(request)
+    if len(vectors) != 1:
+        raise HTTPException(status_code=422, detail="query frames carry exactly one vector")
+    try:
+        query = TopicIndexQueryRequest(**header, vector=vectors[0])
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=422, detail="invalid topic index query") from exc
+    return await asyncio.to_thread(_query_topic_index, query)
@@ -66,39 +66,30 @@ from app.services.request_audit import (
     summarize_request_body,
     summarize_response_body,
 )
+from app.services.skill_hub import start_skill_hub_trending_worker, stop_skill_hub_trending_worker
 from app.storage.database.postgres_client import get_db_session
-from app.storage.database.topic_store import init_topic_tables
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     if os.getenv("DATABASE_URL"):
         try:
-            from app.storage.database.postgres_client import init_auth_tables, ensure_site_feedback_schema
-            from app.storage.database.inspiration_store import ensure_inspiration_schema_and_seed
-            from app.storage.database.site_assets_store import ensure_site_assets_schema_and_seed
-            from app.storage.database.youth_ted_store import ensure_youth_ted_schema_and_seed
-            init_auth_tables()
-            init_topic_tables()
+            from app.storage.database.schema_migrations import ensure_schema_current
+            ensure_schema_current()
             try:
                 topiclink_router.initialize_topiclink_storage()
             except Exception as e2:
                 logging.getLogger(__name__).warning("TopicLink Zvec initialization failed: %s", e2)
-            ensure_site_assets_schema_and_seed()
-            ensure_youth_ted_schema_and_seed()
-            ensure_inspiration_schema_and_seed()
-            try:
-                ensure_site_feedback_schema()
-            except Exception as e2:
-                logging.getLogger(__name__).warning("site_feedback schema ensure failed (will retry on first feedback): %s", e2)
             try:
                 topiclink_router.start_topiclink_metadata_worker()
             except Exception as e2:
                 logging.getLogger(__name__).warning("TopicLink metadata worker start skipped: %s", e2)
+            start_skill_hub_trending_worker()
         except Exception as e:
             logging.getLogger(__name__).warning(f"Auth tables init skipped: {e}")
 
     yield
     await topiclink_router.stop_topiclink_metadata_worker()
+    await stop_skill_hub_trending_worker()
     await close_shared_async_clients()
 
 app = FastAPI(
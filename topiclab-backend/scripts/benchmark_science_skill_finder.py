@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Compare local science skill finder latency: linear field scoring vs. the BM25 inverted index."""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.services import science_skill_finder as finder  # noqa: E402
+from app.services.science_skill_catalog import get_catalog_items, get_catalog_meta  # noqa: E402
+
+
+DEFAULT_QUERIES = (
+    "reproduce paper results",
+    "AlphaFold2",
+    "蛋白质结构预测",
+    "因果推断",
+    "单细胞 RNA 测序聚类",
+    "protein structure",
+    "分子对接 药物筛选",
+    "literature review",
+    "统计检验 显著性",
+    "genome assembly",
+    "显微镜图像分割",
+    "question answering benchmark",
+)
+
+
+def _linear_item_score(item: dict[str, Any], query_tokens: set[str]) -> int:
+    """The pre-index scorer: re-tokenize every field of every item per query."""
+    return sum(
+        len(query_tokens & finder._text_tokens(str(item.get(field) or ""))) * weight
+        for field, weight in finder.FIELD_WEIGHTS
+    )
+
+
+def _linear_search(query: str, limit: int) -> list[str]:
+    query_tokens = finder._text_tokens(query)
+    scored = [(_linear_item_score(item, query_tokens), item) for item in get_catalog_items()]
+    scored.sort(key=lambda pair: (-pair[0], -int(pair[1].get("quality_score") or 0), str(pair[1].get("id"))))
+    return [str(item["id"]) for score, item in scored[:limit] if score > 0]
+
+
+def _indexed_search(query: str, limit: int) -> list[str]:
+    route = {"domain": None, "stage": None, "function": None, "search_terms": []}
+    ranked, _ = finder._rank_results(query, route, limit)
+    return [str(item["id"]) for item in ranked]
+
+
+def _measure(run: Callable[[str, int], list[str]], queries: tuple[str, ...], rounds: int, limit: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(rounds):
+        for query in queries:
+            started = time.perf_counter()
+            run(query, limit)
+            samples.append((time.perf_counter() - started) * 1000)
+    return sorted(samples)
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=24)
+    parser.add_argument("queries", nargs="*", help="defaults to a bilingual sample of finder queries")
+    args = parser.parse_args()
+    queries = tuple(args.queries) or DEFAULT_QUERIES
+    total = get_catalog_meta()["total"]
+
+    started = time.perf_counter()
+    finder._catalog_index.cache_clear()
+    index = finder._catalog_index()
+    build_ms = (time.perf_counter() - started) * 1000
+    print(f"catalog: {total} skills, {len(index.postings)} tokens, index built in {build_ms:.1f} ms")
+
+    for label, run in (("linear", _linear_search), ("bm25-index", _indexed_search)):
+        samples = _measure(run, queries, max(1, args.rounds), args.limit)
+        print(
+            f"{label:>10}: p50 {_percentile(samples, 0.50):8.2f} ms  "
+            f"p99 {_percentile(samples, 0.99):8.2f} ms  "
+            f"mean {statistics.fmean(samples):8.2f} ms  (n={len(samples)})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
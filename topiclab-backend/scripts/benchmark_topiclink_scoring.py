@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Compare TopicLink candidate scoring latency: pairwise Python cosine vs. one float32 matrix-vector product."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.services.topiclink_vectors import UnitVectorMatrix  # noqa: E402
+
+
+def _pairwise_cosine(profile: list[float], candidates: list[list[float]]) -> list[float]:
+    """The previous scorer: one Python dot product per candidate."""
+    return [sum(x * y for x, y in zip(profile, vector)) if len(vector) == len(profile) else 0.0 for vector in candidates]
+
+
+def _vectorized(profile: list[float], candidates: list[list[float]]) -> list[float]:
+    """Build the unit matrix from the lists, as ``_score_topics`` does per request, then score."""
+    return UnitVectorMatrix.for_query(profile, candidates).similarities(profile).tolist()
+
+
+def _unit(vector: list[float]) -> list[float]:
+    norm = sum(item * item for item in vector) ** 0.5 or 1.0
+    return [item / norm for item in vector]
+
+
+def _measure(run: Callable[[list[float], list[list[float]]], object], profile, candidates, rounds: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        run(profile, candidates)
+        samples.append((time.perf_counter() - started) * 1000)
+    return sorted(samples)
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candidates", type=int, default=300)
+    parser.add_argument("--dimensions", type=int, default=4096)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    profile = _unit([rng.gauss(0.0, 1.0) for _ in range(args.dimensions)])
+    candidates = [_unit([rng.gauss(0.0, 1.0) for _ in range(args.dimensions)]) for _ in range(args.candidates)]
+
+    reference = _pairwise_cosine(profile, candidates)
+    vectorized = _vectorized(profile, candidates)
+    same_order = sorted(range(len(reference)), key=lambda row: -round(reference[row], 5)) == sorted(
+        range(len(vectorized)), key=lambda row: -round(vectorized[row], 5)
+    )
+    max_error = max((abs(a - b) for a, b in zip(reference, vectorized)), default=0.0)
+    print(f"{args.candidates} candidates x {args.dimensions} dims: same ranking={same_order}, max |Δcos|={max_error:.2e}")
+
+    prebuilt = UnitVectorMatrix.for_query(profile, candidates)
+    runs: tuple[tuple[str, Callable[[list[float], list[list[float]]], object]], ...] = (
+        ("pairwise", _pairwise_cosine),
+        ("matvec", _vectorized),
+        ("prebuilt", lambda query, _candidates: prebuilt.similarities(query)),
+    )
+    for label, run in runs:
+        samples = _measure(run, profile, candidates, max(1, args.rounds))
+        print(
+            f"{label:>10}: p50 {_percentile(samples, 0.50):8.2f} ms  "
+            f"p99 {_percentile(samples, 0.99):8.2f} ms  "
+            f"mean {statistics.fmean(samples):8.2f} ms  (n={len(samples)})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Embed or verify the memory-mapped vector files for the science skill and MCP catalogs."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.services import science_mcp_catalog, science_skill_catalog  # noqa: E402
+from app.services.science_catalog_vectors import embed_catalog, read_vector_file, write_vector_file  # noqa: E402
+
+
+def _catalogs() -> list[tuple[str, Path, list[dict], str]]:
+    return [
+        (
+            "science skills",
+            science_skill_catalog.CATALOG_VECTORS_PATH,
+            science_skill_catalog.get_catalog_items(),
+            science_skill_catalog.get_catalog_meta()["source"]["sha256"],
+        ),
+        (
+            "science MCPs",
+            science_mcp_catalog.CATALOG_VECTORS_PATH,
+            science_mcp_catalog.get_mcp_catalog_items(),
+            science_mcp_catalog.get_mcp_catalog_meta()["source"]["snapshot_sha256"],
+        ),
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+    status = 0
+    for label, destination, items, digest in _catalogs():
+        if args.check:
+            if read_vector_file(destination, source_sha256=digest, expected_rows=len(items)) is None:
+                print(f"OUTDATED: {destination}")
+                status = 1
+            else:
+                print(f"OK: {label} vectors match the catalog snapshot")
+            continue
+        write_vector_file(embed_catalog(items, source_sha256=digest), destination)
+        print(f"BUILT: {len(items)} {label} -> {destination}")
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -34,7 +34,7 @@ def _is_safe_target() -> bool:
     return host in {"", "localhost", "127.0.0.1", "::1"} or host.endswith(".local")
 
 
-def _iter_jsonl(path: Path) -> Iterable[dict[str, Any]]:
+def _iter_jsonl(path: Path) -> Iterable[tuple[int, dict[str, Any]]]:
     opener = gzip.open if path.suffix == ".gz" else open
     with opener(path, "rt", encoding="utf-8") as handle:
         for line_number, line in enumerate(handle, start=1):
@@ -47,7 +47,7 @@ def _iter_jsonl(path: Path) -> Iterable[dict[str, Any]]:
                 raise ValueError(f"line {line_number}: invalid JSON") from exc
             if not isinstance(value, dict):
                 raise ValueError(f"line {line_number}: expected object")
-            yield value
+            yield line_number, value
 
 
 def _normalize_row(row: dict[str, Any], *, line_number: int) -> dict[str, Any]:
@@ -117,24 +117,33 @@ def _upsert_batch(rows: list[dict[str, Any]]) -> None:
         )
 
 
-def import_cache(path: Path, *, batch_size: int) -> int:
-    pending: list[dict[str, Any]] = []
+def import_cache(
+    path: Path,
+    *,
+    batch_size: int,
+    checkpoint: Path | None = None,
+    max_rows_per_second: float = 0.0,
+) -> int:
+    from app.services.bulk_pipeline import Checkpoint, RowRateLimiter, iter_chunks
+
+    state = Checkpoint.load(checkpoint, path) if checkpoint else None
+    limiter = RowRateLimiter(max_rows_per_second)
     total = 0
-    for line_number, row in enumerate(_iter_jsonl(path), start=1):
-        pending.append(_normalize_row(row, line_number=line_number))
-        if len(pending) >= batch_size:
-            _upsert_batch(pending)
-            total += len(pending)
-            pending = []
-    if pending:
-        _upsert_batch(pending)
-        total += len(pending)
+    for chunk in iter_chunks(_iter_jsonl(path), batch_size, after_line=state.line if state else 0):
+        rows = [_normalize_row(row, line_number=line_number) for line_number, row in chunk]
+        limiter.wait(len(rows))
+        _upsert_batch(rows)
+        total += len(rows)
+        if state is not None:
+            state.advance(chunk[-1][0], len(rows))
+    if state is not None:
+        state.complete()
     return total
 
 
 def validate_cache(path: Path) -> int:
     total = 0
-    for line_number, row in enumerate(_iter_jsonl(path), start=1):
+    for line_number, row in _iter_jsonl(path):
         _normalize_row(row, line_number=line_number)
         total += 1
     return total
@@ -145,6 +154,13 @@ def main() -> None:
     parser.add_argument("path", type=Path, help="Path to topiclink_embedding_cache_*.jsonl or .jsonl.gz")
     parser.add_argument("--batch-size", type=int, default=200, help="Rows per database upsert batch")
     parser.add_argument("--execute", action="store_true", help="Actually import rows into the configured database")
+    parser.add_argument("--checkpoint", type=Path, help="Resume file updated after every committed batch")
+    parser.add_argument(
+        "--max-rows-per-second",
+        type=float,
+        default=0.0,
+        help="Throttle upserts so the import can run next to production (0 = unlimited)",
+    )
     args = parser.parse_args()
     if args.batch_size < 1:
         raise SystemExit("--batch-size must be >= 1")
@@ -159,7 +175,12 @@ def main() -> None:
             "Refusing to import into a non-local database. Set TOPICLAB_ALLOW_PRODUCTION_DB_WRITES=1 "
             "only for an intentional production cache import."
         )
-    total = import_cache(args.path, batch_size=args.batch_size)
+    total = import_cache(
+        args.path,
+        batch_size=args.batch_size,
+        checkpoint=args.checkpoint,
+        max_rows_per_second=args.max_rows_per_second,
+    )
     print(f"imported_or_updated={total}")
 
 
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Apply or check TopicLab schema migrations outside of web worker startup."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.storage.database.schema_migrations import (  # noqa: E402
+    pending_migrations,
+    run_schema_migrations,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--check", action="store_true", help="exit 1 when migrations are pending")
+    parser.add_argument("--force", action="store_true", help="re-apply every step even if the ledger is current")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    if args.check:
+        pending = pending_migrations()
+        if pending:
+            print("PENDING: " + ", ".join(f"{migration.name} v{migration.version}" for migration in pending))
+            return 1
+        print("OK: schema ledger is current")
+        return 0
+    applied = run_schema_migrations(force=args.force)
+    if applied:
+        print("APPLIED: " + ", ".join(applied))
+    else:
+        print("OK: schema ledger is current")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
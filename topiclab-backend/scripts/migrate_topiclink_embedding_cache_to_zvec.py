@@ -1,4 +1,14 @@
-"""Migrate a TopicLink embedding-cache export into a Zvec collection."""
+"""Migrate a TopicLink embedding-cache export into a Zvec collection.
+
+The export is first streamed once to validate every row and check that one
+model and one dimension cover the whole file, so a bad line never leaves a
+half-written collection. It is then streamed again in chunks of float32
+vectors. Each chunk is one bulk upsert and one flush, either into a local
+collection directory or, while the single-writer sidecar owns that directory,
+through its ``/v2/cache/upsert`` binary frames.
+``--checkpoint`` makes the run resumable and ``--max-rows-per-second`` keeps it
+from starving live traffic.
+"""
 
 from __future__ import annotations
 
@@ -6,15 +16,24 @@ import argparse
 import gzip
 import hashlib
 import json
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterator, TextIO
 
+import numpy as np
+
 try:
     import zvec
 except ImportError as exc:  # pragma: no cover - exercised by the CLI environment
     raise SystemExit("zvec is required; run with `uv run --with zvec python ...`") from exc
 
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services.bulk_pipeline import Checkpoint, RowRateLimiter, iter_chunks  # noqa: E402
+
 
 VECTOR_FIELD = "embedding"
 
@@ -29,7 +48,7 @@ def _open_source(path: Path) -> TextIO:
     return path.open("r", encoding="utf-8")
 
 
-def _parse_row(raw: dict[str, Any], line_number: int) -> tuple[dict[str, Any], list[float]]:
+def _parse_row(raw: dict[str, Any], line_number: int) -> tuple[dict[str, Any], np.ndarray]:
     cache_key = str(raw.get("cache_key") or "").strip()
     model = str(raw.get("model") or "").strip()
     text_hash = str(raw.get("text_hash") or "").strip()
@@ -46,9 +65,11 @@ def _parse_row(raw: dict[str, Any], line_number: int) -> tuple[dict[str, Any], l
     if not isinstance(vector_value, list) or not vector_value:
         raise ValueError(f"line {line_number}: vector must be a non-empty array")
     try:
-        vector = [float(value) for value in vector_value]
+        vector = np.asarray(vector_value, dtype=np.float32)
     except (TypeError, ValueError) as exc:
         raise ValueError(f"line {line_number}: vector contains a non-numeric value") from exc
+    if vector.ndim != 1:
+        raise ValueError(f"line {line_number}: vector must be a flat array")
     dimensions = int(raw.get("dimensions") or len(vector))
     if dimensions != len(vector):
         raise ValueError(
@@ -67,35 +88,46 @@ def _parse_row(raw: dict[str, Any], line_number: int) -> tuple[dict[str, Any], l
     return {"id": zvec_document_id(runtime_cache_key), "fields": fields}, vector
 
 
-def _iter_rows(path: Path) -> Iterator[tuple[dict[str, Any], list[float]]]:
+def _iter_lines(path: Path) -> Iterator[tuple[int, str]]:
     with _open_source(path) as handle:
         for line_number, line in enumerate(handle, start=1):
-            if not line.strip():
-                continue
-            try:
-                raw = json.loads(line)
-            except json.JSONDecodeError as exc:
-                raise ValueError(f"line {line_number}: invalid JSON") from exc
-            if not isinstance(raw, dict):
-                raise ValueError(f"line {line_number}: each row must be a JSON object")
-            yield _parse_row(raw, line_number)
-
-
-def _inspect_source(path: Path) -> tuple[int, str, int]:
-    count = 0
-    models: set[str] = set()
-    dimensions: set[int] = set()
-    for item, vector in _iter_rows(path):
-        count += 1
+            if line.strip():
+                yield line_number, line
+
+
+def _parse_line(line: str, line_number: int) -> tuple[dict[str, Any], np.ndarray]:
+    try:
+        raw = json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"line {line_number}: invalid JSON") from exc
+    if not isinstance(raw, dict):
+        raise ValueError(f"line {line_number}: each row must be a JSON object")
+    return _parse_row(raw, line_number)
+
+
+def _inspect_source(
+    path: Path,
+    *,
+    after_line: int = 0,
+    model: str | None = None,
+    dimensions: int | None = None,
+) -> tuple[str | None, int | None, int]:
+    """Validate every row after ``after_line`` before anything is written; return model, dimensions and row count."""
+    models = {model} if model else set()
+    widths = {dimensions} if dimensions else set()
+    rows = 0
+    for line_number, line in _iter_lines(path):
+        if line_number <= after_line:
+            continue
+        item, vector = _parse_line(line, line_number)
         models.add(str(item["fields"]["model"]))
-        dimensions.add(len(vector))
-    if count == 0:
-        raise ValueError("embedding cache is empty")
-    if len(models) != 1:
+        widths.add(len(vector))
+        rows += 1
+    if len(models) > 1:
         raise ValueError(f"embedding cache contains mixed models: {sorted(models)}")
-    if len(dimensions) != 1:
-        raise ValueError(f"embedding cache contains mixed dimensions: {sorted(dimensions)}")
-    return count, next(iter(models)), next(iter(dimensions))
+    if len(widths) > 1:
+        raise ValueError(f"embedding cache contains mixed dimensions: {sorted(widths)}")
+    return next(iter(models), None), next(iter(widths), None), rows
 
 
 def _open_collection(path: Path, dimensions: int):
@@ -137,45 +169,117 @@ def _assert_statuses(statuses: Any) -> None:
         raise RuntimeError(f"Zvec upsert failed: {detail}")
 
 
+class _CollectionSink:
+    def __init__(self, target: Path) -> None:
+        self.target = target
+        self.collection = None
+
+    def write(self, model: str, dimensions: int, rows: list[tuple[dict[str, Any], np.ndarray]], migrated_at: str) -> None:
+        if self.collection is None:
+            self.collection = _open_collection(self.target, dimensions)
+        documents = [
+            zvec.Doc(
+                id=item["id"],
+                vectors={VECTOR_FIELD: vector},
+                fields={**item["fields"], "last_used_at": migrated_at},
+            )
+            for item, vector in rows
+        ]
+        _assert_statuses(self.collection.upsert(documents))
+        self.collection.flush()
+
+    def finish(self, optimize: bool) -> None:
+        if self.collection is not None and optimize:
+            self.collection.optimize()
+
+    def close(self) -> None:
+        pass
+
+
+class _ServiceSink:
+    """Write through the running sidecar, which owns the collection directory."""
+
+    def __init__(self, service_url: str, service_socket: str | None = None) -> None:
+        import httpx
+
+        from app.services.topiclink_vector_codec import VECTOR_FRAME_CONTENT_TYPE, encode_vector_frame
+
+        transport = httpx.HTTPTransport(uds=service_socket) if service_socket else None
+        self.url = f"{service_url.rstrip('/')}/v2/cache/upsert"
+        self.client = httpx.Client(transport=transport, timeout=120.0)
+        self.content_type = VECTOR_FRAME_CONTENT_TYPE
+        self.encode = encode_vector_frame
+
+    def write(self, model: str, dimensions: int, rows: list[tuple[dict[str, Any], np.ndarray]], migrated_at: str) -> None:
+        header = {"model": model, "text_hashes": [str(item["fields"]["text_hash"]) for item, _ in rows]}
+        response = self.client.post(
+            self.url,
+            content=self.encode(header, [vector for _, vector in rows]),
+            headers={"Content-Type": self.content_type},
+        )
+        if response.status_code >= 400:
+            raise RuntimeError(f"Zvec service upsert failed: HTTP {response.status_code}")
+
+    def finish(self, optimize: bool) -> None:
+        pass
+
+    def close(self) -> None:
+        self.client.close()
+
+
 def migrate_cache(
     source: str | Path,
-    target: str | Path,
+    target: str | Path | None = None,
     *,
-    batch_size: int = 64,
+    batch_size: int = 256,
     optimize: bool = True,
+    checkpoint: str | Path | None = None,
+    max_rows_per_second: float = 0.0,
+    service_url: str | None = None,
+    service_socket: str | None = None,
 ) -> dict[str, Any]:
     source_path = Path(source).expanduser().resolve()
-    target_path = Path(target).expanduser().resolve()
     if not source_path.is_file():
         raise FileNotFoundError(source_path)
     if batch_size < 1:
         raise ValueError("batch_size must be at least 1")
+    if (target is None) == (service_url is None):
+        raise ValueError("pass exactly one of target or service_url")
 
-    source_rows, model, dimensions = _inspect_source(source_path)
-    collection = _open_collection(target_path, dimensions)
+    state = Checkpoint.load(Path(checkpoint), source_path) if checkpoint else None
+    model, dimensions, _ = _inspect_source(
+        source_path,
+        after_line=state.line if state else 0,
+        model=state.extra.get("model") if state else None,
+        dimensions=state.extra.get("dimensions") if state else None,
+    )
+    if model is None or dimensions is None:
+        raise ValueError("embedding cache is empty")
+    sink = (
+        _ServiceSink(service_url, service_socket)
+        if service_url
+        else _CollectionSink(Path(target).expanduser().resolve())
+    )
+    limiter = RowRateLimiter(max_rows_per_second)
     migrated_at = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
-    batch: list[Any] = []
+    skipped_rows = state.rows if state else 0
     upserted_rows = 0
-    for item, vector in _iter_rows(source_path):
-        batch.append(
-            zvec.Doc(
-                id=item["id"],
-                vectors={VECTOR_FIELD: vector},
-                fields={**item["fields"], "last_used_at": migrated_at},
-            )
-        )
-        if len(batch) >= batch_size:
-            _assert_statuses(collection.upsert(batch))
-            upserted_rows += len(batch)
-            batch = []
-    if batch:
-        _assert_statuses(collection.upsert(batch))
-        upserted_rows += len(batch)
-    collection.flush()
-    if optimize:
-        collection.optimize()
+    try:
+        for chunk in iter_chunks(_iter_lines(source_path), batch_size, after_line=state.line if state else 0):
+            rows = [_parse_line(line, line_number) for line_number, line in chunk]
+            limiter.wait(len(rows))
+            sink.write(model, dimensions, rows, migrated_at)
+            upserted_rows += len(rows)
+            if state is not None:
+                state.extra.update({"model": model, "dimensions": dimensions})
+                state.advance(chunk[-1][0], len(rows))
+        sink.finish(optimize)
+    finally:
+        sink.close()
+    if state is not None:
+        state.complete()
     return {
-        "source_rows": source_rows,
+        "source_rows": skipped_rows + upserted_rows,
         "upserted_rows": upserted_rows,
         "model": model,
         "dimensions": dimensions,
@@ -185,17 +289,33 @@ def migrate_cache(
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("source", type=Path, help="TopicLink embedding-cache JSONL or JSONL.GZ")
-    parser.add_argument("target", type=Path, help="Zvec collection directory")
-    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("target", type=Path, nargs="?", help="Zvec collection directory (omit with --service-url)")
+    parser.add_argument("--batch-size", type=int, default=256, help="Rows per bulk upsert and flush")
     parser.add_argument("--no-optimize", action="store_true")
+    parser.add_argument("--checkpoint", type=Path, help="Resume file updated after every flushed chunk")
+    parser.add_argument(
+        "--max-rows-per-second",
+        type=float,
+        default=0.0,
+        help="Throttle writes so the backfill can run next to production (0 = unlimited)",
+    )
+    parser.add_argument("--service-url", help="Write through a running topiclink-zvec sidecar instead of the directory")
+    parser.add_argument("--service-socket", help="Unix socket of the sidecar, with --service-url")
     args = parser.parse_args()
+    if (args.target is None) == (args.service_url is None):
+        parser.error("pass either target or --service-url")
     summary = migrate_cache(
         args.source,
         args.target,
         batch_size=args.batch_size,
         optimize=not args.no_optimize,
+        checkpoint=args.checkpoint,
+        max_rows_per_second=args.max_rows_per_second,
+        service_url=args.service_url,
+        service_socket=args.service_socket,
     )
-    print(json.dumps({**summary, "target": str(args.target.resolve())}, ensure_ascii=False))
+    destination = args.service_url or str(args.target.resolve())
+    print(json.dumps({**summary, "target": destination}, ensure_ascii=False))
 
 
 if __name__ == "__main__":
@@ -11,3 +11,5 @@ os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 @pytest.fixture(autouse=True)
 def isolated_skill_hub_storage(tmp_path, monkeypatch):
     monkeypatch.setenv("SKILL_HUB_STORAGE_DIR", str(tmp_path / "skill_hub_uploads"))
+    monkeypatch.setenv("SCIENCE_FINDER_CACHE_PATH", str(tmp_path / "science_finder_cache.sqlite3"))
+    monkeypatch.setenv("TOPICLINK_ANSWER_CACHE_PATH", str(tmp_path / "topiclink_answer_cache.sqlite3"))
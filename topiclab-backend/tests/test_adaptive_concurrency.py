@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from app.services.adaptive_concurrency import AdaptiveConcurrencyLimit
+
+
+def test_adaptive_concurrency_grows_additively_and_halves_once_per_congestion_burst():
+    limit = AdaptiveConcurrencyLimit(initial=1, maximum=8, latency_target_seconds=10.0, cooldown_seconds=60.0)
+
+    for _ in range(20):
+        limit.record(1.0)
+    assert limit.limit == 6
+
+    limit.record(1.0, throttled=True)
+    limit.record(30.0)
+    limit.record(1.0, throttled=True)
+
+    assert limit.limit == 3
+    assert (limit.throttled, limit.slow) == (2, 1)
+
+    for _ in range(200):
+        limit.record(1.0)
+    assert limit.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_bounds_in_flight_work_by_the_current_limit():
+    limit = AdaptiveConcurrencyLimit(initial=2, maximum=4, latency_target_seconds=10.0)
+    state = {"in_flight": 0, "peak": 0}
+
+    async def call():
+        async with limit.slot():
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    assert state["peak"] == 2
+    assert limit.stats()["in_flight"] == 0
+    assert limit.stats()["waiting"] == 0
@@ -1268,7 +1268,7 @@ def test_run_request_acquires_npm_source_before_mcp_evaluation(monkeypatch, tmp_
     (source / "package.json").write_text('{"name":"@scope/mcp"}', encoding="utf-8")
     acquisitions = []
 
-    def acquire(package, job_dir):
+    def acquire(package, job_dir, *, source_cache=None):
         acquisitions.append((package, job_dir))
         return source, {
             "requested_target": package,
@@ -1300,3 +1300,194 @@ def test_run_request_acquires_npm_source_before_mcp_evaluation(monkeypatch, tmp_
 
     assert result["status"] == "completed"
     assert acquisitions == [("@scope/mcp", tmp_path / "job")]
+
+
+def test_run_request_reuses_cached_verdict_for_identical_source_content(monkeypatch, tmp_path):
+    from app import critic_runner
+
+    source = tmp_path / "npm-source"
+    source.mkdir()
+    (source / "package.json").write_text('{"name":"@scope/mcp"}', encoding="utf-8")
+    evaluations = []
+
+    def evaluate(request, source_root, job_dir, *, kernel_root):
+        evaluations.append(job_dir)
+        if len(evaluations) == 1:
+            return {"status": "blocked", "blocker": "provider_unavailable", "evidence": {}}
+        return {
+            "status": "completed",
+            "score": 88,
+            "verdict": "建议采用",
+            "evidence": {
+                "provider_calls": 4,
+                "behavior_cases": 1,
+                "trigger_queries": 8,
+                "final_adjudications": 1,
+            },
+        }
+
+    monkeypatch.delenv("CRITIC_VERDICT_CACHE_DIR", raising=False)
+    monkeypatch.delenv("CRITIC_VERDICT_CACHE_TTL_SECONDS", raising=False)
+    monkeypatch.setattr(
+        critic_runner,
+        "_acquire_npm",
+        lambda package, job_dir, *, source_cache=None: (
+            source,
+            {"requested_target": package, "requested_subpath": None},
+        ),
+    )
+    monkeypatch.setattr(critic_runner, "run_standard_criticagent", evaluate)
+    request = _standard_request("mcp")
+    request["target"] = "@scope/mcp"
+    kernel = tmp_path / "kernel"
+
+    blocked = critic_runner.run_request(request, tmp_path / "jobs" / "first", kernel_root=kernel)
+    fresh = critic_runner.run_request(request, tmp_path / "jobs" / "second", kernel_root=kernel)
+    cached = critic_runner.run_request(request, tmp_path / "jobs" / "third", kernel_root=kernel)
+
+    assert blocked["status"] == "blocked" and "verdict_cache" not in blocked
+    assert fresh["verdict_cache"]["hit"] is False
+    assert cached["status"] == "completed"
+    assert cached["score"] == 88
+    assert cached["verdict_cache"] == {
+        "hit": True,
+        "key": fresh["verdict_cache"]["key"],
+        "cached_at": cached["verdict_cache"]["cached_at"],
+    }
+    assert evaluations == [tmp_path / "jobs" / "first", tmp_path / "jobs" / "second"]
+    assert (tmp_path / "jobs" / "third" / "source-manifest.json").is_file()
+    progress = json.loads((tmp_path / "jobs" / "third" / "progress.json").read_text(encoding="utf-8"))
+    assert progress["current_step"] == "verdict"
+
+    (kernel / "src").mkdir(parents=True)
+    (kernel / "src" / "rubric.py").write_text("THRESHOLD = 80\n", encoding="utf-8")
+    rescored = critic_runner.run_request(request, tmp_path / "jobs" / "fourth", kernel_root=kernel)
+    (source / "index.js").write_text("export {};\n", encoding="utf-8")
+    changed = critic_runner.run_request(request, tmp_path / "jobs" / "fifth", kernel_root=kernel)
+
+    assert rescored["verdict_cache"]["hit"] is False
+    assert changed["verdict_cache"]["hit"] is False
+    assert len(evaluations) == 4
+
+
+def test_github_acquisition_reuses_cached_snapshot_for_the_resolved_commit(monkeypatch, tmp_path):
+    from app import critic_runner
+    from app.critic_source_cache import SourceCache
+
+    commit = "a" * 40
+    archive_buffer = io.BytesIO()
+    with tarfile.open(
+        fileobj=archive_buffer,
+        mode="w:gz",
+        format=tarfile.PAX_FORMAT,
+        pax_headers={"comment": commit},
+    ) as archive:
+        payload = b"---\nname: research-skill\n---\n"
+        member = tarfile.TarInfo("research-skill-main/SKILL.md")
+        member.size = len(payload)
+        archive.addfile(member, io.BytesIO(payload))
+    archive_bytes = archive_buffer.getvalue()
+    downloads = []
+    lookups = []
+
+    class FakeResponse:
+        headers = {}
+
+        def __init__(self):
+            self.offset = 0
+
+        def read(self, size=-1):
+            chunk = archive_bytes[self.offset:self.offset + size]
+            self.offset += len(chunk)
+            return chunk
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+    def fake_urlopen(request, timeout):
+        downloads.append(request.full_url)
+        return FakeResponse()
+
+    def fake_ls_remote(command, **kwargs):
+        lookups.append(command[-1])
+        return subprocess.CompletedProcess(command, 0, f"{commit}\tHEAD\n", "")
+
+    monkeypatch.setattr(critic_runner.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(critic_runner, "_run_bounded_process", fake_ls_remote)
+    cache = SourceCache(tmp_path / "source-cache")
+    target = "https://github.com/example/research-skill"
+    jobs = [tmp_path / "first", tmp_path / "second"]
+    for job in jobs:
+        job.mkdir()
+
+    first_source, first = critic_runner._acquire_github(target, jobs[0], source_cache=cache)
+    second_source, second = critic_runner._acquire_github(target, jobs[1], source_cache=cache)
+
+    assert downloads == ["https://codeload.github.com/example/research-skill/tar.gz/HEAD"]
+    assert lookups == ["HEAD", "HEAD"]
+    assert first["commit_sha"] == commit
+    assert first["source_cache"]["hit"] is False
+    assert second["source_cache"] == {"hit": True, "key": first["source_cache"]["key"]}
+    assert second["archive_sha256"] == first["archive_sha256"]
+    assert second_source == (jobs[1] / "source-cached" / "research-skill-main").resolve()
+    assert (second_source / "SKILL.md").read_bytes() == payload
+    assert (second_source / "SKILL.md").stat().st_ino == (first_source / "SKILL.md").stat().st_ino
+    assert (second_source / "SKILL.md").stat().st_mode & 0o222 == 0
+
+
+def test_source_cache_single_flights_acquisitions_and_evicts_least_recently_used(tmp_path):
+    import threading
+
+    from app import critic_runner
+    from app.critic_source_cache import SourceCache, source_cache_key
+
+    cache = SourceCache(tmp_path / "source-cache", max_bytes=25)
+    acquisitions = []
+    entered = threading.Event()
+    release = threading.Event()
+
+    def acquire_for(job, key_name, *, wait=False):
+        def acquire():
+            acquisitions.append(key_name)
+            source = job / "package"
+            source.mkdir(parents=True)
+            (source / "index.js").write_text(key_name.ljust(10), encoding="utf-8")
+            if wait:
+                entered.set()
+                release.wait(timeout=5)
+            return source, {"integrity": key_name}
+
+        return critic_runner._acquire_through_cache(
+            cache,
+            source_cache_key("npm", key_name),
+            job,
+            acquire,
+            pinned=lambda provenance: True,
+            overrides={},
+        )
+
+    results = {}
+    leader = threading.Thread(target=lambda: results.setdefault("leader", acquire_for(tmp_path / "a", "one", wait=True)))
+    leader.start()
+    assert entered.wait(timeout=5)
+    follower = threading.Thread(target=lambda: results.setdefault("follower", acquire_for(tmp_path / "b", "one")))
+    follower.start()
+    release.set()
+    leader.join(timeout=5)
+    follower.join(timeout=5)
+
+    assert acquisitions == ["one"]
+    assert results["follower"][1]["source_cache"]["hit"] is True
+    assert (results["follower"][0] / "index.js").read_text(encoding="utf-8").strip() == "one"
+
+    acquire_for(tmp_path / "c", "two")
+    acquire_for(tmp_path / "d", "one")
+    acquire_for(tmp_path / "e", "three")
+
+    assert acquisitions == ["one", "two", "three"]
+    assert (cache.root / source_cache_key("npm", "one") / "entry.json").is_file()
+    assert not (cache.root / source_cache_key("npm", "two")).exists()
+    assert (cache.root / source_cache_key("npm", "three") / "entry.json").is_file()
@@ -1,5 +1,8 @@
 import asyncio
 import json
+import sys
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 
 import httpx
@@ -468,3 +471,238 @@ def test_worker_preserves_progress_when_restart_interrupts_a_running_job(tmp_pat
             "details": ["使用方式：guidance"],
         },
     ]
+
+
+def test_worker_schedules_by_priority_and_round_robins_between_requesters(tmp_path):
+    from app.critic_worker import create_critic_worker_app
+
+    async def exercise():
+        calls = []
+        gate = asyncio.Event()
+
+        async def gated_runner(request, job_dir):
+            calls.append((request["requester_id"], request["target"]))
+            if len(calls) == 1:
+                await gate.wait()
+            return {"status": "completed"}
+
+        app = create_critic_worker_app(
+            runner=gated_runner,
+            worker_token="worker-secret",
+            state_dir=tmp_path,
+            max_concurrent_jobs=1,
+            max_pending_jobs=8,
+            max_pending_jobs_per_requester=3,
+        )
+        headers = {"Authorization": "Bearer worker-secret"}
+
+        def payload(requester_id, kind, target):
+            return {
+                "kind": kind,
+                "target": target,
+                "depth": "standard",
+                "evaluation_profile": "standard",
+                "runtime": RUNTIME,
+                "requester_id": requester_id,
+                "source": "topiclab-skill-hub",
+            }
+
+        submissions = [
+            payload(17, "skill", "https://github.com/example/first-skill"),
+            payload(17, "skill", "https://github.com/example/second-skill"),
+            payload(17, "skill", "https://github.com/example/third-skill"),
+            payload(18, "skill", "https://github.com/example/other-skill"),
+            payload(19, "mcp", "@scope/small-server"),
+        ]
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://worker.test",
+        ) as client:
+            tasks = []
+            for index, item in enumerate(submissions):
+                tasks.append(
+                    asyncio.create_task(client.post("/api/v1/evaluations", json=item, headers=headers))
+                )
+                for _ in range(200):
+                    stats = (await client.get("/api/v1/scheduler", headers=headers)).json()
+                    if stats["running"] + stats["waiting"] == index + 1:
+                        break
+                    await asyncio.sleep(0.01)
+
+            over_limit = await client.post(
+                "/api/v1/evaluations",
+                json=payload(17, "skill", "https://github.com/example/fourth-skill"),
+                headers=headers,
+            )
+            assert over_limit.status_code == 429
+            assert "排队数已达上限" in over_limit.json()["detail"]
+            stats = (await client.get("/api/v1/scheduler", headers=headers)).json()
+            assert stats["waiting_by_priority"] == {"small": 1, "standard": 3, "large": 0}
+
+            gate.set()
+            responses = await asyncio.gather(*tasks)
+            stats = (await client.get("/api/v1/scheduler", headers=headers)).json()
+            finished = (
+                await client.get(
+                    f"/api/v1/evaluations/{responses[1].json()['job_id']}",
+                    params={"requester_id": 17},
+                    headers=headers,
+                )
+            ).json()
+
+        assert [response.status_code for response in responses] == [202] * 5
+        assert calls == [
+            (17, "https://github.com/example/first-skill"),
+            (19, "@scope/small-server"),
+            (18, "https://github.com/example/other-skill"),
+            (17, "https://github.com/example/second-skill"),
+            (17, "https://github.com/example/third-skill"),
+        ]
+        assert finished["priority"] == "standard"
+        assert finished["queue_wait_seconds"] > 0
+        assert stats["dispatched"] == 5
+        assert stats["queue_wait_seconds"]["samples"] == 5
+        assert stats["queue_wait_seconds"]["max"] >= finished["queue_wait_seconds"]
+
+    asyncio.run(exercise())
+
+
+def test_worker_runs_subprocess_jobs_in_parallel_slots(tmp_path):
+    from app.critic_worker import SubprocessRunner, create_critic_worker_app
+
+    fake_runner = tmp_path / "fake_runner.py"
+    fake_runner.write_text(
+        "\n".join(
+            [
+                "import argparse, json, pathlib, time",
+                "parser = argparse.ArgumentParser()",
+                "parser.add_argument('--request')",
+                "parser.add_argument('--output')",
+                "args = parser.parse_args()",
+                "job_dir = pathlib.Path(args.output).parent",
+                "(job_dir / 'started').write_text('1')",
+                "release = job_dir.parent.parent / 'release'",
+                "deadline = time.monotonic() + 10",
+                "while not release.exists() and time.monotonic() < deadline:",
+                "    time.sleep(0.02)",
+                "pathlib.Path(args.output).write_text(json.dumps({'status': 'completed'}))",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    state_dir = tmp_path / "state"
+    runner = SubprocessRunner(f'"{sys.executable}" "{fake_runner}"', "standard_v1")
+    app = create_critic_worker_app(
+        runner=runner,
+        worker_token="worker-secret",
+        state_dir=state_dir,
+        max_concurrent_jobs=2,
+    )
+    headers = {"Authorization": "Bearer worker-secret"}
+
+    def submit(target):
+        return client.post(
+            "/api/v1/evaluations",
+            json={
+                "kind": "skill",
+                "target": target,
+                "depth": "standard",
+                "evaluation_profile": "standard",
+                "runtime": RUNTIME,
+                "requester_id": 17,
+                "source": "topiclab-skill-hub",
+            },
+            headers=headers,
+        )
+
+    responses = []
+    with TestClient(app) as client:
+        threads = [
+            threading.Thread(target=lambda target=target: responses.append(submit(target)))
+            for target in ("https://github.com/example/first-skill", "https://github.com/example/second-skill")
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 10
+        while len(list(state_dir.glob("*/started"))) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        both_started = len(list(state_dir.glob("*/started"))) == 2
+        (tmp_path / "release").write_text("1", encoding="utf-8")
+        for thread in threads:
+            thread.join(timeout=15)
+
+    assert both_started
+    assert sorted(response.status_code for response in responses) == [202, 202]
+
+
+def test_worker_shares_one_run_between_requesters_submitting_the_same_target(tmp_path):
+    from app.critic_worker import create_critic_worker_app
+
+    async def exercise():
+        calls = []
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def gated_runner(request, job_dir):
+            calls.append(request["requester_id"])
+            started.set()
+            await release.wait()
+            return {"status": "completed", "verdict": "建议采用", "score": 91}
+
+        app = create_critic_worker_app(
+            runner=gated_runner,
+            worker_token="worker-secret",
+            state_dir=tmp_path,
+            max_concurrent_jobs=2,
+        )
+        headers = {"Authorization": "Bearer worker-secret"}
+
+        def payload(requester_id, depth="standard"):
+            return {
+                "kind": "skill",
+                "target": "https://github.com/example/shared-skill",
+                "depth": depth,
+                "evaluation_profile": depth,
+                "runtime": RUNTIME,
+                "requester_id": requester_id,
+                "source": "topiclab-skill-hub",
+            }
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://worker.test",
+        ) as client:
+            leader = asyncio.create_task(client.post("/api/v1/evaluations", json=payload(17), headers=headers))
+            await asyncio.wait_for(started.wait(), timeout=2)
+            follower = asyncio.create_task(client.post("/api/v1/evaluations", json=payload(18), headers=headers))
+            other_depth = asyncio.create_task(
+                client.post("/api/v1/evaluations", json=payload(19, "basic"), headers=headers)
+            )
+            for _ in range(200):
+                if len(calls) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            stats = (await client.get("/api/v1/scheduler", headers=headers)).json()
+            release.set()
+            responses = await asyncio.gather(leader, follower, other_depth)
+            leader_job, follower_job, _ = (response.json() for response in responses)
+            finished = (
+                await client.get(
+                    f"/api/v1/evaluations/{follower_job['job_id']}",
+                    params={"requester_id": 18},
+                    headers=headers,
+                )
+            ).json()
+
+        assert [response.status_code for response in responses] == [202] * 3
+        assert sorted(calls) == [17, 19]
+        assert stats["running"] == 2
+        assert follower_job["shared_job_id"] == leader_job["job_id"]
+        assert follower_job["status"] == "running"
+        assert finished["status"] == "completed"
+        assert finished["score"] == 91
+        assert finished["requester_id"] == 18
+        assert finished["shared_job_id"] == leader_job["job_id"]
+        assert finished["progress"]["completed_steps"] == ["validation", "behavior", "triggers", "verdict"]
+
+    asyncio.run(exercise())
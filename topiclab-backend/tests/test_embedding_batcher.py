@@ -0,0 +1,78 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.services import embedding_batcher
+from app.services.embedding_batcher import EmbeddingBatcher, EmbeddingBatchError, EmbeddingEndpoint
+
+
+def _fake_embedding_server(*, delay: float = 0.0, failures: list[int] | None = None):
+    """In-process ``/embeddings`` server: vector = [len(text), position in batch]."""
+    state = {"batches": [], "in_flight": 0, "peak": 0, "statuses": list(failures or [])}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            state["in_flight"] -= 1
+        if state["statuses"]:
+            return httpx.Response(state["statuses"].pop(0), headers={"Retry-After": "0"})
+        state["batches"].append(payload["input"])
+        return httpx.Response(
+            200,
+            json={
+                "data": [
+                    {"index": index, "embedding": [float(len(text)), float(index)]}
+                    for index, text in reversed(list(enumerate(payload["input"])))
+                ]
+            },
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), state
+
+
+@pytest.mark.asyncio
+async def test_embedding_batcher_merges_concurrent_callers_into_bounded_concurrent_batches(monkeypatch):
+    client, server = _fake_embedding_server(delay=0.02)
+    monkeypatch.setattr(embedding_batcher, "get_shared_async_client", lambda name: client)
+    batcher = EmbeddingBatcher(window_seconds=0.01)
+    endpoint = EmbeddingEndpoint("https://embeddings.test/v1", "key", "model", max_batch_size=3, max_concurrency=2)
+
+    results = await asyncio.gather(
+        batcher.embed(endpoint, ["a", "bb"]),
+        batcher.embed(endpoint, ["bb", "ccc", "dddd"]),
+        batcher.embed(endpoint, ["eeeee", "ffffff", "a"]),
+    )
+
+    assert [[vector[0] for vector in result] for result in results] == [[1, 2], [2, 3, 4], [5, 6, 1]]
+    assert sorted(text for batch in server["batches"] for text in batch) == ["a", "bb", "ccc", "dddd", "eeeee", "ffffff"]
+    assert [len(batch) for batch in server["batches"]] == [3, 3]
+    assert server["peak"] == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_embedding_batcher_retries_transient_failures_per_batch(monkeypatch):
+    client, server = _fake_embedding_server(failures=[503, 429])
+    monkeypatch.setattr(embedding_batcher, "get_shared_async_client", lambda name: client)
+    endpoint = EmbeddingEndpoint("https://embeddings.test/v1", "key", "model")
+
+    vectors = await EmbeddingBatcher(backoff_seconds=0).embed(endpoint, ["x", "yy"])
+
+    assert vectors == [[1.0, 0.0], [2.0, 1.0]]
+    assert server["batches"] == [["x", "yy"]]
+
+    server["statuses"] = [400]
+    with pytest.raises(EmbeddingBatchError):
+        await EmbeddingBatcher(backoff_seconds=0).embed(endpoint, ["z"])
+    assert server["statuses"] == []
+
+    server["statuses"] = [503, 503]
+    with pytest.raises(EmbeddingBatchError):
+        await EmbeddingBatcher(backoff_seconds=0, max_attempts=2).embed(endpoint, ["z"])
+    await client.aclose()
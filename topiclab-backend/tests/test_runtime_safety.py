@@ -103,19 +103,21 @@ def test_topiclink_zvec_store_is_initialized_without_database_cache(tmp_path, mo
     postgres_client.reset_db_state()
 
 
-def test_topiclink_zvec_startup_failure_does_not_skip_existing_service_initializers(monkeypatch):
+def test_topiclink_zvec_startup_failure_does_not_skip_existing_service_initializers(tmp_path, monkeypatch):
     monkeypatch.setenv("TOPICLAB_TESTING", "1")
-    monkeypatch.setenv("DATABASE_URL", "sqlite:///:memory:")
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'startup.sqlite3'}")
 
     import app.storage.database.inspiration_store as inspiration_store
     import app.storage.database.postgres_client as postgres_client
     import app.storage.database.site_assets_store as site_assets_store
+    import app.storage.database.topic_store as topic_store
     import app.storage.database.youth_ted_store as youth_ted_store
     import main as main_module
 
+    postgres_client.reset_db_state()
     calls: list[str] = []
     monkeypatch.setattr(postgres_client, "init_auth_tables", lambda: calls.append("auth"))
-    monkeypatch.setattr(main_module, "init_topic_tables", lambda: calls.append("topics"))
+    monkeypatch.setattr(topic_store, "init_topic_tables", lambda: calls.append("topics"))
     monkeypatch.setattr(
         main_module.topiclink_router,
         "initialize_topiclink_storage",
@@ -130,6 +132,7 @@ def test_topiclink_zvec_startup_failure_does_not_skip_existing_service_initializ
         pass
 
     assert calls == ["auth", "topics", "site_assets", "youth_ted", "inspiration", "worker"]
+    postgres_client.reset_db_state()
 
 
 def test_global_ready_health_does_not_depend_on_topiclink_zvec(tmp_path, monkeypatch):
@@ -307,6 +310,7 @@ def test_topiclab_backend_keeps_two_workers_and_zvec_sidecar_is_single_writer():
 def test_topiclink_zvec_sidecar_exposes_single_writer_cache_contract(monkeypatch):
     monkeypatch.delenv("TOPICLINK_ZVEC_SERVICE_URL", raising=False)
     import app.topiclink_zvec_service as service
+    from app.services.topiclink_vector_codec import VECTOR_FRAME_CONTENT_TYPE, decode_vector_frame, encode_vector_frame
 
     calls: list[str] = []
     monkeypatch.setattr(service.topiclink, "_ensure_zvec_collection", lambda: calls.append("open"))
@@ -320,6 +324,17 @@ def test_topiclink_zvec_sidecar_exposes_single_writer_cache_contract(monkeypatch
     monkeypatch.setattr(service.topiclink, "_read_zvec_cache", lambda model, inputs: [[1.0, 0.0] for _ in inputs])
     monkeypatch.setattr(service.topiclink, "_write_zvec_cache", lambda model, inputs, vectors: True)
     monkeypatch.setattr(service.topiclink, "_prune_zvec_cache", lambda force=False: 2)
+    monkeypatch.setattr(
+        service.topiclink,
+        "_read_local_zvec_cache",
+        lambda model, text_hashes: [[0.5, -1.0] if text_hash == "h1" else None for text_hash in text_hashes],
+    )
+    written: list[tuple[str, list[str], list[list[float]]]] = []
+    monkeypatch.setattr(
+        service.topiclink,
+        "_write_local_zvec_cache",
+        lambda model, text_hashes, vectors: written.append((model, text_hashes, vectors)) or True,
+    )
     monkeypatch.setattr(service.topiclink, "_topiclink_zvec_doc_count", lambda collection: 7)
 
     with TestClient(service.app) as client:
@@ -334,6 +349,23 @@ def test_topiclink_zvec_sidecar_exposes_single_writer_cache_contract(monkeypatch
             json={"model": "m", "inputs": ["a"], "vectors": [[1.0, 0.0]]},
         ).json() == {"written": 1}
         assert client.post("/cache/prune", json={"force": True}).json() == {"deleted": 2}
+        fetched = client.post("/v2/cache/fetch", json={"model": "m", "text_hashes": ["h1", "h2"]})
+        assert fetched.headers["content-type"] == VECTOR_FRAME_CONTENT_TYPE
+        assert decode_vector_frame(fetched.content) == ({"model": "m"}, [[0.5, -1.0], None])
+        upserted = client.post(
+            "/v2/cache/upsert",
+            content=encode_vector_frame({"model": "m", "text_hashes": ["h3"]}, [[0.25, 0.75]]),
+            headers={"Content-Type": VECTOR_FRAME_CONTENT_TYPE},
+        )
+        assert upserted.json() == {"written": 1}
+        assert written == [("m", ["h3"], [[0.25, 0.75]])]
+        assert client.post("/v2/cache/upsert", json={"model": "m"}).status_code == 415
+        mismatched = client.post(
+            "/v2/cache/upsert",
+            content=encode_vector_frame({"model": "m", "text_hashes": []}, [[0.25, 0.75]]),
+            headers={"Content-Type": VECTOR_FRAME_CONTENT_TYPE},
+        )
+        assert mismatched.status_code == 422
         monkeypatch.setenv("TOPICLINK_ZVEC_MIN_DOC_COUNT", "8")
         underfilled = client.get("/health/ready")
         assert underfilled.status_code == 503
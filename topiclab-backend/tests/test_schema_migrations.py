@@ -0,0 +1,124 @@
+import threading
+
+import pytest
+from sqlalchemy import text
+
+
+@pytest.fixture
+def ledger_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOPICLAB_TESTING", "1")
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'ledger.sqlite3'}")
+
+    from app.storage.database import postgres_client
+
+    postgres_client.reset_db_state()
+    yield tmp_path
+    postgres_client.reset_db_state()
+
+
+def _counting_migrations(tmp_path, calls: list[str], *, alpha_version: int = 1):
+    from app.storage.database.schema_migrations import SchemaMigration
+
+    return tmp_path, (
+        SchemaMigration(name="alpha", version=alpha_version, apply=lambda: calls.append("alpha")),
+        SchemaMigration(name="beta", version=1, apply=lambda: calls.append("beta")),
+    )
+
+
+def test_schema_migrations_are_recorded_and_skipped_once_current(ledger_db):
+    from app.storage.database.postgres_client import get_db_session
+    from app.storage.database.schema_migrations import pending_migrations, run_schema_migrations
+
+    calls: list[str] = []
+    _, migrations = _counting_migrations(ledger_db, calls)
+
+    assert [migration.name for migration in pending_migrations(migrations)] == ["alpha", "beta"]
+    assert run_schema_migrations(migrations) == ["alpha", "beta"]
+    assert run_schema_migrations(migrations) == []
+    assert calls == ["alpha", "beta"]
+    assert pending_migrations(migrations) == []
+
+    with get_db_session() as session:
+        rows = session.execute(text("SELECT name, version FROM schema_migrations ORDER BY name")).fetchall()
+    assert [(row.name, row.version) for row in rows] == [("alpha", 1), ("beta", 1)]
+
+
+def test_schema_migration_reruns_only_when_its_version_is_bumped(ledger_db):
+    from app.storage.database.schema_migrations import run_schema_migrations
+
+    calls: list[str] = []
+    _, migrations = _counting_migrations(ledger_db, calls)
+    run_schema_migrations(migrations)
+    assert run_schema_migrations(migrations) == []
+
+    _, migrations = _counting_migrations(ledger_db, calls, alpha_version=2)
+
+    assert run_schema_migrations(migrations) == ["alpha"]
+    assert calls == ["alpha", "beta", "alpha"]
+    assert run_schema_migrations(migrations, force=True) == ["alpha", "beta"]
+
+
+def test_concurrent_startups_apply_each_migration_once(ledger_db):
+    from app.storage.database.schema_migrations import SchemaMigration, run_schema_migrations
+
+    calls: list[str] = []
+    entered = threading.Event()
+
+    def slow_step():
+        entered.set()
+        calls.append("slow")
+
+    migrations = (SchemaMigration(name="slow", version=1, apply=slow_step),)
+    results: list[list[str]] = []
+    threads = [threading.Thread(target=lambda: results.append(run_schema_migrations(migrations))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert entered.is_set()
+    assert calls == ["slow"]
+    assert sorted(results, key=len) == [[], [], [], ["slow"]]
+
+
+def test_startup_only_reads_ledger_when_migrate_on_startup_is_disabled(ledger_db, monkeypatch):
+    from app.storage.database import schema_migrations
+
+    calls: list[str] = []
+    _, migrations = _counting_migrations(ledger_db, calls)
+    monkeypatch.setenv("TOPICLAB_SCHEMA_MIGRATE_ON_STARTUP", "0")
+
+    assert schema_migrations.ensure_schema_current(migrations) == []
+    assert calls == []
+
+    monkeypatch.setenv("TOPICLAB_SCHEMA_MIGRATE_ON_STARTUP", "1")
+    assert schema_migrations.ensure_schema_current(migrations) == ["alpha", "beta"]
+    assert schema_migrations.ensure_schema_current(migrations) == []
+    assert calls == ["alpha", "beta"]
+
+
+def test_default_schema_migrations_build_real_tables(ledger_db):
+    from app.storage.database.postgres_client import get_db_session
+    from app.storage.database.schema_migrations import SCHEMA_MIGRATIONS, pending_migrations, run_schema_migrations
+
+    assert run_schema_migrations() == [migration.name for migration in SCHEMA_MIGRATIONS]
+    assert pending_migrations() == []
+
+    with get_db_session() as session:
+        tables = {
+            row[0]
+            for row in session.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'")).fetchall()
+        }
+    assert {"users", "topics", "posts", "schema_migrations"} <= tables
+
+
+def test_ledger_read_errors_other_than_a_missing_table_are_not_swallowed(ledger_db, monkeypatch):
+    from app.storage.database import schema_migrations
+    from app.storage.database.postgres_client import get_db_session
+
+    assert schema_migrations.read_applied_migrations() == {}
+    with get_db_session() as session:
+        session.execute(text("CREATE TABLE schema_migrations (name VARCHAR(64) PRIMARY KEY)"))
+
+    with pytest.raises(Exception, match="version"):
+        schema_migrations.read_applied_migrations()
@@ -53,7 +53,7 @@ def test_science_mcp_catalog_search_and_categories():
 
 def test_science_mcp_catalog_uses_indexed_runtime_database(monkeypatch):
     from app.services import science_mcp_catalog as catalog
-    from app.services.science_mcp_catalog_db import open_catalog_database
+    from app.services.science_mcp_catalog_db import catalog_connection
 
     database = catalog._runtime_database_path()
     assert database is not None
@@ -73,7 +73,7 @@ def test_science_mcp_catalog_uses_indexed_runtime_database(monkeypatch):
     assert catalog.get_mcp_catalog_item(result["list"][0]["id"])["id"] == result["list"][0]["id"]
     assert sum(catalog.get_mcp_catalog_categories()["status_counts"].values()) == 5643
 
-    with open_catalog_database(database) as connection:
+    with catalog_connection(database) as connection:
         indexes = connection.execute("PRAGMA index_list(mcps)").fetchall()
         unique_index_columns = [
             [column[2] for column in connection.execute(f'PRAGMA index_info("{row[1]}")')]
@@ -92,3 +92,45 @@ def test_science_mcp_catalog_missing_detail_is_404():
 def test_science_mcp_catalog_normalizes_canonical_identity_without_rewriting_evidence():
     assert normalize_canonical_url("HTTPS://Example.COM:443/research/mcp/#readme") == "https://example.com/research/mcp"
     assert normalize_canonical_url("http://example.com:8080/research/mcp/?view=raw#tools") == "http://example.com:8080/research/mcp?view=raw"
+
+
+def test_catalog_connection_pool_batches_hydration_and_reuses_decompressed_payloads(tmp_path):
+    import json
+    import sqlite3
+    import zlib
+
+    from app.services.science_mcp_catalog_db import catalog_connection, load_catalog_payloads
+
+    database = tmp_path / "catalog.sqlite3"
+    with sqlite3.connect(database) as connection:
+        connection.execute("CREATE TABLE mcps (id TEXT PRIMARY KEY, payload BLOB NOT NULL)")
+        connection.executemany(
+            "INSERT INTO mcps(id, payload) VALUES (?, ?)",
+            [
+                (f"mcp-{index}", zlib.compress(json.dumps({"id": f"mcp-{index}", "rank": index}).encode("utf-8")))
+                for index in range(600)
+            ],
+        )
+
+    with catalog_connection(database) as first:
+        pass
+    with catalog_connection(database) as second:
+        assert second is first
+        statements: list[str] = []
+        second.set_trace_callback(statements.append)
+
+    ids = [f"mcp-{index}" for index in range(600)] + ["missing"]
+    payloads = load_catalog_payloads(database, "mcps", ids)
+    assert len(payloads) == 600
+    assert payloads["mcp-599"] == {"id": "mcp-599", "rank": 599}
+    assert [statement.split(" WHERE")[0] for statement in statements] == ["SELECT id, payload FROM mcps"] * 2
+
+    statements.clear()
+    payloads["mcp-599"]["rank"] = -1
+    again = load_catalog_payloads(database, "mcps", ["mcp-598", "mcp-599"])
+    assert statements == []
+    assert again["mcp-599"] == {"id": "mcp-599", "rank": 599}
+    # The LRU is bounded, so the oldest decompressed payloads go back to SQLite.
+    load_catalog_payloads(database, "mcps", ["mcp-0"])
+    assert len(statements) == 1
+    first.set_trace_callback(None)
@@ -1,4 +1,5 @@
 import importlib
+import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -87,6 +88,162 @@ def test_critic_worker_url_supports_local_process_override(monkeypatch):
     assert critic_evaluation._worker_url() == "http://127.0.0.1:8090"
 
 
+def test_skill_hub_seed_sync_skips_unchanged_and_preserves_counters(client, monkeypatch):
+    import app.services.skill_hub as skill_hub
+    from app.services.openclaw_runtime import ensure_primary_openclaw_agent
+    from app.storage.database.postgres_client import get_db_session
+
+    owner = register_and_login(client, phone="13800019992", username="seed-keeper")
+    with get_db_session() as session:
+        agent = ensure_primary_openclaw_agent(int(owner["user"]["id"]), username="seed-keeper", phone="13800019992", session=session)
+        session.execute(text("UPDATE skill_hub_skills SET total_downloads = 42 WHERE slug = 'research-dream'"))
+        skill_hub._record_task_event(session, openclaw_agent_id=int(agent["id"]), task_key="review_a_skill", target_id="kept")
+
+    assert skill_hub.ensure_skill_hub_seed_data() == {"applied": False, "changed": [], "removed": []}
+
+    changed_tasks = tuple(
+        {**task, "title": "提交一条结构化评测"} if task["task_key"] == "review_a_skill" else task
+        for task in skill_hub.DEFAULT_TASK_DEFS
+    )
+    monkeypatch.setattr(skill_hub, "DEFAULT_TASK_DEFS", changed_tasks)
+    result = skill_hub.ensure_skill_hub_seed_data()
+    assert result["applied"] is True
+    assert result["changed"] == ["task:review_a_skill"]
+
+    with get_db_session() as session:
+        title = session.execute(
+            text("SELECT title FROM skill_hub_task_defs WHERE task_key = 'review_a_skill'")
+        ).scalar_one()
+        events = session.execute(text("SELECT COUNT(*) FROM skill_hub_task_events WHERE target_id = 'kept'")).scalar_one()
+        downloads = session.execute(
+            text("SELECT total_downloads FROM skill_hub_skills WHERE slug = 'research-dream'")
+        ).scalar_one()
+        collection_items = session.execute(text("SELECT COUNT(*) FROM skill_hub_collection_items")).scalar_one()
+    assert title == "提交一条结构化评测"
+    assert events == 1
+    assert downloads == 42
+    assert collection_items == 1
+
+    assert skill_hub.ensure_skill_hub_seed_data()["applied"] is False
+
+
+def test_skill_hub_seed_sync_prunes_skills_removed_from_the_seed(client, monkeypatch):
+    import app.services.skill_hub as skill_hub
+    from app.storage.database.postgres_client import get_db_session
+
+    load_seed_entities = skill_hub._load_seed_entities
+    dropped = "retired-seed-skill"
+
+    def with_extra_skill():
+        sources, checksums = load_seed_entities()
+        extra = {**sources[0], "slug": dropped, "legacy_id": None, "name": "Retired Seed Skill"}
+        checksums[f"skill:{dropped}"] = skill_hub._seed_checksum(extra)
+        return [*sources, extra], checksums
+
+    monkeypatch.setattr(skill_hub, "_load_seed_entities", with_extra_skill)
+    skill_hub.ensure_skill_hub_seed_data()
+    assert client.get(f"/api/v1/skill-hub/skills/{dropped}").status_code == 200
+    user = register_and_login(client, phone="13800010099", username="seed-downloader")
+    download = client.get(f"/api/v1/skill-hub/skills/{dropped}/download", headers={"Authorization": f"Bearer {user['token']}"})
+    assert download.status_code == 200, download.text
+
+    monkeypatch.setattr(skill_hub, "_load_seed_entities", load_seed_entities)
+    result = skill_hub.ensure_skill_hub_seed_data()
+
+    assert result["removed"] == [f"skill:{dropped}"]
+    with get_db_session() as session:
+        statuses = dict(
+            session.execute(
+                text("SELECT slug, status FROM skill_hub_skills WHERE slug IN (:dropped, 'research-dream')"),
+                {"dropped": dropped},
+            ).fetchall()
+        )
+        downloads = session.execute(
+            text(
+                "SELECT COUNT(*) FROM skill_hub_downloads d JOIN skill_hub_skills s ON s.id = d.skill_id "
+                "WHERE s.slug = :dropped"
+            ),
+            {"dropped": dropped},
+        ).scalar_one()
+    assert statuses == {"research-dream": "published", dropped: "archived"}
+    assert downloads == 1
+    assert client.get(f"/api/v1/skill-hub/skills/{dropped}").status_code == 404
+    assert all(item["slug"] != dropped for item in client.get("/api/v1/skill-hub/skills").json()["list"])
+
+    monkeypatch.setattr(skill_hub, "_load_seed_entities", with_extra_skill)
+    skill_hub.ensure_skill_hub_seed_data()
+    assert client.get(f"/api/v1/skill-hub/skills/{dropped}").status_code == 200
+
+
+def test_skill_hub_search_index_and_keyset_cursors(client, monkeypatch):
+    from app.services import skill_hub
+    from app.storage.database.postgres_client import get_db_session
+
+    with get_db_session() as session:
+        for index in range(7):
+            session.execute(
+                text(
+                    """
+                    INSERT INTO skill_hub_skills (
+                        slug, name, summary, description, category_key, category_name,
+                        cluster_key, cluster_name, tags_json, weekly_downloads, avg_rating, published_at
+                    )
+                    VALUES (
+                        :slug, :name, :summary, '用于分页测试', '07', '理学',
+                        'bio', '生物与生命科学', '["paging"]', :weekly, :rating, :published_at
+                    )
+                    """
+                ),
+                {
+                    "slug": f"paging-skill-{index}",
+                    "name": f"Paging Skill {index}",
+                    "summary": "单细胞转录组聚类" if index % 2 == 0 else "Protein structure search",
+                    "weekly": index % 3,
+                    "rating": 4.5 if index < 3 else 3.0,
+                    "published_at": f"2026-01-0{index + 1} 00:00:00",
+                },
+            )
+        session.execute(text("UPDATE skill_hub_skills SET summary = '蛋白质结构预测' WHERE slug = 'paging-skill-1'"))
+
+    cjk = client.get("/api/v1/skill-hub/search", params={"q": "细胞转录", "limit": 20})
+    assert cjk.status_code == 200, cjk.text
+    assert {item["slug"] for item in cjk.json()["list"]} == {f"paging-skill-{index}" for index in (0, 2, 4, 6)}
+    updated = client.get("/api/v1/skill-hub/search", params={"q": "蛋白质结构", "limit": 20}).json()
+    assert [item["slug"] for item in updated["list"]] == ["paging-skill-1"]
+    short = client.get("/api/v1/skill-hub/search", params={"q": "细胞", "limit": 20}).json()
+    assert short["total"] == 4
+    mixed_case = client.get("/api/v1/skill-hub/search", params={"q": "PROTEIN Struct", "limit": 20}).json()
+    assert {item["slug"] for item in mixed_case["list"]} == {"paging-skill-3", "paging-skill-5"}
+
+    for sort in ("new", "downloads", "stars", "top", "hot"):
+        expected = client.get("/api/v1/skill-hub/skills", params={"sort": sort, "cluster": "bio", "limit": 100}).json()
+        seen: list[str] = []
+        cursor = None
+        while True:
+            params = {"sort": sort, "cluster": "bio", "limit": 3}
+            if cursor:
+                params["cursor"] = cursor
+            page = client.get("/api/v1/skill-hub/skills", params=params)
+            assert page.status_code == 200, page.text
+            payload = page.json()
+            assert payload["total"] == expected["total"]
+            seen.extend(item["slug"] for item in payload["list"])
+            cursor = payload["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == [item["slug"] for item in expected["list"]]
+
+    first_new = client.get("/api/v1/skill-hub/skills", params={"sort": "new", "limit": 2}).json()
+    mismatched = client.get("/api/v1/skill-hub/skills", params={"sort": "hot", "cursor": first_new["next_cursor"]})
+    assert mismatched.status_code == 400
+    assert client.get("/api/v1/skill-hub/skills", params={"cursor": "not-a-cursor"}).status_code == 400
+
+    monkeypatch.setattr(skill_hub, "SKILL_HUB_EXACT_COUNT_CAP", 2)
+    capped = client.get("/api/v1/skill-hub/skills", params={"cluster": "bio", "limit": 1}).json()
+    assert capped["total"] == expected["total"]
+    assert capped["total_is_estimate"] is False
+
+
 def test_skill_hub_public_seeded_routes(client):
     skills = client.get("/api/v1/skill-hub/skills?limit=100&sort=new")
     assert skills.status_code == 200, skills.text
@@ -224,6 +381,7 @@ def test_science_catalog_sort_is_stable_and_source_review_aware(monkeypatch):
         },
     ]
     monkeypatch.setattr(science_skill_catalog, "_load_catalog", lambda: ({"skills": skills}, "digest"))
+    monkeypatch.setattr(science_skill_catalog, "_runtime_database_path", lambda: None)
 
     result = science_skill_catalog.list_catalog_skills(limit=10)
 
@@ -258,6 +416,7 @@ def test_science_catalog_search_matches_bilingual_field_tokens(monkeypatch):
         },
     ]
     monkeypatch.setattr(science_skill_catalog, "_load_catalog", lambda: ({"skills": skills}, "digest"))
+    monkeypatch.setattr(science_skill_catalog, "_runtime_database_path", lambda: None)
 
     english = science_skill_catalog.list_catalog_skills(q="protein structure", limit=10)
     chinese = science_skill_catalog.list_catalog_skills(q="蛋白质结构", limit=10)
@@ -266,6 +425,180 @@ def test_science_catalog_search_matches_bilingual_field_tokens(monkeypatch):
     assert [item["id"] for item in chinese["list"]] == ["protein-analysis"]
 
 
+def test_science_catalog_compiled_database_matches_json_search(tmp_path, monkeypatch):
+    from app.services import science_skill_catalog
+    from app.services.science_skill_catalog_db import build_catalog_database, database_matches_source
+
+    base = {"domain": "生命科学", "subdomain": "分子模拟", "stage": "分析验证", "function": "模拟建模"}
+    skills = [
+        {**base, "id": "protein-fold", "name": "Protein fold", "task": "蛋白质结构预测",
+         "readiness": "provisional", "review_status": "manual_confirmed", "quality_score": 95},
+        {**base, "id": "protein-docking", "name": "Protein docking", "task": "分子对接",
+         "readiness": "trusted", "review_status": "manual_confirmed", "quality_score": 80},
+        {**base, "id": "paper-writing", "name": "Paper writing", "task": "科研写作", "stage": "成果表达",
+         "readiness": "trusted", "review_status": "metadata_reviewed", "quality_score": 70},
+    ]
+    source = tmp_path / "science_skill_catalog.json"
+    source.write_text(
+        json.dumps({"schema": "science_skill_catalog_v1", "skill_count": 3, "dimensions": {}, "skills": skills}),
+        encoding="utf-8",
+    )
+    database = tmp_path / "science_skill_catalog.sqlite3"
+    assert build_catalog_database(source, database)[0] == 3
+    assert database_matches_source(source, database)
+
+    def unexpected_json_fallback():
+        raise AssertionError("compiled deployments must not load the full JSON catalog")
+
+    monkeypatch.setattr(science_skill_catalog, "_load_catalog", unexpected_json_fallback)
+    monkeypatch.setattr(science_skill_catalog, "_runtime_database_path", lambda: database)
+
+    listed = science_skill_catalog.list_catalog_skills(limit=10)
+    assert [item["id"] for item in listed["list"]] == ["protein-docking", "paper-writing", "protein-fold"]
+    assert listed["total"] == 3
+    searched = science_skill_catalog.list_catalog_skills(q="protein fold", limit=10)
+    assert searched["list"][0]["id"] == "protein-fold"
+    assert {item["id"] for item in searched["list"]} == {"protein-fold", "protein-docking"}
+    assert science_skill_catalog.list_catalog_skills(q="蛋白质结构", limit=10)["total"] == 1
+    # Stopword-only queries still match compact substrings, exactly like the JSON fallback.
+    assert science_skill_catalog.list_catalog_skills(q="科研", limit=10)["total"] == 1
+    assert science_skill_catalog.list_catalog_skills(stage="成果表达", limit=10)["total"] == 1
+    assert science_skill_catalog.get_catalog_skill("paper-writing")["task"] == "科研写作"
+    assert science_skill_catalog.get_catalog_meta()["total"] == 3
+    assert [item["id"] for item in science_skill_catalog.get_catalog_items()] == [
+        "protein-fold",
+        "protein-docking",
+        "paper-writing",
+    ]
+    assert science_skill_catalog.get_catalog_items() is science_skill_catalog.get_catalog_items()
+    hydrated = science_skill_catalog.hydrate_catalog_results([{"id": "paper-writing", "rank": 1}])
+    assert hydrated == [{**skills[2], "rank": 1}]
+    with pytest.raises(HTTPException):
+        science_skill_catalog.get_catalog_skill("missing")
+
+    source.write_text(source.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    assert not database_matches_source(source, database)
+
+
+def test_science_catalog_database_pages_match_json_search(tmp_path, monkeypatch):
+    from app.services import science_skill_catalog
+    from app.services.science_skill_catalog_db import build_catalog_database
+
+    database = tmp_path / "science_skill_catalog.sqlite3"
+    build_catalog_database(science_skill_catalog.CATALOG_PATH, database)
+
+    def collect(runtime_database, query: str) -> tuple[list[str], int]:
+        monkeypatch.setattr(science_skill_catalog, "_runtime_database_path", lambda: runtime_database)
+        ids: list[str] = []
+        offset = 0
+        while True:
+            page = science_skill_catalog.list_catalog_skills(q=query, limit=100, offset=offset)
+            ids.extend(item["id"] for item in page["list"])
+            offset += page["limit"]
+            if offset >= page["total"]:
+                return ids, page["total"]
+
+    for query in ("analysis", "data", "protein"):
+        database_ids, database_total = collect(database, query)
+        json_ids, json_total = collect(None, query)
+        assert len(database_ids) == len(set(database_ids)) == database_total
+        assert database_total == json_total
+        assert database_ids == json_ids
+
+
+def test_science_finder_bm25_index_scores_only_matching_postings():
+    from app.services import science_skill_finder
+
+    base = {"domain": "生命科学", "stage": "执行采集", "function": "模拟建模", "summary": ""}
+    items = [
+        {**base, "id": "protein-fold", "name": "Protein fold", "task": "蛋白质结构预测"},
+        {**base, "id": "protein-notes", "name": "Lab notes", "summary": "mentions protein once among many other words here"},
+        {**base, "id": "docking", "name": "Docking", "task": "分子对接", "stage": "分析验证"},
+    ]
+    index = science_skill_finder.build_catalog_index(items)
+
+    assert index.document_frequency("protein") == 2
+    assert index.document_frequency("蛋白质") == 1
+    scores = index.bm25({"protein", "蛋白质"})
+    assert set(scores) == {0, 1}
+    assert scores[0] > scores[1] > 0
+    assert index.bm25({"absent-token"}) == {}
+    assert index.dimension_members[("stage", "分析验证")] == frozenset({2})
+    assert "proteinfold" in index.compact_names
+
+
+def test_science_catalog_vectors_round_trip_and_reject_stale_files(tmp_path):
+    from app.services.science_catalog_vectors import (
+        embed_catalog,
+        read_vector_file,
+        reciprocal_rank_fusion,
+        write_vector_file,
+    )
+
+    items = [
+        {"id": "protein-fold", "name": "Protein folding", "task": "蛋白质结构预测"},
+        {"id": "single-cell", "name": "Single-cell clustering", "task": "单细胞测序聚类"},
+        {"id": "paper-writing", "name": "Paper writing", "task": "科研写作"},
+    ]
+    vectors = embed_catalog(items, source_sha256="a" * 64)
+    destination = tmp_path / "catalog.vectors.f32"
+    write_vector_file(vectors, destination)
+
+    loaded = read_vector_file(destination, source_sha256="a" * 64, expected_rows=3)
+    assert loaded is not None
+    assert (loaded.matrix == vectors.matrix).all()
+    assert read_vector_file(destination, source_sha256="b" * 64, expected_rows=3) is None
+    assert read_vector_file(destination, source_sha256="a" * 64, expected_rows=4) is None
+    assert read_vector_file(tmp_path / "missing.f32", source_sha256="a" * 64, expected_rows=3) is None
+
+    assert loaded.nearest(loaded.embed("proteins fold"), limit=3, minimum=0.1)[0][0] == 0
+    assert loaded.nearest(loaded.embed("单细胞"), limit=3, minimum=0.1)[0][0] == 1
+    assert loaded.nearest(loaded.embed("zzqvorn"), limit=3, minimum=0.1) == []
+
+    fused = reciprocal_rank_fusion([[0, 1], [1, 2]], k=60)
+    assert max(fused, key=fused.get) == 1
+    assert fused[0] == pytest.approx(1 / 61)
+
+
+def test_science_finder_skips_model_when_lexical_and_vector_retrieval_agree(client, monkeypatch):
+    import asyncio
+
+    from app.services import science_skill_finder
+
+    monkeypatch.setenv("SCNET_API_KEY", "test-key")
+
+    async def unexpected_model_call(*args, **kwargs):
+        raise AssertionError("an unambiguous catalog hit must not call the model")
+
+    monkeypatch.setattr(science_skill_finder, "_route_with_agentscope", unexpected_model_call)
+    confident_match = science_skill_finder._confident_local_match
+    on_event_loop: list[bool] = []
+
+    def tracked_confident_match(query):
+        try:
+            asyncio.get_running_loop()
+            on_event_loop.append(True)
+        except RuntimeError:
+            on_event_loop.append(False)
+        return confident_match(query)
+
+    monkeypatch.setattr(science_skill_finder, "_confident_local_match", tracked_confident_match)
+    owner = register_and_login(client, phone="13800019996", username="hybrid-finder-viewer")
+    response = client.post(
+        "/api/v1/skill-hub/science-catalog/find",
+        json={"query": "AlphaFold2", "limit": 3},
+        headers={"Authorization": f"Bearer {owner['token']}"},
+    )
+
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert payload["driver"]["mode"] == "hybrid_local"
+    assert payload["results"][0]["id"] == "alphafold2"
+    assert payload["results"][0]["ranking_signals"]["vector_match"] > 0.45
+    assert {"key": "vector_match", "label": "语义相近"} in payload["ranking"]["criteria"]
+    assert on_event_loop == [False]
+
+
 def test_science_finder_uses_agentscope_only_for_valid_taxonomy_routing(client, monkeypatch):
     from app.services import science_skill_finder
 
@@ -401,6 +734,136 @@ def test_science_finder_streams_route_and_recommendations(client, monkeypatch):
     assert '"skill_mounted":true' in text
 
 
+def test_science_finder_stream_replays_cached_results_without_new_search(client, monkeypatch):
+    from app.api import skill_hub
+
+    calls = []
+    result = {
+        "query": "Protein  Structure",
+        "route": {"domain": "生命科学", "stage": None, "function": None, "search_terms": [], "rationale": ""},
+        "results": [{"id": "alphafold2", "name": "AlphaFold2"}],
+        "total": 1,
+        "ranking": {"criteria": []},
+        "driver": {"mode": "local_fallback"},
+    }
+
+    async def fake_find(query, *, limit, on_event=None, allow_model=True):
+        calls.append(query)
+        if on_event is not None:
+            await on_event("route", result["route"])
+            await on_event("result", result["results"][0])
+        return result
+
+    monkeypatch.setattr(skill_hub, "find_science_skills", fake_find)
+    first = client.post("/api/v1/skill-hub/science-catalog/find", json={"query": "Protein  Structure", "limit": 5})
+    assert first.status_code == 200, first.text
+    assert "cached" not in first.json()["driver"]
+
+    stream = client.post(
+        "/api/v1/skill-hub/science-catalog/find/stream",
+        json={"query": "protein structure", "limit": 5},
+    )
+    assert stream.status_code == 200, stream.text
+    text = stream.text
+    assert calls == ["Protein  Structure"]
+    assert text.index("event: route") < text.index("event: result") < text.index("event: done")
+    assert '"id":"alphafold2"' in text
+    assert '"cached":true' in text
+    assert '"query":"protein structure"' in text
+
+    other_limit = client.post("/api/v1/skill-hub/science-catalog/find", json={"query": "protein structure", "limit": 3})
+    assert other_limit.status_code == 200
+    assert len(calls) == 2
+
+
+def test_science_finder_cache_coalesces_identical_searches_and_skips_degraded_results(monkeypatch):
+    import asyncio
+
+    from app.services import science_finder_cache
+
+    versions = {"current": "catalog-a:GLM-5.2"}
+    calls: list[str] = []
+
+    async def run(query: str, *, mode: str = "model", delay: float = 0.05):
+        async def compute():
+            calls.append(query)
+            await asyncio.sleep(delay)
+            return {"query": query, "route": {}, "results": [{"id": "x"}], "driver": {"mode": mode}}
+
+        return await science_finder_cache.cached_finder_result(
+            "skill",
+            query,
+            limit=5,
+            allow_model=True,
+            version=lambda: versions["current"],
+            compute=compute,
+        )
+
+    async def scenario():
+        concurrent = await asyncio.gather(*(run("单细胞") for _ in range(5)))
+        assert calls == ["单细胞"]
+        assert sorted(cached for _, cached in concurrent) == [False, True, True, True, True]
+        assert (await run(" 单细胞 "))[1] is True
+
+        versions["current"] = "catalog-b:GLM-5.2"
+        assert (await run("单细胞"))[1] is False
+        assert len(calls) == 2
+
+        assert (await run("degraded", mode="model_route_local_rank"))[1] is False
+        assert (await run("degraded", mode="model_route_local_rank"))[1] is False
+        assert calls.count("degraded") == 2
+
+        key = science_finder_cache.finder_cache_key(
+            "skill", "peer", limit=5, allow_model=True, version=versions["current"]
+        )
+        assert science_finder_cache.FINDER_CACHE.acquire_lease(key, "other-worker")
+
+        async def peer_worker_finishes():
+            await asyncio.sleep(0.1)
+            science_finder_cache.FINDER_CACHE.write(
+                key,
+                kind="skill",
+                version=versions["current"],
+                payload='{"query":"peer","route":{},"results":[],"driver":{"mode":"model"}}',
+                ttl=60,
+            )
+
+        waiter, _ = await asyncio.gather(run("peer"), peer_worker_finishes())
+        assert waiter[1] is True
+        assert "peer" not in calls
+
+    asyncio.run(scenario())
+
+    monkeypatch.setenv("SCIENCE_FINDER_CACHE_TTL_SECONDS", "0")
+    calls.clear()
+    assert asyncio.run(run("单细胞"))[1] is False
+    assert calls == ["单细胞"]
+
+
+def test_science_finder_cache_creates_its_directory_and_closes_connections(tmp_path, monkeypatch):
+    import sqlite3
+
+    from app.services import science_finder_cache, single_flight_cache
+
+    monkeypatch.setenv("SCIENCE_FINDER_CACHE_PATH", str(tmp_path / "fresh" / "nested" / "cache.sqlite3"))
+    opened: list[sqlite3.Connection] = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        connection = connect(*args, **kwargs)
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(single_flight_cache.sqlite3, "connect", tracking_connect)
+    science_finder_cache.FINDER_CACHE.write("key", kind="skill", version="v1", payload="{}", ttl=60)
+    assert science_finder_cache.FINDER_CACHE.read("key") == "{}"
+
+    assert len(opened) == 2
+    for connection in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+
 def test_science_finder_supports_legacy_deploy_env_during_migration(monkeypatch):
     from app.services import science_skill_finder
 
@@ -1021,6 +1484,166 @@ def test_skill_hub_download_wish_vote_and_points(client):
     leaderboard = client.get("/api/v1/skill-hub/leaderboard")
     assert leaderboard.status_code == 200, leaderboard.text
     assert any(item["slug"] == slug for item in leaderboard.json()["skills"])
+    users = leaderboard.json()["users"]
+    buyer_stats = next(item for item in users if item["id"] == int(agent["id"]))
+    assert buyer_stats["total_downloads"] == 1
+    assert buyer_stats["total_skills"] == 0
+    assert sum(item["total_skills"] for item in users) == 1
+
+    from app.services.skill_hub import rebuild_agent_leaderboard_stats
+
+    with get_db_session() as session:
+        session.execute(text("UPDATE skill_hub_agent_stats SET total_downloads = 99"))
+        rebuild_agent_leaderboard_stats(session)
+    rebuilt = client.get("/api/v1/skill-hub/leaderboard").json()["users"]
+    assert [(item["id"], item["total_skills"], item["total_downloads"]) for item in rebuilt] == [
+        (item["id"], item["total_skills"], item["total_downloads"]) for item in users
+    ]
+
+
+def test_skill_hub_hot_score_and_rolling_counters_decay(client):
+    from app.services import skill_hub
+    from app.storage.database.postgres_client import get_db_session
+
+    owner = register_and_login(client, phone="13800010005", username="trend-owner")
+    reviewer = register_and_login(client, phone="13800010006", username="trend-reviewer")
+    publish = client.post(
+        "/api/v1/skill-hub/skills",
+        headers={"Authorization": f"Bearer {owner['token']}"},
+        data={
+            "name": "Trending Atlas",
+            "summary": "滚动窗口计数测试。",
+            "description": "用于测试 hot_score 与周榜计数。",
+            "category_key": "07",
+            "cluster_key": "bio",
+            "content_markdown": "# Trending Atlas\n\nBody.",
+        },
+    )
+    assert publish.status_code == 200, publish.text
+    slug = publish.json()["slug"]
+    for token in (owner["token"], reviewer["token"]):
+        download = client.get(f"/api/v1/skill-hub/skills/{slug}/download", headers={"Authorization": f"Bearer {token}"})
+        assert download.status_code == 200, download.text
+    review = client.post(
+        "/api/v1/skill-hub/reviews",
+        headers={"Authorization": f"Bearer {reviewer['token']}"},
+        json={"skill_id": slug, "rating": 5, "content": "窗口计数和热度分数都按预期更新，值得推荐。"},
+    )
+    assert review.status_code == 200, review.text
+
+    detail = client.get(f"/api/v1/skill-hub/skills/{slug}").json()
+    assert (detail["weekly_downloads"], detail["monthly_downloads"]) == (2, 2)
+    assert (detail["weekly_reviews"], detail["monthly_reviews"]) == (1, 1)
+    with get_db_session() as session:
+        hot_score = session.execute(text("SELECT hot_score FROM skill_hub_skills WHERE slug = :slug"), {"slug": slug}).scalar_one()
+    assert hot_score == 2 * 2 + 0 + 1
+
+    trending = client.get("/api/v1/skill-hub/skills", params={"sort": "trending", "limit": 1}).json()
+    assert trending["list"][0]["slug"] == slug
+
+    with get_db_session() as session:
+        skill_id = session.execute(text("SELECT id FROM skill_hub_skills WHERE slug = :slug"), {"slug": slug}).scalar_one()
+        ten_days_ago = (datetime.now(timezone.utc) - timedelta(days=10)).date().isoformat()
+        session.execute(
+            text("UPDATE skill_hub_skill_daily_stats SET bucket_day = :day WHERE skill_id = :skill_id"),
+            {"day": ten_days_ago, "skill_id": skill_id},
+        )
+        assert skill_hub.refresh_skill_trending_scores(session) >= 1
+        assert skill_hub.refresh_skill_trending_scores(session) == 0
+    decayed = client.get(f"/api/v1/skill-hub/skills/{slug}").json()
+    assert (decayed["weekly_downloads"], decayed["monthly_downloads"]) == (0, 2)
+    assert (decayed["weekly_reviews"], decayed["monthly_reviews"]) == (0, 1)
+    with get_db_session() as session:
+        hot_score = session.execute(text("SELECT hot_score FROM skill_hub_skills WHERE slug = :slug"), {"slug": slug}).scalar_one()
+        assert hot_score == 1
+        skill_hub.rebuild_skill_trending_stats(session)
+        buckets = session.execute(
+            text("SELECT downloads, reviews FROM skill_hub_skill_daily_stats WHERE skill_id = :skill_id"),
+            {"skill_id": skill_id},
+        ).fetchall()
+    assert [(row.downloads, row.reviews) for row in buckets] == [(2, 1)]
+    assert client.get(f"/api/v1/skill-hub/skills/{slug}").json()["weekly_downloads"] == 2
+
+
+def test_skill_hub_trending_refresh_runs_only_on_the_lease_holder(client, monkeypatch):
+    import asyncio
+
+    import app.services.skill_hub as skill_hub
+    from app.storage.database import worker_leases
+
+    refreshed = []
+    # The app lifespan started its own worker on the client's loop; drive a fresh one here instead.
+    monkeypatch.setattr(skill_hub, "_trending_worker_task", None)
+    monkeypatch.setattr(skill_hub, "_trending_worker_stop", None)
+    monkeypatch.setattr(skill_hub, "refresh_skill_trending_scores", lambda: refreshed.append(skill_hub._trending_worker_owner))
+    monkeypatch.setattr(skill_hub, "_rebuild_agent_leaderboard_stats_if_due", lambda: refreshed.append("stats"))
+    assert worker_leases.acquire_worker_lease(skill_hub.SKILL_HUB_TRENDING_LEASE_NAME, "other-worker", 600) is True
+
+    async def run_ticks(count):
+        stop_event = asyncio.Event()
+        task = asyncio.create_task(skill_hub._skill_hub_trending_worker_loop(stop_event, 0.01))
+        while len(refreshed) < count and not task.done():
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        stop_event.set()
+        await task
+
+    asyncio.run(run_ticks(0))
+    assert refreshed == []
+    assert skill_hub._trending_worker_leader is False
+
+    worker_leases.release_worker_lease(skill_hub.SKILL_HUB_TRENDING_LEASE_NAME, "other-worker")
+    asyncio.run(run_ticks(1))
+    assert refreshed
+    assert skill_hub._trending_worker_leader is True
+    assert worker_leases.acquire_worker_lease(skill_hub.SKILL_HUB_TRENDING_LEASE_NAME, "other-worker", 600) is False
+
+    asyncio.run(skill_hub.stop_skill_hub_trending_worker())
+    assert worker_leases.acquire_worker_lease(skill_hub.SKILL_HUB_TRENDING_LEASE_NAME, "other-worker", 600) is True
+
+
+def test_skill_hub_lease_holder_rebuilds_drifted_agent_stats(client, monkeypatch):
+    import app.services.skill_hub as skill_hub
+    from app.storage.database.postgres_client import get_db_session
+
+    owner = register_and_login(client, phone="13800010007", username="stats-owner")
+    publish = client.post(
+        "/api/v1/skill-hub/skills",
+        headers={"Authorization": f"Bearer {owner['token']}"},
+        data={
+            "name": "Stats Drift",
+            "summary": "排行计数重算测试。",
+            "description": "用于测试级联删除后的计数修正。",
+            "category_key": "07",
+            "cluster_key": "bio",
+            "content_markdown": "# Stats Drift\n\nBody.",
+        },
+    )
+    assert publish.status_code == 200, publish.text
+    slug = publish.json()["slug"]
+    download = client.get(f"/api/v1/skill-hub/skills/{slug}/download", headers={"Authorization": f"Bearer {owner['token']}"})
+    assert download.status_code == 200, download.text
+
+    def stats():
+        users = client.get("/api/v1/skill-hub/leaderboard").json()["users"]
+        return {item["id"]: (item["total_skills"], item["total_downloads"]) for item in users}
+
+    with get_db_session() as session:
+        agent_id = session.execute(
+            text("SELECT author_openclaw_agent_id FROM skill_hub_skills WHERE slug = :slug"), {"slug": slug}
+        ).scalar_one()
+        session.execute(text("DELETE FROM skill_hub_downloads WHERE openclaw_agent_id = :agent_id"), {"agent_id": agent_id})
+    assert stats()[agent_id] == (1, 1)
+
+    monkeypatch.setattr(skill_hub, "_agent_stats_rebuilt_at", None)
+    monkeypatch.setenv("SKILL_HUB_AGENT_STATS_REBUILD_SECONDS", "3600")
+    assert skill_hub._rebuild_agent_leaderboard_stats_if_due() is True
+    assert stats()[agent_id] == (1, 0)
+    assert skill_hub._rebuild_agent_leaderboard_stats_if_due() is False
+
+    monkeypatch.setenv("SKILL_HUB_AGENT_STATS_REBUILD_SECONDS", "0")
+    monkeypatch.setattr(skill_hub, "_agent_stats_rebuilt_at", None)
+    assert skill_hub._rebuild_agent_leaderboard_stats_if_due() is False
 
 
 def test_claude_scientific_taxonomy_json_covers_meta_and_valid_keys():
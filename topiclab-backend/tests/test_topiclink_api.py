@@ -1,17 +1,29 @@
 import asyncio
+import hashlib
 import importlib
+import json
+import math
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
+import httpx
 import pytest
 from fastapi import HTTPException
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session
 
 from app.api import topiclink
+from app.services import embedding_batcher
+from app.services.embedding_lru import EmbeddingLRU
+from app.services.topiclink_vector_codec import (
+    VECTOR_FRAME_CONTENT_TYPE,
+    VectorFrameError,
+    decode_vector_frame,
+    encode_vector_frame,
+)
 
 
 def test_topiclink_task_schema_requeues_claims_created_before_lease_tokens():
@@ -191,37 +203,57 @@ def test_topiclink_embedding_cache_round_trips_through_zvec_only(topiclink_clien
 
 
 def test_topiclink_embedding_cache_uses_internal_zvec_service(monkeypatch):
-    calls: list[tuple[str, str, dict | None]] = []
+    calls: list[tuple[str, str, object]] = []
     vector = [0.25, -0.5, 0.75]
 
-    class FakeResponse:
-        def __init__(self, payload):
-            self.payload = payload
-
-        def raise_for_status(self):
-            return None
-
-        def json(self):
-            return self.payload
-
-    def fake_request(method, url, *, json=None, timeout=None):
-        calls.append((method, url, json))
-        if url.endswith("/cache/fetch"):
-            return FakeResponse({"vectors": [vector]})
-        if url.endswith("/cache/upsert"):
-            return FakeResponse({"written": 1})
-        return FakeResponse({"status": "ready"})
+    def sidecar(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.headers.get("content-type") == VECTOR_FRAME_CONTENT_TYPE:
+            body = decode_vector_frame(request.content)
+        else:
+            body = json.loads(request.content) if request.content else None
+        calls.append((request.method, str(request.url), body))
+        if path == "/v2/cache/fetch":
+            return httpx.Response(
+                200,
+                content=encode_vector_frame({"model": body["model"]}, [vector for _ in body["text_hashes"]]),
+                headers={"Content-Type": VECTOR_FRAME_CONTENT_TYPE},
+            )
+        if path == "/v2/cache/upsert":
+            return httpx.Response(200, json={"written": len(body[1])})
+        return httpx.Response(200, json={"status": "ready"})
 
     monkeypatch.setenv("TOPICLINK_ZVEC_SERVICE_URL", "http://topiclink-zvec:8000/")
-    monkeypatch.setattr(topiclink.httpx, "request", fake_request)
+    monkeypatch.setattr(topiclink, "_zvec_service_client", httpx.Client(transport=httpx.MockTransport(sidecar)))
+    monkeypatch.setattr(
+        topiclink,
+        "get_shared_async_client",
+        lambda name, uds=None: httpx.AsyncClient(transport=httpx.MockTransport(sidecar)),
+    )
 
     assert topiclink._read_embedding_cache("model", ["text"]) == [vector]
     topiclink._write_embedding_cache("model", ["text"], [vector])
     topiclink.probe_topiclink_storage(None)
+    assert asyncio.run(topiclink._read_embedding_cache_async("model", ["text", "other"])) == [vector, vector]
 
-    assert [call[0] for call in calls] == ["POST", "POST", "GET"]
-    assert calls[0][1] == "http://topiclink-zvec:8000/cache/fetch"
-    assert calls[1][2] == {"model": "model", "inputs": ["text"], "vectors": [vector]}
+    text_hash = topiclink._embedding_cache_key("model", "text")[1]
+    assert [call[0] for call in calls] == ["POST", "POST", "GET", "POST"]
+    assert calls[0][1] == "http://topiclink-zvec:8000/v2/cache/fetch"
+    assert calls[0][2] == {"model": "model", "text_hashes": [text_hash]}
+    assert calls[1][2] == ({"model": "model", "text_hashes": [text_hash]}, [vector])
+    assert len(calls[3][2]["text_hashes"]) == 2
+
+
+def test_topiclink_vector_frames_round_trip_missing_rows_and_reject_truncation():
+    vectors = [[0.25, -0.5, 0.75], None, [1.0, 2.0]]
+    frame = encode_vector_frame({"model": "m"}, vectors)
+
+    assert decode_vector_frame(frame) == ({"model": "m"}, vectors)
+    assert len(encode_vector_frame({}, [[0.0] * 4096])) < 4096 * 4 + 64
+    with pytest.raises(VectorFrameError):
+        decode_vector_frame(frame[:-1])
+    with pytest.raises(VectorFrameError):
+        decode_vector_frame(b"JSON" + frame[4:])
 
 
 def test_topiclink_web_process_delegates_background_worker_to_zvec_service(monkeypatch):
@@ -271,11 +303,85 @@ def test_topiclink_zvec_refreshes_hits_and_prunes_stale_vectors(topiclink_client
     assert fetched[active_id].fields["last_used_at"] > "2026-07-01T00:00:00Z"
 
 
+def test_topiclink_zvec_cache_hits_buffer_last_used_until_flushed(topiclink_client, monkeypatch):
+    import zvec
+
+    model = "Qwen3-Embedding-8B"
+    texts = ["first cached TopicLink text", "second cached TopicLink text"]
+    topiclink._write_embedding_cache(model, texts, [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    kept_id, pruned_id = [
+        topiclink._topiclink_zvec_document_id(topiclink._embedding_cache_key(model, text)[0]) for text in texts
+    ]
+    collection = topiclink._zvec_collection
+    collection.update(
+        [zvec.Doc(id=document_id, fields={"last_used_at": "2026-07-01T00:00:00Z"}) for document_id in (kept_id, pruned_id)]
+    )
+    writes = []
+
+    class RecordingCollection:
+        def __getattr__(self, name):
+            return getattr(collection, name)
+
+        def update(self, documents):
+            writes.append(sorted(document.id for document in documents))
+            return collection.update(documents)
+
+    monkeypatch.setattr(topiclink, "_zvec_collection", RecordingCollection())
+
+    for _ in range(3):
+        assert topiclink._read_embedding_cache(model, texts) == [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+
+    assert writes == []
+    assert set(topiclink._zvec_pending_touches) == {kept_id, pruned_id}
+    assert collection.fetch([kept_id], include_vector=False)[kept_id].fields["last_used_at"] == "2026-07-01T00:00:00Z"
+
+    collection.delete([pruned_id])
+    assert asyncio.run(topiclink._run_topiclink_zvec_maintenance_pass())["touched"] == 1
+    assert writes == [sorted([kept_id, pruned_id])]
+    assert topiclink._zvec_pending_touches == {}
+    fetched = collection.fetch([kept_id, pruned_id], include_vector=False)
+    assert list(fetched) == [kept_id]
+    assert fetched[kept_id].fields["last_used_at"] > "2026-07-01T00:00:00Z"
+
+
+def test_topiclink_embedding_lru_serves_hot_vectors_and_warms_from_snapshot(topiclink_client, monkeypatch):
+    model = "Qwen3-Embedding-8B"
+    texts = ["hot TopicLink text", "warm TopicLink text", "cold TopicLink text"]
+    vectors = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    topiclink._write_embedding_cache(model, texts, vectors)
+    zvec_reads: list[list[str]] = []
+    read_zvec_cache = topiclink._read_zvec_cache
+    monkeypatch.setattr(
+        topiclink,
+        "_read_zvec_cache",
+        lambda model, inputs: zvec_reads.append(list(inputs)) or read_zvec_cache(model, inputs),
+    )
+
+    assert topiclink._read_embedding_cache(model, texts) == vectors
+    assert zvec_reads == []
+    stats = topiclink_client.get("/topiclink/health/ready").json()["embedding_lru"]
+    assert (stats["entries"], stats["hits"], stats["misses"], stats["hit_rate"]) == (3, 3, 0, 1.0)
+
+    monkeypatch.setattr(topiclink, "_embedding_lru", EmbeddingLRU(2 * 3 * 4))
+    assert topiclink._read_embedding_cache(model, texts[::-1]) == vectors[::-1]
+    assert topiclink._read_embedding_cache(model, texts[:2]) == vectors[:2]
+    assert zvec_reads == [texts[::-1]]
+    assert topiclink._embedding_lru.stats()["entries"] == 2
+
+    assert topiclink.save_topiclink_embedding_lru_snapshot() == 2
+    monkeypatch.setattr(topiclink, "_embedding_lru", EmbeddingLRU(3 * 4))
+    assert topiclink.warm_topiclink_embedding_lru() == 1
+    assert topiclink._read_embedding_cache(model, texts[1:2]) == vectors[1:2]
+    assert zvec_reads == [texts[::-1]]
+
+
 def test_topiclink_embeddings_only_fetch_missing_inputs_then_hit_zvec(topiclink_client, monkeypatch):
     model = "Qwen3-Embedding-8B"
     requests: list[list[str]] = []
 
     class FakeResponse:
+        status_code = 200
+
         def __init__(self, inputs: list[str]):
             self.inputs = inputs
 
@@ -291,23 +397,14 @@ def test_topiclink_embeddings_only_fetch_missing_inputs_then_hit_zvec(topiclink_
             }
 
     class FakeAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, traceback):
-            return False
-
-        async def post(self, url, *, headers, json):
+        async def post(self, url, *, headers, json, timeout):
             inputs = list(json["input"])
             requests.append(inputs)
             return FakeResponse(inputs)
 
     monkeypatch.setenv("TOPICLINK_EMBEDDING_API_KEY", "test-key")
     monkeypatch.setenv("TOPICLINK_EMBEDDING_MODEL", model)
-    monkeypatch.setattr(topiclink.httpx, "AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(embedding_batcher, "get_shared_async_client", lambda name: FakeAsyncClient())
 
     first_inputs = ["科研议程筛选", "一人公司尽调"]
     first = asyncio.run(topiclink._try_remote_embeddings(first_inputs))
@@ -320,6 +417,292 @@ def test_topiclink_embeddings_only_fetch_missing_inputs_then_hit_zvec(topiclink_
     assert requests == [first_inputs, ["新增产业线索"]]
 
 
+def _pure_python_hash_embedding(text: str) -> list[float]:
+    vector = [0.0] * topiclink.EMBEDDING_DIM
+    for token in text.lower().replace("/", " ").replace("_", " ").split():
+        value = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+        vector[value % topiclink.EMBEDDING_DIM] += 1.0 if value & 1 else -1.0
+    norm = math.sqrt(sum(item * item for item in vector)) or 1.0
+    return [item / norm for item in vector]
+
+
+def test_topiclink_vectorized_scoring_matches_pairwise_cosine_ranking(monkeypatch):
+    topics = [
+        {"id": f"topic-{index}", "title": title, "body": body, "category": "research"}
+        for index, (title, body) in enumerate(
+            [
+                ("single cell clustering", "scanpy leiden umap marker genes"),
+                ("protein structure prediction", "alphafold msa templates"),
+                ("literature review workflow", "zotero notes citation graph"),
+                ("causal inference", "instrumental variables diff in diff"),
+                ("科研协作", "资料整理 真实经验 research collaboration"),
+                ("empty", ""),
+            ]
+        )
+    ]
+    profile = "single cell research collaboration and literature notes"
+    monkeypatch.setattr(topiclink, "_try_remote_embeddings", AsyncMock(return_value=None))
+
+    items, source = asyncio.run(topiclink._score_topics(profile, topics))
+
+    profile_vector = _pure_python_hash_embedding(profile)
+    expected = [
+        topiclink._recommendation_item(
+            topic,
+            sum(x * y for x, y in zip(profile_vector, _pure_python_hash_embedding(topiclink._topic_text(topic)))),
+            "local_text_rule",
+        )
+        for topic in topics
+    ]
+    expected.sort(key=lambda item: item["recommendation_score"], reverse=True)
+    assert source == "local_text_rule"
+    assert items == expected
+
+    monkeypatch.setattr(
+        topiclink,
+        "_try_remote_embeddings",
+        AsyncMock(return_value=[[3.0, 4.0, 0.0], [0.0, 2.0, 0.0], [6.0, 8.0, 0.0], [1.0, 0.0], [-3.0, -4.0, 0.0]]),
+    )
+    items, source = asyncio.run(topiclink._score_topics(profile, topics[:4]))
+
+    assert source == "qwen_embedding"
+    assert [(item["topic_id"], item["recommendation_score"]) for item in items] == [
+        ("topic-1", 96),
+        ("topic-0", 87),
+        ("topic-2", 50),
+        ("topic-3", 35),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_topiclink_knowledge_answers_are_cached_per_question_and_cited_topic_versions(monkeypatch):
+    topics = [
+        {"id": "topic-a", "title": "single cell clustering", "body": "scanpy leiden", "category": "research"},
+        {"id": "topic-b", "title": "protein folding", "body": "alphafold msa", "category": "research"},
+    ]
+    llm_calls = []
+
+    async def fake_answer(query, ranked_topics):
+        llm_calls.append([topic["body"] for topic in ranked_topics])
+        await asyncio.sleep(0.01)
+        return f"answer {len(llm_calls)}"
+
+    monkeypatch.setenv("TOPICLINK_CHAT_API_KEY", "test-key")
+    monkeypatch.setattr(topiclink, "_try_remote_embeddings", AsyncMock(return_value=None))
+    monkeypatch.setattr(topiclink, "_try_remote_knowledge_answer", fake_answer)
+
+    def ask(query, candidates=topics):
+        return topiclink.answer_topiclink_knowledge(
+            topiclink.TopicLinkKnowledgeAnswerRequest(query=query, topics=candidates)
+        )
+
+    first, concurrent = await asyncio.gather(ask("single cell clustering"), ask("  Single   CELL clustering "))
+    repeated = await ask("single cell clustering")
+
+    assert [first["answer"], concurrent["answer"], repeated["answer"]] == ["answer 1"] * 3
+    assert sorted([first["cached"], concurrent["cached"]]) == [False, True]
+    assert repeated["cached"] is True
+    assert len(llm_calls) == 1
+
+    edited = [{**topics[0], "body": "scanpy leiden marker genes"}, topics[1]]
+    refreshed = await ask("single cell clustering", edited)
+
+    assert (refreshed["answer"], refreshed["cached"]) == ("answer 2", False)
+    assert "scanpy leiden marker genes" in llm_calls[1]
+
+    monkeypatch.setattr(topiclink, "KNOWLEDGE_ANSWER_PROMPT_VERSION", "next-prompt")
+    reworded = await ask("single cell clustering", edited)
+
+    assert (reworded["answer"], reworded["cached"]) == ("answer 3", False)
+
+
+def _sse_chunks(*pieces):
+    lines = [f"data: {json.dumps({'choices': [{'delta': {'content': piece}}]})}\n\n" for piece in pieces]
+    return [line.encode("utf-8") for line in lines] + [b"data: [DONE]\n\n"]
+
+
+async def _read_topiclink_events(response):
+    events = []
+    async for frame in response.body_iterator:
+        event, data = frame.strip().split("\n", 1)
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_topiclink_knowledge_answer_stream_forwards_retrieval_and_tokens_then_caches(monkeypatch):
+    topics = [{"id": "topic-a", "title": "single cell clustering", "body": "scanpy leiden", "category": "research"}]
+    upstream_calls = []
+
+    def handler(request):
+        upstream_calls.append(json.loads(request.content))
+        return httpx.Response(200, content=b"".join(_sse_chunks("先看", "单细胞这桌。")))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setenv("TOPICLINK_CHAT_API_KEY", "test-key")
+    monkeypatch.setattr(topiclink, "_try_remote_embeddings", AsyncMock(return_value=None))
+    monkeypatch.setattr(topiclink, "get_shared_async_client", lambda name, **kwargs: client)
+    req = topiclink.TopicLinkKnowledgeAnswerRequest(query="single cell clustering", topics=topics)
+
+    first = await _read_topiclink_events(await topiclink.stream_topiclink_knowledge_answer(req))
+    replay = await _read_topiclink_events(await topiclink.stream_topiclink_knowledge_answer(req))
+    await client.aclose()
+
+    assert [event for event, _ in first] == ["retrieval", "token", "token", "done"]
+    assert first[0][1]["topic_ids"] == ["topic-a"]
+    assert first[-1][1]["answer"] == "先看单细胞这桌。"
+    assert first[-1][1]["cached"] is False
+    assert upstream_calls[0]["stream"] is True
+    assert [event for event, _ in replay] == ["retrieval", "done"]
+    assert (replay[-1][1]["answer"], replay[-1][1]["cached"]) == ("先看单细胞这桌。", True)
+    assert len(upstream_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_topiclink_knowledge_answer_stream_caps_tokens_and_resets_on_upstream_failure(monkeypatch):
+    topics = [{"id": "topic-a", "title": "single cell clustering", "body": "scanpy leiden", "category": "research"}]
+    long_pieces = ["先看单细胞这桌，" * 10] * 5
+
+    class BrokenCompletion(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield _sse_chunks("先看")[0]
+            raise httpx.ReadError("upstream dropped")
+
+    responses = iter(
+        [
+            httpx.Response(200, content=b"".join(_sse_chunks(*long_pieces))),
+            httpx.Response(200, stream=BrokenCompletion()),
+        ]
+    )
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: next(responses)))
+    monkeypatch.setenv("TOPICLINK_CHAT_API_KEY", "test-key")
+    monkeypatch.setenv("TOPICLINK_ANSWER_CACHE_TTL_SECONDS", "0")
+    monkeypatch.setattr(topiclink, "_try_remote_embeddings", AsyncMock(return_value=None))
+    monkeypatch.setattr(topiclink, "get_shared_async_client", lambda name, **kwargs: client)
+
+    def ask(query):
+        req = topiclink.TopicLinkKnowledgeAnswerRequest(query=query, topics=topics)
+        return topiclink.stream_topiclink_knowledge_answer(req)
+
+    capped = await _read_topiclink_events(await ask("single cell clustering"))
+    broken = await _read_topiclink_events(await ask("single cell markers"))
+    await client.aclose()
+
+    streamed = "".join(payload["text"] for event, payload in capped if event == "token")
+    answer = capped[-1][1]["answer"]
+    assert len(answer) == topiclink.KNOWLEDGE_ANSWER_VISIBLE_CHARS and answer.endswith("…")
+    assert streamed == answer[:-1]
+
+    assert [event for event, _ in broken] == ["retrieval", "token", "reset", "done"]
+    assert broken[-1][1]["provider_status"] == "local"
+    assert broken[-1][1]["answer"] == topiclink._fallback_knowledge_answer("single cell markers", topics)
+
+
+@pytest.mark.asyncio
+async def test_topiclink_simulation_stream_closes_the_upstream_completion_on_disconnect(topiclink_client, monkeypatch):
+    from app.storage.database.topic_store import create_topic
+
+    topic = create_topic("科研复现", "找一起复现实验的人", "research")
+    upstream = {"closed": False}
+    release = asyncio.Event()
+
+    class SlowCompletion(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield _sse_chunks('{"summary":')[0]
+            await release.wait()
+            yield b"data: [DONE]\n\n"
+
+        async def aclose(self):
+            upstream["closed"] = True
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, stream=SlowCompletion())))
+    monkeypatch.setenv("TOPICLINK_CHAT_API_KEY", "test-key")
+    monkeypatch.setattr(topiclink, "get_shared_async_client", lambda name, **kwargs: client)
+
+    response = await topiclink.stream_topiclink_simulation(topic["id"])
+    frames = response.body_iterator
+    assert (await frames.__anext__()).startswith("event: context")
+    assert (await frames.__anext__()).startswith("event: token")
+    await frames.aclose()
+    for _ in range(50):
+        if upstream["closed"]:
+            break
+        await asyncio.sleep(0.01)
+    await client.aclose()
+
+    assert upstream["closed"] is True
+
+
+def test_topiclink_recommendations_query_the_topic_index_with_metadata_filters(topiclink_client, monkeypatch):
+    from app.storage.database.topic_store import create_topic
+
+    model = "Qwen3-Embedding-8B"
+    seed = create_topic("科研复现", "找一起复现实验的人", "research")
+    near = create_topic("实验复现小组", "复现论文实验", "research")
+    other = create_topic("产品交付", "讨论上线流程", "product")
+    entries = [
+        {"topic_id": seed["id"], "category": "research", "status": "open"},
+        {"topic_id": near["id"], "category": "research", "status": "open"},
+        {"topic_id": other["id"], "category": "product", "status": "open"},
+        {"topic_id": "deleted-topic", "category": "research", "status": "open"},
+    ]
+    vectors = [[1.0, 0.0, 0.0], [0.9, 0.1, 0.0], [0.0, 1.0, 0.0], [0.95, 0.05, 0.0]]
+    assert topiclink._write_topic_index(model, entries, vectors) == 4
+
+    hits = topiclink._query_topic_index(model, [1.0, 0.0, 0.0], limit=3, exclude_topic_id=seed["id"])
+    assert [hit["topic_id"] for hit in hits] == ["deleted-topic", near["id"], other["id"]]
+    assert hits[0]["similarity"] > hits[1]["similarity"] > hits[2]["similarity"]
+    product = topiclink._query_topic_index(model, [1.0, 0.0, 0.0], limit=3, category="product")
+    assert [hit["topic_id"] for hit in product] == [other["id"]]
+    assert topiclink._query_topic_index(model, [1.0, 0.0, 0.0], limit=3, status="closed") == []
+    assert topiclink._query_topic_index(model, [1.0, 0.0, 0.0], limit=3, category="x' or '1") == []
+
+    async def fake_embeddings(inputs):
+        return [[1.0, 0.0, 0.0] for _ in inputs]
+
+    monkeypatch.setenv("TOPICLINK_EMBEDDING_API_KEY", "test-key")
+    monkeypatch.setattr(topiclink, "_try_remote_embeddings", fake_embeddings)
+    response = topiclink_client.get(
+        "/api/v1/topiclink/recommendations",
+        params={"topic_id": seed["id"], "limit": 2, "category": "research"},
+    )
+
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert payload["candidate_source"] == "topic_index"
+    assert payload["vector_status"] == "ready"
+    assert [item["topic_id"] for item in payload["items"]] == [near["id"]]
+    assert payload["items"][0]["score_source"] == "qwen_embedding"
+    assert topiclink._topic_index_collection.fetch(
+        [topiclink._topic_index_document_id("deleted-topic")], include_vector=False
+    ) == {}
+
+
+def test_topiclink_topic_writes_refresh_the_topic_index(topiclink_client, monkeypatch):
+    from app.storage.database.topic_store import close_topic, create_topic, delete_topic
+
+    async def fake_embeddings(inputs):
+        return [[0.0, 0.0, 1.0] for _ in inputs]
+
+    monkeypatch.setenv("TOPICLINK_EMBEDDING_API_KEY", "test-key")
+    monkeypatch.setattr(topiclink, "_try_remote_embeddings", fake_embeddings)
+    topic = create_topic("新话题", "刚写入就能被推荐", "research")
+    document_id = topiclink._topic_index_document_id(topic["id"])
+
+    assert asyncio.run(topiclink.refresh_topiclink_topic_index([topic["id"]])) == 1
+    indexed = topiclink._topic_index_collection.fetch([document_id], include_vector=False)
+    assert indexed[document_id].fields["status"] == "open"
+
+    close_topic(topic["id"])
+    asyncio.run(topiclink.refresh_topiclink_topic_index([topic["id"]]))
+    indexed = topiclink._topic_index_collection.fetch([document_id], include_vector=False)
+    assert indexed[document_id].fields["status"] == "closed"
+
+    delete_topic(topic["id"])
+    assert asyncio.run(topiclink.refresh_topiclink_topic_index([topic["id"]])) == 0
+    assert topiclink._topic_index_collection.fetch([document_id], include_vector=False) == {}
+
+
 def test_scnet_credentials_enable_embedding_and_default_chat_without_extra_config(topiclink_client, monkeypatch):
     monkeypatch.setenv("SCNET_BASE_URL", "https://scnet.example/v1")
     monkeypatch.setenv("SCNET_API_KEY", "shared-scnet-key")
@@ -619,6 +1002,12 @@ async def test_topiclink_background_embedding_pass_indexes_topics_and_public_opc
         return [[0.1] * topiclink.DEFAULT_ZVEC_DIMENSIONS for _ in inputs]
 
     monkeypatch.setattr(topiclink, "_try_remote_embeddings", fake_embeddings)
+    indexed_entries = []
+    monkeypatch.setattr(
+        topiclink,
+        "_write_topic_index",
+        lambda model, entries, vectors: indexed_entries.extend(entries) or len(entries),
+    )
     topiclink._embedding_worker_cursor = None
 
     result = await topiclink._run_topiclink_embedding_background_pass()
@@ -645,6 +1034,10 @@ async def test_topiclink_background_embedding_pass_indexes_topics_and_public_opc
             "stuck": "",
         })),
     ]
+    assert indexed_entries == [
+        {"topic_id": "topic-1", "category": "research", "status": ""},
+        {"topic_id": "topic-2", "category": "product", "status": ""},
+    ]
     assert topiclink._embedding_worker_cursor == "next-page"
     assert topiclink._embedding_worker_opc_offset == 2
 
@@ -663,7 +1056,11 @@ async def test_topiclink_background_worker_runs_embedding_and_metadata_passes(mo
     async def fake_metadata_pass():
         calls.append("metadata")
 
+    async def fake_lease():
+        return True
+
     monkeypatch.setattr(topiclink, "_sleep_until_topiclink_worker_tick", fake_sleep)
+    monkeypatch.setattr(topiclink, "_hold_topiclink_worker_lease", fake_lease)
     monkeypatch.setattr(topiclink, "_run_topiclink_embedding_background_pass", fake_embedding_pass)
     monkeypatch.setattr(topiclink, "_run_topiclink_metadata_background_pass", fake_metadata_pass)
     topiclink._metadata_worker_stop = asyncio.Event()
@@ -675,6 +1072,120 @@ async def test_topiclink_background_worker_runs_embedding_and_metadata_passes(mo
     assert calls == ["embedding", "metadata"]
 
 
+def test_topiclink_background_worker_lease_elects_one_leader(topiclink_client, monkeypatch):
+    from app.storage.database import worker_leases
+
+    now = {"value": 1000.0}
+    monkeypatch.setattr(worker_leases.time, "time", lambda: now["value"])
+    name = topiclink.TOPICLINK_WORKER_LEASE_NAME
+
+    assert worker_leases.acquire_worker_lease(name, "worker-a", 60) is True
+    assert worker_leases.acquire_worker_lease(name, "worker-b", 60) is False
+    now["value"] += 45
+    assert worker_leases.acquire_worker_lease(name, "worker-a", 60) is True
+    now["value"] += 45
+    assert worker_leases.acquire_worker_lease(name, "worker-b", 60) is False
+    now["value"] += 30
+    assert worker_leases.acquire_worker_lease(name, "worker-b", 60) is True
+
+    worker_leases.release_worker_lease(name, "worker-a")
+    assert worker_leases.acquire_worker_lease(name, "worker-a", 60) is False
+    worker_leases.release_worker_lease(name, "worker-b")
+    assert worker_leases.acquire_worker_lease(name, "worker-a", 60) is True
+
+
+@pytest.mark.asyncio
+async def test_topiclink_metadata_pass_renews_the_lease_between_batches(monkeypatch):
+    topics = [
+        {"id": f"topic-{index}", "title": f"议题 {index}", "body": "需要补充", "category": "research", "metadata": None}
+        for index in range(5)
+    ]
+    filled = []
+    renewals = iter([True, False])
+
+    async def fake_lease():
+        return next(renewals)
+
+    async def fake_remote_metadata(topic):
+        filled.append(topic["id"])
+        return {**topiclink._derive_topiclink_metadata(topic), "source": "topiclink_llm_autofill"}
+
+    monkeypatch.setenv("TOPICLINK_METADATA_AUTOFILL", "1")
+    monkeypatch.setenv("TOPICLINK_METADATA_BACKGROUND_AUTOFILL", "1")
+    monkeypatch.setenv("TOPICLINK_METADATA_BACKGROUND_MAX_PER_PASS", "5")
+    monkeypatch.setenv("TOPICLINK_METADATA_BACKGROUND_MAX_CONCURRENCY", "2")
+    monkeypatch.setenv("TOPICLINK_METADATA_BACKGROUND_LLM_DELAY_SECONDS", "0")
+    monkeypatch.setattr(topiclink, "_metadata_worker_limit", None)
+    monkeypatch.setattr(topiclink, "_metadata_worker_cursor", "before-pass")
+    monkeypatch.setattr(topiclink, "list_topics", lambda limit=20, cursor=None, **kwargs: {"items": topics, "next_cursor": "after-pass"})
+    monkeypatch.setattr(topiclink, "_try_remote_topiclink_metadata", fake_remote_metadata)
+    monkeypatch.setattr(topiclink, "_persist_topiclink_metadata", lambda topic_id, metadata: {"id": topic_id})
+    monkeypatch.setattr(topiclink, "_hold_topiclink_worker_lease", fake_lease)
+    monkeypatch.setattr(topiclink, "_count_topiclink_metadata_backlog", lambda: 1)
+
+    result = await topiclink._run_topiclink_metadata_background_pass()
+
+    # Batches of two: the first renewal succeeds, the second finds the lease taken over.
+    assert filled == ["topic-0", "topic-1", "topic-2", "topic-3"]
+    assert result["written"] == 4
+    assert topiclink._metadata_worker_cursor == "before-pass"
+
+
+def test_topiclink_metadata_backlog_count_is_bounded(topiclink_client, monkeypatch):
+    from app.storage.database.topic_store import create_topic
+
+    before = topiclink._count_topiclink_metadata_backlog()
+    for index in range(3):
+        create_topic(f"待补元数据 {index}", body="需要补充 TopicLink", category="research")
+    assert topiclink._count_topiclink_metadata_backlog() == before + 3
+    monkeypatch.setattr(topiclink, "METADATA_BACKLOG_COUNT_LIMIT", before + 2)
+    assert topiclink._count_topiclink_metadata_backlog() == before + 2
+
+
+@pytest.mark.asyncio
+async def test_topiclink_background_worker_follower_skips_shared_passes_and_leader_catches_up(monkeypatch):
+    calls = []
+    sleeps = []
+    leadership = iter([False, True])
+    ticks = iter([True, True, False])
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        return next(ticks)
+
+    async def fake_lease():
+        leader = next(leadership)
+        topiclink._metadata_worker_status["leader"] = leader
+        return leader
+
+    async def fake_maintenance_pass():
+        calls.append("zvec-prune")
+
+    async def fake_embedding_pass():
+        calls.append("embedding")
+
+    async def fake_metadata_pass():
+        calls.append("metadata")
+        topiclink._metadata_worker_status.update(backlog=40, written=10)
+
+    monkeypatch.setenv("TOPICLINK_METADATA_BACKGROUND_INTERVAL_SECONDS", "300")
+    monkeypatch.setenv("TOPICLINK_METADATA_CATCH_UP_INTERVAL_SECONDS", "5")
+    monkeypatch.setattr(topiclink, "_metadata_worker_status", {"leader": False, "backlog": None, "written": 0, "last_pass_at": None})
+    monkeypatch.setattr(topiclink, "_sleep_until_topiclink_worker_tick", fake_sleep)
+    monkeypatch.setattr(topiclink, "_hold_topiclink_worker_lease", fake_lease)
+    monkeypatch.setattr(topiclink, "_run_topiclink_zvec_maintenance_pass", fake_maintenance_pass)
+    monkeypatch.setattr(topiclink, "_run_topiclink_embedding_background_pass", fake_embedding_pass)
+    monkeypatch.setattr(topiclink, "_run_topiclink_metadata_background_pass", fake_metadata_pass)
+    topiclink._metadata_worker_stop = asyncio.Event()
+    try:
+        await topiclink._topiclink_metadata_worker_loop()
+    finally:
+        topiclink._metadata_worker_stop = None
+
+    assert calls == ["zvec-prune", "zvec-prune", "embedding", "metadata"]
+    assert sleeps[1:] == [300.0, 5.0]
+
+
 def test_topiclink_dispatch_queues_bound_openclaw_without_posting_for_it(monkeypatch):
     queued = []
     presence_updates = []
@@ -1,9 +1,13 @@
 import gzip
 import json
 
+import httpx
 import pytest
 import zvec
 
+import scripts.migrate_topiclink_embedding_cache_to_zvec as migration
+from app.services.bulk_pipeline import RowRateLimiter
+from app.services.topiclink_vector_codec import decode_vector_frame
 from scripts.migrate_topiclink_embedding_cache_to_zvec import migrate_cache, zvec_document_id
 from scripts.validate_topiclink_zvec_collection import validate_collection
 
@@ -99,8 +103,24 @@ def test_rejects_mixed_embedding_dimensions(tmp_path):
         for row in rows:
             handle.write(json.dumps(row) + "\n")
 
+    target = tmp_path / "topiclink.zvec"
     with pytest.raises(ValueError, match="dimension"):
-        migrate_cache(source, tmp_path / "topiclink.zvec", optimize=False)
+        migrate_cache(source, target, batch_size=1, optimize=False)
+    assert not target.exists()
+
+
+def test_invalid_row_fails_before_the_first_chunk_is_written(tmp_path):
+    source = tmp_path / "cache.jsonl.gz"
+    rows = _write_cache(source)
+    with gzip.open(source, "wt", encoding="utf-8") as handle:
+        for row in rows:
+            handle.write(json.dumps(row) + "\n")
+        handle.write("{not json\n")
+
+    target = tmp_path / "topiclink.zvec"
+    with pytest.raises(ValueError, match="line 3: invalid JSON"):
+        migrate_cache(source, target, batch_size=1, optimize=False)
+    assert not target.exists()
 
 
 def test_validates_deployable_zvec_collection(tmp_path):
@@ -125,3 +145,78 @@ def test_validates_deployable_zvec_collection(tmp_path):
             min_doc_count=3,
             expected_dimensions=4,
         )
+
+
+def test_resumes_bulk_migration_from_the_last_flushed_chunk(tmp_path, monkeypatch):
+    source = tmp_path / "cache.jsonl.gz"
+    rows = _write_cache(source)
+    target = tmp_path / "topiclink.zvec"
+    checkpoint = tmp_path / "migrate.checkpoint.json"
+    original_write = migration._CollectionSink.write
+    writes = []
+
+    def interrupted_write(self, model, dimensions, chunk, migrated_at):
+        if len(writes) == 1:
+            raise RuntimeError("simulated interruption")
+        writes.append([item["fields"]["text_hash"] for item, _ in chunk])
+        original_write(self, model, dimensions, chunk, migrated_at)
+
+    monkeypatch.setattr(migration._CollectionSink, "write", interrupted_write)
+    with pytest.raises(RuntimeError, match="simulated interruption"):
+        migrate_cache(source, target, batch_size=1, optimize=False, checkpoint=checkpoint)
+    assert json.loads(checkpoint.read_text(encoding="utf-8"))["line"] == 1
+
+    monkeypatch.setattr(migration._CollectionSink, "write", original_write)
+    resumed = migrate_cache(source, target, batch_size=1, optimize=False, checkpoint=checkpoint)
+
+    assert resumed["source_rows"] == 2
+    assert resumed["upserted_rows"] == 1
+    assert writes == [["first"]]
+    assert not checkpoint.exists()
+    fetched = zvec.open(str(target)).fetch([zvec_document_id(row["cache_key"]) for row in rows], include_vector=False)
+    assert len(fetched) == 2
+
+
+def test_bulk_migration_writes_one_frame_per_chunk_through_the_sidecar(tmp_path, monkeypatch):
+    source = tmp_path / "cache.jsonl.gz"
+    _write_cache(source)
+    frames = []
+
+    def handler(request):
+        assert request.url.path == "/v2/cache/upsert"
+        frames.append(decode_vector_frame(request.content))
+        return httpx.Response(200, json={"written": len(frames[-1][1])})
+
+    real_client = httpx.Client
+    monkeypatch.setattr(
+        httpx,
+        "Client",
+        lambda **kwargs: real_client(**{**kwargs, "transport": httpx.MockTransport(handler)}),
+    )
+
+    summary = migrate_cache(source, service_url="http://topiclink-zvec:8100", batch_size=2)
+
+    assert summary["upserted_rows"] == 2
+    assert len(frames) == 1
+    header, vectors = frames[0]
+    assert header == {"model": "Qwen3-Embedding-8B", "text_hashes": ["first", "second"]}
+    assert vectors == [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]]
+
+
+def test_row_rate_limiter_keeps_the_average_under_budget():
+    now = [0.0]
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    limiter = RowRateLimiter(100.0, clock=lambda: now[0], sleep=sleep)
+    limiter.wait(50)
+    now[0] += 0.1
+    limiter.wait(50)
+    now[0] += 2.0
+    limiter.wait(50)
+
+    assert slept == pytest.approx([0.5, 0.4])
+    assert RowRateLimiter(0).wait(10_000) == 0.0
@@ -4,9 +4,12 @@ import hmac
 import io
 import json
 import os
+import re
 import stat
 import sys
+import threading
 import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
@@ -27,6 +30,7 @@ from scripts.topiclink_zvec_release import (  # noqa: E402
     load_release_spec,
     load_oss_credentials,
     prepare_release,
+    rollback_release,
 )
 
 
@@ -61,6 +65,39 @@ def _write_lock(path: Path, archive: Path, *, digest: str | None = None) -> None
     )
 
 
+def _serve_ranges(payload: bytes, failing_starts: set[int]):
+    """Static file server with Range support that can fail selected chunks."""
+    requested: list[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            header = self.headers.get("Range", "")
+            requested.append(header)
+            match = re.fullmatch(r"bytes=(\d+)-(\d+)", header)
+            if not match:
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+                return
+            start, end = int(match.group(1)), min(int(match.group(2)), len(payload) - 1)
+            if start in failing_starts:
+                self.send_error(503)
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(payload)}")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.end_headers()
+            self.wfile.write(payload[start : end + 1])
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, requested
+
+
 def _oss_credentials() -> OssCredentials:
     return OssCredentials(
         access_key_id="test-access-key-id",
@@ -315,3 +352,82 @@ def test_deploy_repairs_unhealthy_active_release_before_activation_and_restart()
     assert '"$ZVEC_MANAGER" prepare --force' in workflow
     assert "TopicLink Zvec active release is unhealthy; reinstalling" in workflow
     assert "docker compose start topiclink-zvec || true" in workflow
+
+
+def test_downloads_archive_in_parallel_ranges_and_resumes_after_interruption(
+    tmp_path, monkeypatch
+):
+    archive = tmp_path / "topiclink-zvec-qwen3-embedding-8b-4096-20260717.zip"
+    lock = tmp_path / "topiclink-zvec.lock.json"
+    destination = tmp_path / "downloads" / archive.name
+    with zipfile.ZipFile(archive, "w") as bundle:
+        bundle.writestr(f"{COLLECTION_DIR}/manifest.3", "manifest")
+        bundle.writestr(f"{COLLECTION_DIR}/0/embedding.index", os.urandom(200_000))
+    _write_lock(lock, archive)
+    payload = archive.read_bytes()
+    spec = load_release_spec(lock)
+    chunk_size = 32 * 1024
+    failing = {3 * chunk_size}
+    server, requested = _serve_ranges(payload, failing)
+    monkeypatch.setattr(
+        release_manager,
+        "_oss_object_url",
+        lambda _credentials, key: f"http://127.0.0.1:{server.server_port}/{key}",
+    )
+    monkeypatch.setattr(release_manager.time, "sleep", lambda _seconds: None)
+    progress_path = destination.with_name(f".{destination.name}.part.json")
+    try:
+        with pytest.raises(RuntimeError, match="HTTP 503"):
+            download_archive(
+                spec, destination, _oss_credentials(), workers=4, chunk_size=chunk_size
+            )
+        progress = json.loads(progress_path.read_text(encoding="utf-8"))
+        chunk_count = -(-len(payload) // chunk_size)
+        assert sorted(progress["done"]) == [i for i in range(chunk_count) if i != 3]
+        assert not destination.exists()
+
+        failing.clear()
+        requested.clear()
+        assert download_archive(
+            spec, destination, _oss_credentials(), workers=4, chunk_size=chunk_size
+        ) is True
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert requested == [f"bytes={3 * chunk_size}-{4 * chunk_size - 1}"]
+    assert destination.read_bytes() == payload
+    assert not progress_path.exists()
+    assert not destination.with_name(f".{destination.name}.part").exists()
+
+
+def test_rollback_atomically_restores_the_previous_release(tmp_path):
+    workspace = tmp_path / "workspace"
+    specs = []
+    for version in ("20260717", "20260718"):
+        archive = tmp_path / f"topiclink-zvec-qwen3-embedding-8b-4096-{version}.zip"
+        lock = tmp_path / f"topiclink-zvec-{version}.lock.json"
+        _write_archive(archive)
+        _write_lock(lock, archive)
+        payload = json.loads(lock.read_text(encoding="utf-8"))
+        payload["version"] = version
+        lock.write_text(json.dumps(payload), encoding="utf-8")
+        spec = load_release_spec(lock)
+        prepare_release(spec, build_release_paths(workspace, spec), archive_override=archive)
+        specs.append(spec)
+    first, second = (build_release_paths(workspace, spec) for spec in specs)
+
+    with pytest.raises(RuntimeError, match="no installed release marker"):
+        rollback_release(specs[0], first)
+    activate_release(specs[0], first)
+    marker = activate_release(specs[1], second)
+    assert marker["previous_path"] == str(first.release_collection)
+
+    restored = rollback_release(specs[1], second)
+
+    assert active_resolved_path(second) == str(first.release_collection)
+    assert restored["version"] == "20260717"
+    installed = json.loads(second.installed_marker.read_text(encoding="utf-8"))
+    assert installed["previous_path"] == str(second.release_collection)
+    rollback_release(specs[1], second)
+    assert active_resolved_path(second) == str(second.release_collection)
@@ -1201,6 +1201,73 @@ def test_arcade_review_queue_does_not_scan_every_topic_post(client, monkeypatch)
     assert items[0]["submission_post"]["id"] == submission_resp.json()["post"]["id"]
 
 
+def test_arcade_review_queue_uses_indexed_metadata_columns(client):
+    admin = admin_panel_login(client)
+    create = client.post(
+        "/api/v1/internal/arcade/topics",
+        json={
+            "title": "Arcade Indexed Review Queue",
+            "body": "题目正文",
+            "metadata": {
+                "arcade": {
+                    "prompt": "给出最终答案",
+                    "rules": "等评测再继续",
+                    "output_mode": "plain_text",
+                    "validator": {"type": "custom", "config": {"source": "cabinets/local/indexed"}},
+                }
+            },
+        },
+        headers={"Authorization": f"Bearer {admin['token']}"},
+    )
+    assert create.status_code == 201, create.text
+    owner = register_login_and_openclaw_key(client, phone="13800009016", username="arcade-indexed-owner")
+    submission_resp = client.post(
+        f"/api/v1/openclaw/topics/{create.json()['id']}/posts",
+        json={"body": "索引评测答案"},
+        headers={"Authorization": f"Bearer {owner['openclaw_key']}"},
+    )
+    assert submission_resp.status_code == 201, submission_resp.text
+    owner_agent_id = submission_resp.json()["post"]["metadata"]["arcade"]["branch_owner_openclaw_agent_id"]
+
+    from app.storage.database import topic_store
+    from app.storage.database.postgres_client import get_db_session
+
+    with get_db_session() as session:
+        promoted = session.execute(
+            text("SELECT arcade_scene, arcade_post_kind, arcade_branch_owner_openclaw_agent_id FROM posts WHERE id = :id"),
+            {"id": submission_resp.json()["post"]["id"]},
+        ).one()
+        assert promoted.arcade_scene == "arcade"
+        assert promoted.arcade_post_kind == "submission"
+        assert promoted.arcade_branch_owner_openclaw_agent_id == str(owner_agent_id)
+
+        plans = {}
+        for owner_filter in (None, owner_agent_id):
+            queue_query, params = topic_store._build_arcade_pending_review_query(
+                is_sqlite=True,
+                topic_id=None,
+                owner_openclaw_agent_id=owner_filter,
+                source_filters=[],
+                limit=20,
+            )
+            assert "json_extract(br.metadata" not in queue_query.text
+            plan = session.execute(text(f"EXPLAIN QUERY PLAN {queue_query.text}"), params).fetchall()
+            plans[owner_filter] = " | ".join(str(row.detail) for row in plan)
+
+    unfiltered_plan = plans[None]
+    assert "SEARCH br USING INDEX idx_posts_arcade_kind" in unfiltered_plan, unfiltered_plan
+    assert "SEARCH lp USING INDEX idx_posts_arcade_kind" in unfiltered_plan, unfiltered_plan
+    assert "SEARCH ev USING INDEX idx_posts_arcade_for_post" in unfiltered_plan, unfiltered_plan
+    for alias in ("lp", "le", "ev", "sp"):
+        assert f"SCAN {alias}" not in unfiltered_plan, unfiltered_plan
+    owner_plan = plans[owner_agent_id]
+    assert "SEARCH br USING INDEX idx_posts_arcade_branch_owner" in owner_plan, owner_plan
+
+    items = topic_store.list_arcade_pending_review_items(owner_openclaw_agent_id=owner_agent_id)
+    assert [item["submission_post"]["id"] for item in items] == [submission_resp.json()["post"]["id"]]
+    assert items[0]["branch_owner_openclaw_agent_id"] == owner_agent_id
+
+
 def test_arcade_review_queue_can_filter_to_supported_sources(client):
     admin = admin_panel_login(client)
     unsupported = client.post(